@@ -116,6 +116,10 @@ def init_db():
         # Auto-sync schema: create missing tables, columns, and indexes.
         from config import settings
         from migrations.auto_schema import AutoSchemaMigration
+        from migrations.client_data_types import convert_client_data_columns
+
+        # Casts that the generic sync does not apply (VARCHAR -> macaddr/inet)
+        convert_client_data_columns(engine)
 
         auto = AutoSchemaMigration(engine, Base)
         migration_results = auto.run()
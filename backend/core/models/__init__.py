@@ -1,6 +1,11 @@
 from core.models.agents import CockpitAgentCommand
 from core.models.audit import AuditLog
-from core.models.client_data import ClientHostname, ClientIpAddress, ClientMacAddress
+from core.models.client_data import (
+    ClientDataRow,
+    ClientHostname,
+    ClientIpAddress,
+    ClientMacAddress,
+)
 from core.models.compliance import ComplianceCheck, ComplianceRule, RegexPattern
 from core.models.credentials import Credential, LoginCredential, SNMPMapping
 from core.models.git import GitRepository
@@ -95,6 +100,7 @@ __all__ = [
     "ClientIpAddress",
     "ClientMacAddress",
     "ClientHostname",
+    "ClientDataRow",
     # Servers
     "Server",
     "ServerFactsHistory",
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, DateTime, Index, Integer, String
+from sqlalchemy import Column, DateTime, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import INET, MACADDR
 from sqlalchemy.sql import func
 
 from core.database import Base
@@ -17,14 +18,14 @@ class ClientIpAddress(Base):
     session_id = Column(
         String(36), nullable=False
     )  # UUID of the collection run — cross-table join key
-    ip_address = Column(String(45), nullable=False)  # IPv4 or IPv6
+    ip_address = Column(INET, nullable=False)  # IPv4 or IPv6
     mac_address = Column(
-        String(20), nullable=True
-    )  # dotted-quad format (e.g. aabb.cc00.0100), join key to ClientMacAddress
+        MACADDR, nullable=True
+    )  # join key to ClientMacAddress; None for incomplete ARP entries
     interface = Column(String(255), nullable=True)  # ARP interface
     vrf = Column(String(64), nullable=True)  # VRF name; None = default VRF
     device_name = Column(String(255), nullable=False)  # source network device name
-    device_ip = Column(String(45), nullable=True)  # primary IP of the source device
+    device_ip = Column(INET, nullable=True)  # primary IP of the source device
     collected_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -47,13 +48,11 @@ class ClientMacAddress(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String(36), nullable=False)
-    mac_address = Column(
-        String(20), nullable=False
-    )  # dotted-quad format — join key to ClientIpAddress
+    mac_address = Column(MACADDR, nullable=False)  # join key to ClientIpAddress
     vlan = Column(String(20), nullable=True)
     port = Column(String(255), nullable=True)  # switch port / destination port
     device_name = Column(String(255), nullable=False)  # source network device name
-    device_ip = Column(String(45), nullable=True)  # primary IP of the source device
+    device_ip = Column(INET, nullable=True)  # primary IP of the source device
     collected_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -75,12 +74,10 @@ class ClientHostname(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String(36), nullable=False)
-    ip_address = Column(
-        String(45), nullable=False
-    )  # join key to ClientIpAddress.ip_address
+    ip_address = Column(INET, nullable=False)  # join key to ClientIpAddress.ip_address
     hostname = Column(String(255), nullable=False)  # DNS-resolved name
     device_name = Column(String(255), nullable=False)  # source network device name
-    device_ip = Column(String(45), nullable=True)  # primary IP of the source device
+    device_ip = Column(INET, nullable=True)  # primary IP of the source device
     collected_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -89,3 +86,60 @@ class ClientHostname(Base):
         Index("idx_client_hostname_session", "session_id"),
         Index("idx_client_hostname_ip", "ip_address"),
     )
+
+
+class ClientDataRow(Base):
+    """Correlated client data of the latest collection session.
+
+    Materialized from the three tables above by
+    ``ClientDataRepository.refresh_client_data`` at the end of each
+    get_client_data run, so the client table is searched and paged here
+    instead of re-running the correlation query.  ``position`` is the row's
+    rank in the table's display order and serves as the keyset cursor.
+    """
+
+    __tablename__ = "client_data_rows"
+
+    id = Column(Integer, primary_key=True)
+    position = Column(Integer, nullable=False)
+    session_id = Column(String(36), nullable=False)
+    mac_address = Column(MACADDR, nullable=False)
+    port = Column(String(255), nullable=True)
+    vlan = Column(String(20), nullable=True)
+    vrf = Column(String(64), nullable=True)
+    ip_address = Column(INET, nullable=True)
+    hostname = Column(String(255), nullable=True)
+    device_name = Column(String(255), nullable=False)
+    collected_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("idx_client_data_rows_position", "position", unique=True),
+        # Subnet containment (<<=) searches
+        Index(
+            "idx_client_data_rows_ip_inet",
+            "ip_address",
+            postgresql_using="gist",
+            postgresql_ops={"ip_address": "inet_ops"},
+        ),
+        # Trigram indexes serve the partial (ILIKE '%x%') column filters; MAC
+        # and IP are matched on their text form, see ClientDataRepository
+        Index(
+            "idx_client_data_rows_mac_digits_trgm",
+            text("replace(mac_address::text, ':', '') gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        Index(
+            "idx_client_data_rows_ip_host_trgm",
+            text("host(ip_address) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        *(
+            Index(
+                f"idx_client_data_rows_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+            for column in ("hostname", "port", "device_name")
+        ),
+    )
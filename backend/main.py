@@ -451,6 +451,19 @@ async def _startup_services():
         # ServerDefaultsService fall back to dataclass defaults, and each
         # will create its built-in row lazily on first update() call.
 
+    # Materialize client data collected before client_data_rows existed
+    try:
+        from repositories.client_data.client_data_repository import (
+            ClientDataRepository,
+        )
+
+        materialized = ClientDataRepository().materialize_if_empty()
+        if materialized:
+            logger.info("Materialized %s client data rows", materialized)
+    except Exception as e:
+        logger.error("Failed to materialize client data: %s", e)
+        # Don't raise - the rows are rebuilt after the next collection
+
     # Export SSH keys to filesystem
     try:
         import service_factory
@@ -577,7 +590,18 @@ async def _startup_services():
                     raise Exception(f"GraphQL errors: {result['errors']}")
                 locations = result["data"]["locations"]
                 ttl = int(cache_cfg.get("ttl_seconds", 600))
-                cache_service.set("nautobot:locations:list", locations, ttl)
+                from services.inventory.location_tree import (
+                    LOCATION_CLOSURE_KEY,
+                    build_location_closure,
+                )
+
+                cache_service.set_many(
+                    {
+                        "nautobot:locations:list": locations,
+                        LOCATION_CLOSURE_KEY: build_location_closure(locations),
+                    },
+                    ttl,
+                )
                 logger.debug(
                     "Startup cache: Prefetched locations (%s items) (ttl=%ss)",
                     len(locations),
@@ -9,5 +9,11 @@ For interactive checking and applying schema differences, use:
 """
 
 from .auto_schema import AutoSchemaMigration, ColumnDiff, SchemaDiff
+from .client_data_types import convert_client_data_columns
 
-__all__ = ["AutoSchemaMigration", "ColumnDiff", "SchemaDiff"]
+__all__ = [
+    "AutoSchemaMigration",
+    "ColumnDiff",
+    "SchemaDiff",
+    "convert_client_data_columns",
+]
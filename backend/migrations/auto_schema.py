@@ -16,6 +16,9 @@ logger = logging.getLogger(__name__)
 # Tables that are not part of the application models and should be ignored.
 _SKIP_TABLES = {"schema_migrations", "alembic_version"}
 
+# PostgreSQL extensions the model indexes depend on (e.g. gin_trgm_ops).
+_REQUIRED_EXTENSIONS = ("pg_trgm",)
+
 
 def normalize_pg_type(type_str: str) -> str:
     """Normalize a PostgreSQL type string to a canonical form for comparison."""
@@ -436,6 +439,32 @@ class AutoSchemaMigration:
 
         return added_count
 
+    def ensure_extensions(self) -> int:
+        """Create required PostgreSQL extensions that are not installed yet."""
+        if self.engine.dialect.name != "postgresql":
+            return 0
+
+        created_count = 0
+        for extension in _REQUIRED_EXTENSIONS:
+            try:
+                with self.engine.connect() as conn:
+                    installed = conn.execute(
+                        text("SELECT 1 FROM pg_extension WHERE extname = :name"),
+                        {"name": extension},
+                    ).scalar()
+                    if installed:
+                        continue
+                    logger.info("Creating extension %s", extension)
+                    conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+                    conn.commit()
+                created_count += 1
+                logger.info("✓ Created extension: %s", extension)
+            except Exception as e:
+                # Indexes using the extension fail later and are logged there
+                logger.warning("✗ Failed to create extension %s: %s", extension, e)
+
+        return created_count
+
     def create_missing_indexes(self) -> int:
         """Create indexes that exist in models but not in database."""
         existing_tables = self.get_existing_tables()
@@ -476,6 +505,9 @@ class AutoSchemaMigration:
         }
 
         try:
+            # Before any table: a new table is created together with its
+            # indexes, and gin_trgm_ops indexes need pg_trgm.
+            self.ensure_extensions()
             results["tables_created"] = self.create_missing_tables()
             # Re-inspect after table creation so column checks see the new tables.
             self.inspector = inspect(self.engine)
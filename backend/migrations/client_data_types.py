@@ -0,0 +1,121 @@
+"""
+Conversion of the client data tables to native address types.
+
+The ARP, MAC table and hostname tables used to store MAC and IP addresses as
+VARCHAR.  They now use PostgreSQL ``macaddr`` and ``inet``, which
+AutoSchemaMigration cannot convert on its own (it never casts existing
+columns on startup).  This runs before it: values that do not parse are
+cleared (nullable columns) or their rows dropped, then the columns are cast
+in place.  ``client_data_rows`` is derived data and is simply dropped; it is
+recreated with the new types and refilled on the next read.
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# MAC in colon, hyphen, Cisco dotted or bare notation
+_MAC_PATTERN = (
+    r"^([0-9a-f]{2}[:-]){5}[0-9a-f]{2}$"
+    r"|^[0-9a-f]{4}\.[0-9a-f]{4}\.[0-9a-f]{4}$"
+    r"|^[0-9a-f]{12}$"
+)
+# IPv4 dotted quad or anything made of IPv6 characters
+_INET_PATTERN = (
+    r"^(25[0-5]|2[0-4][0-9]|1?[0-9]?[0-9])(\.(25[0-5]|2[0-4][0-9]|1?[0-9]?[0-9])){3}$"
+    r"|^[0-9a-f]*:[0-9a-f:.]*$"
+)
+
+# table -> [(column, target type, nullable)]
+_CONVERSIONS: Dict[str, List[Tuple[str, str, bool]]] = {
+    "client_ip_addresses": [
+        ("ip_address", "INET", False),
+        ("mac_address", "MACADDR", True),
+        ("device_ip", "INET", True),
+    ],
+    "client_mac_addresses": [
+        ("mac_address", "MACADDR", False),
+        ("device_ip", "INET", True),
+    ],
+    "client_hostnames": [
+        ("ip_address", "INET", False),
+        ("device_ip", "INET", True),
+    ],
+}
+
+_DERIVED_TABLE = "client_data_rows"
+
+
+def convert_client_data_columns(engine: Engine) -> int:
+    """Cast VARCHAR address columns of the client data tables to macaddr/inet.
+
+    Idempotent: columns that already have the target type are left alone.
+    Returns the number of columns converted.
+    """
+    if engine.dialect.name != "postgresql":
+        return 0
+
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    converted = 0
+
+    if _DERIVED_TABLE in existing_tables:
+        columns = {c["name"]: c for c in inspector.get_columns(_DERIVED_TABLE)}
+        mac_type = str(columns["mac_address"]["type"]).upper()
+        if mac_type != "MACADDR":
+            logger.info("Dropping %s to recreate it with address types", _DERIVED_TABLE)
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP TABLE {_DERIVED_TABLE}"))
+
+    for table, conversions in _CONVERSIONS.items():
+        if table not in existing_tables:
+            continue
+        columns = {c["name"]: c for c in inspector.get_columns(table)}
+
+        for column, target, nullable in conversions:
+            if column not in columns:
+                continue
+            if str(columns[column]["type"]).upper() == target:
+                continue
+
+            pattern = _MAC_PATTERN if target == "MACADDR" else _INET_PATTERN
+            invalid = f"NOT (trim({column}) ~* :pattern)"
+            try:
+                with engine.begin() as conn:
+                    if nullable:
+                        cleaned = conn.execute(
+                            text(
+                                f"UPDATE {table} SET {column} = NULL "
+                                f"WHERE {column} IS NOT NULL AND {invalid}"
+                            ),
+                            {"pattern": pattern},
+                        ).rowcount
+                    else:
+                        cleaned = conn.execute(
+                            text(f"DELETE FROM {table} WHERE {invalid}"),
+                            {"pattern": pattern},
+                        ).rowcount
+                    conn.execute(
+                        text(
+                            f"ALTER TABLE {table} ALTER COLUMN {column} "
+                            f"TYPE {target} USING trim({column})::{target.lower()}"
+                        )
+                    )
+                converted += 1
+                logger.info(
+                    "✓ Converted %s.%s to %s (%s unparseable value(s) removed)",
+                    table,
+                    column,
+                    target,
+                    cleaned,
+                )
+            except Exception as e:
+                logger.error(
+                    "✗ Failed to convert %s.%s to %s: %s", table, column, target, e
+                )
+
+    return converted
@@ -111,6 +111,8 @@ class ClientDataPageResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    # Pass as ``cursor`` to fetch the following page; None on the last page
+    next_cursor: Optional[int] = None
 
 
 class ClientIpHistoryRow(BaseModel):
@@ -38,6 +38,21 @@ class GitContentSearchRequest(BaseModel):
     case_sensitive: bool = Field(default=False)
     limit: int = Field(default=100, ge=1, le=500)
     offset: int = Field(default=0, ge=0)
+    stream: bool = Field(
+        default=False,
+        description="Stop scanning once the page is full and return a resume cursor",
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "next_cursor from a previous streaming response "
+            "(requires stream, offset must be 0)"
+        ),
+    )
+    count_total: bool = Field(
+        default=False,
+        description="In streaming mode, finish the scan to report an exact total",
+    )
 
     @model_validator(mode="after")
     def validate_diff_mode(self) -> GitContentSearchRequest:
@@ -45,6 +60,8 @@ class GitContentSearchRequest(BaseModel):
             raise ValueError("commit1 and commit2 are required when diff_mode is true")
         if self.diff_mode and self.include_history:
             raise ValueError("include_history cannot be used with diff_mode")
+        if self.cursor and not self.stream:
+            raise ValueError("cursor can only be used with stream")
         return self
 
 
@@ -71,6 +88,8 @@ class GitContentSearchData(BaseModel):
     files_scanned: int
     truncated: bool
     search_mode: SearchMode
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class GitContentSearchResponse(BaseModel):
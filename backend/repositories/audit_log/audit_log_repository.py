@@ -4,6 +4,7 @@ import json
 import logging
 from typing import List, Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from core.database import get_db_session
@@ -70,6 +71,31 @@ class AuditLogRepository:
             if should_close:
                 db.close()
 
+    def create_logs(self, rows: List[dict], db: Session = None) -> int:
+        """Insert prepared audit log rows in one multi-row INSERT and commit.
+
+        *rows* hold AuditLog column values with ``extra_data`` already
+        serialized.  Used by the batched audit log writer.
+        """
+        if not rows:
+            return 0
+
+        should_close = False
+        if db is None:
+            db = get_db_session()
+            should_close = True
+
+        try:
+            db.execute(insert(AuditLog), rows)
+            db.commit()
+            return len(rows)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            if should_close:
+                db.close()
+
     def get_logs(
         self,
         username: Optional[str] = None,
@@ -0,0 +1,390 @@
+"""Batched, non-blocking audit log writer.
+
+``AuditLogRepository.create_log`` commits one row per call on the caller's
+thread.  The writer instead queues events in process and a background
+thread stores them in multi-row inserts, every ``batch_size`` events or
+``flush_interval`` seconds, whichever comes first.
+
+Each queued event is also appended to a per-process Redis list (the
+journal) that is trimmed once its batch is committed.  A process keeps its
+journal alive with a heartbeat key; journals whose owner stopped beating
+(the process died before flushing) are claimed and replayed by the writer
+of another process; a claim expires like a heartbeat, so a replay cut short
+by a crash is picked up again.  Without Redis the writer still batches, it just
+cannot recover events of a crashed process.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Deque, List, Optional
+
+from repositories.audit_log.audit_log_repository import AuditLogRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 0.5  # seconds
+# How often a writer renews its heartbeat and looks for orphaned journals
+RECOVERY_INTERVAL = 30  # seconds
+# A journal whose heartbeat is older than this is considered orphaned
+HEARTBEAT_TTL = RECOVERY_INTERVAL * 4
+DEFAULT_KEY_PREFIX = "cockpit-audit"
+
+
+def _default_redis():
+    import redis
+
+    from config import settings
+
+    return redis.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        socket_timeout=1,
+        socket_connect_timeout=1,
+        **settings.redis_ssl_params,
+    )
+
+
+def _db_row(payload: str) -> dict:
+    row = json.loads(payload)
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    return row
+
+
+class AuditLogWriter:
+    """Queues audit events and writes them to the database in batches."""
+
+    def __init__(
+        self,
+        repository: Optional[AuditLogRepository] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        redis_factory: Optional[Callable[[], object]] = _default_redis,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+    ):
+        """Initialize the writer; nothing starts until the first event.
+
+        Args:
+            repository: Repository used for the multi-row inserts
+            batch_size: Events per insert; a full batch is flushed at once
+            flush_interval: Seconds a queued event waits at most
+            redis_factory: Returns the Redis client for the journal, or None
+                to run without one
+            key_prefix: Prefix of the journal and heartbeat keys
+        """
+        self._repo = repository or AuditLogRepository()
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._redis_factory = redis_factory
+        self._key_prefix = key_prefix
+        self._pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def write(
+        self,
+        username: str,
+        event_type: str,
+        message: str,
+        user_id: Optional[int] = None,
+        ip_address: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        resource_name: Optional[str] = None,
+        severity: str = "info",
+        extra_data: Optional[dict] = None,
+    ) -> None:
+        """Queue an audit event; arguments match ``create_log``.
+
+        Returns immediately.  The event keeps the time it was queued as its
+        ``created_at``.
+        """
+        self._ensure_started()
+        payload = json.dumps(
+            {
+                "username": username,
+                "user_id": user_id,
+                "event_type": event_type,
+                "message": message,
+                "ip_address": ip_address,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "resource_name": resource_name,
+                "severity": severity,
+                "extra_data": json.dumps(extra_data) if extra_data else None,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+        with self._lock:
+            self._pending.append(payload)
+            # Same order as the queue, so committed batches trim from the head
+            self._journal_push(payload)
+            if len(self._pending) >= self._batch_size:
+                self._wakeup.set()
+
+    def flush(self) -> int:
+        """Write all queued events now. Returns the number stored."""
+        if self._pid != os.getpid():
+            return 0
+
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = list(itertools.islice(self._pending, self._batch_size))
+                if not batch:
+                    return written
+                self._keep_alive()
+                stored = self._store(batch)
+                self._keep_alive()
+                if not stored:
+                    return written  # database unavailable, retried later
+                with self._lock:
+                    for _ in batch:
+                        self._pending.popleft()
+                    self._journal_trim(len(batch))
+                written += len(batch)
+
+    def pending(self) -> int:
+        """Number of events queued and not yet stored."""
+        if self._pid != os.getpid():
+            return 0
+        return len(self._pending)
+
+    def close(self) -> None:
+        """Flush the queue and release the journal (called at exit)."""
+        if self._pid != os.getpid():
+            return
+        self._stopped.set()
+        self._wakeup.set()
+        self.flush()
+        if not self._pending and self._redis:
+            try:
+                self._redis.delete(self._journal_key, self._alive_key)
+            except Exception as e:
+                logger.debug("Could not remove audit journal: %s", e)
+
+    # ------------------------------------------------------------------
+    # Background thread
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            # First event in this process (or in a forked child: the parent
+            # flushes what it had queued)
+            self._lock = threading.Lock()
+            self._flush_lock = threading.Lock()
+            self._pending: Deque[str] = deque()
+            self._wakeup = threading.Event()
+            self._stopped = threading.Event()
+            owner = "%s:%s:%s" % (
+                socket.gethostname(),
+                os.getpid(),
+                uuid.uuid4().hex[:8],
+            )
+            self._journal_key = f"{self._key_prefix}:journal:{owner}"
+            self._alive_key = f"{self._key_prefix}:alive:{owner}"
+            self._redis = None
+            self._last_beat = 0.0
+            self._connect_journal()
+            self._pid = os.getpid()
+            threading.Thread(
+                target=self._run, name="audit-log-writer", daemon=True
+            ).start()
+
+    def _run(self) -> None:
+        next_recovery = 0.0
+        while not self._stopped.is_set():
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+                if time.monotonic() >= next_recovery:
+                    next_recovery = time.monotonic() + RECOVERY_INTERVAL
+                    self._heartbeat()
+                    self._recover_orphans()
+            except Exception as e:
+                logger.error("Audit log writer iteration failed: %s", e)
+
+    def _store(self, batch: List[str]) -> bool:
+        """Insert *batch*; False if nothing could be stored."""
+        rows = [_db_row(payload) for payload in batch]
+        try:
+            self._repo.create_logs(rows)
+            return True
+        except Exception as e:
+            logger.warning("Batched audit insert of %s rows failed: %s", len(rows), e)
+
+        # Isolate rows the database rejects (e.g. a deleted user_id) so they
+        # do not block the queue; if none go in, the database is down.
+        stored = 0
+        for row in rows:
+            try:
+                self._repo.create_logs([row])
+                stored += 1
+            except Exception as e:
+                logger.error("Dropping audit log entry %s: %s", row, e)
+        return stored > 0
+
+    # ------------------------------------------------------------------
+    # Redis journal
+    # ------------------------------------------------------------------
+
+    def _connect_journal(self) -> None:
+        """(Re)connect the journal and rewrite it from the queue."""
+        if self._redis_factory is None:
+            return
+        try:
+            client = self._redis_factory()
+            with client.pipeline() as pipe:
+                pipe.delete(self._journal_key)
+                if self._pending:
+                    pipe.rpush(self._journal_key, *self._pending)
+                pipe.set(self._alive_key, "1", ex=HEARTBEAT_TTL)
+                pipe.execute()
+            self._redis = client
+            self._last_beat = time.monotonic()
+        except Exception as e:
+            logger.warning("Audit log journal unavailable: %s", e)
+            self._redis = None
+
+    def _journal_push(self, payload: str) -> None:
+        if not self._redis:
+            return
+        try:
+            self._redis.rpush(self._journal_key, payload)
+        except Exception as e:
+            # Stop journaling until the next heartbeat reconnects
+            logger.warning("Audit log journal unavailable: %s", e)
+            self._redis = None
+
+    def _journal_trim(self, count: int) -> None:
+        if not self._redis:
+            return
+        try:
+            self._redis.ltrim(self._journal_key, count, -1)
+        except Exception as e:
+            logger.warning("Audit log journal unavailable: %s", e)
+            self._redis = None
+
+    def _heartbeat(self) -> None:
+        with self._lock:
+            if not self._redis:
+                self._connect_journal()
+                return
+            try:
+                self._redis.set(self._alive_key, "1", ex=HEARTBEAT_TTL)
+                self._last_beat = time.monotonic()
+            except Exception as e:
+                logger.warning("Audit log journal unavailable: %s", e)
+                self._redis = None
+
+    def _keep_alive(self) -> None:
+        """Renew the heartbeat if it is due, e.g. around a slow insert.
+
+        A flush that blocks on the database must not let the heartbeat lapse,
+        or a peer replays the journal and the rows are stored twice.
+        """
+        client = self._redis
+        if not client or time.monotonic() - self._last_beat < RECOVERY_INTERVAL:
+            return
+        try:
+            client.set(self._alive_key, "1", ex=HEARTBEAT_TTL)
+            self._last_beat = time.monotonic()
+        except Exception as e:
+            logger.debug("Could not renew audit journal heartbeat: %s", e)
+
+    def _recover_orphans(self) -> int:
+        """Store the journals of writers whose heartbeat expired.
+
+        A journal is claimed by renaming it to ``recovering:<id>`` under a
+        ``claim:<id>`` key that expires like a heartbeat.  Journals whose
+        claim expired (the replaying process died too) are claimed again.
+        """
+        if not self._redis:
+            return 0
+        prefix = f"{self._key_prefix}:journal:"
+        recovering = f"{self._key_prefix}:recovering:"
+        recovered = 0
+        for key in list(self._redis.scan_iter(match=f"{prefix}*", count=100)):
+            owner = key[len(prefix) :]
+            if key == self._journal_key or self._redis.exists(
+                f"{self._key_prefix}:alive:{owner}"
+            ):
+                continue
+            claim_id = uuid.uuid4().hex
+            # Claim first, so the renamed journal is never seen unclaimed
+            self._redis.set(self._claim_key(claim_id), "1", ex=HEARTBEAT_TTL)
+            try:
+                # Atomic claim: only one writer wins the rename
+                self._redis.rename(key, f"{recovering}{claim_id}")
+            except Exception:
+                self._redis.delete(self._claim_key(claim_id))
+                continue
+            stored = self._replay(claim_id)
+            if stored is None:
+                return recovered
+            recovered += stored
+            logger.info(
+                "Recovered %s audit log entries from orphaned journal %s",
+                stored,
+                owner,
+            )
+        for key in list(self._redis.scan_iter(match=f"{recovering}*", count=100)):
+            claim_id = key[len(recovering) :]
+            if not self._redis.set(
+                self._claim_key(claim_id), "1", ex=HEARTBEAT_TTL, nx=True
+            ):
+                continue  # another writer is replaying it
+            stored = self._replay(claim_id)
+            if stored is None:
+                return recovered
+            recovered += stored
+            logger.info(
+                "Recovered %s audit log entries from abandoned replay %s",
+                stored,
+                claim_id,
+            )
+        return recovered
+
+    def _claim_key(self, claim_id: str) -> str:
+        return f"{self._key_prefix}:claim:{claim_id}"
+
+    def _replay(self, claim_id: str) -> Optional[int]:
+        """Store the claimed journal *claim_id*; None if the database is down.
+
+        On failure the stored part is trimmed off and the claim released, so
+        the rest is retried by the next recovery of any writer.
+        """
+        claimed = f"{self._key_prefix}:recovering:{claim_id}"
+        claim_key = self._claim_key(claim_id)
+        payloads = self._redis.lrange(claimed, 0, -1)
+        for start in range(0, len(payloads), self._batch_size):
+            self._redis.expire(claim_key, HEARTBEAT_TTL)
+            self._keep_alive()
+            if not self._store(payloads[start : start + self._batch_size]):
+                self._redis.ltrim(claimed, start, -1)
+                self._redis.delete(claim_key)
+                return None
+        self._redis.delete(claimed, claim_key)
+        return len(payloads)
+
+
+audit_log_writer = AuditLogWriter()
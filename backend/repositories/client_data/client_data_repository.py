@@ -5,25 +5,40 @@ Provides bulk insert and query operations for the three client data tables:
   - client_ip_addresses  (ARP table entries)
   - client_mac_addresses (MAC address table entries)
   - client_hostnames     (DNS-resolved hostnames)
+
+and maintains client_data_rows, their correlated result for the latest
+collection session, which backs the paginated client table.
 """
 
+import ipaddress
 import logging
+import re
 from datetime import datetime
-from typing import List, NamedTuple, Optional, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from sqlalchemy import (
+    Text,
     and_,
-    bindparam,
+    cast,
     delete,
     func,
+    insert,
+    literal_column,
     nulls_last,
     select,
+    text,
     union,
     union_all,
 )
+from sqlalchemy.dialects.postgresql import INET
 
 from core.database import get_db_session
-from core.models import ClientHostname, ClientIpAddress, ClientMacAddress
+from core.models import (
+    ClientDataRow,
+    ClientHostname,
+    ClientIpAddress,
+    ClientMacAddress,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +51,106 @@ class ClientDataCleanupResult(NamedTuple):
     host: int
 
 
+_MAC_SEPARATORS = re.compile(r"[.:\-\s]")
+_HEX = re.compile(r"^[0-9a-f]+$")
+# Leading octets of a MAC, e.g. an OUI: "00:1b:54", "00-1b-54-"
+_MAC_PREFIX = re.compile(r"^([0-9a-f]{2}[:-])+([0-9a-f]{2})?$")
+
+
+def _normalize_mac(value: Optional[str]) -> Optional[str]:
+    """Return *value* as ``aa:bb:cc:dd:ee:ff``, or None if it is no MAC address.
+
+    Accepts Cisco dotted (aabb.cc00.0100), colon, hyphen and bare notation.
+    """
+    if not value:
+        return None
+    digits = _MAC_SEPARATORS.sub("", value).lower()
+    if len(digits) != 12 or not _HEX.match(digits):
+        return None
+    return ":".join(digits[i : i + 2] for i in range(0, 12, 2))
+
+
+def _normalize_ip(value: Optional[str]) -> Optional[str]:
+    """Return *value* as a canonical IPv4/IPv6 address, or None if invalid."""
+    if not value:
+        return None
+    try:
+        return str(ipaddress.ip_address(value.strip()))
+    except ValueError:
+        return None
+
+
+# column -> (normalizer, required); rows missing a required address are skipped
+_IP_ADDRESS_FIELDS = {
+    "ip_address": (_normalize_ip, True),
+    "mac_address": (_normalize_mac, False),
+    "device_ip": (_normalize_ip, False),
+}
+_MAC_ADDRESS_FIELDS = {
+    "mac_address": (_normalize_mac, True),
+    "device_ip": (_normalize_ip, False),
+}
+_HOSTNAME_FIELDS = {
+    "ip_address": (_normalize_ip, True),
+    "device_ip": (_normalize_ip, False),
+}
+
+
+def _normalize_records(
+    records: List[dict],
+    fields: Dict[str, Tuple[Callable[[Optional[str]], Optional[str]], bool]],
+    kind: str,
+) -> List[dict]:
+    """Normalize the address columns of *records* for macaddr/inet storage."""
+    rows = []
+    for record in records:
+        row = dict(record)
+        for name, (normalize, required) in fields.items():
+            row[name] = normalize(row.get(name))
+            if row[name] is None and required:
+                break
+        else:
+            rows.append(row)
+    if len(rows) < len(records):
+        logger.warning(
+            "Skipped %s %s record(s) with an invalid address",
+            len(records) - len(rows),
+            kind,
+        )
+    return rows
+
+
+def _ip_condition(column, value: str):
+    """Subnet containment for CIDR input ("10.1.0.0/16"), else a partial match."""
+    value = value.strip()
+    if "/" in value:
+        try:
+            network = ipaddress.ip_network(value, strict=False)
+        except ValueError:
+            pass
+        else:
+            return column.op("<<=")(cast(str(network), INET))
+    return func.host(column).ilike(f"%{value}%")
+
+
+def _mac_condition(column, value: str):
+    """Prefix match for colon/hyphen octets ("00:1b:54"), else a partial match.
+
+    Both compare hex digits only, so any MAC notation finds the stored value.
+    """
+    value = value.strip().lower()
+    digits = _MAC_SEPARATORS.sub("", value)
+    if not _HEX.match(digits):
+        return cast(column, Text).ilike(f"%{value}%")
+    # Literals, so the expression matches idx_client_data_rows_mac_digits_trgm
+    stored_digits = func.replace(
+        cast(column, Text), literal_column("':'"), literal_column("''")
+    )
+    if _MAC_PREFIX.match(value):
+        return stored_digits.like(f"{digits}%")
+    return stored_digits.like(f"%{digits}%")
+
+
 def _ranked_session_ids_statement():
     """Select session_id ordered by newest collection (union of MAC + IP tables).
 
@@ -206,10 +321,15 @@ def _client_data_combined_cte():
 
 
 class ClientDataRepository:
-    """Bulk insert operations for the three client data tables."""
+    """Bulk insert operations for the three client data tables.
+
+    MAC and IP addresses are stored as PostgreSQL macaddr/inet; the bulk
+    inserts accept any common notation and skip rows without a valid address.
+    """
 
     def bulk_insert_ip_addresses(self, records: List[dict]) -> int:
         """Insert ARP table entries. Returns count inserted."""
+        records = _normalize_records(records, _IP_ADDRESS_FIELDS, "ARP")
         if not records:
             return 0
         with get_db_session() as session:
@@ -220,6 +340,7 @@ class ClientDataRepository:
 
     def bulk_insert_mac_addresses(self, records: List[dict]) -> int:
         """Insert MAC address table entries. Returns count inserted."""
+        records = _normalize_records(records, _MAC_ADDRESS_FIELDS, "MAC table")
         if not records:
             return 0
         with get_db_session() as session:
@@ -230,6 +351,7 @@ class ClientDataRepository:
 
     def bulk_insert_hostnames(self, records: List[dict]) -> int:
         """Insert DNS-resolved hostname entries. Returns count inserted."""
+        records = _normalize_records(records, _HOSTNAME_FIELDS, "hostname")
         if not records:
             return 0
         with get_db_session() as session:
@@ -260,6 +382,9 @@ class ClientDataRepository:
                 .delete(synchronize_session=False)
             )
             session.commit()
+        if n_ip or n_mac or n_host:
+            # The latest session may have aged out as well
+            self.refresh_client_data()
         return ClientDataCleanupResult(ip=n_ip, mac=n_mac, host=n_host)
 
     def get_device_names(self) -> List[str]:
@@ -304,6 +429,63 @@ class ClientDataRepository:
             session.commit()
         logger.debug("Deleted client data sessions beyond the most recent %s", keep)
 
+    def refresh_client_data(self) -> int:
+        """Rebuild ``client_data_rows`` from the latest collection session.
+
+        Runs the correlation query of ``_client_data_combined_cte`` once and
+        stores its result, numbered in display order, so page requests only
+        read the materialized rows.  The swap happens in one transaction:
+        readers keep seeing the previous rows until it commits.  Returns the
+        number of rows materialized.
+        """
+        combined = _client_data_combined_cte()
+        position = func.row_number().over(
+            order_by=(
+                nulls_last(combined.c.ip_address.asc()),
+                combined.c.mac_address,
+                combined.c.device_name,
+            )
+        )
+        columns = [
+            "position",
+            "session_id",
+            "mac_address",
+            "port",
+            "vlan",
+            "vrf",
+            "ip_address",
+            "hostname",
+            "device_name",
+            "collected_at",
+        ]
+        source = select(
+            position,
+            *(combined.c[name] for name in columns[1:]),
+        ).select_from(combined)
+
+        with get_db_session() as session:
+            if session.bind.dialect.name == "postgresql":
+                # Serialize concurrent refreshes; readers are not blocked
+                session.execute(text("LOCK TABLE client_data_rows IN EXCLUSIVE MODE"))
+            session.execute(delete(ClientDataRow))
+            result = session.execute(insert(ClientDataRow).from_select(columns, source))
+            session.commit()
+        logger.debug("Materialized %s client data rows", result.rowcount)
+        return result.rowcount
+
+    def materialize_if_empty(self) -> int:
+        """Run ``refresh_client_data`` if ``client_data_rows`` is empty.
+
+        Called on startup, so data collected before ``client_data_rows``
+        existed is listed without waiting for the next collection.  Returns
+        the number of rows materialized.
+        """
+        with get_db_session() as session:
+            materialized = session.execute(select(ClientDataRow.id).limit(1)).first()
+        if materialized is not None:
+            return 0
+        return self.refresh_client_data()
+
     def get_client_data(
         self,
         device_name: Optional[str] = None,
@@ -315,10 +497,13 @@ class ClientDataRepository:
         hostname: Optional[str] = None,
         page: int = 1,
         page_size: int = 50,
+        cursor: Optional[int] = None,
     ) -> Tuple[List[dict], int]:
         """Return correlated client data with pagination.
 
-        Query strategy (MAC-centric, one row per MAC+device observation):
+        Rows are read from ``client_data_rows``, which holds the result of
+        the correlation query for the latest session (see
+        ``_client_data_combined_cte`` and ``refresh_client_data``):
 
         1. mac_table_entries  — one row per (mac, device) from the MAC address
            table; provides port and VLAN.
@@ -333,108 +518,74 @@ class ClientDataRepository:
         6. combined           — joins everything; ip_address is
            COALESCE(same-device ARP, cross-device ARP).
 
-        Filters are applied on the outer combined result so ILIKE can operate on
-        the computed ip_address column.  Returns (rows, total_count).
+        Filters are partial, case-insensitive matches served by the trigram
+        indexes.  *ip_address* may also be a CIDR ("10.1.0.0/16") to find
+        the clients inside that subnet, and *mac_address* given as leading
+        octets ("00:1b:54") matches by prefix to find an OUI.
+        When *cursor* is given (the ``position`` of the last row of the
+        previous page) the page starts after it instead of at *page*.
+        Returns (rows, total_count).
         """
-        combined = _client_data_combined_cte()
-        conditions = []
-        params: dict = {}
-
-        if device_name:
-            conditions.append(
-                combined.c.device_name.ilike(
-                    func.concat("%", bindparam("device_name_filter"), "%")
-                )
-            )
-            params["device_name_filter"] = device_name
-
+        row = ClientDataRow
+        filters = (
+            (row.device_name, device_name),
+            (row.port, port),
+            (row.vlan, vlan),
+            (row.vrf, vrf),
+            (row.hostname, hostname),
+        )
+        conditions = [column.ilike(f"%{value}%") for column, value in filters if value]
         if ip_address:
-            conditions.append(
-                combined.c.ip_address.ilike(
-                    func.concat("%", bindparam("ip_address"), "%")
-                )
-            )
-            params["ip_address"] = ip_address
-
+            conditions.append(_ip_condition(row.ip_address, ip_address))
         if mac_address:
-            conditions.append(
-                combined.c.mac_address.ilike(
-                    func.concat("%", bindparam("mac_address"), "%")
-                )
-            )
-            params["mac_address"] = mac_address
-
-        if port:
-            conditions.append(
-                combined.c.port.ilike(func.concat("%", bindparam("port"), "%"))
-            )
-            params["port"] = port
-
-        if vlan:
-            conditions.append(
-                combined.c.vlan.ilike(func.concat("%", bindparam("vlan"), "%"))
-            )
-            params["vlan"] = vlan
+            conditions.append(_mac_condition(row.mac_address, mac_address))
 
-        if vrf:
-            conditions.append(
-                combined.c.vrf.ilike(func.concat("%", bindparam("vrf"), "%"))
-            )
-            params["vrf"] = vrf
+        if conditions:
+            count_stmt = select(func.count()).select_from(row).where(*conditions)
+        else:
+            # Positions are dense, so the unfiltered total is the last one
+            count_stmt = select(func.coalesce(func.max(row.position), 0))
 
-        if hostname:
-            conditions.append(
-                combined.c.hostname.ilike(func.concat("%", bindparam("hostname"), "%"))
-            )
-            params["hostname"] = hostname
-
-        where_clause = and_(*conditions) if conditions else None
-
-        count_stmt = select(func.count()).select_from(combined)
-        if where_clause is not None:
-            count_stmt = count_stmt.where(where_clause)
-
-        offset = (page - 1) * page_size
-        data_stmt = select(
-            combined.c.mac_address,
-            combined.c.port,
-            combined.c.vlan,
-            combined.c.vrf,
-            combined.c.ip_address,
-            combined.c.hostname,
-            combined.c.device_name,
-            combined.c.session_id,
-            combined.c.collected_at,
-        ).select_from(combined)
-        if where_clause is not None:
-            data_stmt = data_stmt.where(where_clause)
         data_stmt = (
-            data_stmt.order_by(
-                nulls_last(combined.c.ip_address.asc()),
-                combined.c.mac_address,
-                combined.c.device_name,
+            select(
+                row.mac_address,
+                row.port,
+                row.vlan,
+                row.vrf,
+                row.ip_address,
+                row.hostname,
+                row.device_name,
+                row.session_id,
+                row.collected_at,
+                row.position,
             )
+            .where(*conditions)
+            .order_by(row.position)
             .limit(page_size)
-            .offset(offset)
         )
+        if cursor is not None:
+            data_stmt = data_stmt.where(row.position > cursor)
+        else:
+            data_stmt = data_stmt.offset((page - 1) * page_size)
 
         with get_db_session() as session:
-            total = session.execute(count_stmt, params).scalar() or 0
-            rows = session.execute(data_stmt, params).fetchall()
+            total = session.execute(count_stmt).scalar() or 0
+            rows = session.execute(data_stmt).fetchall()
 
         items = [
             {
-                "mac_address": row[0],
-                "port": row[1],
-                "vlan": row[2],
-                "vrf": row[3],
-                "ip_address": row[4],
-                "hostname": row[5],
-                "device_name": row[6],
-                "session_id": row[7],
-                "collected_at": row[8].isoformat() if row[8] else None,
+                "mac_address": r[0],
+                "port": r[1],
+                "vlan": r[2],
+                "vrf": r[3],
+                "ip_address": r[4],
+                "hostname": r[5],
+                "device_name": r[6],
+                "session_id": r[7],
+                "collected_at": r[8].isoformat() if r[8] else None,
+                "position": r[9],
             }
-            for row in rows
+            for r in rows
         ]
         return items, total
 
@@ -454,6 +605,9 @@ class ClientDataRepository:
             "mac_history": [],
             "hostname_history": [],
         }
+        # Addresses that do not parse cannot match a macaddr/inet column
+        ip_address = _normalize_ip(ip_address)
+        mac_address = _normalize_mac(mac_address)
 
         with get_db_session() as session:
             if ip_address:
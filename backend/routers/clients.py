@@ -46,9 +46,13 @@ async def get_client_devices(
 @router.get("/data", response_model=ClientDataPageResponse)
 async def get_client_data(
     device_name: Optional[str] = Query(None, description="Filter by device name"),
-    ip_address: Optional[str] = Query(None, description="Filter IP address (partial)"),
+    ip_address: Optional[str] = Query(
+        None, description="Filter IP address (partial, or CIDR such as 10.1.0.0/16)"
+    ),
     mac_address: Optional[str] = Query(
-        None, description="Filter MAC address (partial)"
+        None,
+        description="Filter MAC address (partial in any notation, or leading "
+        "octets such as 00:1b:54)",
     ),
     port: Optional[str] = Query(None, description="Filter port (partial)"),
     vlan: Optional[str] = Query(None, description="Filter VLAN (partial)"),
@@ -56,6 +60,12 @@ async def get_client_data(
     hostname: Optional[str] = Query(None, description="Filter hostname (partial)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=500, description="Rows per page"),
+    cursor: Optional[int] = Query(
+        None,
+        ge=0,
+        description="next_cursor of the previous page; continues after it "
+        "instead of using page",
+    ),
     _: dict = Depends(require_permission("server_clients.clients", "read")),
     client_data: ClientDataService = Depends(get_client_data_service),
 ) -> ClientDataPageResponse:
@@ -71,12 +81,14 @@ async def get_client_data(
             hostname=hostname,
             page=page,
             page_size=page_size,
+            cursor=cursor,
         )
         return ClientDataPageResponse(
             items=[ClientDataTableRow.model_validate(row) for row in items],
             total=total,
             page=page,
             page_size=page_size,
+            next_cursor=items[-1]["position"] if len(items) == page_size else None,
         )
     except Exception as exc:
         raise_internal_server_error(logger, "Failed to get client data", exc)
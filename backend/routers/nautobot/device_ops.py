@@ -26,6 +26,12 @@ from services.nautobot.offboarding.service import OffboardingService
 from services.nautobot.offboarding.virtual_chassis_cleanup import (
     VirtualChassisCleanupManager,
 )
+from services.nautobot_helpers import (
+    DEVICE_CACHE_TTL,
+    CacheAside,
+    get_device_details_cache_key,
+    get_device_list_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["nautobot-device-ops"])
@@ -108,16 +114,11 @@ async def delete_device(
         cache_key = f"nautobot:devices:{device_id}"
         cache_service.delete(cache_key)
 
-        # Clear device details cache
-        details_cache_key = f"nautobot:device_details:{device_id}"
-        cache_service.delete(details_cache_key)
-
-        # Clear device list caches to force refresh
-        cache_keys_to_clear = [
-            "nautobot:devices:list:all",
-        ]
-        for key in cache_keys_to_clear:
-            cache_service.delete(key)
+        # Clear device details and list caches to force refresh; they are
+        # written through CacheAside, so in-flight rebuilds must not restore them
+        cache_aside = CacheAside(cache_service, DEVICE_CACHE_TTL)
+        cache_aside.invalidate(get_device_details_cache_key(device_id))
+        cache_aside.invalidate(get_device_list_cache_key())
 
         audit_log.log_event(
             username=current_user.get("sub"),
@@ -18,7 +18,11 @@ if TYPE_CHECKING:
     from services.agents.deployment_service import AgentDeploymentService
     from services.agents.template_render_service import AgentTemplateRenderService
     from services.checkmk.activation_service import CheckMKActivationService
-    from services.checkmk.client import CheckMKClient, CheckMKConnectionService
+    from services.checkmk.client import (
+        AsyncCheckMKClient,
+        CheckMKClient,
+        CheckMKConnectionService,
+    )
     from services.checkmk.discovery_service import CheckMKDiscoveryService
     from services.checkmk.host_group_service import CheckMKHostGroupService
     from services.checkmk.host_service import CheckMKHostService
@@ -55,6 +59,17 @@ def build_checkmk_client(site_name: Optional[str] = None) -> CheckMKClient:
     return CheckMKClientFactory.build_client_from_settings(site_name=site_name)
 
 
+def build_async_checkmk_client(site_name: Optional[str] = None) -> AsyncCheckMKClient:
+    """Create an async, connection-pooled CheckMK client from database settings.
+
+    The caller owns the client and must ``await client.aclose()`` (or use
+    ``async with``) when done.
+    """
+    from services.checkmk.base import CheckMKClientFactory
+
+    return CheckMKClientFactory.build_async_client_from_settings(site_name=site_name)
+
+
 def build_inventory_persistence_service() -> InventoryPersistenceService:
     """Create a new InventoryPersistenceService instance (PostgreSQL CRUD)."""
     from repositories.inventory.inventory_repository import InventoryRepository
@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 
 from git.exc import GitCommandError
 
+from services.git.file_catalog import invalidate_file_catalog
+
 logger = logging.getLogger(__name__)
 
 
@@ -133,6 +135,7 @@ class AgentDeploymentService:
         Callers merge their own fields via extra_result_fields.
         """
         self._update_progress(task_context, 75, "Committing and pushing changes...")
+        invalidate_file_catalog(repo_dict.get("id"))
 
         current_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         result = self._commit_and_push(repo_dict, repo, file_paths, commit_message)
@@ -1,19 +1,22 @@
-"""Application audit trail — router-facing API over AuditLogRepository."""
+"""Application audit trail — router-facing API over the audit log writer."""
 
 from __future__ import annotations
 
 from typing import Any
 
-from core.models import AuditLog
-from repositories.audit_log.audit_log_repository import AuditLogRepository
+from repositories.audit_log.audit_log_writer import AuditLogWriter, audit_log_writer
 
 
 class AuditLogService:
     """Thin service so routers do not import the repository directly."""
 
-    def __init__(self, repository: AuditLogRepository | None = None) -> None:
-        self._repo = repository or AuditLogRepository()
+    def __init__(self, writer: AuditLogWriter | None = None) -> None:
+        self._writer = writer or audit_log_writer
 
-    def log_event(self, **kwargs: Any) -> AuditLog:
-        """Persist an audit row; keyword arguments match ``create_log``."""
-        return self._repo.create_log(**kwargs)
+    def log_event(self, **kwargs: Any) -> None:
+        """Queue an audit row; keyword arguments match ``create_log``.
+
+        The row is stored in the next batch, so requests do not wait for a
+        commit per audit line.
+        """
+        self._writer.write(**kwargs)
@@ -5,50 +5,16 @@ Background jobs for caching device data from Nautobot into Redis.
 
 import asyncio
 import logging
-from typing import Any, Dict
+import uuid
+from typing import Any, Dict, Tuple
 
 from celery import shared_task
 
 logger = logging.getLogger(__name__)
 
 
-@shared_task(bind=True, name="cache_all_devices")
-def cache_all_devices_task(self, job_run_id: int = None) -> Dict[str, Any]:
-    """
-    Celery task to fetch all devices from Nautobot and cache them in Redis.
-
-    This task:
-    1. Fetches all devices from Nautobot via GraphQL
-    2. Caches each device individually with key: nautobot:devices:{device_id}
-    3. Caches a lightweight bulk collection with key: nautobot:devices:all
-    4. Reports progress via Celery task state updates
-
-    Returns:
-        Dictionary with task results (status, cached count, failed count)
-    """
-    try:
-        logger.info("Starting cache_all_devices task: %s", self.request.id)
-
-        # Import here to avoid circular dependencies
-        import service_factory
-
-        nautobot_service = service_factory.build_nautobot_service()
-        cache_service = service_factory.build_cache_service()
-        from services.background_jobs.base import (
-            extract_device_essentials,
-            format_progress_message,
-            safe_graphql_query,
-        )
-
-        # Update task state
-        self.update_state(
-            state="PROGRESS", meta={"status": "Fetching devices from Nautobot..."}
-        )
-
-        # GraphQL query for all devices
-        query = """
-        query getAllDevices {
-          devices {
+# GraphQL selection set cached for every device (paged bulk fetch).
+DEVICE_CACHE_FIELDS = """
             id
             name
             role {
@@ -78,16 +44,174 @@ def cache_all_devices_task(self, job_run_id: int = None) -> Dict[str, Any]:
             serial
             asset_tag
             comments
-          }
-        }
-        """
+"""
 
-        # Execute GraphQL query
-        result = asyncio.run(nautobot_service.graphql_query(query, {}))
+# Cache configuration
+DEVICE_TTL = 3600  # 1 hour
 
-        # Validate GraphQL result
-        success, error_msg, data = safe_graphql_query(result)
-        if not success:
+
+async def _cache_device_pages(
+    task, nautobot_service, cache_service, bulk
+) -> Tuple[int, int]:
+    """Fetch devices page by page and cache each page as it arrives.
+
+    Full device payloads are written to Redis and their lightweight records
+    appended to the staged bulk collection *bulk*, so only the current pages
+    are held in memory.
+
+    Returns:
+        Tuple of (cached_count, failed_count)
+    """
+    from services.background_jobs.base import extract_device_essentials
+
+    cached_count = 0
+    failed_count = 0
+
+    async for page in nautobot_service.iter_device_pages(DEVICE_CACHE_FIELDS):
+        page_entries: Dict[str, Any] = {}
+        for device in page:
+            device_id = device.get("id")
+            if not device_id:
+                logger.warning(
+                    "Task %s: Device %s has no ID, skipping",
+                    task.request.id,
+                    device.get("name", "unknown"),
+                )
+                failed_count += 1
+                continue
+            page_entries[f"nautobot:devices:{device_id}"] = device
+
+        # Cache full device data for the whole page in pipelined writes
+        written = cache_service.set_many(page_entries, DEVICE_TTL)
+        cached_count += written
+        failed_count += len(page_entries) - written
+        if written < len(page_entries):
+            logger.error(
+                "Task %s: Failed to cache %s devices of a page",
+                task.request.id,
+                len(page_entries) - written,
+            )
+
+        bulk.extend(
+            extract_device_essentials(device) for device in page_entries.values()
+        )
+
+        progress_msg = "Cached %d devices (%d failed)" % (cached_count, failed_count)
+        task.update_state(
+            state="PROGRESS",
+            meta={
+                "current": cached_count + failed_count,
+                "cached": cached_count,
+                "failed": failed_count,
+                "status": progress_msg,
+            },
+        )
+        logger.info("Task %s: %s", task.request.id, progress_msg)
+
+    return cached_count, failed_count
+
+
+async def _stage_ip_records(nautobot_service, ip_index) -> None:
+    """Fetch all IP addresses page by page into the staged prefix index."""
+    from services.inventory.prefix_index import IP_INDEX_FIELDS, compact_ip_record
+
+    query = f"""
+    query paged_ip_addresses($limit: Int, $offset: Int) {{
+      ip_addresses(limit: $limit, offset: $offset) {{
+        {IP_INDEX_FIELDS}
+      }}
+    }}
+    """
+    async for page in nautobot_service.paginate_graphql(query, "ip_addresses"):
+        records = (compact_ip_record(ip_address) for ip_address in page)
+        ip_index.extend(record for record in records if record is not None)
+
+
+async def _cache_device_data(
+    task, nautobot_service, cache_service, bulk, ip_index
+) -> Tuple[int, int, bool]:
+    """Stage the devices and, if there are any, the IP prefix index.
+
+    Runs every Nautobot call of the task in one event loop.
+
+    Returns:
+        Tuple of (cached_count, failed_count, ip_index_staged)
+    """
+    cached_count, failed_count = await _cache_device_pages(
+        task, nautobot_service, cache_service, bulk
+    )
+    if cached_count + failed_count == 0:
+        return cached_count, failed_count, False
+
+    # Inventory prefix conditions fall back to live Nautobot queries when the
+    # index is missing, so a failure is not fatal
+    task.update_state(
+        state="PROGRESS", meta={"status": "Fetching IP addresses from Nautobot..."}
+    )
+    try:
+        await _stage_ip_records(nautobot_service, ip_index)
+        return cached_count, failed_count, True
+    except Exception as e:
+        logger.warning(
+            "Task %s: Failed to build IP prefix index: %s", task.request.id, e
+        )
+        return cached_count, failed_count, False
+
+
+@shared_task(bind=True, name="cache_all_devices")
+def cache_all_devices_task(self, job_run_id: int = None) -> Dict[str, Any]:
+    """
+    Celery task to fetch all devices from Nautobot and cache them in Redis.
+
+    This task:
+    1. Fetches all devices from Nautobot via paged GraphQL queries
+    2. Caches each device individually with key: nautobot:devices:{device_id}
+    3. Caches a lightweight bulk collection with key: nautobot:devices:all
+       and a version stamp with key: nautobot:devices:all:version
+    4. Caches the IP prefix index of all device addresses with key:
+       nautobot:devices:ip_index
+    5. Reports progress via Celery task state updates
+
+    The bulk collection and the IP index are staged in Redis page by page
+    and published together once all pages are in.
+
+    Returns:
+        Dictionary with task results (status, cached count, failed count)
+    """
+    try:
+        logger.info("Starting cache_all_devices task: %s", self.request.id)
+
+        # Import here to avoid circular dependencies
+        import service_factory
+        from services.inventory.device_index import BULK_CACHE_KEY, BULK_VERSION_KEY
+        from services.inventory.prefix_index import IP_INDEX_KEY
+        from services.nautobot.common.exceptions import NautobotAPIError
+
+        nautobot_service = service_factory.build_nautobot_service()
+        cache_service = service_factory.build_cache_service()
+
+        # Update task state
+        self.update_state(
+            state="PROGRESS", meta={"status": "Fetching devices from Nautobot..."}
+        )
+
+        # New version stamp so in-process device indexes know to rebuild
+        version = uuid.uuid4().hex
+        bulk = cache_service.stage_list(BULK_CACHE_KEY, DEVICE_TTL)
+        ip_index = cache_service.stage_list(
+            IP_INDEX_KEY, DEVICE_TTL, envelope={"version": version}, field="records"
+        )
+
+        try:
+            cached_count, failed_count, ip_indexed = asyncio.run(
+                _cache_device_data(
+                    self, nautobot_service, cache_service, bulk, ip_index
+                )
+            )
+        except NautobotAPIError as e:
+            bulk.discard()
+            ip_index.discard()
+            error_msg = str(e)
             logger.error("Task %s: %s", self.request.id, error_msg)
             return {
                 "status": "failed",
@@ -96,10 +220,11 @@ def cache_all_devices_task(self, job_run_id: int = None) -> Dict[str, Any]:
                 "failed": 0,
             }
 
-        devices = data.get("devices", [])
-        total_devices = len(devices)
+        total_devices = cached_count + failed_count
 
         if total_devices == 0:
+            bulk.discard()
+            ip_index.discard()
             logger.warning("Task %s: No devices found in Nautobot", self.request.id)
             return {
                 "status": "completed",
@@ -108,78 +233,23 @@ def cache_all_devices_task(self, job_run_id: int = None) -> Dict[str, Any]:
                 "failed": 0,
             }
 
-        logger.info("Task %s: Processing %s devices", self.request.id, total_devices)
-
-        # Cache configuration
-        DEVICE_TTL = 3600  # 1 hour
-
-        # Track progress
-        cached_count = 0
-        failed_count = 0
-        lightweight_devices = []
-
-        # Cache each device individually
-        for i, device in enumerate(devices):
-            try:
-                device_id = device.get("id")
-                device_name = device.get("name", f"device_{i}")
-
-                if not device_id:
-                    logger.warning(
-                        "Task %s: Device %s has no ID, skipping",
-                        self.request.id,
-                        device_name,
-                    )
-                    failed_count += 1
-                    continue
-
-                # Cache full device data
-                cache_key = f"nautobot:devices:{device_id}"
-                cache_service.set(cache_key, device, DEVICE_TTL)
-                cached_count += 1
-
-                # Collect lightweight data for bulk cache
-                lightweight_devices.append(extract_device_essentials(device))
-
-                # Update progress every 50 devices or on last device
-                if (i + 1) % 50 == 0 or i == total_devices - 1:
-                    progress_msg = format_progress_message(
-                        cached_count, total_devices, "Cached"
-                    )
-                    self.update_state(
-                        state="PROGRESS",
-                        meta={
-                            "current": i + 1,
-                            "total": total_devices,
-                            "cached": cached_count,
-                            "failed": failed_count,
-                            "status": progress_msg,
-                        },
-                    )
-                    logger.info("Task %s: %s", self.request.id, progress_msg)
-
-            except Exception as e:
-                failed_count += 1
-                logger.error(
-                    "Task %s: Failed to cache device %s: %s",
-                    self.request.id,
-                    device.get("name", "unknown"),
-                    e,
-                )
+        logger.info("Task %s: Processed %s devices", self.request.id, total_devices)
 
-        # Cache bulk collection with lightweight device data
-        try:
-            bulk_cache_key = "nautobot:devices:all"
-            cache_service.set(bulk_cache_key, lightweight_devices, DEVICE_TTL)
+        # Publish the bulk collection and IP index, then their version
+        if bulk.commit():
+            if ip_indexed:
+                ip_index.commit()
+            else:
+                ip_index.discard()
+            cache_service.set(BULK_VERSION_KEY, version, DEVICE_TTL)
             logger.info(
                 "Task %s: Cached bulk collection with %s devices",
                 self.request.id,
-                len(lightweight_devices),
-            )
-        except Exception as e:
-            logger.error(
-                "Task %s: Failed to cache bulk collection: %s", self.request.id, e
+                bulk.count,
             )
+        else:
+            ip_index.discard()
+            logger.error("Task %s: Failed to cache bulk collection", self.request.id)
 
         # Determine final status
         if failed_count == 0:
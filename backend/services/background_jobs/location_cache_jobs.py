@@ -9,6 +9,11 @@ from typing import Any, Dict
 
 from celery import shared_task
 
+from services.inventory.location_tree import (
+    LOCATION_CLOSURE_KEY,
+    build_location_closure,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +25,10 @@ def cache_all_locations_task(self, job_run_id: int = None) -> Dict[str, Any]:
     This task:
     1. Fetches all locations from Nautobot via GraphQL
     2. Caches the location list with key: nautobot:locations:list
-    3. Reports progress via Celery task state updates
+       and each location with key: nautobot:locations:{location_id}
+    3. Caches the parent→descendants closure table with key:
+       nautobot:locations:closure
+    4. Reports progress via Celery task state updates
 
     Returns:
         Dictionary with task results (status, cached count)
@@ -108,9 +116,16 @@ def cache_all_locations_task(self, job_run_id: int = None) -> Dict[str, Any]:
             },
         )
 
-        # Cache the locations list
-        cache_key = "nautobot:locations:list"
-        cache_service.set(cache_key, locations, LOCATION_TTL)
+        # Cache the locations list, each location by ID and the hierarchy
+        # closure used by inventory location filters in one pipeline
+        entries = {
+            "nautobot:locations:list": locations,
+            LOCATION_CLOSURE_KEY: build_location_closure(locations),
+        }
+        for location in locations:
+            if location.get("id"):
+                entries[f"nautobot:locations:{location['id']}"] = location
+        cache_service.set_many(entries, LOCATION_TTL)
 
         logger.info(
             "Task %s: Successfully cached %s locations",
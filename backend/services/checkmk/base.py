@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
-    from services.checkmk.client import CheckMKClient
+    from services.checkmk.client import AsyncCheckMKClient, CheckMKClient
 from urllib.parse import urlparse
 
 from services.checkmk.exceptions import CheckMKClientError
@@ -133,3 +133,24 @@ class CheckMKClientFactory:
     def build_client_from_settings(site_name: Optional[str] = None) -> CheckMKClient:
         config = get_checkmk_config(site_name=site_name)
         return CheckMKClientFactory.build_client(config)
+
+    @staticmethod
+    def build_async_client(config: CheckMKConfig) -> AsyncCheckMKClient:
+        from services.checkmk.client import AsyncCheckMKClient
+
+        return AsyncCheckMKClient(
+            host=config.host,
+            site_name=config.site,
+            username=config.username,
+            password=config.password,
+            protocol=config.protocol,
+            verify_ssl=config.verify_ssl,
+            timeout=config.timeout,
+        )
+
+    @staticmethod
+    def build_async_client_from_settings(
+        site_name: Optional[str] = None,
+    ) -> AsyncCheckMKClient:
+        config = get_checkmk_config(site_name=site_name)
+        return CheckMKClientFactory.build_async_client(config)
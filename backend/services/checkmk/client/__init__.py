@@ -2,10 +2,12 @@ from services.checkmk.client._connection_service import (
     CheckMKConnectionService,
     CheckMKService,
 )
+from services.checkmk.client.aio import AsyncCheckMKClient
 from services.checkmk.client.client import CheckMKClient
 from services.checkmk.exceptions import CheckMKAPIError
 
 __all__ = [
+    "AsyncCheckMKClient",
     "CheckMKClient",
     "CheckMKConnectionService",
     "CheckMKService",
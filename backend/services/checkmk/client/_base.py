@@ -25,7 +25,9 @@ def _extract_validation_errors(error_data: dict) -> List[str]:
     return messages
 
 
-class _CheckMKBase:
+class _CheckMKCommon:
+    """Connection settings and response handling shared by the sync and async clients."""
+
     def __init__(
         self,
         host: str,
@@ -45,77 +47,36 @@ class _CheckMKBase:
         self.timeout = timeout
 
         self.base_url = f"{protocol}://{host}/{site_name}/check_mk/api/1.0"
-
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {username} {password}",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-        )
-        self.session.verify = verify_ssl
+        self.default_headers = {
+            "Authorization": f"Bearer {username} {password}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
 
         self.logger = logging.getLogger(__name__)
 
-    def _make_request(
-        self,
-        method: str,
-        endpoint: str,
-        params: Dict = None,
-        json_data: Dict = None,
-        headers: Dict = None,
-        etag: str = None,
-    ) -> requests.Response:
-        url = urljoin(self.base_url + "/", endpoint)
-
-        request_headers = self.session.headers.copy()
-        if headers:
-            request_headers.update(headers)
+    def _request_headers(self, headers: Dict = None, etag: str = None) -> Dict:
+        """Per-request headers only; the session supplies the defaults."""
+        request_headers = dict(headers) if headers else {}
         if etag:
             request_headers["If-Match"] = etag
+        return request_headers
 
-        self.logger.debug("Making CheckMK API request: %s %s", method, url)
-        if params:
-            self.logger.debug("Params: %s", params)
-        if json_data:
-            self.logger.debug("JSON Data: %s", json_data)
-
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data,
-                headers=request_headers,
-                timeout=self.timeout,
-            )
-
+    def _log_response(self, method: str, url: str, response, json_data: Dict) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug("Response Status: %s", response.status_code)
             if response.content:
-                try:
-                    response_json = response.json()
-                    self.logger.debug(
-                        "Response Body (first 500 chars): %s", str(response_json)[:500]
-                    )
-                except (json.JSONDecodeError, ValueError):
-                    self.logger.debug(
-                        "Response Text (first 500 chars): %s", response.text[:500]
-                    )
-
-            if response.status_code >= 400 and json_data:
-                self.logger.error(
-                    "Request sent to CheckMK (%s %s):\n%s",
-                    method,
-                    url,
-                    json.dumps(json_data, indent=2, default=str),
+                self.logger.debug(
+                    "Response Body (first 500 chars): %s", response.text[:500]
                 )
 
-            return response
-
-        except requests.exceptions.RequestException as e:
-            self.logger.error("Request exception: %s", str(e))
-            raise CheckMKAPIError(f"Request failed: {str(e)}")
+        if response.status_code >= 400 and json_data:
+            self.logger.error(
+                "Request sent to CheckMK (%s %s):\n%s",
+                method,
+                url,
+                json.dumps(json_data, indent=2, default=str),
+            )
 
     def _handle_response(
         self, response: requests.Response, request_body: Dict = None
@@ -181,6 +142,49 @@ class _CheckMKBase:
                 status_code=response.status_code,
             )
 
+
+class _CheckMKBase(_CheckMKCommon):
+    """Synchronous client base using a pooled ``requests.Session``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.session = requests.Session()
+        self.session.headers.update(self.default_headers)
+        self.session.verify = self.verify_ssl
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict = None,
+        json_data: Dict = None,
+        headers: Dict = None,
+        etag: str = None,
+    ) -> requests.Response:
+        url = urljoin(self.base_url + "/", endpoint)
+        request_headers = self._request_headers(headers, etag)
+
+        self.logger.debug("Making CheckMK API request: %s %s", method, url)
+        if params:
+            self.logger.debug("Params: %s", params)
+
+        try:
+            response = self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                json=json_data,
+                headers=request_headers,
+                timeout=self.timeout,
+            )
+            self._log_response(method, url, response, json_data)
+            return response
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error("Request exception: %s", str(e))
+            raise CheckMKAPIError(f"Request failed: {str(e)}")
+
     def test_connection(self) -> bool:
         try:
             response = self._make_request("GET", "version")
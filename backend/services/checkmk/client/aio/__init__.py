@@ -0,0 +1,3 @@
+from services.checkmk.client.aio.client import AsyncCheckMKClient
+
+__all__ = ["AsyncCheckMKClient"]
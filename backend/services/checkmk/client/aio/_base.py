@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import weakref
+from typing import Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urljoin
+
+import httpx
+
+from services.checkmk.client._base import _CheckMKCommon
+from services.checkmk.exceptions import CheckMKAPIError
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits; callers may fan out far more coroutines than this,
+# they simply queue for a free connection.
+DEFAULT_MAX_CONNECTIONS = 50
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+PRECONDITION_FAILED = 412
+
+
+class _AsyncCheckMKBase(_CheckMKCommon):
+    """Asynchronous client base using a pooled ``httpx.AsyncClient``."""
+
+    def __init__(
+        self,
+        *args,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+
+        self.client = httpx.AsyncClient(
+            headers=self.default_headers,
+            verify=self.verify_ssl,
+            # No pool timeout: queued requests wait for a connection instead
+            # of failing when hundreds of host calls are fanned out at once.
+            timeout=httpx.Timeout(self.timeout, pool=None),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+        # One lock per ETag-protected object so concurrent read-modify-write
+        # sequences on the same host/folder/group do not overtake each other.
+        self._etag_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict = None,
+        json_data: Dict = None,
+        headers: Dict = None,
+        etag: str = None,
+    ) -> httpx.Response:
+        url = urljoin(self.base_url + "/", endpoint)
+        request_headers = self._request_headers(headers, etag)
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        self.logger.debug("Making CheckMK API request: %s %s", method, url)
+        if params:
+            self.logger.debug("Params: %s", params)
+
+        try:
+            response = await self.client.request(
+                method,
+                url,
+                params=params,
+                json=json_data,
+                headers=request_headers,
+            )
+            self._log_response(method, url, response, json_data)
+            return response
+
+        except httpx.HTTPError as e:
+            self.logger.error("Request exception: %s", str(e))
+            raise CheckMKAPIError(f"Request failed: {str(e)}")
+
+    def _etag_lock(self, key: str) -> asyncio.Lock:
+        lock = self._etag_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._etag_locks[key] = lock
+        return lock
+
+    async def _fetch_etag(
+        self, endpoint: str, description: str, params: Dict = None
+    ) -> str:
+        response = await self._make_request("GET", endpoint, params=params)
+        if response.status_code == 200:
+            return response.headers.get("ETag", "*")
+        raise CheckMKAPIError(f"Failed to get ETag for {description}")
+
+    async def _make_etag_request(
+        self,
+        key: str,
+        fetch_etag: Callable[[], Awaitable[str]],
+        method: str,
+        endpoint: str,
+        json_data: Dict = None,
+        etag: Optional[str] = None,
+    ) -> httpx.Response:
+        """Send a conditional write, fetching the ETag when none is given.
+
+        Writes to the same object are serialized, and a fetched ETag that went
+        stale before the write (412) is refreshed once. A caller-supplied ETag
+        is never replaced, so its 412 reaches the caller.
+        """
+        async with self._etag_lock(key):
+            fetched = etag is None
+            if fetched:
+                etag = await fetch_etag()
+            response = await self._make_request(
+                method, endpoint, json_data=json_data, etag=etag
+            )
+            if fetched and response.status_code == PRECONDITION_FAILED:
+                self.logger.info("ETag for %s changed; retrying once", key)
+                etag = await fetch_etag()
+                response = await self._make_request(
+                    method, endpoint, json_data=json_data, etag=etag
+                )
+            return response
+
+    async def test_connection(self) -> bool:
+        try:
+            response = await self._make_request("GET", "version")
+            return response.status_code == 200
+        except CheckMKAPIError:
+            return False
+
+    async def get_version(self) -> Dict:
+        response = await self._make_request("GET", "version")
+        return self._handle_response(response)
+
+    async def bulk_operation(self, operations: List[Dict]) -> List[Dict]:
+        async def run(operation: Dict) -> Dict:
+            try:
+                op_type = operation.get("type")
+                params = operation.get("params", {})
+                if op_type == "create_host":
+                    result = await self.create_host(**params)
+                elif op_type == "update_host":
+                    result = await self.update_host(**params)
+                elif op_type == "delete_host":
+                    result = await self.delete_host(params.get("hostname"))
+                else:
+                    result = {"error": f"Unknown operation type: {op_type}"}
+                return {"operation": operation, "result": result, "success": True}
+            except CheckMKAPIError as e:
+                return {"operation": operation, "error": str(e), "success": False}
+
+        return list(await asyncio.gather(*(run(op) for op in operations)))
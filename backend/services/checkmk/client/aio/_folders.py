@@ -0,0 +1,129 @@
+import logging
+from typing import Dict, List
+
+from services.checkmk.base import slash_to_tilde
+
+logger = logging.getLogger(__name__)
+
+
+class _AsyncFoldersMixin:
+    async def get_all_folders(
+        self, parent: str = None, recursive: bool = False, show_hosts: bool = False
+    ) -> Dict:
+        params = {"recursive": recursive, "show_hosts": show_hosts, "parent": parent}
+
+        response = await self._make_request(
+            "GET", "domain-types/folder_config/collections/all", params=params
+        )
+        return self._handle_response(response)
+
+    async def get_folder(self, folder_path: str, show_hosts: bool = False) -> Dict:
+        folder_url = slash_to_tilde(folder_path)
+        params = {"show_hosts": show_hosts}
+
+        response = await self._make_request(
+            "GET", f"objects/folder_config/{folder_url}", params=params
+        )
+        return self._handle_response(response)
+
+    async def create_folder(
+        self, name: str, title: str, parent: str = "/", attributes: Dict = None
+    ) -> Dict:
+        if attributes is None:
+            attributes = {}
+
+        json_data = {
+            "name": name,
+            "title": title,
+            "parent": parent,
+            "attributes": attributes,
+        }
+
+        response = await self._make_request(
+            "POST", "domain-types/folder_config/collections/all", json_data=json_data
+        )
+        return self._handle_response(response)
+
+    async def update_folder(
+        self,
+        folder_path: str,
+        title: str = None,
+        attributes: Dict = None,
+        remove_attributes: List[str] = None,
+        etag: str = None,
+    ) -> Dict:
+        folder_url = slash_to_tilde(folder_path)
+
+        json_data = {}
+        if title is not None:
+            json_data["title"] = title
+        if attributes is not None:
+            json_data["attributes"] = attributes
+        if remove_attributes is not None:
+            json_data["remove_attributes"] = remove_attributes
+
+        response = await self._make_etag_request(
+            f"folder:{folder_url}",
+            lambda: self.get_folder_etag(folder_path),
+            "PUT",
+            f"objects/folder_config/{folder_url}",
+            json_data=json_data,
+            etag=etag,
+        )
+        return self._handle_response(response)
+
+    async def delete_folder(
+        self, folder_path: str, delete_mode: str = "recursive"
+    ) -> bool:
+        folder_url = slash_to_tilde(folder_path)
+        params = {"delete_mode": delete_mode}
+
+        response = await self._make_request(
+            "DELETE", f"objects/folder_config/{folder_url}", params=params
+        )
+        self._handle_response(response)
+        return True
+
+    async def move_folder(
+        self, folder_path: str, destination: str, etag: str = None
+    ) -> Dict:
+        folder_url = slash_to_tilde(folder_path)
+
+        response = await self._make_etag_request(
+            f"folder:{folder_url}",
+            lambda: self.get_folder_etag(folder_path),
+            "POST",
+            f"objects/folder_config/{folder_url}/actions/move/invoke",
+            json_data={"destination": destination},
+            etag=etag,
+        )
+        return self._handle_response(response)
+
+    async def bulk_update_folders(self, entries: List[Dict]) -> Dict:
+        json_data = {"entries": entries}
+
+        response = await self._make_request(
+            "PUT",
+            "domain-types/folder_config/actions/bulk-update/invoke",
+            json_data=json_data,
+        )
+        return self._handle_response(response)
+
+    async def get_hosts_in_folder(
+        self, folder_path: str, effective_attributes: bool = False
+    ) -> Dict:
+        folder_url = slash_to_tilde(folder_path)
+        params = {"effective_attributes": effective_attributes}
+
+        response = await self._make_request(
+            "GET",
+            f"objects/folder_config/{folder_url}/collections/hosts",
+            params=params,
+        )
+        return self._handle_response(response)
+
+    async def get_folder_etag(self, folder_path: str) -> str:
+        folder_url = slash_to_tilde(folder_path)
+        return await self._fetch_etag(
+            f"objects/folder_config/{folder_url}", f"folder {folder_path}"
+        )
@@ -0,0 +1,79 @@
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class _AsyncHostGroupsMixin:
+    async def get_host_groups(self) -> Dict:
+        response = await self._make_request(
+            "GET", "domain-types/host_group_config/collections/all"
+        )
+        return self._handle_response(response)
+
+    async def get_host_group(self, group_name: str) -> Dict:
+        response = await self._make_request(
+            "GET", f"objects/host_group_config/{group_name}"
+        )
+        return self._handle_response(response)
+
+    async def create_host_group(self, name: str, alias: str = None) -> Dict:
+        json_data = {"name": name}
+        if alias:
+            json_data["alias"] = alias
+
+        response = await self._make_request(
+            "POST",
+            "domain-types/host_group_config/collections/all",
+            json_data=json_data,
+        )
+        return self._handle_response(response)
+
+    async def update_host_group(
+        self, name: str, alias: str = None, etag: str = None
+    ) -> Dict:
+        json_data = {}
+        if alias is not None:
+            json_data["alias"] = alias
+
+        response = await self._make_etag_request(
+            f"host_group:{name}",
+            lambda: self.get_host_group_etag(name),
+            "PUT",
+            f"objects/host_group_config/{name}",
+            json_data=json_data,
+            etag=etag,
+        )
+        return self._handle_response(response)
+
+    async def delete_host_group(self, name: str) -> bool:
+        response = await self._make_request(
+            "DELETE", f"objects/host_group_config/{name}"
+        )
+        self._handle_response(response)
+        return True
+
+    async def bulk_update_host_groups(self, entries: List[Dict]) -> Dict:
+        json_data = {"entries": entries}
+
+        response = await self._make_request(
+            "PUT",
+            "domain-types/host_group_config/actions/bulk-update/invoke",
+            json_data=json_data,
+        )
+        return self._handle_response(response)
+
+    async def bulk_delete_host_groups(self, entries: List[str]) -> Dict:
+        json_data = {"entries": entries}
+
+        response = await self._make_request(
+            "DELETE",
+            "domain-types/host_group_config/actions/bulk-delete/invoke",
+            json_data=json_data,
+        )
+        return self._handle_response(response)
+
+    async def get_host_group_etag(self, name: str) -> str:
+        return await self._fetch_etag(
+            f"objects/host_group_config/{name}", f"host group {name}"
+        )
@@ -0,0 +1,131 @@
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class _AsyncHostsMixin:
+    async def get_all_hosts(
+        self,
+        effective_attributes: bool = False,
+        include_links: bool = False,
+        site: str = None,
+        columns: List[str] = None,
+    ) -> Dict:
+        params = {
+            "effective_attributes": effective_attributes,
+            "include_links": include_links,
+            "site": site,
+            "columns": columns,
+        }
+
+        response = await self._make_request(
+            "GET", "domain-types/host_config/collections/all", params=params
+        )
+        return self._handle_response(response)
+
+    async def get_host(self, hostname: str, effective_attributes: bool = False) -> Dict:
+        params = {"effective_attributes": effective_attributes}
+
+        response = await self._make_request(
+            "GET", f"objects/host_config/{hostname}", params=params
+        )
+        return self._handle_response(response)
+
+    async def create_host(
+        self,
+        hostname: str,
+        folder: str = "/",
+        attributes: Dict = None,
+        bake_agent: bool = False,
+    ) -> Dict:
+        if attributes is None:
+            attributes = {}
+
+        json_data = {"host_name": hostname, "folder": folder, "attributes": attributes}
+        params = {"bake_agent": bake_agent}
+
+        response = await self._make_request(
+            "POST",
+            "domain-types/host_config/collections/all",
+            params=params,
+            json_data=json_data,
+        )
+        return self._handle_response(response, request_body=json_data)
+
+    async def update_host(
+        self, hostname: str, attributes: Dict, etag: str = None
+    ) -> Dict:
+        json_data = {"attributes": attributes}
+
+        response = await self._make_etag_request(
+            f"host:{hostname}",
+            lambda: self.get_host_etag(hostname),
+            "PUT",
+            f"objects/host_config/{hostname}",
+            json_data=json_data,
+            etag=etag,
+        )
+        return self._handle_response(response, request_body=json_data)
+
+    async def delete_host(self, hostname: str) -> bool:
+        response = await self._make_request("DELETE", f"objects/host_config/{hostname}")
+        self._handle_response(response)
+        return True
+
+    async def move_host(self, hostname: str, target_folder: str) -> Dict:
+        response = await self._make_etag_request(
+            f"host:{hostname}",
+            lambda: self.get_host_etag(hostname),
+            "POST",
+            f"objects/host_config/{hostname}/actions/move/invoke",
+            json_data={"target_folder": target_folder},
+        )
+        return self._handle_response(response)
+
+    async def rename_host(self, hostname: str, new_hostname: str) -> Dict:
+        json_data = {"new_name": new_hostname}
+
+        response = await self._make_request(
+            "POST",
+            f"objects/host_config/{hostname}/actions/rename/invoke",
+            json_data=json_data,
+        )
+        return self._handle_response(response)
+
+    async def bulk_create_hosts(self, hosts: List[Dict]) -> Dict:
+        json_data = {"entries": hosts}
+
+        response = await self._make_request(
+            "POST",
+            "domain-types/host_config/actions/bulk-create/invoke",
+            json_data=json_data,
+        )
+        return self._handle_response(response)
+
+    async def bulk_update_hosts(self, hosts: Dict) -> Dict:
+        json_data = {"entries": hosts}
+
+        response = await self._make_request(
+            "POST",
+            "domain-types/host_config/actions/bulk-update/invoke",
+            json_data=json_data,
+        )
+        return self._handle_response(response)
+
+    async def bulk_delete_hosts(self, hostnames: List[str]) -> Dict:
+        json_data = {"entries": hostnames}
+
+        response = await self._make_request(
+            "POST",
+            "domain-types/host_config/actions/bulk-delete/invoke",
+            json_data=json_data,
+        )
+        return self._handle_response(response)
+
+    async def get_host_etag(self, hostname: str) -> str:
+        return await self._fetch_etag(
+            f"objects/host_config/{hostname}",
+            f"host {hostname}",
+            params={"effective_attributes": False},
+        )
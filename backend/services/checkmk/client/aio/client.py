@@ -0,0 +1,30 @@
+from ._activation import _AsyncActivationMixin
+from ._base import _AsyncCheckMKBase
+from ._discovery import _AsyncDiscoveryMixin
+from ._folders import _AsyncFoldersMixin
+from ._host_groups import _AsyncHostGroupsMixin
+from ._hosts import _AsyncHostsMixin
+from ._monitoring import _AsyncMonitoringMixin
+from ._problems import _AsyncProblemsMixin
+from ._tag_groups import _AsyncTagGroupsMixin
+
+__all__ = ["AsyncCheckMKClient"]
+
+
+class AsyncCheckMKClient(
+    _AsyncHostsMixin,
+    _AsyncFoldersMixin,
+    _AsyncHostGroupsMixin,
+    _AsyncTagGroupsMixin,
+    _AsyncMonitoringMixin,
+    _AsyncDiscoveryMixin,
+    _AsyncActivationMixin,
+    _AsyncProblemsMixin,
+    _AsyncCheckMKBase,
+):
+    """Async CheckMK REST API Client — same per-resource surface as CheckMKClient.
+
+    Every method is a coroutine. Requests share one pooled ``httpx.AsyncClient``,
+    so callers can ``asyncio.gather`` many host calls; close the client with
+    ``aclose()`` or use it as an async context manager.
+    """
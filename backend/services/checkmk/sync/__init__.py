@@ -22,6 +22,7 @@ from models.nb2cmk import (
 )
 
 from .comparison import DeviceComparisonService
+from .engine import BulkComparisonEngine
 from .operations import DeviceSyncOperations
 from .queries import DeviceQueryService
 
@@ -88,6 +89,14 @@ class NautobotToCheckMKService:
         """
         return await self.comparison_service.get_devices_diff()
 
+    def build_comparison_engine(self) -> BulkComparisonEngine:
+        """Create a bulk comparison engine over this facade's services.
+
+        Returns:
+            BulkComparisonEngine comparing all devices with batched fetches
+        """
+        return BulkComparisonEngine(self.query_service, self.comparison_service)
+
     async def compare_device_config(self, device_id: str) -> DeviceComparison:
         """Compare normalized Nautobot device config with CheckMK host config.
 
@@ -186,4 +195,5 @@ __all__ = [
     "DeviceQueryService",
     "DeviceComparisonService",
     "DeviceSyncOperations",
+    "BulkComparisonEngine",
 ]
@@ -147,236 +147,59 @@ class NB2CMKBackgroundService:
             # Update job to running
             self._db.update_job_status(job_id, JobStatus.RUNNING)
 
-            # Get all devices from Nautobot first
-            logger.info("Job %s: Fetching devices from Nautobot", job_id)
+            # Compare all devices with the bulk engine: one CheckMK host
+            # fetch, paged Nautobot devices, bounded concurrent comparisons
+            logger.info("Job %s: Fetching devices from Nautobot and CheckMK", job_id)
             self._db.update_job_progress(
-                job_id, 0, 0, "Fetching devices from Nautobot..."
+                job_id, 0, 0, "Fetching devices from Nautobot and CheckMK..."
             )
 
-            # Use the existing service to get devices
-            import service_factory
-
-            nautobot_service = service_factory.build_nautobot_service()
-
-            query = """
-            query all_devices {
-              devices {
-                id
-                name
-                role {
-                  name
-                }
-                location {
-                  name
-                }
-                status {
-                  name
-                }
-              }
-            }
-            """
+            from services.nautobot.common.exceptions import NautobotAPIError
+
+            engine = self._sync.build_comparison_engine()
+
+            def store_result(device_info: dict) -> None:
+                # Store result in database
+                self._db.add_device_result(
+                    job_id=job_id,
+                    device_id=device_info["id"],
+                    device_name=device_info["name"],
+                    checkmk_status=device_info["checkmk_status"],
+                    diff=device_info.get("diff", ""),
+                    normalized_config=device_info.get("normalized_config", {}),
+                    checkmk_config=device_info.get("checkmk_config"),
+                )
+
+                # For small device counts (<=20), update every device
+                # For larger counts, update every 5 devices
+                processed = engine.processed
+                update_frequency = 1 if engine.discovered <= 20 else 5
+                if processed % update_frequency == 0:
+                    progress_msg = (
+                        f"Processed {processed} of {engine.discovered} devices"
+                    )
+                    logger.info("Job %s: %s", job_id, progress_msg)
+                    self._db.update_job_progress(
+                        job_id, processed, engine.discovered, progress_msg
+                    )
 
-            result = await nautobot_service.graphql_query(query, {})
-            if "errors" in result:
-                error_msg = f"GraphQL errors: {result['errors']}"
+            try:
+                await engine.run(
+                    on_result=store_result, should_stop=lambda: self._shutdown
+                )
+            except NautobotAPIError as e:
+                error_msg = str(e)
                 logger.error("Job %s: %s", job_id, error_msg)
                 self._db.update_job_status(job_id, JobStatus.FAILED, error_msg)
                 return
 
-            nautobot_devices = result["data"]["devices"]
-            total_devices = len(nautobot_devices)
-
-            logger.info("Job %s: Processing %s devices", job_id, total_devices)
-            self._db.update_job_progress(
-                job_id,
-                0,
-                total_devices,
-                f"Starting comparison of {total_devices} devices",
-            )
-
-            processed_count = 0
-
-            # Process each device
-            for device in nautobot_devices:
-                try:
-                    # Check if job was cancelled
-                    if self._shutdown:
-                        logger.info("Job %s: Cancelled during processing", job_id)
-                        self._db.update_job_status(job_id, JobStatus.CANCELLED)
-                        return
+            processed_count = engine.processed
+            total_devices = engine.discovered
 
-                    device_id = str(device.get("id", ""))
-                    device_name = device.get("name", "")
-
-                    if not device_id:
-                        processed_count += 1
-                        continue
-
-                    logger.debug(
-                        "Job %s: Processing device %s (%s)",
-                        job_id,
-                        device_name,
-                        device_id,
-                    )
-
-                    # Build device info
-                    device_info = {
-                        "id": device_id,
-                        "name": device_name,
-                        "role": device.get("role", {}).get("name", "")
-                        if device.get("role")
-                        else "",
-                        "status": device.get("status", {}).get("name", "")
-                        if device.get("status")
-                        else "",
-                        "location": device.get("location", {}).get("name", "")
-                        if device.get("location")
-                        else "",
-                        "checkmk_status": "unknown",
-                    }
-
-                    # Try to get comparison for this device
-                    try:
-                        logger.debug(
-                            "[BACKGROUND JOB %s] Starting comparison for device %s (%s)",
-                            job_id,
-                            device_name,
-                            device_id,
-                        )
-                        comparison_result = await self._sync.compare_device_config(
-                            device_id
-                        )
-                        device_info["checkmk_status"] = comparison_result.result
-                        device_info["diff"] = comparison_result.diff
-                        device_info["normalized_config"] = (
-                            comparison_result.normalized_config
-                        )
-                        device_info["checkmk_config"] = comparison_result.checkmk_config
-
-                        logger.debug(
-                            "[BACKGROUND JOB %s] Device %s comparison result: %s",
-                            job_id,
-                            device_name,
-                            comparison_result.result,
-                        )
-
-                        # Map host_not_found to missing for frontend consistency
-                        if device_info["checkmk_status"] == "host_not_found":
-                            device_info["checkmk_status"] = "missing"
-                            logger.debug(
-                                "[BACKGROUND JOB %s] Mapped host_not_found to missing for %s",
-                                job_id,
-                                device_name,
-                            )
-
-                    except HTTPException as http_exc:
-                        if http_exc.status_code == 404:
-                            logger.info(
-                                "[BACKGROUND JOB %s] Device %s not found in CheckMK (404)",
-                                job_id,
-                                device_name,
-                            )
-                            device_info["checkmk_status"] = "missing"
-                            device_info["diff"] = (
-                                f"Host '{device_name}' not found in CheckMK"
-                            )
-                            device_info["normalized_config"] = {}
-                            device_info["checkmk_config"] = None
-                        else:
-                            error_detail = getattr(http_exc, "detail", str(http_exc))
-                            logger.error(
-                                "[BACKGROUND JOB %s] HTTP %s error comparing device %s: %s",
-                                job_id,
-                                http_exc.status_code,
-                                device_name,
-                                error_detail,
-                            )
-                            device_info["checkmk_status"] = "error"
-                            device_info["diff"] = (
-                                f"HTTP {http_exc.status_code} Error: {error_detail}"
-                            )
-                            device_info["normalized_config"] = {}
-                            device_info["checkmk_config"] = None
-
-                    except ValueError as val_err:
-                        # Catch normalization/comparison errors with detailed messages
-                        logger.error(
-                            "[BACKGROUND JOB %s] Validation error for device %s: %s",
-                            job_id,
-                            device_name,
-                            str(val_err),
-                            exc_info=True,
-                        )
-                        device_info["checkmk_status"] = "error"
-                        device_info["diff"] = f"Validation Error: {str(val_err)}"
-                        device_info["normalized_config"] = {}
-                        device_info["checkmk_config"] = None
-
-                    except Exception as e:
-                        logger.error(
-                            "[BACKGROUND JOB %s] Unexpected error comparing device %s: %s",
-                            job_id,
-                            device_name,
-                            str(e),
-                            exc_info=True,
-                        )
-                        device_info["checkmk_status"] = "error"
-                        device_info["diff"] = f"Comparison error: {str(e)}"
-                        device_info["normalized_config"] = {}
-                        device_info["checkmk_config"] = None
-
-                    # Store result in database
-                    self._db.add_device_result(
-                        job_id=job_id,
-                        device_id=device_id,
-                        device_name=device_name,
-                        checkmk_status=device_info["checkmk_status"],
-                        diff=device_info.get("diff", ""),
-                        normalized_config=device_info.get("normalized_config", {}),
-                        checkmk_config=device_info.get("checkmk_config"),
-                    )
-
-                    processed_count += 1
-
-                    # Update progress more frequently for better UX
-                    # For small device counts (<=20), update every device
-                    # For larger counts, update every 5 devices or at the end
-                    update_frequency = 1 if total_devices <= 20 else 5
-                    if (
-                        processed_count % update_frequency == 0
-                        or processed_count == total_devices
-                    ):
-                        progress_msg = (
-                            f"Processed {processed_count} of {total_devices} devices"
-                        )
-                        logger.info("Job %s: %s", job_id, progress_msg)
-                        self._db.update_job_progress(
-                            job_id, processed_count, total_devices, progress_msg
-                        )
-
-                    # Small delay to prevent overwhelming the system
-                    await asyncio.sleep(0.1)
-
-                except Exception as e:
-                    logger.error(
-                        "Job %s: Error processing device %s: %s",
-                        job_id,
-                        device.get("name", "unknown"),
-                        e,
-                    )
-                    processed_count += 1
-                    # Update progress even on errors to show we're still working
-                    update_frequency = 1 if total_devices <= 20 else 5
-                    if (
-                        processed_count % update_frequency == 0
-                        or processed_count == total_devices
-                    ):
-                        progress_msg = f"Processed {processed_count} of {total_devices} devices (with errors)"
-                        logger.info("Job %s: %s", job_id, progress_msg)
-                        self._db.update_job_progress(
-                            job_id, processed_count, total_devices, progress_msg
-                        )
-                    continue
+            if self._shutdown:
+                logger.info("Job %s: Cancelled during processing", job_id)
+                self._db.update_job_status(job_id, JobStatus.CANCELLED)
+                return
 
             # Mark job as completed with final progress update
             completion_msg = (
@@ -400,12 +223,12 @@ class NB2CMKBackgroundService:
             logger.error("Job %s: %s", job_id, error_msg)
             # Try to preserve progress information even on failure
             try:
-                if "processed_count" in locals() and "total_devices" in locals():
+                if "engine" in locals():
                     self._db.update_job_progress(
                         job_id,
-                        processed_count,
-                        total_devices,
-                        f"Failed after processing {processed_count} devices: {error_msg}",
+                        engine.processed,
+                        engine.discovered,
+                        f"Failed after processing {engine.processed} devices: {error_msg}",
                     )
             except Exception:
                 pass  # Don't let progress update failures mask the original error
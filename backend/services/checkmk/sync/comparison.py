@@ -8,13 +8,15 @@ and CheckMK to identify differences.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException, status
 
 from core.safe_http_errors import raise_internal_server_error
 from models.nb2cmk import DeviceComparison, DeviceListWithStatus
 
+from .engine import BulkComparisonEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,103 +44,20 @@ class DeviceComparisonService:
             HTTPException: If operation fails
         """
         try:
-            import service_factory
-
-            nautobot_service = service_factory.build_nautobot_service()
-
-            # Use GraphQL query to get all devices from Nautobot
-            query = """
-            query all_devices {
-              devices {
-                id
-                name
-                role {
-                  name
-                }
-                location {
-                  name
-                }
-                status {
-                  name
-                }
-              }
-            }
-            """
+            from services.nautobot.common.exceptions import NautobotAPIError
 
-            result = await nautobot_service.graphql_query(query, {})
-            if "errors" in result:
-                logger.error("GraphQL errors: %s", result["errors"])
+            # Bulk engine: one CheckMK host fetch, paged Nautobot devices and
+            # concurrent normalization/diff instead of per-device round-trips
+            engine = BulkComparisonEngine(self.query_service, self)
+            try:
+                devices_with_status = await engine.run()
+            except NautobotAPIError as e:
+                logger.error("GraphQL errors: %s", e)
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="GraphQL errors: {}".format(result["errors"]),
+                    detail=str(e),
                 )
 
-            nautobot_devices = result["data"]["devices"]
-
-            # Process each device and get comparison status
-            devices_with_status = []
-            for device in nautobot_devices:
-                device_info = {
-                    "id": str(device.get("id", "")),
-                    "name": device.get("name", ""),
-                    "role": device.get("role", {}).get("name", "")
-                    if device.get("role")
-                    else "",
-                    "status": device.get("status", {}).get("name", "")
-                    if device.get("status")
-                    else "",
-                    "location": device.get("location", {}).get("name", "")
-                    if device.get("location")
-                    else "",
-                    "checkmk_status": "unknown",
-                }
-
-                # Try to get comparison status for this device
-                try:
-                    device_id = str(device.get("id", ""))
-                    if device_id:
-                        comparison_result = await self.compare_device_config(device_id)
-                        device_info["checkmk_status"] = comparison_result.result
-                        device_info["diff"] = comparison_result.diff
-                        device_info["normalized_config"] = (
-                            comparison_result.normalized_config
-                        )
-                        device_info["checkmk_config"] = comparison_result.checkmk_config
-
-                        # Map host_not_found to missing for frontend consistency
-                        if device_info["checkmk_status"] == "host_not_found":
-                            device_info["checkmk_status"] = "missing"
-                    else:
-                        device_info["checkmk_status"] = "error"
-                except HTTPException as http_exc:
-                    if http_exc.status_code == 404:
-                        logger.info(
-                            "Device %s not found in CheckMK",
-                            device.get("name", "unknown"),
-                        )
-                        device_info["checkmk_status"] = "missing"
-                        device_info["diff"] = (
-                            f"Host '{device.get('name', 'unknown')}' not found in CheckMK"
-                        )
-                        device_info["normalized_config"] = {}
-                        device_info["checkmk_config"] = None
-                    else:
-                        logger.warning(
-                            "HTTP error comparing device %s: %s",
-                            device.get("name", "unknown"),
-                            http_exc,
-                        )
-                        device_info["checkmk_status"] = "error"
-                except Exception as e:
-                    logger.warning(
-                        "Error comparing device %s: %s",
-                        device.get("name", "unknown"),
-                        e,
-                    )
-                    device_info["checkmk_status"] = "error"
-
-                devices_with_status.append(device_info)
-
             return DeviceListWithStatus(
                 devices=devices_with_status,
                 total=len(devices_with_status),
@@ -186,22 +105,7 @@ class DeviceComparisonService:
                     norm_error,
                 )
 
-            # Get hostname from internal dict
-            internal_data = normalized_config.get("internal", {})
-            hostname = internal_data.get("hostname")
-
-            if not hostname:
-                error_msg = (
-                    f"Device {device_id} has no hostname configured in normalized data"
-                )
-                logger.error(
-                    "[COMPARE ERROR] %s. Internal data: %s", error_msg, internal_data
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Device has no hostname configured",
-                )
-
+            hostname = self._hostname_of(normalized_config, device_id)
             logger.info("[COMPARE] Comparing device: %s (ID: %s)", hostname, device_id)
 
             # Get CheckMK host config using service layer
@@ -219,8 +123,8 @@ class DeviceComparisonService:
                     logger.debug(
                         "[COMPARE] Fetching CheckMK data for host: %s", hostname
                     )
-                    client = service_factory.build_checkmk_client()
-                    checkmk_data = client.get_host(hostname, False)
+                    async with service_factory.build_async_checkmk_client() as client:
+                        checkmk_data = await client.get_host(hostname, False)
                     logger.debug(
                         "[COMPARE] Successfully retrieved CheckMK data for %s", hostname
                     )
@@ -229,29 +133,19 @@ class DeviceComparisonService:
                         "[COMPARE] Host '%s' not found in CheckMK during comparison",
                         hostname,
                     )
-                    return DeviceComparison(
-                        result="host_not_found",
-                        diff=f"Host '{hostname}' not found in CheckMK",
-                        normalized_config=normalized_config,
-                        checkmk_config=None,
-                    )
+                    checkmk_data = None
                 except CheckMKAPIError as e:
-                    if e.status_code == 404:
-                        logger.info(
-                            "[COMPARE] Host '%s' not found in CheckMK (404)", hostname
-                        )
-                        return DeviceComparison(
-                            result="host_not_found",
-                            diff=f"Host '{hostname}' not found in CheckMK",
-                            normalized_config=normalized_config,
-                            checkmk_config=None,
+                    if e.status_code != 404:
+                        raise_internal_server_error(
+                            logger,
+                            f"CheckMK API error for host {hostname}",
+                            e,
+                            status_code=status.HTTP_502_BAD_GATEWAY,
                         )
-                    raise_internal_server_error(
-                        logger,
-                        f"CheckMK API error for host {hostname}",
-                        e,
-                        status_code=status.HTTP_502_BAD_GATEWAY,
+                    logger.info(
+                        "[COMPARE] Host '%s' not found in CheckMK (404)", hostname
                     )
+                    checkmk_data = None
 
             except HTTPException:
                 raise
@@ -262,97 +156,152 @@ class DeviceComparisonService:
                     e,
                 )
 
-            # Extract attributes from CheckMK data
-            try:
-                checkmk_extensions = checkmk_data.get("extensions", {})
-                logger.debug(
-                    "[COMPARE] CheckMK extensions keys for %s: %s",
-                    hostname,
-                    list(checkmk_extensions.keys()),
-                )
+            return self.compare_normalized(normalized_config, checkmk_data, device_id)
 
-                # Remove meta_data key from CheckMK config before comparison
-                if "meta_data" in checkmk_extensions.get("attributes", {}):
-                    del checkmk_extensions["attributes"]["meta_data"]
-                    logger.debug(
-                        "[COMPARE] Removed meta_data from CheckMK attributes for %s",
-                        hostname,
-                    )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise_internal_server_error(
+                logger, f"Error comparing device configs for {device_id}", e
+            )
 
-                # Create clean copies for comparison (remove internal dicts)
-                nb_config_for_comparison = {
-                    k: v for k, v in normalized_config.items() if k != "internal"
-                }
-                cmk_config_for_comparison = {
-                    k: v for k, v in checkmk_extensions.items() if k != "internal"
-                }
+    def _hostname_of(self, normalized_config: Dict[str, Any], device_id: Any) -> str:
+        """Return the CheckMK hostname from a normalized config.
 
-                logger.debug(
-                    "[COMPARE] Nautobot config keys for %s: %s",
-                    hostname,
-                    list(nb_config_for_comparison.keys()),
-                )
-                logger.debug(
-                    "[COMPARE] CheckMK config keys for %s: %s",
-                    hostname,
-                    list(cmk_config_for_comparison.keys()),
-                )
+        Raises:
+            HTTPException: 400 if the normalized config carries no hostname
+        """
+        internal_data = normalized_config.get("internal", {})
+        hostname = internal_data.get("hostname")
 
-                # Compare the configurations
-                logger.info("+" * 80)
-                logger.info("[SECTION] ATTRIBUTE COMPARISON")
-                logger.info("+" * 80)
-                logger.info(
-                    "[COMPARE] Starting configuration comparison for %s", hostname
-                )
-                differences = self._compare_configurations(
-                    nb_config_for_comparison, cmk_config_for_comparison
-                )
-                logger.info(
-                    "[COMPARE] Found %s difference(s) for %s",
-                    len(differences),
-                    hostname,
-                )
+        if not hostname:
+            error_msg = (
+                f"Device {device_id} has no hostname configured in normalized data"
+            )
+            logger.error(
+                "[COMPARE ERROR] %s. Internal data: %s", error_msg, internal_data
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Device has no hostname configured",
+            )
+        return hostname
 
-                logger.info("#" * 80)
-                logger.info("[SECTION] COMPARISON RESULT")
-                logger.info("#" * 80)
-            except Exception as e:
-                raise_internal_server_error(
-                    logger,
-                    f"Error processing configurations for comparison of {hostname}",
-                    e,
-                )
+    def compare_normalized(
+        self,
+        normalized_config: Dict[str, Any],
+        checkmk_data: Optional[Dict[str, Any]],
+        device_id: Optional[str] = None,
+    ) -> DeviceComparison:
+        """Diff a normalized Nautobot config against a CheckMK host object.
 
-            # Determine result
-            if differences:
-                result = "diff"
-                diff_text = "; ".join(differences)
-            else:
-                result = "equal"
-                diff_text = ""
+        Args:
+            normalized_config: Output of ``get_device_normalized``
+            checkmk_data: CheckMK host_config object, or None if the host does
+                not exist in CheckMK
+            device_id: Nautobot device ID, used in error messages
 
-            # Include internal section in the response for UI display purposes
-            # The comparison was done without it, but we need it for device metadata
-            nb_config_with_internal = nb_config_for_comparison.copy()
-            if "internal" in normalized_config:
-                nb_config_with_internal["internal"] = normalized_config["internal"]
+        Returns:
+            DeviceComparison with comparison results
 
+        Raises:
+            HTTPException: If the config has no hostname or cannot be compared
+        """
+        hostname = self._hostname_of(normalized_config, device_id)
+        if checkmk_data is None:
             return DeviceComparison(
-                result=result,
-                diff=diff_text,
-                normalized_config=nb_config_with_internal,
-                checkmk_config=cmk_config_for_comparison,
-                ignored_attributes=self._config.get_ignore_attributes(),
+                result="host_not_found",
+                diff=f"Host '{hostname}' not found in CheckMK",
+                normalized_config=normalized_config,
+                checkmk_config=None,
             )
 
-        except HTTPException:
-            raise
+        # Extract attributes from CheckMK data
+        try:
+            checkmk_extensions = dict(checkmk_data.get("extensions", {}))
+            logger.debug(
+                "[COMPARE] CheckMK extensions keys for %s: %s",
+                hostname,
+                list(checkmk_extensions.keys()),
+            )
+
+            # Remove meta_data key from CheckMK config before comparison
+            if "meta_data" in checkmk_extensions.get("attributes", {}):
+                checkmk_extensions["attributes"] = {
+                    k: v
+                    for k, v in checkmk_extensions["attributes"].items()
+                    if k != "meta_data"
+                }
+                logger.debug(
+                    "[COMPARE] Removed meta_data from CheckMK attributes for %s",
+                    hostname,
+                )
+
+            # Create clean copies for comparison (remove internal dicts)
+            nb_config_for_comparison = {
+                k: v for k, v in normalized_config.items() if k != "internal"
+            }
+            cmk_config_for_comparison = {
+                k: v for k, v in checkmk_extensions.items() if k != "internal"
+            }
+
+            logger.debug(
+                "[COMPARE] Nautobot config keys for %s: %s",
+                hostname,
+                list(nb_config_for_comparison.keys()),
+            )
+            logger.debug(
+                "[COMPARE] CheckMK config keys for %s: %s",
+                hostname,
+                list(cmk_config_for_comparison.keys()),
+            )
+
+            # Compare the configurations
+            logger.info("+" * 80)
+            logger.info("[SECTION] ATTRIBUTE COMPARISON")
+            logger.info("+" * 80)
+            logger.info("[COMPARE] Starting configuration comparison for %s", hostname)
+            differences = self._compare_configurations(
+                nb_config_for_comparison, cmk_config_for_comparison
+            )
+            logger.info(
+                "[COMPARE] Found %s difference(s) for %s",
+                len(differences),
+                hostname,
+            )
+
+            logger.info("#" * 80)
+            logger.info("[SECTION] COMPARISON RESULT")
+            logger.info("#" * 80)
         except Exception as e:
             raise_internal_server_error(
-                logger, f"Error comparing device configs for {device_id}", e
+                logger,
+                f"Error processing configurations for comparison of {hostname}",
+                e,
             )
 
+        # Determine result
+        if differences:
+            result = "diff"
+            diff_text = "; ".join(differences)
+        else:
+            result = "equal"
+            diff_text = ""
+
+        # Include internal section in the response for UI display purposes
+        # The comparison was done without it, but we need it for device metadata
+        nb_config_with_internal = nb_config_for_comparison.copy()
+        if "internal" in normalized_config:
+            nb_config_with_internal["internal"] = normalized_config["internal"]
+
+        return DeviceComparison(
+            result=result,
+            diff=diff_text,
+            normalized_config=nb_config_with_internal,
+            checkmk_config=cmk_config_for_comparison,
+            ignored_attributes=self._config.get_ignore_attributes(),
+        )
+
     def _compare_configurations(
         self, nb_config: Dict[str, Any], cmk_config: Dict[str, Any]
     ) -> List[str]:
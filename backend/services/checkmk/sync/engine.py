@@ -0,0 +1,199 @@
+"""
+Bulk comparison engine for Nautobot to CheckMK device diffs.
+
+Instead of one normalization query and one ``get_host`` call per device, the
+engine reads every CheckMK host with a single ``get_all_hosts`` call, streams
+Nautobot devices in paged GraphQL requests using the configured
+normalization fields, and normalizes and diffs them on a bounded pool of
+worker threads while the next pages are being fetched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+# Normalization reads config files and may hit the database, so it runs in
+# threads; this bounds how many devices are in flight at once.
+DEFAULT_COMPARISON_WORKERS = 8
+
+
+def _device_summary(device: Dict[str, Any]) -> Dict[str, Any]:
+    """Base result row for a Nautobot device (before comparison)."""
+    return {
+        "id": str(device.get("id", "")),
+        "name": device.get("name", ""),
+        "role": (device.get("role") or {}).get("name", ""),
+        "status": (device.get("status") or {}).get("name", ""),
+        "location": (device.get("location") or {}).get("name", ""),
+        "checkmk_status": "unknown",
+    }
+
+
+class BulkComparisonEngine:
+    """Compare all Nautobot devices with CheckMK using batched fetches."""
+
+    def __init__(
+        self,
+        query_service,
+        comparison_service,
+        max_workers: int = DEFAULT_COMPARISON_WORKERS,
+    ):
+        """Initialize the engine.
+
+        Args:
+            query_service: DeviceQueryService providing paged device data and
+                normalization
+            comparison_service: DeviceComparisonService providing the diff
+            max_workers: Maximum number of devices compared concurrently
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        self.query_service = query_service
+        self.comparison_service = comparison_service
+        self.max_workers = max_workers
+        self.discovered = 0
+        self.processed = 0
+
+    async def run(
+        self,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Compare every Nautobot device and return result rows in Nautobot order.
+
+        Args:
+            on_result: Called on the event loop with each result row as soon as
+                it is ready (completion order).
+            should_stop: Polled before each device is queued; when it returns
+                True no further devices are queued and the rows finished so far
+                are returned.
+
+        Raises:
+            NautobotAPIError: If fetching Nautobot devices fails
+            CheckMKAPIError: If fetching CheckMK hosts fails
+        """
+        hosts_task = asyncio.create_task(self._fetch_checkmk_hosts())
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_workers * 2)
+        results: List[Optional[Dict[str, Any]]] = []
+
+        async def produce() -> None:
+            position = 0
+            stopped = False
+            async for page in self.query_service.iter_normalization_pages():
+                for device in page:
+                    if should_stop is not None and should_stop():
+                        stopped = True
+                        break
+                    if not device.get("id"):
+                        logger.warning(
+                            "Skipping Nautobot device without ID: %s",
+                            device.get("name", "unknown"),
+                        )
+                        continue
+                    results.append(None)
+                    self.discovered += 1
+                    await queue.put((position, device))
+                    position += 1
+                if stopped:
+                    break
+            for _ in range(self.max_workers):
+                await queue.put(None)
+
+        async def work() -> None:
+            hosts = await hosts_task
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                position, device = item
+                row = await asyncio.to_thread(self._compare_device, device, hosts)
+                results[position] = row
+                self.processed += 1
+                if on_result is not None:
+                    on_result(row)
+
+        # Run producer and workers together so a failure on either side
+        # (Nautobot paging or the CheckMK host fetch) ends the whole run
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(work()) for _ in range(self.max_workers)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in (*tasks, hosts_task):
+                task.cancel()
+
+        return [row for row in results if row is not None]
+
+    async def _fetch_checkmk_hosts(self) -> Dict[str, Dict[str, Any]]:
+        """Fetch all CheckMK host configs in one call, keyed by hostname.
+
+        Uses the same non-effective attributes as ``get_host(hostname, False)``
+        so bulk and single-device comparisons agree.
+        """
+        import service_factory
+
+        async with service_factory.build_async_checkmk_client() as client:
+            response = await client.get_all_hosts(effective_attributes=False)
+        hosts = {host["id"]: host for host in response.get("value", []) if "id" in host}
+        logger.info("Fetched %s hosts from CheckMK", len(hosts))
+        return hosts
+
+    def _compare_device(
+        self, device: Dict[str, Any], hosts: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Normalize and diff one device; errors become result rows."""
+        row = _device_summary(device)
+        try:
+            normalized = self.query_service.normalize_device_data(device)
+            hostname = normalized.get("internal", {}).get("hostname")
+            comparison = self.comparison_service.compare_normalized(
+                normalized, hosts.get(hostname), row["id"]
+            )
+            row["checkmk_status"] = comparison.result
+            row["diff"] = comparison.diff
+            row["normalized_config"] = comparison.normalized_config
+            row["checkmk_config"] = comparison.checkmk_config
+
+            # Map host_not_found to missing for frontend consistency
+            if row["checkmk_status"] == "host_not_found":
+                row["checkmk_status"] = "missing"
+            return row
+
+        except HTTPException as http_exc:
+            error_detail = getattr(http_exc, "detail", str(http_exc))
+            logger.error(
+                "HTTP %s error comparing device %s: %s",
+                http_exc.status_code,
+                row["name"],
+                error_detail,
+            )
+            diff = f"HTTP {http_exc.status_code} Error: {error_detail}"
+        except ValueError as val_err:
+            # Normalization/comparison errors carry detailed messages
+            logger.error(
+                "Validation error for device %s: %s",
+                row["name"],
+                val_err,
+                exc_info=True,
+            )
+            diff = f"Validation Error: {val_err}"
+        except Exception as e:
+            logger.error(
+                "Unexpected error comparing device %s: %s",
+                row["name"],
+                e,
+                exc_info=True,
+            )
+            diff = f"Comparison error: {e}"
+
+        row["checkmk_status"] = "error"
+        row["diff"] = diff
+        row["normalized_config"] = {}
+        row["checkmk_config"] = None
+        return row
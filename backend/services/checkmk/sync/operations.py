@@ -77,86 +77,88 @@ class DeviceSyncOperations:
             from services.checkmk.exceptions import CheckMKAPIError
 
             try:
-                client = service_factory.build_checkmk_client()
-
-                # Log detailed information for debugging
-                logger.info("Creating host with parameters:")
-                logger.info("  hostname: %s", hostname)
-                logger.info("  folder: %s", folder)
-                logger.info("  site: %s", device_site)
-                logger.info("  attributes: %s", attributes)
-
-                # Ensure folder exists before creating host
-                if folder and folder != "/":
-                    logger.info(
-                        "Ensuring folder '%s' exists before creating host", folder
-                    )
-                    folder_created = await self._folder.create_path(
-                        folder, device_site, {}
-                    )
-                    if not folder_created:
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=f"Cannot create or ensure folder path '{folder}' exists in CheckMK",
+                async with service_factory.build_async_checkmk_client() as client:
+                    # Log detailed information for debugging
+                    logger.info("Creating host with parameters:")
+                    logger.info("  hostname: %s", hostname)
+                    logger.info("  folder: %s", folder)
+                    logger.info("  site: %s", device_site)
+                    logger.info("  attributes: %s", attributes)
+
+                    # Ensure folder exists before creating host
+                    if folder and folder != "/":
+                        logger.info(
+                            "Ensuring folder '%s' exists before creating host", folder
                         )
-                    logger.info("Folder '%s' is ready", folder)
-
-                # Convert folder path format: CheckMK uses ~ instead of /
-                # First normalize double slashes, then convert / to ~
-                normalized_folder = folder.replace("//", "/") if folder else "/"
-                checkmk_folder = (
-                    normalized_folder.replace("/", "~") if normalized_folder else "~"
-                )
-                logger.info(
-                    "Converted folder path from '%s' to '%s' for CheckMK client",
-                    folder,
-                    checkmk_folder,
-                )
-
-                # Create host in CheckMK
-                result = client.create_host(
-                    hostname=hostname,
-                    folder=checkmk_folder,
-                    attributes=attributes,
-                    bake_agent=False,
-                )
-
-                create_result = {
-                    "success": True,
-                    "message": f"Host {hostname} created successfully",
-                    "data": result,
-                }
-
-                # Start service discovery with tabula_rasa mode to add services
-                try:
-                    logger.info(
-                        "Starting service discovery (tabula_rasa) for host %s", hostname
-                    )
-                    discovery_result = client.start_service_discovery(
-                        hostname, mode="tabula_rasa"
+                        folder_created = await self._folder.create_path(
+                            folder, device_site, {}
+                        )
+                        if not folder_created:
+                            raise HTTPException(
+                                status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=f"Cannot create or ensure folder path '{folder}' exists in CheckMK",
+                            )
+                        logger.info("Folder '%s' is ready", folder)
+
+                    # Convert folder path format: CheckMK uses ~ instead of /
+                    # First normalize double slashes, then convert / to ~
+                    normalized_folder = folder.replace("//", "/") if folder else "/"
+                    checkmk_folder = (
+                        normalized_folder.replace("/", "~")
+                        if normalized_folder
+                        else "~"
                     )
                     logger.info(
-                        "Service discovery started for host %s: %s",
-                        hostname,
-                        discovery_result,
+                        "Converted folder path from '%s' to '%s' for CheckMK client",
+                        folder,
+                        checkmk_folder,
                     )
-                    create_result["discovery"] = {
-                        "started": True,
-                        "mode": "tabula_rasa",
-                        "result": discovery_result,
-                    }
-                except Exception as discovery_error:
-                    # Log but don't fail the whole operation if discovery fails
-                    logger.warning(
-                        "Failed to start service discovery for host %s: %s",
-                        hostname,
-                        discovery_error,
+
+                    # Create host in CheckMK
+                    result = await client.create_host(
+                        hostname=hostname,
+                        folder=checkmk_folder,
+                        attributes=attributes,
+                        bake_agent=False,
                     )
-                    create_result["discovery"] = {
-                        "started": False,
-                        "error": str(discovery_error),
+
+                    create_result = {
+                        "success": True,
+                        "message": f"Host {hostname} created successfully",
+                        "data": result,
                     }
 
+                    # Start service discovery with tabula_rasa mode to add services
+                    try:
+                        logger.info(
+                            "Starting service discovery (tabula_rasa) for host %s",
+                            hostname,
+                        )
+                        discovery_result = await client.start_service_discovery(
+                            hostname, mode="tabula_rasa"
+                        )
+                        logger.info(
+                            "Service discovery started for host %s: %s",
+                            hostname,
+                            discovery_result,
+                        )
+                        create_result["discovery"] = {
+                            "started": True,
+                            "mode": "tabula_rasa",
+                            "result": discovery_result,
+                        }
+                    except Exception as discovery_error:
+                        # Log but don't fail the whole operation if discovery fails
+                        logger.warning(
+                            "Failed to start service discovery for host %s: %s",
+                            hostname,
+                            discovery_error,
+                        )
+                        create_result["discovery"] = {
+                            "started": False,
+                            "error": str(discovery_error),
+                        }
+
             except CheckMKAPIError as e:
                 logger.error("CheckMK API error creating host %s: %s", hostname, e)
 
@@ -245,117 +247,115 @@ class DeviceSyncOperations:
             import service_factory
             from services.checkmk.exceptions import CheckMKAPIError
 
-            try:
-                # Create CheckMK client with device-specific site
-                client = service_factory.build_checkmk_client()
-
-                # Get current host data
-                checkmk_data = client.get_host(hostname)
-
-                # The folder is in extensions.folder
-                extensions = checkmk_data.get("extensions", {})
-                current_folder = extensions.get("folder", "/")
+            async with service_factory.build_async_checkmk_client() as client:
+                try:
+                    # Get current host data
+                    checkmk_data = await client.get_host(hostname)
 
-            except CheckMKAPIError as e:
-                if "404" in str(e) or "not found" in str(e).lower():
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"Host '{hostname}' not found in CheckMK site '{device_site}' - cannot update non-existent host",
-                    )
-                else:
-                    raise_internal_server_error(
-                        logger, f"CheckMK API error getting host {hostname}", e
-                    )
+                    # The folder is in extensions.folder
+                    extensions = checkmk_data.get("extensions", {})
+                    current_folder = extensions.get("folder", "/")
 
-            # Normalize folder paths for comparison
-            current_folder_normalized = normalize_folder_path(current_folder)
-            new_folder_normalized = normalize_folder_path(new_folder)
+                except CheckMKAPIError as e:
+                    if "404" in str(e) or "not found" in str(e).lower():
+                        raise HTTPException(
+                            status_code=status.HTTP_404_NOT_FOUND,
+                            detail=f"Host '{hostname}' not found in CheckMK site '{device_site}' - cannot update non-existent host",
+                        )
+                    else:
+                        raise_internal_server_error(
+                            logger, f"CheckMK API error getting host {hostname}", e
+                        )
 
-            # Check if folder has changed
-            folder_changed = current_folder_normalized != new_folder_normalized
+                # Normalize folder paths for comparison
+                current_folder_normalized = normalize_folder_path(current_folder)
+                new_folder_normalized = normalize_folder_path(new_folder)
 
-            if folder_changed:
-                # Ensure the new folder path exists
-                path_created = await self._folder.create_path(
-                    new_folder_normalized, device_site, {}
-                )
+                # Check if folder has changed
+                folder_changed = current_folder_normalized != new_folder_normalized
 
-                if not path_created:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Cannot create or ensure folder path '{new_folder_normalized}' exists in CheckMK",
+                if folder_changed:
+                    # Ensure the new folder path exists
+                    path_created = await self._folder.create_path(
+                        new_folder_normalized, device_site, {}
                     )
 
-                # Convert folder path format: CheckMK uses ~ instead of /
-                # First normalize double slashes, then convert / to ~
-                normalized_new_folder = (
-                    new_folder_normalized.replace("//", "/")
-                    if new_folder_normalized
-                    else "/"
-                )
-                checkmk_new_folder = (
-                    normalized_new_folder.replace("/", "~")
-                    if normalized_new_folder
-                    else "~"
-                )
-                logger.info(
-                    "Converted new folder path from '%s' to '%s' for CheckMK client",
-                    new_folder_normalized,
-                    checkmk_new_folder,
-                )
+                    if not path_created:
+                        raise HTTPException(
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"Cannot create or ensure folder path '{new_folder_normalized}' exists in CheckMK",
+                        )
 
-                # Move the host to the new folder
-                try:
-                    client.move_host(hostname, checkmk_new_folder)
+                    # Convert folder path format: CheckMK uses ~ instead of /
+                    # First normalize double slashes, then convert / to ~
+                    normalized_new_folder = (
+                        new_folder_normalized.replace("//", "/")
+                        if new_folder_normalized
+                        else "/"
+                    )
+                    checkmk_new_folder = (
+                        normalized_new_folder.replace("/", "~")
+                        if normalized_new_folder
+                        else "~"
+                    )
                     logger.info(
-                        "Moved host %s from %s to %s",
-                        hostname,
-                        current_folder_normalized,
+                        "Converted new folder path from '%s' to '%s' for CheckMK client",
                         new_folder_normalized,
+                        checkmk_new_folder,
                     )
-                except CheckMKAPIError as e:
-                    if "428" in str(e) or "precondition" in str(e).lower():
-                        raise HTTPException(
-                            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
-                            detail=f"Cannot move host '{hostname}' - CheckMK changes may need to be activated first. Please activate pending changes in CheckMK and try again.",
-                        )
-                    else:
-                        raise_internal_server_error(
-                            logger, f"CheckMK API error moving host {hostname}", e
-                        )
 
-            # Update host attributes
-            try:
-                update_result = client.update_host(hostname, new_attributes)
-                logger.info("Updated host %s attributes", hostname)
-            except CheckMKAPIError as e:
-                logger.error("CheckMK API error updating host %s: %s", hostname, e)
+                    # Move the host to the new folder
+                    try:
+                        await client.move_host(hostname, checkmk_new_folder)
+                        logger.info(
+                            "Moved host %s from %s to %s",
+                            hostname,
+                            current_folder_normalized,
+                            new_folder_normalized,
+                        )
+                    except CheckMKAPIError as e:
+                        if "428" in str(e) or "precondition" in str(e).lower():
+                            raise HTTPException(
+                                status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+                                detail=f"Cannot move host '{hostname}' - CheckMK changes may need to be activated first. Please activate pending changes in CheckMK and try again.",
+                            )
+                        else:
+                            raise_internal_server_error(
+                                logger, f"CheckMK API error moving host {hostname}", e
+                            )
+
+                # Update host attributes
+                try:
+                    update_result = await client.update_host(hostname, new_attributes)
+                    logger.info("Updated host %s attributes", hostname)
+                except CheckMKAPIError as e:
+                    logger.error("CheckMK API error updating host %s: %s", hostname, e)
 
-                # Preserve CheckMK error details for better error reporting
-                error_detail = {
-                    "error": str(e),
-                    "status_code": e.status_code,
-                }
+                    # Preserve CheckMK error details for better error reporting
+                    error_detail = {
+                        "error": str(e),
+                        "status_code": e.status_code,
+                    }
 
-                # Include detailed error fields if available
-                if e.response_data:
-                    if "detail" in e.response_data:
-                        error_detail["detail"] = e.response_data["detail"]
-                    if "fields" in e.response_data:
-                        error_detail["fields"] = e.response_data["fields"]
-                    if "title" in e.response_data:
-                        error_detail["title"] = e.response_data["title"]
-                    if "validation_summary" in e.response_data:
-                        error_detail["validation_summary"] = e.response_data[
-                            "validation_summary"
-                        ]
-                    if "request" in e.response_data:
-                        error_detail["request"] = e.response_data["request"]
+                    # Include detailed error fields if available
+                    if e.response_data:
+                        if "detail" in e.response_data:
+                            error_detail["detail"] = e.response_data["detail"]
+                        if "fields" in e.response_data:
+                            error_detail["fields"] = e.response_data["fields"]
+                        if "title" in e.response_data:
+                            error_detail["title"] = e.response_data["title"]
+                        if "validation_summary" in e.response_data:
+                            error_detail["validation_summary"] = e.response_data[
+                                "validation_summary"
+                            ]
+                        if "request" in e.response_data:
+                            error_detail["request"] = e.response_data["request"]
 
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=json.dumps(error_detail),
-                )
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=json.dumps(error_detail),
+                    )
 
             logger.info(
                 "Successfully updated device %s (%s) in CheckMK", device_id, hostname
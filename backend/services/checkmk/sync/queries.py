@@ -8,7 +8,8 @@ used in CheckMK synchronization.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from fastapi import HTTPException, status
 
@@ -31,6 +32,69 @@ _DEVICE_LIST_GRAPHQL_FIELDS = """
                 }
 """
 
+# Used when checkmk_queries.yaml does not define "get_device_normalized".
+_FALLBACK_NORMALIZED_QUERY = """
+query getDevice($deviceId: ID!) {
+  device(id: $deviceId) {
+    id
+    name
+    primary_ip4 {
+      address
+    }
+    location {
+      name
+      location_type {
+        name
+      }
+      parent {
+        name
+        location_type {
+          name
+        }
+        parent {
+          name
+          location_type {
+            name
+          }
+        }
+      }
+    }
+    role {
+      name
+    }
+    platform {
+      name
+    }
+    status {
+      name
+    }
+    _custom_field_data
+    tags {
+      name
+    }
+  }
+}
+"""
+
+
+def _selection_set(query: str, field: str) -> Optional[str]:
+    """Return the selection set of ``field(id: ...) { ... }`` in ``query``.
+
+    Used to reuse the configured single-device query for paged bulk fetches.
+    """
+    match = re.search(rf"\b{field}\s*\(\s*id\s*:[^)]*\)\s*\{{", query)
+    if not match:
+        return None
+    depth = 0
+    for position in range(match.end() - 1, len(query)):
+        if query[position] == "{":
+            depth += 1
+        elif query[position] == "}":
+            depth -= 1
+            if depth == 0:
+                return query[match.end() : position]
+    return None
+
 
 class DeviceQueryService:
     """Service for querying device data from Nautobot."""
@@ -144,56 +208,7 @@ class DeviceQueryService:
             nautobot_service = service_factory.build_nautobot_service()
 
             # Fetch device data from Nautobot including custom fields
-            # Load query from configuration file
-            query = self._config.get_query("get_device_normalized")
-            if not query:
-                # Fallback to default query if not found in config
-                logger.warning(
-                    "Query 'get_device_normalized' not found in config, using fallback query"
-                )
-                query = """
-                query getDevice($deviceId: ID!) {
-                  device(id: $deviceId) {
-                    id
-                    name
-                    primary_ip4 {
-                      address
-                    }
-                    location {
-                      name
-                      location_type {
-                        name
-                      }
-                      parent {
-                        name
-                        location_type {
-                          name
-                        }
-                        parent {
-                          name
-                          location_type {
-                            name
-                          }
-                        }
-                      }
-                    }
-                    role {
-                      name
-                    }
-                    platform {
-                      name
-                    }
-                    status {
-                      name
-                    }
-                    _custom_field_data
-                    tags {
-                      name
-                    }
-                  }
-                }
-                """
-
+            query = self._normalized_query()
             variables = {"deviceId": device_id}
             result = await nautobot_service.graphql_query(query, variables)
 
@@ -211,62 +226,7 @@ class DeviceQueryService:
                     detail=f"Device with ID {device_id} not found",
                 )
 
-            # Find the matching priority rule and load its config
-            matched_rule = self._rule_evaluator.find_matching_rule(device_data)
-            if matched_rule:
-                try:
-                    device_config = self._config.load_config_file(matched_rule.filename)
-                    logger.info(
-                        "[NORMALIZE] Device %s uses priority rule '%s' (id=%s)",
-                        device_id,
-                        matched_rule.filename,
-                        matched_rule.id,
-                    )
-                except FileNotFoundError:
-                    logger.warning(
-                        "[NORMALIZE] Config file '%s' for rule id=%s not found, falling back to default",
-                        matched_rule.filename,
-                        matched_rule.id,
-                    )
-                    device_config = self._config.load_checkmk_config()
-                    matched_rule = None
-            else:
-                device_config = self._config.load_checkmk_config()
-                logger.info(
-                    "[NORMALIZE] Device %s uses default config (no priority rule matched)",
-                    device_id,
-                )
-
-            # Normalize the device data using the matched config
-            extensions = self._normalization.normalize_device(
-                device_data, config=device_config
-            )
-
-            # Convert to dictionary for API response
-            normalized_dict = extensions.model_dump()
-
-            # Embed matched rule info in internal section for UI display
-            if matched_rule:
-                normalized_dict["internal"]["matched_rule"] = {
-                    "id": matched_rule.id,
-                    "filename": matched_rule.filename,
-                    "priority_order": matched_rule.priority_order,
-                    "is_default": False,
-                }
-            else:
-                normalized_dict["internal"]["matched_rule"] = {
-                    "id": None,
-                    "filename": "checkmk.yaml",
-                    "priority_order": None,
-                    "is_default": True,
-                }
-
-            # DEBUG: Log normalized device config for test fixture creation
-            logger.debug("[NORMALIZE] Device %s normalized config:", device_id)
-            logger.debug("[NORMALIZE] Config keys: %s", list(normalized_dict.keys()))
-            logger.debug("[NORMALIZE] Full normalized config: %s", normalized_dict)
-
-            return normalized_dict
+            return self.normalize_device_data(device_data)
 
         except HTTPException:
             raise
@@ -276,3 +236,99 @@ class DeviceQueryService:
                 f"Error getting normalized device config for {device_id}",
                 e,
             )
+
+    def _normalized_query(self) -> str:
+        """Return the configured single-device normalization query."""
+        query = self._config.get_query("get_device_normalized")
+        if not query:
+            # Fallback to default query if not found in config
+            logger.warning(
+                "Query 'get_device_normalized' not found in config, using fallback query"
+            )
+            query = _FALLBACK_NORMALIZED_QUERY
+        return query
+
+    def iter_normalization_pages(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield all Nautobot devices page by page with normalization fields.
+
+        The selection set is taken from the configured ``get_device_normalized``
+        query, so bulk comparisons normalize exactly the data a single-device
+        comparison would.
+        """
+        import service_factory
+
+        nautobot_service = service_factory.build_nautobot_service()
+        fields = _selection_set(self._normalized_query(), "device")
+        if fields is None:
+            logger.warning(
+                "Could not extract device fields from 'get_device_normalized', "
+                "using fallback query fields"
+            )
+            fields = _selection_set(_FALLBACK_NORMALIZED_QUERY, "device")
+        return nautobot_service.iter_device_pages(fields)
+
+    def normalize_device_data(self, device_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize raw Nautobot device data into a CheckMK host config.
+
+        Synchronous and free of Nautobot calls, so bulk comparisons can run it
+        in worker threads.
+
+        Raises:
+            ValueError: If device data is invalid or missing required fields
+        """
+        # Find the matching priority rule and load its config
+        matched_rule = self._rule_evaluator.find_matching_rule(device_data)
+        if matched_rule:
+            try:
+                device_config = self._config.load_config_file(matched_rule.filename)
+                logger.info(
+                    "[NORMALIZE] Device %s uses priority rule '%s' (id=%s)",
+                    device_data.get("id"),
+                    matched_rule.filename,
+                    matched_rule.id,
+                )
+            except FileNotFoundError:
+                logger.warning(
+                    "[NORMALIZE] Config file '%s' for rule id=%s not found, falling back to default",
+                    matched_rule.filename,
+                    matched_rule.id,
+                )
+                device_config = self._config.load_checkmk_config()
+                matched_rule = None
+        else:
+            device_config = self._config.load_checkmk_config()
+            logger.info(
+                "[NORMALIZE] Device %s uses default config (no priority rule matched)",
+                device_data.get("id"),
+            )
+
+        # Normalize the device data using the matched config
+        extensions = self._normalization.normalize_device(
+            device_data, config=device_config
+        )
+
+        # Convert to dictionary for API response
+        normalized_dict = extensions.model_dump()
+
+        # Embed matched rule info in internal section for UI display
+        if matched_rule:
+            normalized_dict["internal"]["matched_rule"] = {
+                "id": matched_rule.id,
+                "filename": matched_rule.filename,
+                "priority_order": matched_rule.priority_order,
+                "is_default": False,
+            }
+        else:
+            normalized_dict["internal"]["matched_rule"] = {
+                "id": None,
+                "filename": "checkmk.yaml",
+                "priority_order": None,
+                "is_default": True,
+            }
+
+        # DEBUG: Log normalized device config for test fixture creation
+        logger.debug("[NORMALIZE] Device %s normalized config:", device_data.get("id"))
+        logger.debug("[NORMALIZE] Config keys: %s", list(normalized_dict.keys()))
+        logger.debug("[NORMALIZE] Full normalized config: %s", normalized_dict)
+
+        return normalized_dict
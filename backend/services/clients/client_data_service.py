@@ -27,6 +27,7 @@ class ClientDataService:
         hostname: Optional[str] = None,
         page: int = 1,
         page_size: int = 50,
+        cursor: Optional[int] = None,
     ) -> Tuple[List[dict], int]:
         return self._repo.get_client_data(
             device_name=device_name,
@@ -38,6 +39,7 @@ class ClientDataService:
             hostname=hostname,
             page=page,
             page_size=page_size,
+            cursor=cursor,
         )
 
     def get_client_history(
@@ -3,6 +3,7 @@ Service for Grafana Agent management
 Handles Redis Pub/Sub communication and command tracking
 """
 
+import asyncio
 import base64
 import hashlib
 import hmac
@@ -10,6 +11,9 @@ import json
 import logging
 import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait as wait_futures
 from typing import Dict, List, Optional
 
 import redis
@@ -19,6 +23,12 @@ from sqlalchemy.orm import Session
 from config import settings
 from repositories.cockpit_agent.cockpit_agent_repository import CockpitAgentRepository
 from services.cockpit_agent.ansible_auth import ResolvedAnsibleAuth
+from services.cockpit_agent.response_dispatcher import (
+    AgentResponseDispatcher,
+    agent_response_dispatcher,
+    is_progress,
+    parse_response_message,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +36,13 @@ logger = logging.getLogger(__name__)
 class CockpitAgentService:
     """Service for managing Grafana Agents via Redis Pub/Sub"""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self, db: Session, dispatcher: Optional[AgentResponseDispatcher] = None
+    ):
         self.db = db
         self.repository = CockpitAgentRepository(db)
         self.redis_client = self._get_redis_client()
+        self._dispatcher = dispatcher or agent_response_dispatcher
 
     def _get_redis_client(self) -> redis.Redis:
         """Create Redis client from settings"""
@@ -45,8 +58,12 @@ class CockpitAgentService:
         """Look up the HMAC shared secret for a Cockpit agent from the settings table."""
         return self.repository.get_agent_shared_secret(agent_id)
 
-    def _resolve_credential(self, credential_id: int) -> tuple[str, str]:
-        """Fetch username and decrypted password from the credentials table."""
+    def resolve_credential(self, credential_id: int) -> tuple[str, str]:
+        """Fetch username and decrypted password from the credentials table.
+
+        Raises:
+            ValueError: If the credential is missing or incomplete
+        """
         import service_factory
 
         credentials_manager = service_factory.build_credentials_service()
@@ -100,13 +117,16 @@ class CockpitAgentService:
         command: str,
         params: dict,
         sent_by: str,
+        command_id: Optional[str] = None,
     ) -> str:
         """
         Send command to agent via Redis Pub/Sub
         Returns command_id for tracking
+
+        Callers that registered for the response beforehand pass the
+        *command_id* they registered; otherwise a new one is generated.
         """
-        # Generate unique command ID
-        command_id = str(uuid.uuid4())
+        command_id = command_id or str(uuid.uuid4())
 
         # Build command message
         command_message = {
@@ -162,116 +182,100 @@ class CockpitAgentService:
 
         return command_id
 
-    # Short per-read socket timeout.  Keeping this at 1 s means the blocking
-    # recv loop wakes up frequently enough that Ctrl-C / graceful shutdown can
-    # interrupt it, while still avoiding a busy-poll.
+    # How long AgentCommandChannel.next_response() waits before returning None
+    # so the caller can dispatch more work.
     _POLL_INTERVAL = 1
 
-    def _open_subscription(self, agent_id: str) -> tuple:
-        """
-        Open a Redis pub/sub subscription for agent responses.
+    # Kept as static methods for AgentCommandChannel and existing callers.
+    _parse_response_message = staticmethod(parse_response_message)
+    _is_progress = staticmethod(is_progress)
+
+    def _record_response(self, command_id: str, response_data: dict) -> None:
+        """Persist a final agent response for *command_id*."""
+        # Serialize dict/list outputs to JSON string for DB storage
+        raw_output = response_data.get("output")
+        output_to_store = (
+            json.dumps(raw_output)
+            if isinstance(raw_output, (dict, list))
+            else raw_output
+        )
+        self.repository.update_command_result(
+            command_id=command_id,
+            status=response_data.get("status"),
+            output=output_to_store,
+            error=response_data.get("error"),
+            execution_time_ms=response_data.get("execution_time_ms"),
+        )
 
-        Must be called BEFORE send_command to avoid a race where the agent
-        responds before the caller has started listening.
+    def _record_timeout(self, command_id: str, timeout: int) -> dict:
+        """Mark *command_id* as timed out and return the synthetic response."""
+        error = f"Response timeout after {timeout}s"
+        self.repository.update_command_result(
+            command_id=command_id, status="timeout", error=error
+        )
+        return {"command_id": command_id, "status": "timeout", "error": error}
 
-        Returns (redis_client, pubsub) — caller is responsible for cleanup.
-        """
-        response_channel = f"cockpit-agent-response:{agent_id}"
-        redis_sub = redis.from_url(
-            settings.redis_url,
-            decode_responses=True,
-            socket_timeout=self._POLL_INTERVAL,
-            **settings.redis_ssl_params,
+    def _record_redis_error(self, command_id: str, error: redis.RedisError) -> None:
+        logger.error("Redis error while waiting for response: %s", error)
+        self.repository.update_command_result(
+            command_id=command_id, status="error", error=str(error)
         )
-        pubsub = redis_sub.pubsub()
-        pubsub.subscribe(response_channel)
-        return redis_sub, pubsub
 
-    def _drain_response(
+    def _resolve_response(self, future: Future, command_id: str) -> dict:
+        """Record and return the response in the completed *future*."""
+        try:
+            response_data = future.result(timeout=0)
+        except redis.RedisError as e:
+            self._record_redis_error(command_id, e)
+            raise
+        self._record_response(command_id, response_data)
+        return response_data
+
+    def _wait_response(self, future: Future, command_id: str, timeout: int) -> dict:
+        try:
+            future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return self._record_timeout(command_id, timeout)
+        except redis.RedisError:
+            pass  # recorded below
+        return self._resolve_response(future, command_id)
+
+    def open_command_channel(self, agent_id: str) -> "AgentCommandChannel":
+        """
+        Track many in-flight commands to one agent and collect their replies.
+
+        Use this instead of send_command_and_wait when several commands to the
+        same agent should overlap; close the channel (or use it as a context
+        manager) when done.
+        """
+        return AgentCommandChannel(self, agent_id)
+
+    def send_command_and_wait(
         self,
-        redis_sub,
-        pubsub,
-        command_id: str,
-        timeout: int,
+        agent_id: str,
+        command: str,
+        params: dict,
+        sent_by: str,
+        timeout: int = 30,
     ) -> dict:
         """
-        Block until the agent publishes a response for *command_id*, then return it.
-        Always closes *pubsub* and *redis_sub* before returning.
+        Register for the response, send the command, then wait for the reply.
+
+        Registering first prevents the race condition where an agent responds
+        before the caller has started listening (common for fast error paths
+        such as pre-flight checks that return in < 1 ms).  The reply arrives
+        through the process-wide response dispatcher, so concurrent calls
+        share one Redis subscription connection.
         """
-        start_time = time.time()
+        command_id = str(uuid.uuid4())
+        future = self._dispatcher.expect(agent_id, command_id)
         try:
-            while time.time() - start_time < timeout:
-                try:
-                    message = pubsub.get_message(
-                        ignore_subscribe_messages=True, timeout=self._POLL_INTERVAL
-                    )
-                except redis.exceptions.TimeoutError:
-                    continue
-
-                if message is None:
-                    continue
-                if message.get("type") != "message":
-                    continue
-
-                try:
-                    response_data = json.loads(message["data"])
-                except json.JSONDecodeError as e:
-                    logger.error("Failed to parse response JSON: %s", e)
-                    continue
-
-                if response_data.get("command_id") != command_id:
-                    continue
-
-                # Progress updates: log and keep waiting for the final result.
-                if response_data.get("type") == "progress":
-                    logger.info(
-                        "Agent progress for %s: %s/%s IPs completed",
-                        command_id,
-                        response_data.get("completed_ips", "?"),
-                        response_data.get("total_ips", "?"),
-                    )
-                    continue
-
-                # Serialize dict/list outputs to JSON string for DB storage
-                raw_output = response_data.get("output")
-                output_to_store = (
-                    json.dumps(raw_output)
-                    if isinstance(raw_output, (dict, list))
-                    else raw_output
-                )
-                self.repository.update_command_result(
-                    command_id=command_id,
-                    status=response_data.get("status"),
-                    output=output_to_store,
-                    error=response_data.get("error"),
-                    execution_time_ms=response_data.get("execution_time_ms"),
-                )
-                return response_data
-
-            # Timeout
-            self.repository.update_command_result(
-                command_id=command_id,
-                status="timeout",
-                error=f"Response timeout after {timeout}s",
-            )
-            return {
-                "command_id": command_id,
-                "status": "timeout",
-                "error": f"Response timeout after {timeout}s",
-            }
-
-        except redis.RedisError as e:
-            logger.error("Redis error while waiting for response: %s", e)
-            self.repository.update_command_result(
-                command_id=command_id, status="error", error=str(e)
-            )
-            raise
+            self.send_command(agent_id, command, params, sent_by, command_id=command_id)
+            return self._wait_response(future, command_id, timeout)
         finally:
-            pubsub.unsubscribe()
-            pubsub.close()
-            redis_sub.close()
+            self._dispatcher.discard(agent_id, command_id)
 
-    def send_command_and_wait(
+    async def send_command_and_wait_async(
         self,
         agent_id: str,
         command: str,
@@ -280,15 +284,36 @@ class CockpitAgentService:
         timeout: int = 30,
     ) -> dict:
         """
-        Subscribe to the response channel, send the command, then wait for the reply.
+        send_command_and_wait for asyncio callers.
 
-        Subscribing first prevents the race condition where an agent responds
-        before the caller has started listening (common for fast error paths
-        such as pre-flight checks that return in < 1 ms).
+        Waiting does not hold a thread, so thousands of commands can be in
+        flight from one event loop.  Publishing and the command history
+        writes run in worker threads so they do not block the loop.
         """
-        redis_sub, pubsub = self._open_subscription(agent_id)
-        command_id = self.send_command(agent_id, command, params, sent_by)
-        return self._drain_response(redis_sub, pubsub, command_id, timeout)
+        command_id = str(uuid.uuid4())
+        future = await self._dispatcher.expect_async(agent_id, command_id)
+        try:
+            await asyncio.to_thread(
+                self.send_command,
+                agent_id,
+                command,
+                params,
+                sent_by,
+                command_id=command_id,
+            )
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(future)), timeout
+                )
+            except asyncio.TimeoutError:
+                return await asyncio.to_thread(
+                    self._record_timeout, command_id, timeout
+                )
+            except redis.RedisError:
+                pass  # recorded below
+            return await asyncio.to_thread(self._resolve_response, future, command_id)
+        finally:
+            await asyncio.to_thread(self._dispatcher.discard, agent_id, command_id)
 
     def wait_for_response(
         self, agent_id: str, command_id: str, timeout: int = 30
@@ -296,12 +321,15 @@ class CockpitAgentService:
         """
         Wait for response from agent by command_id.
 
-        Prefer send_command_and_wait for new call sites — it subscribes before
+        Prefer send_command_and_wait for new call sites — it registers before
         sending and avoids the race condition described there.  This method is
         kept for callers that must separate send from wait.
         """
-        redis_sub, pubsub = self._open_subscription(agent_id)
-        return self._drain_response(redis_sub, pubsub, command_id, timeout)
+        future = self._dispatcher.expect(agent_id, command_id)
+        try:
+            return self._wait_response(future, command_id, timeout)
+        finally:
+            self._dispatcher.discard(agent_id, command_id)
 
     def get_agent_status(self, agent_id: str) -> Optional[Dict]:
         """
@@ -760,7 +788,7 @@ class CockpitAgentService:
         if err:
             return err
 
-        username, password = self._resolve_credential(credential_id)
+        username, password = self.resolve_credential(credential_id)
         return self.send_command_and_wait(
             agent_id=agent_id,
             command="execute_commands",
@@ -796,7 +824,7 @@ class CockpitAgentService:
         if err:
             return err
 
-        username, password = self._resolve_credential(credential_id)
+        username, password = self.resolve_credential(credential_id)
         return self.send_command_and_wait(
             agent_id=agent_id,
             command="get_running_config",
@@ -828,7 +856,7 @@ class CockpitAgentService:
         if err:
             return err
 
-        username, password = self._resolve_credential(credential_id)
+        username, password = self.resolve_credential(credential_id)
         return self.send_command_and_wait(
             agent_id=agent_id,
             command="get_startup_config",
@@ -843,3 +871,98 @@ class CockpitAgentService:
             sent_by=sent_by,
             timeout=timeout,
         )
+
+
+class AgentCommandChannel:
+    """
+    Several in-flight commands to one agent, answered through the dispatcher.
+
+    Commands are sent with send(); next_response() returns final responses in
+    the order the agent completes them, or a synthetic timeout response once a
+    command's own deadline has passed.  Results are recorded in the database
+    exactly as send_command_and_wait does.
+    """
+
+    def __init__(self, service: CockpitAgentService, agent_id: str):
+        self._service = service
+        self.agent_id = agent_id
+        # command_id -> (future, deadline, timeout)
+        self._pending: Dict[str, tuple[Future, float, int]] = {}
+
+    def __enter__(self) -> "AgentCommandChannel":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """Number of commands still waiting for a response."""
+        return len(self._pending)
+
+    def send(self, command: str, params: dict, sent_by: str, timeout: int = 30) -> str:
+        """Send *command* and start tracking it; returns its command_id."""
+        dispatcher = self._service._dispatcher
+        command_id = str(uuid.uuid4())
+        future = dispatcher.expect(self.agent_id, command_id)
+        try:
+            self._service.send_command(
+                self.agent_id, command, params, sent_by, command_id=command_id
+            )
+        except Exception:
+            dispatcher.discard(self.agent_id, command_id)
+            raise
+        self._pending[command_id] = (future, time.time() + timeout, timeout)
+        return command_id
+
+    def _finish(self, command_id: str) -> tuple[Future, float, int]:
+        self._service._dispatcher.discard(self.agent_id, command_id)
+        return self._pending.pop(command_id)
+
+    def next_response(self) -> Optional[dict]:
+        """
+        Return the next final response for any pending command.
+
+        Returns None when nothing is pending, or when a poll interval elapsed
+        without a result so the caller can dispatch more work.
+        """
+        if not self._pending:
+            return None
+
+        by_future = {
+            future: command_id for command_id, (future, _, _) in self._pending.items()
+        }
+        done = [future for future in by_future if future.done()]
+        if not done:
+            now = time.time()
+            for command_id, (_, deadline, timeout) in list(self._pending.items()):
+                if now >= deadline:
+                    self._finish(command_id)
+                    return self._service._record_timeout(command_id, timeout)
+            next_deadline = min(deadline for _, deadline, _ in self._pending.values())
+            done, _ = wait_futures(
+                list(by_future),
+                timeout=max(0, min(self._service._POLL_INTERVAL, next_deadline - now)),
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                return None
+
+        command_id = by_future[next(iter(done))]
+        future, _, _ = self._finish(command_id)
+        try:
+            return self._service._resolve_response(future, command_id)
+        except Exception as e:
+            # Keep the other pending commands going; report this one as failed
+            logger.error("Failed to resolve response of %s: %s", command_id, e)
+            return {"command_id": command_id, "status": "error", "error": str(e)}
+
+    def close(self) -> None:
+        """Mark unanswered commands as cancelled and stop tracking them."""
+        for command_id in list(self._pending):
+            self._finish(command_id)
+            self._service.repository.update_command_result(
+                command_id=command_id,
+                status="error",
+                error="Command channel closed before a response arrived",
+            )
@@ -0,0 +1,240 @@
+"""
+Process-wide dispatcher for Cockpit agent responses.
+
+Agents publish every reply on ``cockpit-agent-response:<agent_id>``.  Rather
+than opening a Redis connection and pub/sub per command, each process keeps
+one subscription connection, subscribes to an agent's response channel while
+at least one command to that agent is in flight, and hands each final reply
+to the ``concurrent.futures.Future`` registered for its ``command_id``.
+Futures work for blocking callers (``future.result(timeout)``) and for
+asyncio code (``asyncio.wrap_future``) alike.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple
+
+import redis
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for Redis to confirm a new channel subscription
+SUBSCRIBE_TIMEOUT = 5.0
+# Read timeout of the dispatcher loop; bounds how long a stop request waits
+POLL_INTERVAL = 1.0
+
+
+def response_channel(agent_id: str) -> str:
+    """Pub/sub channel on which *agent_id* publishes its responses."""
+    return f"cockpit-agent-response:{agent_id}"
+
+
+def parse_response_message(message: Optional[dict]) -> Optional[dict]:
+    """Decode a pub/sub message into a response dict, or None if it is not one."""
+    if message is None or message.get("type") != "message":
+        return None
+    try:
+        return json.loads(message["data"])
+    except json.JSONDecodeError as e:
+        logger.error("Failed to parse response JSON: %s", e)
+        return None
+
+
+def is_progress(response_data: dict) -> bool:
+    """Log progress updates; the caller keeps waiting for the final result."""
+    if response_data.get("type") != "progress":
+        return False
+    logger.info(
+        "Agent progress for %s: %s/%s IPs completed",
+        response_data.get("command_id"),
+        response_data.get("completed_ips", "?"),
+        response_data.get("total_ips", "?"),
+    )
+    return True
+
+
+def _default_redis() -> redis.Redis:
+    return redis.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        socket_connect_timeout=5,
+        socket_keepalive=True,
+        health_check_interval=30,
+        **settings.redis_ssl_params,
+    )
+
+
+class _Subscription:
+    """Reference-counted subscription to one agent's response channel."""
+
+    __slots__ = ("refs", "ready")
+
+    def __init__(self) -> None:
+        self.refs = 0
+        self.ready = threading.Event()
+
+
+class AgentResponseDispatcher:
+    """Routes agent responses from shared subscriptions to per-command futures."""
+
+    def __init__(
+        self, redis_factory=_default_redis, subscribe_timeout=SUBSCRIBE_TIMEOUT
+    ):
+        self._redis_factory = redis_factory
+        self._subscribe_timeout = subscribe_timeout
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._pubsub = None
+        self._waiters: Dict[str, Future] = {}
+        self._subscriptions: Dict[str, _Subscription] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of commands currently waiting for a response."""
+        return len(self._waiters)
+
+    def expect(self, agent_id: str, command_id: str) -> Future:
+        """
+        Register *command_id* and return the future its final response resolves.
+
+        Returns once the agent's response channel is subscribed, so the
+        command may be published right away without racing its reply.  Every
+        call must be paired with discard().
+        """
+        future, ready = self._register(agent_id, command_id)
+        if not ready.wait(self._subscribe_timeout):
+            self.discard(agent_id, command_id)
+            raise redis.exceptions.TimeoutError(
+                f"Timed out subscribing to {response_channel(agent_id)}"
+            )
+        return future
+
+    async def expect_async(self, agent_id: str, command_id: str) -> Future:
+        """expect() for asyncio callers.
+
+        Subscribing writes to the Redis connection and may wait for the
+        confirmation, so it runs in a worker thread instead of the loop.
+        """
+        return await asyncio.to_thread(self.expect, agent_id, command_id)
+
+    def discard(self, agent_id: str, command_id: str) -> None:
+        """Forget *command_id*; unsubscribe once no command to the agent is left."""
+        channel = response_channel(agent_id)
+        with self._lock:
+            if self._waiters.pop(command_id, None) is None:
+                return
+            subscription = self._subscriptions.get(channel)
+            if subscription is None:
+                return
+            subscription.refs -= 1
+            if subscription.refs > 0:
+                return
+            del self._subscriptions[channel]
+            try:
+                self._pubsub.unsubscribe(channel)
+            except redis.RedisError as e:
+                logger.warning("Failed to unsubscribe from %s: %s", channel, e)
+
+    def close(self) -> None:
+        """Stop the reader thread and drop the subscription connection."""
+        with self._lock:
+            pubsub, self._pubsub, self._pid = self._pubsub, None, None
+            self._subscriptions = {}
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except redis.RedisError as e:
+                logger.debug("Failed to close agent response subscription: %s", e)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _register(
+        self, agent_id: str, command_id: str
+    ) -> Tuple[Future, threading.Event]:
+        self._ensure_started()
+        channel = response_channel(agent_id)
+        future: Future = Future()
+        with self._lock:
+            subscription = self._subscriptions.get(channel)
+            if subscription is None:
+                subscription = _Subscription()
+                self._pubsub.subscribe(channel)
+                self._subscriptions[channel] = subscription
+            subscription.refs += 1
+            self._waiters[command_id] = future
+        return future, subscription.ready
+
+    def _ensure_started(self) -> None:
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # First command in this process, or in a forked child that must
+            # not share the parent's connection and reader thread
+            self._waiters = {}
+            self._subscriptions = {}
+            self._pubsub = self._redis_factory().pubsub()
+            self._pid = os.getpid()
+            threading.Thread(
+                target=self._run,
+                args=(self._pubsub, self._pid),
+                name="agent-response-dispatcher",
+                daemon=True,
+            ).start()
+
+    def _run(self, pubsub, pid: int) -> None:
+        while self._pid == pid:
+            try:
+                message = pubsub.get_message(timeout=POLL_INTERVAL)
+            except redis.exceptions.TimeoutError:
+                continue
+            except Exception as e:
+                # redis-py reconnects and resubscribes on the next read, but
+                # replies published in between are lost
+                logger.error("Agent response subscription failed: %s", e)
+                self._fail_all(e)
+                time.sleep(POLL_INTERVAL)
+                continue
+            if message is not None:
+                self._dispatch(message)
+
+    def _dispatch(self, message: dict) -> None:
+        if message.get("type") == "subscribe":
+            subscription = self._subscriptions.get(message.get("channel"))
+            if subscription is not None:
+                subscription.ready.set()
+            return
+
+        response_data = parse_response_message(message)
+        if response_data is None:
+            return
+        future = self._waiters.get(response_data.get("command_id"))
+        if future is None or future.done():
+            return
+        if is_progress(response_data):
+            return
+        future.set_result(response_data)
+
+    def _fail_all(self, error: Exception) -> None:
+        with self._lock:
+            waiters = list(self._waiters.values())
+            for subscription in self._subscriptions.values():
+                subscription.ready.clear()
+        for future in waiters:
+            if not future.done():
+                future.set_exception(error)
+
+
+agent_response_dispatcher = AgentResponseDispatcher()
@@ -0,0 +1,488 @@
+"""
+Git Content Index - persistent trigram index for repository content search.
+
+Each repository gets a small SQLite database under ``data/git_index/`` with:
+
+- ``files``: path -> blob SHA for the indexed HEAD tree, plus the size and
+  mtime of the working copy when it was last found identical to the blob
+- ``history``: path -> blob SHA of older revisions seen by history searches
+- ``blobs``: every blob SHA that has been indexed (and whether it is text)
+- ``postings``: lower-cased trigram -> blob SHA
+
+Postings are keyed by blob SHA, so a blob is read and indexed once no matter
+how many paths or commits reference it.  The HEAD tree is kept current
+incrementally from ``git diff --name-only <indexed>..HEAD``; history blobs
+are indexed the first time a history search sees them.  Blobs referenced by
+neither the HEAD tree nor the history of a file in it are dropped with their
+postings whenever the tree changes.
+
+Building and refreshing run in a background thread.  Until the index is at
+HEAD, searches do not use it and scan the files as before.  A working copy
+counts as unchanged while its size and mtime match the recorded ones, so
+searches need no ``git status``.
+
+The index only narrows candidates: a blob whose trigrams do not cover the
+query cannot contain it, anything else still gets line-matched as before.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from git import GitCommandError, Repo
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIRECTORY = "git_index"
+
+# Bump when the tables change; older indexes are then rebuilt from scratch
+SCHEMA_VERSION = "2"
+
+# Paths per ``git ls-tree`` call when applying an incremental diff
+_LS_TREE_CHUNK = 500
+
+# Seconds after which a search re-checks the working copies in the background
+VERIFY_INTERVAL = 60
+
+# A file modified this recently may change again without a new mtime, so it
+# is not recorded as unchanged yet (git's "racily clean" rule)
+_RACY_WINDOW_NS = 2 * 10**9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    sha TEXT NOT NULL,
+    size INTEGER,
+    mtime_ns INTEGER
+);
+CREATE TABLE IF NOT EXISTS history (
+    path TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    PRIMARY KEY (path, sha)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS blobs (sha TEXT PRIMARY KEY, is_text INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS postings (
+    trigram TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    PRIMARY KEY (trigram, sha)
+) WITHOUT ROWID;
+"""
+
+_TABLES = ("meta", "files", "history", "blobs", "postings")
+
+
+def index_path(repository: Dict) -> Path:
+    """Compute the on-disk path of a repository's content index."""
+    from config import settings as config_settings
+
+    return (
+        Path(config_settings.data_directory)
+        / INDEX_DIRECTORY
+        / f"repo_{repository['id']}.sqlite3"
+    )
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the case-folded trigrams of *text*."""
+    folded = text.lower()
+    return {folded[i : i + 3] for i in range(len(folded) - 2)}
+
+
+def _stat(root: str, path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(os.path.join(root, path))
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _blob_sha(data: bytes) -> str:
+    """Return the git object id *data* would have as a blob."""
+    header = b"blob %d\0" % len(data)
+    return hashlib.sha1(header + data).hexdigest()
+
+
+class GitContentIndex:
+    """Trigram index over the blobs of one git repository."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        if self._meta("schema") != SCHEMA_VERSION:
+            self._reset()
+
+    def __enter__(self) -> GitContentIndex:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        try:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def _reset(self) -> None:
+        with self._conn:
+            for table in _TABLES:
+                self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self._conn.executescript(_SCHEMA)
+        with self._conn:
+            self._set_meta("schema", SCHEMA_VERSION)
+
+    # ------------------------------------------------------------------
+    # Updating
+    # ------------------------------------------------------------------
+
+    def indexed_commit(self) -> Optional[str]:
+        return self._meta("head")
+
+    def verified_at(self) -> float:
+        """Return when the working copies were last checked (epoch seconds)."""
+        return float(self._meta("verified_at") or 0)
+
+    def refresh(self, repo: Repo) -> None:
+        """Bring the index up to date with *repo*'s HEAD and working tree."""
+        try:
+            head = repo.head.commit.hexsha
+        except ValueError:
+            return  # empty repository, nothing to index
+
+        if self.indexed_commit() != head:
+            self._update_tree(repo, head)
+        self._verify_working_tree(repo.working_tree_dir)
+
+    def _update_tree(self, repo: Repo, head: str) -> None:
+        indexed = self.indexed_commit()
+        changed: Optional[List[str]] = None
+        if indexed:
+            try:
+                output = repo.git.diff("--name-only", "--no-renames", indexed, head)
+                changed = [line for line in output.splitlines() if line]
+            except GitCommandError:
+                logger.info("Indexed commit %s is gone, rebuilding", indexed[:8])
+
+        with self._conn:
+            if changed is None:
+                self._conn.execute("DELETE FROM files")
+                entries = self._ls_tree(repo, head)
+            else:
+                self._conn.executemany(
+                    "DELETE FROM files WHERE path = ?", ((p,) for p in changed)
+                )
+                entries = {}
+                for start in range(0, len(changed), _LS_TREE_CHUNK):
+                    entries.update(
+                        self._ls_tree(
+                            repo, head, changed[start : start + _LS_TREE_CHUNK]
+                        )
+                    )
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (path, sha) VALUES (?, ?)",
+                entries.items(),
+            )
+            self._ensure_blobs(repo, entries.values())
+            pruned = self._prune()
+            self._set_meta("head", head)
+
+        logger.info(
+            "Content index at %s: %s paths %s, %s blobs pruned",
+            head[:8],
+            len(entries),
+            "rebuilt" if changed is None else "updated",
+            pruned,
+        )
+
+    def _prune(self) -> int:
+        """Drop blobs no current file references, now or in its history."""
+        self._conn.execute(
+            "DELETE FROM history WHERE path NOT IN (SELECT path FROM files)"
+        )
+        pruned = self._conn.execute(
+            "DELETE FROM blobs WHERE sha NOT IN (SELECT sha FROM files)"
+            " AND sha NOT IN (SELECT sha FROM history)"
+        ).rowcount
+        if pruned:
+            self._conn.execute(
+                "DELETE FROM postings WHERE sha NOT IN (SELECT sha FROM blobs)"
+            )
+        return pruned
+
+    def _verify_working_tree(self, root: str) -> None:
+        """Record the size and mtime of working copies identical to HEAD."""
+        racy_after = time.time_ns() - _RACY_WINDOW_NS
+        updates = []
+        for path, sha, size, mtime_ns in self._conn.execute(
+            "SELECT path, sha, size, mtime_ns FROM files"
+        ).fetchall():
+            stat = _stat(root, path)
+            if stat is not None and stat == (size, mtime_ns):
+                continue
+            verified: Tuple[Optional[int], Optional[int]] = (None, None)
+            if stat is not None and stat[1] < racy_after:
+                try:
+                    with open(os.path.join(root, path), "rb") as handle:
+                        if _blob_sha(handle.read()) == sha:
+                            verified = stat
+                except OSError:
+                    pass
+            if verified != (size, mtime_ns):
+                updates.append((*verified, path))
+
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", updates
+            )
+            self._set_meta("verified_at", str(time.time()))
+
+    @staticmethod
+    def _ls_tree(
+        repo: Repo, commit: str, paths: Optional[List[str]] = None
+    ) -> Dict[str, str]:
+        args = ["-r", "-z", commit]
+        if paths:
+            args += ["--", *paths]
+        entries: Dict[str, str] = {}
+        for record in repo.git.ls_tree(*args).split("\0"):
+            if not record:
+                continue
+            meta, path = record.split("\t", 1)
+            _mode, obj_type, sha = meta.split()
+            if obj_type == "blob":
+                entries[path] = sha
+        return entries
+
+    def ensure_blobs(
+        self, repo: Repo, path: str, shas: Iterable[str], query: str = ""
+    ) -> Dict[str, str]:
+        """
+        Index every blob of *path*'s history in *shas* that is not indexed yet.
+
+        Returns the text of the newly indexed blobs containing *query*
+        (ignoring case), so that callers do not read them a second time.
+        """
+        shas = set(shas)
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO history (path, sha) VALUES (?, ?)",
+                ((path, sha) for sha in shas),
+            )
+            return self._ensure_blobs(repo, shas, query)
+
+    def _ensure_blobs(
+        self, repo: Repo, shas: Iterable[str], query: str = ""
+    ) -> Dict[str, str]:
+        shas = set(shas)
+        folded = query.lower()
+        texts: Dict[str, str] = {}
+        for sha in shas - self._known(shas):
+            text = self._index_blob(sha, repo.odb.stream(bytes.fromhex(sha)).read())
+            if text is not None and folded and folded in text.lower():
+                texts[sha] = text
+        return texts
+
+    def _known(self, shas: Set[str]) -> Set[str]:
+        shas = list(shas)
+        known: Set[str] = set()
+        for start in range(0, len(shas), 500):
+            chunk = shas[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(
+                row[0]
+                for row in self._conn.execute(
+                    f"SELECT sha FROM blobs WHERE sha IN ({placeholders})", chunk
+                )
+            )
+        return known
+
+    def _index_blob(self, sha: str, raw: bytes) -> Optional[str]:
+        try:
+            text = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blobs (sha, is_text) VALUES (?, 0)", (sha,)
+            )
+            return None
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO blobs (sha, is_text) VALUES (?, 1)", (sha,)
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO postings (trigram, sha) VALUES (?, ?)",
+            ((trigram, sha) for trigram in trigrams(text)),
+        )
+        return text
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def files(self) -> Dict[str, str]:
+        """Return path -> blob SHA for the indexed HEAD tree."""
+        return dict(self._conn.execute("SELECT path, sha FROM files"))
+
+    def unchanged_files(self, root: str, paths: Iterable[str]) -> Dict[str, str]:
+        """
+        Return path -> blob SHA for those of *paths* whose working copy
+        under *root* still has the size and mtime it had when found
+        identical to HEAD.  Only these paths are stat'ed.
+        """
+        paths = list(set(paths))
+        rows: List[Tuple[str, str, int, int]] = []
+        for start in range(0, len(paths), 500):
+            chunk = paths[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(
+                self._conn.execute(
+                    "SELECT path, sha, size, mtime_ns FROM files"
+                    f" WHERE size IS NOT NULL AND path IN ({placeholders})",
+                    chunk,
+                )
+            )
+        return {
+            path: sha
+            for path, sha, size, mtime_ns in rows
+            if _stat(root, path) == (size, mtime_ns)
+        }
+
+    def matching_blobs(
+        self, query: str, among: Optional[Iterable[str]] = None
+    ) -> Optional[Set[str]]:
+        """
+        Return the indexed text blobs that may contain *query*.
+
+        *among* restricts the answer to the given blob SHAs.  Returns None
+        when the query is too short to filter on (fewer than three
+        characters); every blob is then a candidate.
+        """
+        grams = trigrams(query)
+        if not grams:
+            return None
+
+        if among is None:
+            return self._matching(grams, [])
+
+        shas = list(set(among))
+        matching: Set[str] = set()
+        for start in range(0, len(shas), 500):
+            matching |= self._matching(grams, shas[start : start + 500])
+        return matching
+
+    def _matching(self, grams: Set[str], shas: List[str]) -> Set[str]:
+        sql = "SELECT sha FROM postings WHERE trigram IN (%s)" % ",".join(
+            "?" * len(grams)
+        )
+        if shas:
+            sql += " AND sha IN (%s)" % ",".join("?" * len(shas))
+        sql += " GROUP BY sha HAVING COUNT(*) = ?"
+        rows = self._conn.execute(sql, (*grams, *shas, len(grams)))
+        return {row[0] for row in rows}
+
+
+# Index path -> thread refreshing it in this process
+_refreshes: Dict[Path, threading.Thread] = {}
+_refreshes_lock = threading.Lock()
+
+
+def _start_refresh(repository: Dict, repo: Repo) -> None:
+    """Refresh the repository's index in a background thread, once at a time."""
+    path = index_path(repository)
+    with _refreshes_lock:
+        running = _refreshes.get(path)
+        if running is not None and running.is_alive():
+            return
+        thread = threading.Thread(
+            target=_refresh_in_background,
+            args=(path, repo.working_tree_dir, repository.get("name")),
+            name=f"git-content-index-{repository['id']}",
+            daemon=True,
+        )
+        _refreshes[path] = thread
+        thread.start()
+
+
+def _refresh_in_background(path: Path, working_tree_dir: str, name: str) -> None:
+    try:
+        with Repo(working_tree_dir) as repo, GitContentIndex(path) as index:
+            index.refresh(repo)
+    except Exception as e:
+        logger.warning("Failed to refresh content index for %s: %s", name, e)
+    finally:
+        with _refreshes_lock:
+            if _refreshes.get(path) is threading.current_thread():
+                del _refreshes[path]
+
+
+def open_content_index(repository: Dict, repo: Repo) -> Optional[GitContentIndex]:
+    """
+    Open the repository's index if it is up to date with HEAD.
+
+    Otherwise a background refresh is started and None is returned, as it is
+    when the index cannot be used; callers then search without it.
+    """
+    try:
+        head = repo.head.commit.hexsha
+    except ValueError:
+        return None
+
+    try:
+        path = index_path(repository)
+        if path.exists():
+            index = GitContentIndex(path)
+            try:
+                current = index.indexed_commit() == head
+                stale = time.time() - index.verified_at() > VERIFY_INTERVAL
+            except Exception:
+                index.close()
+                raise
+            if current:
+                if stale:
+                    _start_refresh(repository, repo)
+                return index
+            index.close()
+        _start_refresh(repository, repo)
+    except Exception as e:
+        logger.warning(
+            "Content index unavailable for %s: %s", repository.get("name"), e
+        )
+    return None
+
+
+def refresh_content_index(repository: Dict, repo: Repo) -> None:
+    """
+    Start updating an existing index after a pull or commit.
+
+    Repositories that have never been searched have no index yet; the first
+    search starts building it, so nothing is done for them here.
+    """
+    try:
+        if index_path(repository).exists():
+            _start_refresh(repository, repo)
+    except Exception as e:
+        logger.warning(
+            "Failed to refresh content index for %s: %s", repository.get("name"), e
+        )
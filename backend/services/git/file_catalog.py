@@ -0,0 +1,232 @@
+"""
+Git File Catalog - cached listing of the files in a repository's working tree.
+
+Built from one ``git ls-tree -r -l -z HEAD`` call, overlaid with the paths
+``git status --porcelain -z`` reports as added, modified, deleted or
+untracked, and kept in process memory per repository.  An entry is keyed by
+the HEAD commit SHA alone, so a lookup only resolves HEAD before it can use
+the cache: a new commit (pull, backup, edit) makes the next lookup rebuild
+the catalog.  Cockpit's own writes (pull, commit, backup, file save) drop
+the entry explicitly; other working tree changes are picked up by a
+background ``git status`` at most every ``OVERLAY_INTERVAL`` seconds.
+
+Filename search, directory trees, directory listings and the candidate files
+of a content search are then served from a sorted path array without walking
+the working tree.  Paths with a
+dot-prefixed component (``.gitignore``, ``.github/...``) are left out, as
+the filesystem listings always did; so are git-ignored files.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from git import Repo
+from git.exc import InvalidGitRepositoryError, NoSuchPathError
+
+logger = logging.getLogger(__name__)
+
+# Seconds between background checks for working tree changes made outside
+# Cockpit's write paths
+OVERLAY_INTERVAL = 60
+
+
+@dataclass
+class FileCatalog:
+    """Files of the working tree, with sizes and a directory index."""
+
+    head: str
+    paths: List[str]
+    sizes: Dict[str, int]
+    # (path, size or -1 when deleted) of every working tree change
+    changes: Tuple[Tuple[str, int], ...] = ()
+    # time.monotonic() of the last working tree check
+    checked_at: float = field(default_factory=time.monotonic)
+    lower_paths: List[str] = field(init=False, repr=False)
+    directories: Dict[str, Tuple[List[str], List[str]]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.paths.sort()
+        self.lower_paths = [path.lower() for path in self.paths]
+
+        # directory -> (sub-directory names, file names), "" is the root
+        subdirs: Dict[str, Set[str]] = {"": set()}
+        files: Dict[str, List[str]] = {"": []}
+        for path in self.paths:
+            directory, name = os.path.split(path)
+            files.setdefault(directory, []).append(name)
+            subdirs.setdefault(directory, set())
+            while directory:
+                parent, child = os.path.split(directory)
+                siblings = subdirs.setdefault(parent, set())
+                if child in siblings:
+                    break  # the rest of the chain is linked already
+                siblings.add(child)
+                directory = parent
+
+        self.directories = {
+            directory: (
+                sorted(subdirs.get(directory, ()), key=str.lower),
+                files.get(directory, []),
+            )
+            for directory in subdirs
+        }
+
+    def is_directory(self, path: str) -> bool:
+        return path in self.directories
+
+    def is_file(self, path: str) -> bool:
+        return path in self.sizes
+
+
+def _hidden(path: str) -> bool:
+    return any(part.startswith(".") for part in path.split("/"))
+
+
+def working_tree_changes(repo: Repo) -> Tuple[Tuple[str, int], ...]:
+    """Paths that differ from HEAD, with their size (-1 when deleted)."""
+    records = repo.git.status(
+        "--porcelain", "-z", "--untracked-files=all", "--no-renames"
+    ).split("\0")
+    changes = []
+    for record in records:
+        if not record:
+            continue
+        state, path = record[:2], record[3:]
+        if _hidden(path):
+            continue
+        try:
+            size = os.path.getsize(os.path.join(repo.working_tree_dir, path))
+        except OSError:
+            size = -1  # deleted (staged or not)
+        if "D" in state:
+            size = -1
+        changes.append((path, size))
+    return tuple(sorted(changes))
+
+
+def build_file_catalog(
+    repo: Repo, head: str, changes: Tuple[Tuple[str, int], ...] = ()
+) -> FileCatalog:
+    """List every blob in *head* with its size, updated by *changes*."""
+    sizes: Dict[str, int] = {}
+    for record in repo.git.ls_tree("-r", "-l", "-z", head).split("\0"):
+        if not record:
+            continue
+        meta, path = record.split("\t", 1)
+        _mode, obj_type, _sha, size = meta.split()
+        if obj_type != "blob":
+            continue
+        if _hidden(path):
+            continue
+        sizes[path] = int(size)
+    for path, size in changes:
+        if size < 0:
+            sizes.pop(path, None)
+        else:
+            sizes[path] = size
+    return FileCatalog(head=head, paths=list(sizes), sizes=sizes, changes=changes)
+
+
+_catalogs: Dict[int, FileCatalog] = {}
+_catalogs_lock = threading.Lock()
+# Repository id -> thread re-checking its working tree
+_overlay_refreshes: Dict[int, threading.Thread] = {}
+
+
+def _resolve_head(repo_path: str) -> Optional[str]:
+    try:
+        repo = Repo(repo_path)
+    except (InvalidGitRepositoryError, NoSuchPathError):
+        return None
+    try:
+        return repo.head.commit.hexsha
+    except ValueError:
+        return None
+    finally:
+        repo.close()
+
+
+def _build(repo_id: int, repo_path: str, head: str) -> FileCatalog:
+    with Repo(repo_path) as repo:
+        changes = working_tree_changes(repo)
+        catalog = build_file_catalog(repo, head, changes)
+    logger.debug(
+        "Built file catalog for repo %s at %s (%s files, %s changed)",
+        repo_id,
+        head[:8],
+        len(catalog.paths),
+        len(changes),
+    )
+    return catalog
+
+
+def get_file_catalog(repo_id: int, repo_path: str) -> Optional[FileCatalog]:
+    """
+    Return the catalog for the repository's working tree, building it if needed.
+
+    Returns None when *repo_path* is not a git repository with at least one
+    commit; callers then fall back to listing the filesystem.
+    """
+    head = _resolve_head(repo_path)
+    if head is None:
+        return None
+
+    with _catalogs_lock:
+        cached = _catalogs.get(repo_id)
+    if cached is not None and cached.head == head:
+        if time.monotonic() - cached.checked_at > OVERLAY_INTERVAL:
+            _start_overlay_refresh(repo_id, repo_path, cached)
+        return cached
+
+    catalog = _build(repo_id, repo_path, head)
+    with _catalogs_lock:
+        _catalogs[repo_id] = catalog
+    return catalog
+
+
+def _start_overlay_refresh(repo_id: int, repo_path: str, cached: FileCatalog) -> None:
+    """Re-check the working tree of *cached* in a background thread, once at a time."""
+    with _catalogs_lock:
+        running = _overlay_refreshes.get(repo_id)
+        if running is not None and running.is_alive():
+            return
+        thread = threading.Thread(
+            target=_refresh_overlay,
+            args=(repo_id, repo_path, cached),
+            name=f"git-file-catalog-{repo_id}",
+            daemon=True,
+        )
+        _overlay_refreshes[repo_id] = thread
+        thread.start()
+
+
+def _refresh_overlay(repo_id: int, repo_path: str, cached: FileCatalog) -> None:
+    try:
+        with Repo(repo_path) as repo:
+            changes = working_tree_changes(repo)
+            catalog = cached
+            if changes != cached.changes:
+                catalog = build_file_catalog(repo, cached.head, changes)
+        catalog.checked_at = time.monotonic()
+        with _catalogs_lock:
+            # Leave entries that were dropped or rebuilt in the meantime alone
+            if _catalogs.get(repo_id) is cached:
+                _catalogs[repo_id] = catalog
+    except Exception as e:
+        logger.warning("Failed to refresh file catalog for repo %s: %s", repo_id, e)
+    finally:
+        with _catalogs_lock:
+            if _overlay_refreshes.get(repo_id) is threading.current_thread():
+                del _overlay_refreshes[repo_id]
+
+
+def invalidate_file_catalog(repo_id: Optional[int]) -> None:
+    """Drop the cached catalog of a repository (after pull, commit or a write)."""
+    with _catalogs_lock:
+        _catalogs.pop(repo_id, None)
@@ -5,10 +5,11 @@ from __future__ import annotations
 import fnmatch
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 
+from services.git.file_catalog import FileCatalog, get_file_catalog
 from services.git.path_containment import resolve_within_repo as _resolve_within_repo
 from services.git.paths import repo_path as git_repo_path
 from services.git.shared_utils import get_git_repo_by_id, git_repo_manager
@@ -16,6 +17,12 @@ from services.git.shared_utils import get_git_repo_by_id, git_repo_manager
 logger = logging.getLogger(__name__)
 
 
+def _catalog_key(repo_path: str, resolved_path: str) -> str:
+    """Catalog key ("" for the root, "/"-separated) for a resolved path."""
+    rel = os.path.relpath(resolved_path, os.path.realpath(repo_path))
+    return "" if rel == "." else rel.replace(os.sep, "/")
+
+
 class GitFileListService:
     """Listing operations on files within a managed Git repository."""
 
@@ -45,54 +52,42 @@ class GitFileListService:
                     },
                 }
 
-            structured_files = []
-
-            for root, _dirs, files in os.walk(repo_path):
-                if ".git" in root:
-                    continue
-
-                rel_root = os.path.relpath(root, repo_path)
-                if rel_root == ".":
-                    rel_root = ""
-
-                for file in files:
-                    if file.startswith("."):
-                        continue
-
-                    full_path = os.path.join(rel_root, file) if rel_root else file
-                    file_info = {
-                        "name": file,
-                        "path": full_path,
-                        "directory": rel_root,
-                        "size": os.path.getsize(os.path.join(root, file))
-                        if os.path.exists(os.path.join(root, file))
-                        else 0,
-                    }
-                    structured_files.append(file_info)
+            catalog = get_file_catalog(repo_id, repo_path)
+            if catalog is not None:
+                entries = list(zip(catalog.paths, catalog.lower_paths))
+                sizes = catalog.sizes
+            else:
+                sizes = self._walk_file_sizes(repo_path)
+                entries = [(path, path.lower()) for path in sorted(sizes)]
 
-            filtered_files = structured_files
             if query:
                 query_lower = query.lower()
-                filtered_files = []
-
-                for file_info in structured_files:
-                    if (
-                        query_lower in file_info["name"].lower()
-                        or query_lower in file_info["path"].lower()
-                        or query_lower in file_info["directory"].lower()
-                    ):
-                        filtered_files.append(file_info)
-                    elif fnmatch.fnmatch(
-                        file_info["name"].lower(), f"*{query_lower}*"
-                    ) or fnmatch.fnmatch(file_info["path"].lower(), f"*{query_lower}*"):
-                        filtered_files.append(file_info)
+                pattern = f"*{query_lower}*"
+                # Name and directory are substrings of the path, so matching
+                # the lower-cased path covers all three.
+                matched = [
+                    path
+                    for path, path_lower in entries
+                    if query_lower in path_lower
+                    or fnmatch.fnmatchcase(path_lower, pattern)
+                ]
+            else:
+                matched = [path for path, _lower in entries]
+
+            filtered_files = [
+                {
+                    "name": os.path.basename(path),
+                    "path": path,
+                    "directory": os.path.dirname(path),
+                    "size": sizes.get(path, 0),
+                }
+                for path in matched
+            ]
 
             if query:
 
                 def sort_key(item):
                     name_lower = item["name"].lower()
-                    item["path"].lower()
-                    query_lower = query.lower()
 
                     if name_lower == query_lower:
                         return (0, item["path"])
@@ -104,8 +99,6 @@ class GitFileListService:
                         return (3, item["path"])
 
                 filtered_files.sort(key=sort_key)
-            else:
-                filtered_files.sort(key=lambda x: x["path"])
 
             paginated_files = filtered_files[:limit]
 
@@ -113,7 +106,7 @@ class GitFileListService:
                 "success": True,
                 "data": {
                     "files": paginated_files,
-                    "total_count": len(structured_files),
+                    "total_count": len(entries),
                     "filtered_count": len(filtered_files),
                     "query": query,
                     "repository_name": repository["name"],
@@ -127,6 +120,29 @@ class GitFileListService:
             logger.error("Error searching repository files: %s", e)
             return {"success": False, "message": "File search failed: %s" % str(e)}
 
+    @staticmethod
+    def _walk_file_sizes(repo_path: str) -> Dict[str, int]:
+        """Path -> size for a working tree that has no git catalog."""
+        sizes: Dict[str, int] = {}
+        for root, _dirs, files in os.walk(repo_path):
+            if ".git" in root:
+                continue
+
+            rel_root = os.path.relpath(root, repo_path)
+            if rel_root == ".":
+                rel_root = ""
+
+            for file in files:
+                if file.startswith("."):
+                    continue
+
+                full_path = os.path.join(rel_root, file) if rel_root else file
+                abs_path = os.path.join(root, file)
+                sizes[full_path] = (
+                    os.path.getsize(abs_path) if os.path.exists(abs_path) else 0
+                )
+        return sizes
+
     def get_directory_tree(
         self,
         repo_id: int,
@@ -151,6 +167,14 @@ class GitFileListService:
 
             target_path_resolved = _resolve_within_repo(repo_path, path or "")
 
+            catalog = get_file_catalog(repo_id, repo_path)
+            if catalog is not None:
+                tree = self._catalog_tree(
+                    catalog, _catalog_key(repo_path, target_path_resolved), path
+                )
+                tree["repository_name"] = repository["name"]
+                return tree
+
             if not os.path.exists(target_path_resolved):
                 raise HTTPException(
                     status_code=404,
@@ -227,6 +251,66 @@ class GitFileListService:
                 detail="Error building directory tree: %s" % str(e),
             )
 
+    @staticmethod
+    def _catalog_tree(catalog: FileCatalog, key: str, path: str) -> Dict[str, Any]:
+        if not catalog.is_directory(key):
+            if catalog.is_file(key):
+                raise HTTPException(
+                    status_code=400,
+                    detail="Path is not a directory: %s" % path,
+                )
+            raise HTTPException(status_code=404, detail="Path not found: %s" % path)
+
+        def build_tree(directory: str, rel_path: str) -> dict:
+            subdirs, files = catalog.directories[directory]
+            return {
+                "name": os.path.basename(directory) if rel_path else "root",
+                "path": rel_path,
+                "type": "directory",
+                "file_count": len(files),
+                "children": [
+                    build_tree(
+                        f"{directory}/{name}" if directory else name,
+                        os.path.join(rel_path, name) if rel_path else name,
+                    )
+                    for name in subdirs
+                ],
+            }
+
+        return build_tree(key, path)
+
+    @staticmethod
+    def _list_directory_files(
+        target_path_resolved: str, path: str
+    ) -> Optional[List[Tuple[str, int]]]:
+        """(name, size) of the files in a working-tree directory, None if missing."""
+        if not os.path.exists(target_path_resolved):
+            return None
+
+        if not os.path.isdir(target_path_resolved):
+            raise HTTPException(
+                status_code=400,
+                detail="Path is not a directory: %s" % path,
+            )
+
+        try:
+            items = os.listdir(target_path_resolved)
+        except PermissionError:
+            raise HTTPException(
+                status_code=403,
+                detail="Permission denied accessing directory",
+            )
+
+        entries = []
+        for item in items:
+            if item.startswith("."):
+                continue
+            item_path = os.path.join(target_path_resolved, item)
+            if not os.path.isfile(item_path):
+                continue
+            entries.append((item, os.path.getsize(item_path)))
+        return entries
+
     def get_directory_files(
         self,
         repo_id: int,
@@ -250,39 +334,37 @@ class GitFileListService:
 
             target_path_resolved = _resolve_within_repo(repo_path, path or "")
 
-            if not os.path.exists(target_path_resolved):
-                return {
-                    "path": path,
-                    "files": [],
-                    "directory_exists": False,
-                }
-
-            if not os.path.isdir(target_path_resolved):
-                raise HTTPException(
-                    status_code=400,
-                    detail="Path is not a directory: %s" % path,
-                )
+            catalog = get_file_catalog(repo_id, repo_path)
+            if catalog is not None:
+                key = _catalog_key(repo_path, target_path_resolved)
+                if catalog.is_file(key):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Path is not a directory: %s" % path,
+                    )
+                if not catalog.is_directory(key):
+                    return {
+                        "path": path,
+                        "files": [],
+                        "directory_exists": False,
+                    }
+                prefix = f"{key}/" if key else ""
+                entries = [
+                    (name, catalog.sizes[prefix + name])
+                    for name in catalog.directories[key][1]
+                ]
+            else:
+                entries = self._list_directory_files(target_path_resolved, path)
+                if entries is None:
+                    return {
+                        "path": path,
+                        "files": [],
+                        "directory_exists": False,
+                    }
 
             files_data = []
 
-            try:
-                items = os.listdir(target_path_resolved)
-            except PermissionError:
-                raise HTTPException(
-                    status_code=403,
-                    detail="Permission denied accessing directory",
-                )
-
-            for item in items:
-                if item.startswith("."):
-                    continue
-
-                item_path = os.path.join(target_path_resolved, item)
-
-                if not os.path.isfile(item_path):
-                    continue
-
-                file_size = os.path.getsize(item_path)
+            for item, file_size in entries:
                 file_rel_path = os.path.join(path, item) if path else item
 
                 try:
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import base64
 import difflib
 import fnmatch
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Set, Tuple
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from fastapi import HTTPException, status
 from git import GitCommandError
@@ -17,6 +23,8 @@ from models.git_content_search import (
     GitContentSearchRequest,
     GitContentSearchResponse,
 )
+from services.git.content_index import GitContentIndex, open_content_index
+from services.git.file_catalog import get_file_catalog
 from services.git.path_containment import resolve_within_repo as _resolve_within_repo
 from services.git.paths import repo_path as git_repo_path
 from services.git.shared_utils import get_git_repo_by_id, git_repo_manager
@@ -26,6 +34,78 @@ logger = logging.getLogger(__name__)
 MAX_CONTENT_SEARCH_FILE_SIZE = 1024 * 1024
 MAX_CONTENT_SEARCH_FILES = 5000
 DEFAULT_HISTORY_MAX_COMMITS = 500
+BLOB_TEXT_CACHE_MAX_CHARS = 64 * 1024 * 1024
+
+
+class _BlobTextCache:
+    """
+    Bounded LRU of decoded blob text keyed by blob SHA.
+
+    Blobs are content-addressed, so entries never go stale; the cache is
+    bounded by total characters held.  ``None`` marks a non-text blob.
+    """
+
+    def __init__(self, max_chars: int):
+        self._max_chars = max_chars
+        self._chars = 0
+        self._entries: OrderedDict[str, Optional[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sha: str) -> Tuple[bool, Optional[str]]:
+        with self._lock:
+            if sha not in self._entries:
+                return False, None
+            self._entries.move_to_end(sha)
+            return True, self._entries[sha]
+
+    def put(self, sha: str, text: Optional[str]) -> None:
+        size = len(text or "")
+        if size > self._max_chars:
+            return
+        with self._lock:
+            if sha in self._entries:
+                return
+            self._entries[sha] = text
+            self._chars += size
+            while self._chars > self._max_chars:
+                _sha, evicted = self._entries.popitem(last=False)
+                self._chars -= len(evicted or "")
+
+
+_blob_text_cache = _BlobTextCache(BLOB_TEXT_CACHE_MAX_CHARS)
+
+
+@dataclass
+class _ScanProgress:
+    """Files to scan and scanned so far, updated by the match generators."""
+
+    files_total: int = 0
+    files_scanned: int = 0
+
+
+def _encode_cursor(match: GitContentSearchMatch, ordinal: int) -> str:
+    """Opaque resume token for the position just after *match*."""
+    payload = {
+        "f": match.file_path,
+        "l": match.line_number,
+        "c": match.commit,
+        "n": ordinal,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(token: str) -> Dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        cursor = json.loads(raw)
+        if not isinstance(cursor["f"], str) or not isinstance(cursor["n"], int):
+            raise ValueError("malformed cursor")
+    except (ValueError, KeyError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid search cursor"
+        ) from exc
+    return cursor
 
 
 class GitFileSearchService:
@@ -44,16 +124,43 @@ class GitFileSearchService:
         from config import settings
 
         extensions = settings.allowed_file_extensions
+        if request.cursor and request.offset:
+            # The cursor already encodes the position; skipping again would
+            # silently drop matches
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="offset cannot be combined with a search cursor",
+            )
+        cursor = _decode_cursor(request.cursor) if request.cursor else None
+        resume_file = cursor["f"] if cursor else None
+        progress = _ScanProgress()
 
         if request.diff_mode:
-            data = self._search_content_diff(repo_id, request, extensions)
+            search_mode = "diff"
+            matches = self._iter_content_diff(
+                repo_id, request, extensions, progress, resume_file
+            )
         elif request.include_history:
-            data = self._search_content_history(repo_id, request, extensions)
+            search_mode = "history"
+            matches = self._iter_content_history(
+                repo_id, request, extensions, progress, resume_file
+            )
         else:
-            data = self._search_content_current(
-                repo_id, request, extensions, repository
+            search_mode = "current"
+            matches = self._iter_content_current(
+                repo_id, request, extensions, repository, progress, resume_file
             )
 
+        with closing(matches):
+            if request.stream:
+                data = self._stream_page(
+                    matches, request, cursor, progress, search_mode
+                )
+            else:
+                data = self._paginate_matches(
+                    list(matches), request, progress.files_scanned, search_mode
+                )
+
         return GitContentSearchResponse(data=data).model_dump()
 
     @staticmethod
@@ -78,6 +185,7 @@ class GitFileSearchService:
 
     def _list_candidate_paths(
         self,
+        repo_id: int,
         repo_path: str,
         path_filter: str,
         extensions: List[str],
@@ -85,6 +193,19 @@ class GitFileSearchService:
         if not os.path.exists(repo_path):
             return []
 
+        # The file catalog already knows every path and size (untracked files
+        # included), so the working tree is only walked without one.
+        catalog = get_file_catalog(repo_id, repo_path)
+        if catalog is not None:
+            candidates = [
+                path
+                for path in catalog.paths
+                if self._has_allowed_extension(path, extensions)
+                and self._path_matches_filter(path, path_filter)
+                and catalog.sizes[path] <= MAX_CONTENT_SEARCH_FILE_SIZE
+            ]
+            return candidates[:MAX_CONTENT_SEARCH_FILES]
+
         candidates: List[str] = []
         for root, _dirs, files in os.walk(repo_path):
             if ".git" in root:
@@ -112,6 +233,7 @@ class GitFileSearchService:
 
                 candidates.append(rel_path)
                 if len(candidates) >= MAX_CONTENT_SEARCH_FILES:
+                    candidates.sort()
                     return candidates
 
         candidates.sort()
@@ -199,29 +321,146 @@ class GitFileSearchService:
             search_mode=search_mode,
         )
 
-    def _search_content_current(
+    def _stream_page(
+        self,
+        matches: Iterator[GitContentSearchMatch],
+        request: GitContentSearchRequest,
+        cursor: Optional[Dict[str, Any]],
+        progress: _ScanProgress,
+        search_mode: str,
+    ) -> GitContentSearchData:
+        """
+        Collect one page from *matches*, stopping as soon as it is full.
+
+        Matches are only built for files scanned up to the end of the page
+        (plus one look-ahead match).  ``total_matches`` counts from the
+        cursor position: it is exact when the scan ran to the end or
+        ``count_total`` was requested, otherwise extrapolated from the
+        share of files scanned so far.
+        """
+        # Position of the last consumed match: (file, ordinal within file)
+        file_path: Optional[str] = None
+        ordinal = 0
+
+        page: List[GitContentSearchMatch] = []
+        next_cursor: Optional[str] = None
+        consumed = 0
+        has_more = False
+
+        for match in matches:
+            if match.file_path != file_path:
+                file_path, ordinal = match.file_path, 0
+            ordinal += 1
+            if cursor and file_path == cursor["f"] and ordinal <= cursor["n"]:
+                continue  # already returned before the cursor
+
+            consumed += 1
+            if consumed <= request.offset:
+                continue
+            if len(page) == request.limit:
+                has_more = True
+                break
+            page.append(match)
+            next_cursor = _encode_cursor(match, ordinal)
+
+        total_is_estimate = False
+        total = consumed
+        if has_more:
+            if request.count_total:
+                total += sum(1 for _ in matches)
+            else:
+                total_is_estimate = True
+                if progress.files_scanned:
+                    total = max(
+                        total,
+                        round(consumed * progress.files_total / progress.files_scanned),
+                    )
+
+        return GitContentSearchData(
+            matches=page,
+            total_matches=total,
+            files_scanned=progress.files_scanned,
+            truncated=has_more,
+            search_mode=search_mode,
+            next_cursor=next_cursor if has_more else None,
+            total_is_estimate=total_is_estimate,
+        )
+
+    @staticmethod
+    def _resume_paths(paths: List[str], resume_file: Optional[str]) -> List[str]:
+        """Drop paths that sort before the cursor's file."""
+        if resume_file is None:
+            return paths
+        return [path for path in paths if path >= resume_file]
+
+    @staticmethod
+    def _paths_without_query(
+        index: GitContentIndex,
+        repo: Any,
+        candidate_paths: List[str],
+        query: str,
+    ) -> Set[str]:
+        """
+        Return candidate paths the index proves cannot contain *query*.
+
+        Only paths whose working-tree file is known to be identical to HEAD
+        qualify; modified and untracked files are always read.  Only the
+        candidates whose HEAD blob the trigrams rule out are stat'ed.
+        """
+        matching = index.matching_blobs(query)
+        if matching is None:
+            return set()
+
+        indexed = index.files()
+        ruled_out = [
+            path
+            for path in candidate_paths
+            if path in indexed and indexed[path] not in matching
+        ]
+        return set(index.unchanged_files(repo.working_tree_dir, ruled_out))
+
+    def _iter_content_current(
         self,
         repo_id: int,
         request: GitContentSearchRequest,
         extensions: List[str],
         repository: Dict[str, Any],
-    ) -> GitContentSearchData:
+        progress: _ScanProgress,
+        resume_file: Optional[str] = None,
+    ) -> Iterator[GitContentSearchMatch]:
         repo_path = str(git_repo_path(repository))
-        candidate_paths = self._list_candidate_paths(
-            repo_path, request.path_filter, extensions
+        candidate_paths = self._resume_paths(
+            self._list_candidate_paths(
+                repo_id, repo_path, request.path_filter, extensions
+            ),
+            resume_file,
         )
+        progress.files_total = len(candidate_paths)
 
         head_commit: Optional[str] = None
+        repo = None
         try:
             repo = get_git_repo_by_id(repo_id)
             head_commit = repo.head.commit.hexsha[:8]
         except Exception:
             logger.debug("Could not resolve HEAD commit for repo %s", repo_id)
 
-        all_matches: List[GitContentSearchMatch] = []
-        files_scanned = 0
+        skip_paths: Set[str] = set()
+        if repo is not None and head_commit:
+            index = open_content_index(repository, repo)
+            if index is not None:
+                with index:
+                    try:
+                        skip_paths = self._paths_without_query(
+                            index, repo, candidate_paths, request.query
+                        )
+                    except Exception as e:
+                        logger.warning("Content index lookup failed: %s", e)
 
         for rel_path in candidate_paths:
+            if rel_path in skip_paths:
+                progress.files_scanned += 1
+                continue
             try:
                 abs_path = _resolve_within_repo(repo_path, rel_path)
             except HTTPException:
@@ -230,39 +469,65 @@ class GitFileSearchService:
                 )
                 continue
             content = self._read_text_file(abs_path)
-            files_scanned += 1
+            progress.files_scanned += 1
             if content is None:
                 continue
 
-            all_matches.extend(
-                self._grep_file_content(
-                    content,
-                    request.query,
-                    request.case_sensitive,
-                    rel_path,
-                    match_source="current",
-                    commit=head_commit,
-                )
+            yield from self._grep_file_content(
+                content,
+                request.query,
+                request.case_sensitive,
+                rel_path,
+                match_source="current",
+                commit=head_commit,
             )
 
-        return self._paginate_matches(
-            all_matches, request, files_scanned, search_mode="current"
-        )
+    @staticmethod
+    def _blob_at(commit: Any, file_path: str) -> Optional[Any]:
+        try:
+            return commit.tree / file_path
+        except (KeyError, AttributeError):
+            return None
+
+    @staticmethod
+    def _read_blob_text(blob: Any) -> Optional[str]:
+        """
+        Decode *blob*, going through the blob-text LRU first.
+
+        ``data_stream`` reads via the repository's long-lived
+        ``git cat-file --batch`` process, so uncached blobs cost one
+        round-trip each rather than a subprocess.
+        """
+        found, text = _blob_text_cache.get(blob.hexsha)
+        if found:
+            return text
+        try:
+            text = blob.data_stream.read().decode("utf-8")
+        except (UnicodeDecodeError, AttributeError, OSError, ValueError):
+            text = None
+        _blob_text_cache.put(blob.hexsha, text)
+        return text
 
-    def _search_content_history(
+    def _iter_content_history(
         self,
         repo_id: int,
         request: GitContentSearchRequest,
         extensions: List[str],
-    ) -> GitContentSearchData:
+        progress: _ScanProgress,
+        resume_file: Optional[str] = None,
+    ) -> Iterator[GitContentSearchMatch]:
         repository = git_repo_manager.get_repository(repo_id)
         if not repository:
             raise HTTPException(status_code=404, detail="Repository not found")
 
         repo_path = str(git_repo_path(repository))
-        candidate_paths = self._list_candidate_paths(
-            repo_path, request.path_filter, extensions
+        candidate_paths = self._resume_paths(
+            self._list_candidate_paths(
+                repo_id, repo_path, request.path_filter, extensions
+            ),
+            resume_file,
         )
+        progress.files_total = len(candidate_paths)
 
         repo = get_git_repo_by_id(repo_id)
         max_commits = DEFAULT_HISTORY_MAX_COMMITS
@@ -274,37 +539,85 @@ class GitFileSearchService:
         except Exception:
             pass
 
-        all_matches: List[GitContentSearchMatch] = []
-        seen: Set[Tuple[str, str, int]] = set()
-        files_scanned = 0
+        # Blobs not yet in the index are indexed as they are met, once;
+        # later searches only open blobs whose trigrams cover the query.
+        index = (
+            open_content_index(repository, repo) if len(request.query) >= 3 else None
+        )
+        try:
+            for rel_path in candidate_paths:
+                progress.files_scanned += 1
+                yield from self._history_file_matches(
+                    repo, index, rel_path, max_commits, request
+                )
+        finally:
+            if index is not None:
+                index.close()
 
-        for rel_path in candidate_paths:
-            files_scanned += 1
-            for commit in repo.iter_commits(paths=rel_path, max_count=max_commits):
-                content = self._read_blob_at_commit(repo, commit.hexsha, rel_path)
-                if content is None:
-                    continue
+    def _history_file_matches(
+        self,
+        repo: Any,
+        index: Optional[GitContentIndex],
+        rel_path: str,
+        max_commits: int,
+        request: GitContentSearchRequest,
+    ) -> List[GitContentSearchMatch]:
+        # Resolve every commit to its blob; consecutive revisions of a config
+        # are usually the same blob, so each unique blob is read and grepped
+        # once and its matches are fanned out to every revision.
+        revisions = [
+            (commit, blob)
+            for commit in repo.iter_commits(paths=rel_path, max_count=max_commits)
+            if (blob := self._blob_at(commit, rel_path)) is not None
+        ]
+        blobs = {blob.hexsha: blob for _commit, blob in revisions}
 
-                commit_short = commit.hexsha[:8]
-                for match in self._grep_file_content(
-                    content,
-                    request.query,
-                    request.case_sensitive,
-                    rel_path,
-                    match_source="history",
-                    commit=commit_short,
-                    commit_message=commit.message.strip(),
-                    commit_date=commit.committed_datetime.isoformat(),
-                ):
-                    key = (match.file_path, commit_short, match.line_number)
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    all_matches.append(match)
+        matching: Optional[Set[str]] = None
+        # Text of blobs the index just read, so they are not read again
+        indexed_texts: Dict[str, str] = {}
+        if index is not None:
+            try:
+                indexed_texts = index.ensure_blobs(repo, rel_path, blobs, request.query)
+                matching = index.matching_blobs(request.query, among=blobs)
+            except Exception as e:
+                logger.warning("Failed to index history blobs: %s", e)
+
+        blob_matches: Dict[str, List[GitContentSearchMatch]] = {}
+        for blob_sha, blob in blobs.items():
+            if matching is not None and blob_sha not in matching:
+                continue
+            content = indexed_texts.get(blob_sha)
+            if content is None:
+                content = self._read_blob_text(blob)
+            if content is None:
+                continue
+            blob_matches[blob_sha] = self._grep_file_content(
+                content,
+                request.query,
+                request.case_sensitive,
+                file_path=rel_path,
+                match_source="history",
+            )
 
-        return self._paginate_matches(
-            all_matches, request, files_scanned, search_mode="history"
-        )
+        matches: List[GitContentSearchMatch] = []
+        seen: Set[Tuple[str, int]] = set()
+        for commit, blob in revisions:
+            commit_short = commit.hexsha[:8]
+            for match in blob_matches.get(blob.hexsha, ()):
+                key = (commit_short, match.line_number)
+                if key in seen:
+                    continue
+                seen.add(key)
+                matches.append(
+                    match.model_copy(
+                        update={
+                            "commit": commit_short,
+                            "commit_message": commit.message.strip(),
+                            "commit_date": commit.committed_datetime.isoformat(),
+                        }
+                    )
+                )
+        return matches
 
     def _grep_diff_content(
         self,
@@ -373,12 +686,14 @@ class GitFileSearchService:
 
         return matches
 
-    def _search_content_diff(
+    def _iter_content_diff(
         self,
         repo_id: int,
         request: GitContentSearchRequest,
         extensions: List[str],
-    ) -> GitContentSearchData:
+        progress: _ScanProgress,
+        resume_file: Optional[str] = None,
+    ) -> Iterator[GitContentSearchMatch]:
         commit1 = request.commit1 or ""
         commit2 = request.commit2 or ""
 
@@ -404,32 +719,27 @@ class GitFileSearchService:
             path.strip() for path in changed_output.splitlines() if path.strip()
         ]
 
-        filtered_paths = [
-            path
-            for path in changed_paths
-            if self._has_allowed_extension(path, extensions)
-            and self._path_matches_filter(path, request.path_filter)
-        ]
-
-        all_matches: List[GitContentSearchMatch] = []
-        files_scanned = 0
+        filtered_paths = self._resume_paths(
+            [
+                path
+                for path in changed_paths
+                if self._has_allowed_extension(path, extensions)
+                and self._path_matches_filter(path, request.path_filter)
+            ],
+            resume_file,
+        )
+        progress.files_total = len(filtered_paths)
 
         for file_path in filtered_paths:
-            files_scanned += 1
+            progress.files_scanned += 1
             content1 = self._read_blob_at_commit(repo, commit1, file_path) or ""
             content2 = self._read_blob_at_commit(repo, commit2, file_path) or ""
-            all_matches.extend(
-                self._grep_diff_content(
-                    content1,
-                    content2,
-                    request.query,
-                    request.case_sensitive,
-                    file_path,
-                    commit1,
-                    commit2,
-                )
+            yield from self._grep_diff_content(
+                content1,
+                content2,
+                request.query,
+                request.case_sensitive,
+                file_path,
+                commit1,
+                commit2,
             )
-
-        return self._paginate_matches(
-            all_matches, request, files_scanned, search_mode="diff"
-        )
@@ -46,7 +46,9 @@ from git.exc import GitCommandError, InvalidGitRepositoryError
 from models.git import SyncResult
 from services.git.auth import GitAuthenticationService
 from services.git.config import set_git_author
+from services.git.content_index import refresh_content_index
 from services.git.env import set_ssl_env
+from services.git.file_catalog import invalidate_file_catalog
 from services.git.paths import repo_path as get_repo_path
 
 logger = logging.getLogger(__name__)
@@ -292,6 +294,8 @@ class GitService:
                         pull_info = origin.pull(branch)
 
                     commits_pulled = len(pull_info) if pull_info else 0
+                    refresh_content_index(repository, repo)
+                    invalidate_file_catalog(repository.get("id"))
 
                     logger.info(
                         "Pulled %s commits from %s",
@@ -460,6 +464,8 @@ class GitService:
             logger.info(
                 "Created commit %s with %s files", commit.hexsha[:8], len(changed_files)
             )
+            refresh_content_index(repository, repo)
+            invalidate_file_catalog(repository.get("id"))
 
             return CommitResult(
                 success=True,
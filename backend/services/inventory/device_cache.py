@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional
 
 from models.inventory import DeviceInfo
+from services.inventory import device_index, prefix_index
+from services.inventory.device_index import (
+    BULK_CACHE_KEY,
+    BULK_VERSION_KEY,
+    DeviceIndex,
+)
+from services.inventory.location_tree import LOCATION_CLOSURE_KEY
+from services.inventory.prefix_index import IP_INDEX_KEY, PrefixIndex
 
 if TYPE_CHECKING:
     from services.settings.cache import RedisCacheService
 
 logger = logging.getLogger(__name__)
-_BULK_CACHE_KEY = "nautobot:devices:all"
 
 
 class DeviceCacheLoader:
@@ -19,20 +26,24 @@ class DeviceCacheLoader:
 
     def __init__(self, cache_service: Optional[RedisCacheService] = None):
         self._cache_service = cache_service
-        self._devices: Optional[List[DeviceInfo]] = None
+        self._index: Optional[DeviceIndex] = None
         self._custom_field_types: Optional[Dict[str, str]] = None
+        self._location_closure: Optional[Dict[str, FrozenSet[str]]] = None
+        self._prefix_index: Optional[PrefixIndex] = None
 
     def invalidate(self) -> None:
-        self._devices = None
+        self._index = None
+        self._prefix_index = None
         self._custom_field_types = None
+        self._location_closure = None
 
     @property
     def is_populated(self) -> bool:
         """True once the device list has been loaded (from Redis or live fallback)."""
-        return self._devices is not None
+        return self._index is not None
 
     def set_devices(self, devices: List[DeviceInfo]) -> None:
-        self._devices = devices
+        self._index = DeviceIndex(devices)
 
     @staticmethod
     def parse_device(raw: Dict[str, Any]) -> DeviceInfo:
@@ -58,30 +69,109 @@ class DeviceCacheLoader:
         Returns an empty list on cache miss — callers should fall back to a
         live Nautobot query and then call set_devices() to populate this loader.
         """
-        if self._devices is not None:
-            return self._devices
+        index = await self.get_index()
+        return index.devices() if index is not None else []
+
+    async def get_index(self) -> Optional[DeviceIndex]:
+        """Return the device index, reusing the process-wide one when current.
+
+        Only the small version key is read when the shared index matches the
+        bulk cache; the full list is parsed only after the cache job rewrote
+        it. Returns None on cache miss.
+        """
+        if self._index is not None:
+            return self._index
 
         if self._cache_service is not None:
             try:
-                raw_list = self._cache_service.get(_BULK_CACHE_KEY)
+                version = self._cache_service.get(BULK_VERSION_KEY)
+                if version:
+                    shared = device_index.get_shared_index(version)
+                    if shared is not None:
+                        logger.debug("Reusing device index version %s", version)
+                        self._index = shared
+                        return shared
+
+                raw_list = self._cache_service.get(BULK_CACHE_KEY)
                 if raw_list:
-                    devices = [self.parse_device(d) for d in raw_list]
+                    index = DeviceIndex(
+                        (self.parse_device(d) for d in raw_list), version=version
+                    )
                     logger.info(
-                        "Cache hit for '%s': %s devices", _BULK_CACHE_KEY, len(devices)
+                        "Cache hit for '%s': %s devices", BULK_CACHE_KEY, len(index)
                     )
-                    self._devices = devices
-                    return devices
+                    device_index.publish_shared_index(index)
+                    self._index = index
+                    return index
                 logger.info(
-                    "Cache miss for '%s', falling back to Nautobot API", _BULK_CACHE_KEY
+                    "Cache miss for '%s', falling back to Nautobot API", BULK_CACHE_KEY
                 )
             except Exception as exc:
                 logger.warning(
                     "Redis read failed for '%s', falling back to Nautobot API: %s",
-                    _BULK_CACHE_KEY,
+                    BULK_CACHE_KEY,
                     exc,
                 )
 
-        return []
+        return None
+
+    def get_prefix_index(self) -> Optional[PrefixIndex]:
+        """Return the IP prefix index matching the current bulk cache version.
+
+        Returns None when the IP index is missing or was written by an older
+        cache run than the device list, so callers fall back to Nautobot.
+        """
+        if self._prefix_index is not None:
+            return self._prefix_index
+        if self._cache_service is None:
+            return None
+
+        try:
+            version = self._cache_service.get(BULK_VERSION_KEY)
+            if not version:
+                return None
+            shared = prefix_index.get_shared_index(version)
+            if shared is not None:
+                self._prefix_index = shared
+                return shared
+
+            raw = self._cache_service.get(IP_INDEX_KEY)
+        except Exception as exc:
+            logger.warning("Redis read failed for '%s': %s", IP_INDEX_KEY, exc)
+            return None
+        if not raw or raw.get("version") != version:
+            logger.info("No current '%s' for version %s", IP_INDEX_KEY, version)
+            return None
+
+        index = PrefixIndex(raw.get("records", []), version=version)
+        prefix_index.publish_shared_index(index)
+        self._prefix_index = index
+        return index
+
+    def get_location_closure(self) -> Optional[Dict[str, FrozenSet[str]]]:
+        """Return the location closure table from Redis; cached per loader instance.
+
+        Returns None when the table is missing (expired or never built) so
+        callers fall back to Nautobot's server-side hierarchy resolution.
+        """
+        if self._location_closure is not None:
+            return self._location_closure
+        if self._cache_service is None:
+            return None
+
+        try:
+            raw = self._cache_service.get(LOCATION_CLOSURE_KEY)
+        except Exception as exc:
+            logger.warning("Redis read failed for '%s': %s", LOCATION_CLOSURE_KEY, exc)
+            return None
+        if not raw:
+            logger.info("Cache miss for '%s'", LOCATION_CLOSURE_KEY)
+            return None
+
+        self._location_closure = {
+            name: frozenset(members) for name, members in raw.items()
+        }
+        return self._location_closure
 
     async def get_custom_field_types(self) -> Dict[str, str]:
         """Return custom field type map; cached per loader instance."""
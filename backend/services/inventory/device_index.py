@@ -0,0 +1,145 @@
+"""Process-level, version-stamped inverted index over the bulk device cache.
+
+``cache_all_devices_task`` writes the lightweight device list to
+``nautobot:devices:all`` together with a random version stamp in
+``nautobot:devices:all:version``. The first inventory query in a process
+parses the list once into a ``DeviceIndex``; later queries only read the
+small version key and reuse the shared index until the stamp changes.
+
+The index maps each filterable attribute value to the set of device IDs that
+carry it, so inventory conditions resolve to posting sets and AND/OR/NOT
+trees reduce to set algebra.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from models.inventory import DeviceInfo
+
+logger = logging.getLogger(__name__)
+
+BULK_CACHE_KEY = "nautobot:devices:all"
+BULK_VERSION_KEY = "nautobot:devices:all:version"
+
+# DeviceInfo attributes with exact-match posting sets ("tag" is multi-valued).
+INDEXED_FIELDS = (
+    "name",
+    "role",
+    "status",
+    "tag",
+    "platform",
+    "location",
+    "manufacturer",
+    "device_type",
+)
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+class DeviceIndex:
+    """Inverted index from device attributes to device-ID posting sets."""
+
+    def __init__(self, devices: Iterable[DeviceInfo], version: Optional[str] = None):
+        self.version = version
+        self._devices: Dict[str, DeviceInfo] = {}
+        postings: Dict[str, Dict[str, Set[str]]] = {f: {} for f in INDEXED_FIELDS}
+        with_primary_ip: Set[str] = set()
+
+        for device in devices:
+            device_id = device.id
+            self._devices[device_id] = device
+            for field in INDEXED_FIELDS:
+                if field == "tag":
+                    values = device.tags or []
+                else:
+                    value = getattr(device, field)
+                    values = [value] if value is not None else []
+                for value in values:
+                    postings[field].setdefault(value, set()).add(device_id)
+            if device.primary_ip4:
+                with_primary_ip.add(device_id)
+
+        self._postings: Dict[str, Dict[str, FrozenSet[str]]] = {
+            field: {value: frozenset(ids) for value, ids in by_value.items()}
+            for field, by_value in postings.items()
+        }
+        self._with_primary_ip = frozenset(with_primary_ip)
+        self.all_ids: FrozenSet[str] = frozenset(self._devices)
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def devices(self) -> List[DeviceInfo]:
+        """All indexed devices in cache order."""
+        return list(self._devices.values())
+
+    def get(self, device_id: str) -> Optional[DeviceInfo]:
+        return self._devices.get(device_id)
+
+    def devices_for(self, device_ids: Iterable[str]) -> List[DeviceInfo]:
+        """Resolve device IDs to devices, skipping unknown IDs."""
+        return [self._devices[i] for i in device_ids if i in self._devices]
+
+    def values(self, field: str) -> List[str]:
+        """Distinct values of an indexed field."""
+        return list(self._postings[field])
+
+    def lookup(self, field: str, value: str) -> FrozenSet[str]:
+        """IDs of devices whose ``field`` equals ``value`` (or carry the tag)."""
+        return self._postings[field].get(value, _EMPTY)
+
+    def lookup_contains(self, field: str, needle: str) -> FrozenSet[str]:
+        """IDs of devices whose ``field`` contains ``needle`` (case-insensitive).
+
+        Scans distinct values rather than devices.
+        """
+        needle = needle.lower()
+        ids: Set[str] = set()
+        for value, posting in self._postings[field].items():
+            if needle in value.lower():
+                ids.update(posting)
+        return frozenset(ids)
+
+    def with_primary_ip(self, has_primary: bool) -> FrozenSet[str]:
+        """IDs of devices with (or without) a primary IPv4 address."""
+        if has_primary:
+            return self._with_primary_ip
+        return self.all_ids - self._with_primary_ip
+
+
+# ---------------------------------------------------------------------------
+# Process-wide shared index
+# ---------------------------------------------------------------------------
+
+_shared_lock = threading.Lock()
+_shared_index: Optional[DeviceIndex] = None
+
+
+def get_shared_index(version: str) -> Optional[DeviceIndex]:
+    """Return the process-wide index if it was built from ``version``."""
+    index = _shared_index
+    if index is not None and index.version == version:
+        return index
+    return None
+
+
+def publish_shared_index(index: DeviceIndex) -> None:
+    """Make ``index`` the process-wide index (only versioned indexes are shared)."""
+    global _shared_index
+    if index.version is None:
+        return
+    with _shared_lock:
+        _shared_index = index
+    logger.info(
+        "Published device index version %s with %s devices", index.version, len(index)
+    )
+
+
+def reset_shared_index() -> None:
+    """Drop the process-wide index (used by tests and explicit invalidation)."""
+    global _shared_index
+    with _shared_lock:
+        _shared_index = None
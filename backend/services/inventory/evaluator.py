@@ -8,7 +8,7 @@ See: doc/refactoring/REFACTORING_SERVICES.md — Phase 4
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Dict, List, Set
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Set
 
 from models.inventory import DeviceInfo, LogicalCondition, LogicalOperation
 
@@ -17,6 +17,20 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Condition fields answered from the in-process device index.
+INDEXED_CONDITION_FIELDS = frozenset(
+    {
+        "name",
+        "role",
+        "status",
+        "tag",
+        "device_type",
+        "manufacturer",
+        "platform",
+        "has_primary",
+    }
+)
+
 
 class InventoryEvaluator:
     """Executes logical operations for inventory device filtering."""
@@ -178,6 +192,24 @@ class InventoryEvaluator:
                 )
                 return set(), 0, {}
 
+            # ip_prefix / primary_prefix resolve against the cached prefix
+            # index when it is current; otherwise they query Nautobot below
+            if condition.field in ("ip_prefix", "primary_prefix"):
+                device_ids = await self.query_service._match_prefix_ids(
+                    condition.value,
+                    condition.operator,
+                    primary_only=condition.field == "primary_prefix",
+                )
+                if device_ids is not None:
+                    logger.info(
+                        "Condition %s %s '%s' returned %s devices (prefix index)",
+                        condition.field,
+                        condition.operator,
+                        condition.value,
+                        len(device_ids),
+                    )
+                    return device_ids, 1, {}
+
             # Handle ip_prefix — operator is the GraphQL filter type (within_include/within/exact)
             if condition.field == "ip_prefix":
                 devices_data = await self.query_service._query_devices_by_ip_prefix(
@@ -210,14 +242,35 @@ class InventoryEvaluator:
 
                 # Handle negation for custom fields
                 if is_negated:
-                    all_devices = await self.query_service._query_all_devices()
-                    matched_ids = {device.id for device in devices_data}
-                    devices_data = [d for d in all_devices if d.id not in matched_ids]
+                    return await self._complement(devices_data), 1, {}
 
                 device_ids = {device.id for device in devices_data}
                 devices_dict = {device.id: device for device in devices_data}
                 return device_ids, 1, devices_dict
 
+            # Indexed fields resolve straight to posting sets; DeviceInfo
+            # objects are materialized once for the final result
+            if condition.field in INDEXED_CONDITION_FIELDS:
+                return await self._execute_indexed_condition(condition), 1, {}
+
+            # Location conditions use the cached location tree when it knows
+            # the location; otherwise they fall through to the live query
+            if condition.field == "location" and condition.value.strip():
+                device_ids = await self.query_service._match_location_ids(
+                    condition.value,
+                    use_contains=condition.operator in ["contains", "not_contains"],
+                    use_negation=condition.operator in ["not_equals", "not_contains"],
+                )
+                if device_ids is not None:
+                    logger.info(
+                        "Condition %s %s '%s' returned %s devices (location tree)",
+                        condition.field,
+                        condition.operator,
+                        condition.value,
+                        len(device_ids),
+                    )
+                    return device_ids, 1, {}
+
             # Handle regular fields
             query_func = self.field_to_query_map.get(condition.field)
             if not query_func:
@@ -244,54 +297,6 @@ class InventoryEvaluator:
                 )
                 return device_ids, len(devices_data), devices_dict
 
-            # Special handling for device_type with not_equals - use GraphQL device_type__n filter
-            if condition.field == "device_type" and condition.operator == "not_equals":
-                devices_data = await self.query_service._query_devices_by_devicetype(
-                    condition.value, use_negation=True
-                )
-                device_ids = {device.id for device in devices_data}
-                devices_dict = {device.id: device for device in devices_data}
-                logger.info(
-                    "Condition %s %s '%s' returned %s devices (using GraphQL device_type__n)",
-                    condition.field,
-                    condition.operator,
-                    condition.value,
-                    len(devices_data),
-                )
-                return device_ids, 1, devices_dict
-
-            # Special handling for manufacturer with not_equals - use GraphQL manufacturer__n filter
-            if condition.field == "manufacturer" and condition.operator == "not_equals":
-                devices_data = await self.query_service._query_devices_by_manufacturer(
-                    condition.value, use_negation=True
-                )
-                device_ids = {device.id for device in devices_data}
-                devices_dict = {device.id: device for device in devices_data}
-                logger.info(
-                    "Condition %s %s '%s' returned %s devices (using GraphQL manufacturer__n)",
-                    condition.field,
-                    condition.operator,
-                    condition.value,
-                    len(devices_data),
-                )
-                return device_ids, 1, devices_dict
-
-            # Special handling for role with not_equals - use GraphQL role__n filter
-            if condition.field == "role" and condition.operator == "not_equals":
-                devices_data = await self.query_service._query_devices_by_role(
-                    condition.value, use_negation=True
-                )
-                device_ids = {device.id for device in devices_data}
-                devices_dict = {device.id: device for device in devices_data}
-                logger.info(
-                    "Condition %s %s '%s' returned %s devices (using GraphQL role__n)",
-                    condition.field,
-                    condition.operator,
-                    condition.value,
-                    len(devices_data),
-                )
-                return device_ids, 1, devices_dict
-
             # Only name and location support contains matching
             if condition.field in ["name", "location"] and use_contains:
                 devices_data = await query_func(condition.value, use_contains=True)
@@ -308,20 +313,15 @@ class InventoryEvaluator:
 
             # Handle negation (not_equals, not_contains)
             if is_negated:
-                # Get all devices
-                all_devices = await self.query_service._query_all_devices()
-
-                # Filter out devices that match the condition
-                matched_ids = {device.id for device in devices_data}
-                devices_data = [d for d in all_devices if d.id not in matched_ids]
-
+                device_ids = await self._complement(devices_data)
                 logger.info(
                     "Negated condition %s %s '%s' returned %s devices",
                     condition.field,
                     condition.operator,
                     condition.value,
-                    len(devices_data),
+                    len(device_ids),
                 )
+                return device_ids, 1, {}
 
             device_ids = {device.id for device in devices_data}
             devices_dict = {device.id: device for device in devices_data}
@@ -345,6 +345,41 @@ class InventoryEvaluator:
             )
             return set(), 0, {}
 
+    async def _execute_indexed_condition(
+        self, condition: LogicalCondition
+    ) -> FrozenSet[str]:
+        """Resolve a condition on an indexed field with posting-set algebra."""
+        if condition.value.strip() == "":
+            logger.warning(
+                "Empty %s filter provided, returning empty result", condition.field
+            )
+            return frozenset()
+
+        use_contains = condition.operator in ["contains", "not_contains"]
+        is_negated = condition.operator in ["not_equals", "not_contains"]
+        if use_contains and condition.field != "name":
+            logger.warning(
+                "Field %s does not support 'contains' operator, using exact match",
+                condition.field,
+            )
+
+        device_ids = await self.query_service._match_device_ids(
+            condition.field, condition.value, use_contains, is_negated
+        )
+        logger.info(
+            "Condition %s %s '%s' returned %s devices (device index)",
+            condition.field,
+            condition.operator,
+            condition.value,
+            len(device_ids),
+        )
+        return device_ids
+
+    async def _complement(self, devices_data: List[DeviceInfo]) -> FrozenSet[str]:
+        """IDs of all indexed devices except those in ``devices_data``."""
+        index = await self.query_service._get_device_index()
+        return index.all_ids - {device.id for device in devices_data}
+
     def _intersect_sets(self, sets: List[Set[str]]) -> Set[str]:
         """Compute intersection of multiple sets (AND operation)."""
         if not sets:
@@ -113,6 +113,14 @@ class InventoryService:
                     "Result set size after operation %s: %s", i, len(result_devices)
                 )
 
+            # Indexed conditions return IDs only; resolve them from the index
+            missing_ids = [i for i in result_devices if i not in all_devices_data]
+            if missing_ids:
+                index = await self.query_service._get_device_index()
+                all_devices_data.update(
+                    (device.id, device) for device in index.devices_for(missing_ids)
+                )
+
             result_list = [
                 all_devices_data[device_id]
                 for device_id in result_devices
@@ -0,0 +1,53 @@
+"""Location hierarchy closure table for local location filtering.
+
+Nautobot's ``location`` device filter matches a location and all of its
+descendants. ``build_location_closure`` flattens the cached location tree
+into ``{location name: [names of the location and every descendant]}`` so
+inventory conditions can resolve that hierarchy against the device index
+without a live GraphQL call.
+
+The table is written next to ``nautobot:locations:list`` by the location
+cache job (and the startup prefetch) and shares its TTL; once it expires the
+inventory falls back to querying Nautobot.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Set
+
+LOCATION_CLOSURE_KEY = "nautobot:locations:closure"
+
+
+def build_location_closure(locations: Iterable[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Map every location name to itself plus all descendant location names.
+
+    ``locations`` is the ``locations`` GraphQL result (each entry carries
+    ``id``, ``name`` and ``parent { id }``). Names that occur under several
+    parents are merged, matching Nautobot's name-based filter.
+    """
+    names: Dict[str, str] = {}
+    children: Dict[str, List[str]] = {}
+    for location in locations:
+        location_id = location.get("id")
+        if not location_id or not location.get("name"):
+            continue
+        names[location_id] = location["name"]
+        parent_id = (location.get("parent") or {}).get("id")
+        if parent_id:
+            children.setdefault(parent_id, []).append(location_id)
+
+    closure: Dict[str, Set[str]] = {}
+    for location_id, name in names.items():
+        descendants = closure.setdefault(name, set())
+        stack = [location_id]
+        seen: Set[str] = set()
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue  # guard against cycles in malformed data
+            seen.add(current)
+            if current in names:
+                descendants.add(names[current])
+            stack.extend(children.get(current, ()))
+
+    return {name: sorted(members) for name, members in closure.items()}
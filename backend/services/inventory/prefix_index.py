@@ -0,0 +1,215 @@
+"""Sorted interval index of device IP addresses for local prefix filtering.
+
+``cache_all_devices_task`` also pages through Nautobot's IP addresses and
+stores a compact record per device-assigned address under
+``nautobot:devices:ip_index`` as ``{"version": ..., "records": [...]}``,
+stamped with the same version as the bulk device list. ``PrefixIndex`` keeps those addresses as sorted integers per
+(namespace, IP version), so a CIDR condition becomes two ``bisect`` calls
+plus a filter on each address's parent prefix instead of a nested
+``prefixes → ip_addresses → interface_assignments → device`` GraphQL query.
+
+The matching mirrors the live queries it replaces:
+
+* ``ip_prefix`` walks ``prefixes(<operator>: cidr)`` and their
+  ``ip_addresses``; an address matches when its parent prefix is within
+  (``within``), within-or-equal (``within_include``) or equal to
+  (``exact``) the CIDR.
+* ``primary_prefix`` uses ``ip_addresses(prefix: cidr)``; an address matches
+  when it lies inside the CIDR, and only devices using it as
+  ``primary_ip4`` count.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+IP_INDEX_KEY = "nautobot:devices:ip_index"
+
+# GraphQL selection set for the paged ip_addresses fetch.
+IP_INDEX_FIELDS = """
+            address
+            parent {
+              prefix
+              namespace {
+                name
+              }
+            }
+            interface_assignments {
+              interface {
+                device {
+                  id
+                }
+              }
+            }
+            primary_ip4_for {
+              id
+            }
+"""
+
+IpNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+# Compact cache record: [address, parent prefix, namespace, device IDs, primary-for IDs]
+IpRecord = List[Any]
+
+
+def compact_ip_record(ip_address: Dict[str, Any]) -> Optional[IpRecord]:
+    """Reduce a GraphQL ip_addresses entry to a cache record.
+
+    Returns None for addresses not assigned to any device interface and not
+    used as any device's primary IPv4.
+    """
+    device_ids = set()
+    for assignment in ip_address.get("interface_assignments") or []:
+        device = (assignment.get("interface") or {}).get("device") or {}
+        if device.get("id"):
+            device_ids.add(device["id"])
+    primary_ids = sorted(
+        {d["id"] for d in ip_address.get("primary_ip4_for") or [] if d.get("id")}
+    )
+    if not ip_address.get("address") or not (device_ids or primary_ids):
+        return None
+
+    parent = ip_address.get("parent") or {}
+    namespace = (parent.get("namespace") or {}).get("name")
+    return [
+        ip_address["address"],
+        parent.get("prefix"),
+        namespace,
+        sorted(device_ids),
+        primary_ids,
+    ]
+
+
+class _Bucket:
+    """Addresses of one (namespace, IP version), sorted by integer value."""
+
+    def __init__(
+        self,
+        rows: List[Tuple[int, Optional[IpNetwork], FrozenSet[str], FrozenSet[str]]],
+    ):
+        rows.sort(key=lambda row: row[0])
+        self.keys = [row[0] for row in rows]
+        self.rows = rows
+
+    def within(self, network: IpNetwork):
+        lo = bisect_left(self.keys, int(network.network_address))
+        hi = bisect_right(self.keys, int(network.broadcast_address))
+        return self.rows[lo:hi]
+
+
+class PrefixIndex:
+    """Interval index answering CIDR containment conditions locally."""
+
+    def __init__(self, records: Iterable[IpRecord], version: Optional[str] = None):
+        self.version = version
+        grouped: Dict[Tuple[Optional[str], int], list] = {}
+        for address, parent, namespace, device_ids, primary_ids in records:
+            try:
+                interface = ipaddress.ip_interface(address)
+                parent_net = ipaddress.ip_network(parent) if parent else None
+            except ValueError:
+                logger.debug("Skipping unparsable IP record %s", address)
+                continue
+            grouped.setdefault((namespace, interface.version), []).append(
+                (
+                    int(interface.ip),
+                    parent_net,
+                    frozenset(device_ids),
+                    frozenset(primary_ids),
+                )
+            )
+        self._buckets = {key: _Bucket(rows) for key, rows in grouped.items()}
+
+    def __len__(self) -> int:
+        return sum(len(bucket.keys) for bucket in self._buckets.values())
+
+    def _buckets_for(self, network: IpNetwork, namespace: Optional[str]):
+        for (bucket_namespace, version), bucket in self._buckets.items():
+            if version != network.version:
+                continue
+            if namespace is not None and bucket_namespace != namespace:
+                continue
+            yield bucket
+
+    def match(
+        self,
+        cidr: str,
+        namespace: Optional[str] = None,
+        operator: str = "within_include",
+    ) -> FrozenSet[str]:
+        """IDs of devices with an interface address under ``cidr``.
+
+        Raises:
+            ValueError: If ``cidr`` is not a valid network.
+        """
+        network = ipaddress.ip_network(cidr, strict=False)
+        ids: set = set()
+        for bucket in self._buckets_for(network, namespace):
+            for _, parent, device_ids, _ in bucket.within(network):
+                if parent is None or parent.version != network.version:
+                    continue
+                if operator == "exact":
+                    matched = parent == network
+                elif operator == "within":
+                    matched = parent != network and parent.subnet_of(network)
+                else:
+                    matched = parent.subnet_of(network)
+                if matched:
+                    ids.update(device_ids)
+        return frozenset(ids)
+
+    def match_primary(
+        self, cidr: str, namespace: Optional[str] = None
+    ) -> FrozenSet[str]:
+        """IDs of devices whose primary IPv4 address lies inside ``cidr``.
+
+        Raises:
+            ValueError: If ``cidr`` is not a valid network.
+        """
+        network = ipaddress.ip_network(cidr, strict=False)
+        ids: set = set()
+        for bucket in self._buckets_for(network, namespace):
+            for _, _, _, primary_ids in bucket.within(network):
+                ids.update(primary_ids)
+        return frozenset(ids)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide shared index
+# ---------------------------------------------------------------------------
+
+_shared_lock = threading.Lock()
+_shared_index: Optional[PrefixIndex] = None
+
+
+def get_shared_index(version: str) -> Optional[PrefixIndex]:
+    """Return the process-wide index if it was built from ``version``."""
+    index = _shared_index
+    if index is not None and index.version == version:
+        return index
+    return None
+
+
+def publish_shared_index(index: PrefixIndex) -> None:
+    """Make ``index`` the process-wide index (only versioned indexes are shared)."""
+    global _shared_index
+    if index.version is None:
+        return
+    with _shared_lock:
+        _shared_index = index
+    logger.info(
+        "Published prefix index version %s with %s addresses", index.version, len(index)
+    )
+
+
+def reset_shared_index() -> None:
+    """Drop the process-wide index (used by tests and explicit invalidation)."""
+    global _shared_index
+    with _shared_lock:
+        _shared_index = None
@@ -5,28 +5,36 @@ Extracted from InventoryService as part of Phase 4 decomposition.
 See: doc/refactoring/REFACTORING_SERVICES.md — Phase 4
 
 Cache strategy (Option A — cache-first):
-  Most filter operations load the full device list once from Redis
-  (key: nautobot:devices:all, populated by cache_all_devices_task) and
-  perform in-Python filtering.  The per-request cache lives in
-  DeviceCacheLoader so multiple conditions in the same inventory preview
-  only pay the Redis round-trip once.
+  Most filter operations resolve against a DeviceIndex built from the Redis
+  bulk cache (key: nautobot:devices:all, populated by cache_all_devices_task).
+  The index maps attribute values to device-ID posting sets and is shared
+  process-wide until the cache job writes a new version stamp, so inventory
+  previews neither re-parse the bulk list nor scan it per condition.
+
+  Location conditions resolve against the same index, expanding a location
+  to its descendants via the closure table written by the location cache job
+  (key: nautobot:locations:closure). When that table is missing or does not
+  know the requested location, the query goes to Nautobot, which resolves
+  the child-location hierarchy server-side.
+
+  ip_prefix and primary_prefix conditions resolve against a sorted interval
+  index of device IP addresses (key: nautobot:devices:ip_index), written by
+  the same cache job and stamped with the same version. They fall back to
+  Nautobot's server-side CIDR containment when that index is missing or
+  older than the device list.
 
   Exceptions that still go directly to Nautobot GraphQL:
-    • location       — Nautobot resolves child-location hierarchy server-side
-    • ip_prefix      — requires server-side CIDR containment logic
-    • primary_prefix — requires server-side CIDR containment logic, restricted
-                        to each device's primary_ip4
     • custom_field   — fields are dynamic and not stored in the cache
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple
 
 from models.inventory import DeviceInfo
-from services.inventory import device_filters as filters
 from services.inventory.device_cache import DeviceCacheLoader
+from services.inventory.device_index import DeviceIndex
 
 if TYPE_CHECKING:
     from services.settings.cache import RedisCacheService
@@ -34,6 +42,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _split_prefix_filter(prefix_filter: str) -> Tuple[str, Optional[str]]:
+    """Split a prefix condition value ("<cidr> [namespace]") into its parts."""
+    parts = prefix_filter.strip().split(None, 1)
+    namespace = parts[1].strip() if len(parts) > 1 else None
+    return parts[0], namespace
+
+
 class InventoryQueryService:
     """Handles all Nautobot GraphQL queries for inventory device lookups."""
 
@@ -48,17 +63,120 @@ class InventoryQueryService:
         return await self._cache.get_custom_field_types()
 
     # ------------------------------------------------------------------
-    # Cache-backed device list (with live fallback)
+    # Cache-backed device index (with live fallback)
     # ------------------------------------------------------------------
 
+    async def _get_device_index(self) -> DeviceIndex:
+        """Return the device index, preferring the Redis bulk cache over a live call."""
+        index = await self._cache.get_index()
+        if index is None:
+            # Redis miss — fall back to live Nautobot query and warm the loader
+            self._cache.set_devices(await self._query_all_devices_live())
+            index = await self._cache.get_index()
+        return index
+
     async def _get_all_devices_cached(self) -> List[DeviceInfo]:
         """Return all devices, preferring the Redis bulk cache over a live API call."""
-        devices = await self._cache.get_all()
-        if not self._cache.is_populated:
-            # Redis miss — fall back to live Nautobot query and warm the loader
-            devices = await self._query_all_devices_live()
-            self._cache.set_devices(devices)
-        return devices
+        return (await self._get_device_index()).devices()
+
+    async def _match_device_ids(
+        self,
+        field: str,
+        value: str,
+        use_contains: bool = False,
+        use_negation: bool = False,
+    ) -> FrozenSet[str]:
+        """Resolve a condition on an indexed field to a set of device IDs.
+
+        ``use_contains`` is honoured for ``name`` only; ``has_primary`` takes
+        "true"/"false" as its value.
+        """
+        index = await self._get_device_index()
+        if field == "has_primary":
+            ids = index.with_primary_ip(value.lower() == "true")
+        elif field == "name" and use_contains:
+            ids = index.lookup_contains("name", value)
+        else:
+            ids = index.lookup(field, value)
+        if use_negation:
+            ids = index.all_ids - ids
+        return ids
+
+    async def _match_location_ids(
+        self,
+        location: str,
+        use_contains: bool = False,
+        use_negation: bool = False,
+    ) -> Optional[FrozenSet[str]]:
+        """Resolve a location condition to device IDs without calling Nautobot.
+
+        Exact matches include devices in all descendant locations, like
+        Nautobot's ``location`` filter; ``contains`` matches the device's own
+        location name (``location__name__ic``). Returns None when the cached
+        location tree cannot answer and the caller must query Nautobot.
+        """
+        if use_contains:
+            index = await self._get_device_index()
+            ids = index.lookup_contains("location", location)
+        else:
+            closure = self._cache.get_location_closure()
+            if closure is None or location not in closure:
+                return None
+            index = await self._get_device_index()
+            ids = frozenset().union(
+                *(index.lookup("location", name) for name in closure[location])
+            )
+        if use_negation:
+            ids = index.all_ids - ids
+        return ids
+
+    async def _match_prefix_ids(
+        self,
+        prefix_filter: str,
+        operator: str = "within_include",
+        primary_only: bool = False,
+    ) -> Optional[FrozenSet[str]]:
+        """Resolve an ip_prefix/primary_prefix condition from the prefix index.
+
+        Returns None when no current index is cached (or the CIDR does not
+        parse) and the caller must query Nautobot.
+        """
+        if not prefix_filter.strip():
+            return frozenset()
+        index = self._cache.get_prefix_index()
+        if index is None:
+            return None
+        cidr, namespace = _split_prefix_filter(prefix_filter)
+        try:
+            if primary_only:
+                return index.match_primary(cidr, namespace)
+            return index.match(cidr, namespace, operator)
+        except ValueError:
+            logger.warning("Invalid prefix '%s', querying Nautobot", cidr)
+            return None
+
+    async def _query_indexed(
+        self,
+        field: str,
+        value: str,
+        use_contains: bool = False,
+        use_negation: bool = False,
+    ) -> List[DeviceInfo]:
+        """Resolve an indexed condition to DeviceInfo objects."""
+        if not value or value.strip() == "":
+            logger.warning("Empty %s filter provided, returning empty result", field)
+            return []
+        ids = await self._match_device_ids(field, value, use_contains, use_negation)
+        result = (await self._get_device_index()).devices_for(ids)
+        logger.info(
+            "Index filter %s='%s' (contains=%s, negation=%s): %s devices",
+            field,
+            value,
+            use_contains,
+            use_negation,
+            len(result),
+        )
+        return result
 
     # ------------------------------------------------------------------
     # Live Nautobot GraphQL helpers (used as fallback or for uncacheable queries)
@@ -70,159 +188,89 @@ class InventoryQueryService:
 
         nautobot_service = service_factory.build_nautobot_service()
 
-        query = """
-        query all_devices {
-            devices {
-                id
+        fields = """
+            id
+            name
+            serial
+            primary_ip4 {
+                address
+            }
+            status {
                 name
-                serial
-                primary_ip4 {
-                    address
-                }
-                status {
-                    name
-                }
-                device_type {
-                    model
-                    manufacturer {
-                        name
-                    }
-                }
-                role {
-                    name
-                }
-                location {
-                    name
-                }
-                tags {
-                    name
-                }
-                platform {
+            }
+            device_type {
+                model
+                manufacturer {
                     name
                 }
             }
-        }
+            role {
+                name
+            }
+            location {
+                name
+            }
+            tags {
+                name
+            }
+            platform {
+                name
+            }
         """
 
-        result = await nautobot_service.graphql_query(query, {})
-        devices_data = result.get("data", {}).get("devices", [])
-        logger.info("Retrieved %s total devices from Nautobot", len(devices_data))
-        return self._parse_device_data(devices_data)
+        devices: List[DeviceInfo] = []
+        async for page in nautobot_service.iter_device_pages(fields):
+            devices.extend(self._parse_device_data(page))
+        logger.info("Retrieved %s total devices from Nautobot", len(devices))
+        return devices
 
     async def _query_all_devices(self) -> List[DeviceInfo]:
         """Return all devices, using the bulk cache when available."""
         return await self._get_all_devices_cached()
 
     # ------------------------------------------------------------------
-    # Cache-first filter methods (delegate pure logic to device_filters)
+    # Cache-first filter methods (posting-set lookups on the device index)
     # ------------------------------------------------------------------
 
     async def _query_devices_by_name(
         self, name_filter: str, use_contains: bool = False
     ) -> List[DeviceInfo]:
-        if not name_filter or name_filter.strip() == "":
-            logger.warning("Empty name_filter provided, returning empty result")
-            return []
-        all_devices = await self._get_all_devices_cached()
-        result = filters.by_name(all_devices, name_filter, use_contains)
-        logger.info(
-            "Cache filter name='%s' (contains=%s): %s devices",
-            name_filter,
-            use_contains,
-            len(result),
-        )
-        return result
+        return await self._query_indexed("name", name_filter, use_contains)
 
     async def _query_devices_by_role(
         self, role_filter: str, use_negation: bool = False
     ) -> List[DeviceInfo]:
-        if not role_filter or role_filter.strip() == "":
-            logger.warning("Empty role_filter provided, returning empty result")
-            return []
-        all_devices = await self._get_all_devices_cached()
-        result = filters.by_role(all_devices, role_filter, use_negation)
-        logger.info(
-            "Cache filter role='%s' (negation=%s): %s devices",
-            role_filter,
-            use_negation,
-            len(result),
-        )
-        return result
+        return await self._query_indexed("role", role_filter, use_negation=use_negation)
 
     async def _query_devices_by_status(self, status_filter: str) -> List[DeviceInfo]:
-        if not status_filter or status_filter.strip() == "":
-            logger.warning("Empty status_filter provided, returning empty result")
-            return []
-        all_devices = await self._get_all_devices_cached()
-        result = filters.by_status(all_devices, status_filter)
-        logger.info("Cache filter status='%s': %s devices", status_filter, len(result))
-        return result
+        return await self._query_indexed("status", status_filter)
 
     async def _query_devices_by_tag(self, tag_filter: str) -> List[DeviceInfo]:
-        if not tag_filter or tag_filter.strip() == "":
-            logger.warning("Empty tag_filter provided, returning empty result")
-            return []
-        all_devices = await self._get_all_devices_cached()
-        result = filters.by_tag(all_devices, tag_filter)
-        logger.info("Cache filter tag='%s': %s devices", tag_filter, len(result))
-        return result
+        return await self._query_indexed("tag", tag_filter)
 
     async def _query_devices_by_devicetype(
         self, devicetype_filter: str, use_negation: bool = False
     ) -> List[DeviceInfo]:
-        if not devicetype_filter or devicetype_filter.strip() == "":
-            logger.warning("Empty devicetype_filter provided, returning empty result")
-            return []
-        all_devices = await self._get_all_devices_cached()
-        result = filters.by_device_type(all_devices, devicetype_filter, use_negation)
-        logger.info(
-            "Cache filter device_type='%s' (negation=%s): %s devices",
-            devicetype_filter,
-            use_negation,
-            len(result),
+        return await self._query_indexed(
+            "device_type", devicetype_filter, use_negation=use_negation
         )
-        return result
 
     async def _query_devices_by_manufacturer(
         self, manufacturer_filter: str, use_negation: bool = False
     ) -> List[DeviceInfo]:
-        if not manufacturer_filter or manufacturer_filter.strip() == "":
-            logger.warning("Empty manufacturer_filter provided, returning empty result")
-            return []
-        all_devices = await self._get_all_devices_cached()
-        result = filters.by_manufacturer(all_devices, manufacturer_filter, use_negation)
-        logger.info(
-            "Cache filter manufacturer='%s' (negation=%s): %s devices",
-            manufacturer_filter,
-            use_negation,
-            len(result),
+        return await self._query_indexed(
+            "manufacturer", manufacturer_filter, use_negation=use_negation
         )
-        return result
 
     async def _query_devices_by_platform(
         self, platform_filter: str
     ) -> List[DeviceInfo]:
-        if not platform_filter or platform_filter.strip() == "":
-            logger.warning("Empty platform_filter provided, returning empty result")
-            return []
-        all_devices = await self._get_all_devices_cached()
-        result = filters.by_platform(all_devices, platform_filter)
-        logger.info(
-            "Cache filter platform='%s': %s devices", platform_filter, len(result)
-        )
-        return result
+        return await self._query_indexed("platform", platform_filter)
 
     async def _query_devices_by_has_primary(
         self, has_primary_filter: str
     ) -> List[DeviceInfo]:
-        all_devices = await self._get_all_devices_cached()
-        result = filters.by_has_primary_ip(all_devices, has_primary_filter)
-        logger.info(
-            "Cache filter has_primary=%s: %s devices",
-            has_primary_filter.lower() == "true",
-            len(result),
-        )
-        return result
+        return await self._query_indexed("has_primary", has_primary_filter)
 
     # ------------------------------------------------------------------
     # Live Nautobot queries (location hierarchy / CIDR / custom fields)
@@ -234,21 +282,30 @@ class InventoryQueryService:
         use_contains: bool = False,
         use_negation: bool = False,
     ) -> List[DeviceInfo]:
-        """Query devices by location using GraphQL.
+        """Query devices by location.
 
-        Intentionally kept as a live Nautobot call: Nautobot resolves the full
-        child-location hierarchy server-side.  Replicating that logic in Python
-        would require fetching and traversing the entire location tree, which is
-        more expensive than a single filtered GraphQL query.
+        Resolved from the device index and the cached location closure table
+        when possible; otherwise falls back to GraphQL so Nautobot resolves
+        the child-location hierarchy server-side.
         """
         import service_factory
 
-        nautobot_service = service_factory.build_nautobot_service()
-
         if not location_filter or location_filter.strip() == "":
             logger.warning("Empty location_filter provided, returning empty result")
             return []
 
+        ids = await self._match_location_ids(
+            location_filter, use_contains, use_negation
+        )
+        if ids is not None:
+            return (await self._get_device_index()).devices_for(ids)
+
+        logger.info(
+            "Location '%s' not in cached location tree, querying Nautobot",
+            location_filter,
+        )
+        nautobot_service = service_factory.build_nautobot_service()
+
         if use_negation:
             query = """
             query devices_by_location ($location_filter: [String]) {
@@ -367,22 +424,24 @@ class InventoryQueryService:
     async def _query_devices_by_ip_prefix(
         self, prefix_filter: str, operator: str = "within_include"
     ) -> List[DeviceInfo]:
-        """Query devices by IP prefix using GraphQL.
+        """Query devices by IP prefix.
 
-        Intentionally kept as a live Nautobot call: CIDR containment filtering
-        (within_include / within / exact) requires server-side evaluation.
+        Resolved from the cached prefix index when it is current; otherwise
+        Nautobot evaluates the CIDR containment (within_include / within /
+        exact) server-side.
         """
         import service_factory
 
-        nautobot_service = service_factory.build_nautobot_service()
-
         if not prefix_filter or prefix_filter.strip() == "":
             logger.warning("Empty prefix_filter provided, returning empty result")
             return []
 
-        parts = prefix_filter.strip().split(None, 1)
-        cidr = parts[0]
-        namespace = parts[1].strip() if len(parts) > 1 else None
+        ids = await self._match_prefix_ids(prefix_filter, operator)
+        if ids is not None:
+            return (await self._get_device_index()).devices_for(ids)
+
+        nautobot_service = service_factory.build_nautobot_service()
+        cidr, namespace = _split_prefix_filter(prefix_filter)
 
         namespace_arg = f', namespace: "{namespace}"' if namespace else ""
 
@@ -460,8 +519,8 @@ class InventoryQueryService:
     ) -> List[DeviceInfo]:
         """Query devices whose *primary* IPv4 address falls within a prefix.
 
-        Intentionally kept as a live Nautobot call: CIDR containment filtering
-        requires server-side evaluation.
+        Resolved from the cached prefix index when it is current; otherwise
+        Nautobot evaluates the CIDR containment server-side.
 
         Unlike ip_prefix (which matches devices with ANY interface address in
         the prefix), this only matches devices where the in-prefix address is
@@ -477,15 +536,16 @@ class InventoryQueryService:
         """
         import service_factory
 
-        nautobot_service = service_factory.build_nautobot_service()
-
         if not prefix_filter or prefix_filter.strip() == "":
             logger.warning("Empty prefix_filter provided, returning empty result")
             return []
 
-        parts = prefix_filter.strip().split(None, 1)
-        cidr = parts[0]
-        namespace = parts[1].strip() if len(parts) > 1 else None
+        ids = await self._match_prefix_ids(prefix_filter, operator, primary_only=True)
+        if ids is not None:
+            return (await self._get_device_index()).devices_for(ids)
+
+        nautobot_service = service_factory.build_nautobot_service()
+        cidr, namespace = _split_prefix_filter(prefix_filter)
 
         namespace_arg = f', namespace: "{namespace}"' if namespace else ""
         prefix_arg = f'prefix: "{cidr}"{namespace_arg}'
@@ -4,8 +4,10 @@ Nautobot service for handling GraphQL queries and REST API calls.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
-from typing import Any
+from typing import Any, AsyncIterator, Callable
 
 import httpx
 
@@ -17,6 +19,14 @@ from .common.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Defaults for limit/offset paging of large GraphQL collections.
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_PAGE_CONCURRENCY = 4
+
+# Defaults for list-endpoint bulk PATCH requests.
+DEFAULT_BULK_CHUNK_SIZE = 100
+DEFAULT_BULK_CONCURRENCY = 4
+
 
 class NautobotService:
     """Pure-async Nautobot API client. App-scoped, lifespan-managed.
@@ -38,6 +48,8 @@ class NautobotService:
 
     def __init__(self):
         self._client: httpx.AsyncClient | None = None
+        # Number of bulk operations sharing a client opened by _pooled_client().
+        self._temporary_client_users = 0
 
     async def startup(self) -> None:
         """Initialize the async HTTP client. Called by FastAPI lifespan on startup."""
@@ -166,6 +178,299 @@ class NautobotService:
         except Exception as e:
             logger.error("REST request failed: %s", str(e))
             raise
+        finally:
+            if method.upper() != "GET":
+                self._invalidate_resolutions(endpoint)
+
+    @staticmethod
+    def _invalidate_resolutions(endpoint: str) -> None:
+        """Drop cached name → UUID resolutions a write to *endpoint* may change."""
+        from .resolvers.resolution_cache import resolution_cache
+
+        resolution_cache.invalidate_endpoint(endpoint)
+
+    async def paginate_graphql(
+        self,
+        query: str,
+        collection: str,
+        variables: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of a list-valued GraphQL field using limit/offset paging.
+
+        ``query`` must declare ``$limit: Int`` and ``$offset: Int`` and pass
+        them to the field named ``collection``. The first page is fetched on
+        its own so small inventories cost a single request; after that up to
+        ``max_concurrency`` pages are requested in parallel over one pooled
+        client. Pages are yielded in offset order and iteration stops at the
+        first short page, so peak memory follows ``page_size * max_concurrency``
+        rather than the size of the whole collection.
+
+        Raises:
+            NautobotAPIError: If any page returns GraphQL errors.
+        """
+        if page_size < 1 or max_concurrency < 1:
+            raise NautobotValidationError(
+                "page_size and max_concurrency must be positive"
+            )
+
+        async with self._pooled_client():
+            offset = 0
+            wave = 1
+            while True:
+                offsets = [offset + i * page_size for i in range(wave)]
+                offset += page_size * wave
+                pages = await asyncio.gather(
+                    *(
+                        self._fetch_graphql_page(
+                            query, collection, variables, page_size, page_offset
+                        )
+                        for page_offset in offsets
+                    )
+                )
+                for page in pages:
+                    if page:
+                        yield page
+                    if len(page) < page_size:
+                        return
+                wave = max_concurrency
+
+    def iter_device_pages(
+        self,
+        fields: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield all Nautobot devices page by page.
+
+        Args:
+            fields: GraphQL selection set for each device (without braces).
+            page_size: Number of devices per GraphQL request.
+            max_concurrency: Maximum number of page requests in flight.
+        """
+        query = f"""
+        query paged_devices($limit: Int, $offset: Int) {{
+          devices(limit: $limit, offset: $offset) {{
+            {fields}
+          }}
+        }}
+        """
+        return self.paginate_graphql(
+            query,
+            "devices",
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        )
+
+    async def bulk_update(
+        self,
+        endpoint: str,
+        updates: list[dict[str, Any]],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> dict[str, str]:
+        """PATCH many objects of one list endpoint (e.g. ``dcim/devices/``).
+
+        Each entry of ``updates`` carries the object ``id`` plus the fields to
+        change. Entries are sent as Nautobot bulk PATCH requests of
+        ``chunk_size`` objects, with up to ``max_concurrency`` requests in
+        flight over one pooled client. Nautobot applies a bulk request
+        atomically, so when a chunk is rejected its objects are retried one by
+        one to attribute the failure to the offending objects.
+        ``on_progress(done, total)`` is called after each chunk.
+
+        Returns:
+            Error messages keyed by object ID; empty when every update succeeded.
+
+        Raises:
+            NautobotValidationError: If an entry has no ``id``, the chunking
+                parameters are invalid, or Nautobot is not configured.
+        """
+        if chunk_size < 1 or max_concurrency < 1:
+            raise NautobotValidationError(
+                "chunk_size and max_concurrency must be positive"
+            )
+        if any(not update.get("id") for update in updates):
+            raise NautobotValidationError("Every bulk update entry needs an 'id'")
+
+        list_endpoint = endpoint.strip("/") + "/"
+        semaphore = asyncio.Semaphore(max_concurrency)
+        errors: dict[str, str] = {}
+
+        async def patch_one(update: dict[str, Any]) -> None:
+            object_id = str(update["id"])
+            data = {k: v for k, v in update.items() if k != "id"}
+            async with semaphore:
+                try:
+                    await self.rest_request(
+                        f"{list_endpoint}{object_id}/", method="PATCH", data=data
+                    )
+                except NautobotValidationError:
+                    raise
+                except Exception as e:
+                    errors[object_id] = str(e)
+
+        async def patch_chunk(chunk: list[dict[str, Any]]) -> None:
+            if len(chunk) == 1:
+                await patch_one(chunk[0])
+                return
+            async with semaphore:
+                try:
+                    await self.rest_request(list_endpoint, method="PATCH", data=chunk)
+                    return
+                except NautobotValidationError:
+                    raise
+                except Exception as e:
+                    logger.warning(
+                        "Bulk PATCH of %s objects on %s failed, retrying "
+                        "individually: %s",
+                        len(chunk),
+                        list_endpoint,
+                        e,
+                    )
+            await asyncio.gather(*(patch_one(update) for update in chunk))
+
+        done = 0
+
+        async def send_chunk(chunk: list[dict[str, Any]]) -> None:
+            nonlocal done
+            await patch_chunk(chunk)
+            done += len(chunk)
+            if on_progress is not None:
+                on_progress(done, len(updates))
+
+        chunks = [
+            updates[i : i + chunk_size] for i in range(0, len(updates), chunk_size)
+        ]
+        async with self._pooled_client():
+            await asyncio.gather(*(send_chunk(chunk) for chunk in chunks))
+
+        logger.info(
+            "Bulk PATCH on %s: %s updated, %s failed",
+            list_endpoint,
+            len(updates) - len(errors),
+            len(errors),
+        )
+        return errors
+
+    async def bulk_create(
+        self,
+        endpoint: str,
+        objects: list[dict[str, Any]],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> dict[int, str]:
+        """POST many objects to one list endpoint (e.g. ``ipam/ip-addresses/``).
+
+        The counterpart of :meth:`bulk_update`: objects are sent as Nautobot
+        bulk POST requests of ``chunk_size`` objects, and a rejected chunk is
+        retried one object at a time.
+
+        Returns:
+            Error messages keyed by the object's index in ``objects``; empty
+            when every object was created.
+
+        Raises:
+            NautobotValidationError: If the chunking parameters are invalid or
+                Nautobot is not configured.
+        """
+        if chunk_size < 1 or max_concurrency < 1:
+            raise NautobotValidationError(
+                "chunk_size and max_concurrency must be positive"
+            )
+
+        list_endpoint = endpoint.strip("/") + "/"
+        semaphore = asyncio.Semaphore(max_concurrency)
+        errors: dict[int, str] = {}
+
+        async def post_one(index: int) -> None:
+            async with semaphore:
+                try:
+                    await self.rest_request(
+                        list_endpoint, method="POST", data=objects[index]
+                    )
+                except NautobotValidationError:
+                    raise
+                except Exception as e:
+                    errors[index] = str(e)
+
+        async def post_chunk(indexes: range) -> None:
+            if len(indexes) == 1:
+                await post_one(indexes[0])
+                return
+            async with semaphore:
+                try:
+                    await self.rest_request(
+                        list_endpoint,
+                        method="POST",
+                        data=[objects[i] for i in indexes],
+                    )
+                    return
+                except NautobotValidationError:
+                    raise
+                except Exception as e:
+                    logger.warning(
+                        "Bulk POST of %s objects on %s failed, retrying "
+                        "individually: %s",
+                        len(indexes),
+                        list_endpoint,
+                        e,
+                    )
+            await asyncio.gather(*(post_one(index) for index in indexes))
+
+        chunks = [
+            range(i, min(i + chunk_size, len(objects)))
+            for i in range(0, len(objects), chunk_size)
+        ]
+        async with self._pooled_client():
+            await asyncio.gather(*(post_chunk(chunk) for chunk in chunks))
+
+        logger.info(
+            "Bulk POST on %s: %s created, %s failed",
+            list_endpoint,
+            len(objects) - len(errors),
+            len(errors),
+        )
+        return errors
+
+    async def _fetch_graphql_page(
+        self,
+        query: str,
+        collection: str,
+        variables: dict[str, Any] | None,
+        limit: int,
+        offset: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch one limit/offset page of ``collection``."""
+        page_variables = {**(variables or {}), "limit": limit, "offset": offset}
+        result = await self.graphql_query(query, page_variables)
+        if "errors" in result:
+            raise NautobotAPIError(f"GraphQL errors: {result['errors']}")
+        return (result.get("data") or {}).get(collection) or []
+
+    @contextlib.asynccontextmanager
+    async def _pooled_client(self) -> AsyncIterator[None]:
+        """Ensure a persistent client exists for the duration of a bulk operation.
+
+        Outside the FastAPI lifespan (Celery, scripts) ``_client`` is ``None``
+        and every request would open its own connection; a temporary client is
+        installed here so that all pages share one connection pool.
+        """
+        if self._client is not None and not self._temporary_client_users:
+            yield
+            return
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+        self._temporary_client_users += 1
+        try:
+            yield
+        finally:
+            self._temporary_client_users -= 1
+            if not self._temporary_client_users and self._client is not None:
+                client, self._client = self._client, None
+                await client.aclose()
 
     async def _do_post(
         self,
@@ -22,6 +22,7 @@ from .utils import (
     extract_id_from_url,
     extract_nested_value,
     flatten_nested_fields,
+    merge_update_data,
     normalize_tags,
     prepare_update_data,
 )
@@ -45,6 +46,7 @@ __all__ = [
     "extract_nested_value",
     "normalize_tags",
     "prepare_update_data",
+    "merge_update_data",
     "extract_id_from_url",
     # Exceptions
     "NautobotError",
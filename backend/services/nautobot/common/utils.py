@@ -192,6 +192,36 @@ def prepare_update_data(
     return update_data, interface_config, ip_namespace
 
 
+def merge_update_data(target: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge *update* into *target* the way two consecutive PATCHes would apply.
+
+    Later values win per field, except that nested objects such as
+    ``custom_fields`` are merged key by key, as Nautobot does.
+
+    Args:
+        target: Update data collected so far (modified in place)
+        update: Update data of the next row
+
+    Returns:
+        *target*
+
+    Example:
+        >>> merge_update_data(
+        ...     {"status": "active", "custom_fields": {"a": "1"}},
+        ...     {"status": "reserved", "custom_fields": {"b": "2"}},
+        ... )
+        {'status': 'reserved', 'custom_fields': {'a': '1', 'b': '2'}}
+    """
+    for key, value in update.items():
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            target[key] = merge_update_data(dict(current), value)
+        else:
+            target[key] = value
+    return target
+
+
 def extract_id_from_url(url: str) -> Optional[str]:
     """
     Extract UUID from Nautobot REST API URL.
@@ -9,7 +9,7 @@ import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import service_factory
 from models.backup_models import (
@@ -25,6 +25,21 @@ from utils.netmiko_platform_mapper import NetmikoPlatformMapper
 
 logger = logging.getLogger(__name__)
 
+# Devices kept in flight on one agent by backup_devices_via_agent()
+DEFAULT_AGENT_WINDOW = 5
+
+# Per-command timeout for agent config retrieval (matches CockpitAgentService)
+AGENT_COMMAND_TIMEOUT = 120
+
+
+def _agent_config_output(response: dict) -> str:
+    """Extract the config text from an agent response."""
+    raw_output = response.get("output", "")
+    # Agent wraps the config in a dict: {"device": ..., "output": "<config>", ...}
+    if isinstance(raw_output, dict):
+        return raw_output.get("output", "") or ""
+    return raw_output or ""
+
 
 class DeviceBackupService:
     """
@@ -324,12 +339,7 @@ class DeviceBackupService:
                     % running_response.get("error", running_response.get("status"))
                 )
 
-            raw_output = running_response.get("output", "")
-            # Agent wraps the config in a dict: {"device": ..., "output": "<config>", ...}
-            if isinstance(raw_output, dict):
-                running_config = raw_output.get("output", "") or ""
-            else:
-                running_config = raw_output or ""
+            running_config = _agent_config_output(running_response)
             device_backup_info.ssh_connection_success = True
 
             logger.info(
@@ -348,11 +358,7 @@ class DeviceBackupService:
 
             startup_config = ""
             if startup_response.get("status") in ("success", "ok"):
-                raw_startup = startup_response.get("output", "")
-                if isinstance(raw_startup, dict):
-                    startup_config = raw_startup.get("output", "") or ""
-                else:
-                    startup_config = raw_startup or ""
+                startup_config = _agent_config_output(startup_response)
             else:
                 logger.warning(
                     "[%s] Startup config not retrieved via agent: %s",
@@ -399,6 +405,229 @@ class DeviceBackupService:
 
         return device_backup_info
 
+    def backup_devices_via_agent(
+        self,
+        agent_id: str,
+        db,
+        device_ids: List[str],
+        repo_dir: Path,
+        credential_id: int,
+        current_date: str,
+        backup_running_config_path: Optional[str] = None,
+        backup_startup_config_path: Optional[str] = None,
+        max_in_flight: int = DEFAULT_AGENT_WINDOW,
+        start_index: int = 1,
+        total_devices: Optional[int] = None,
+    ) -> Iterator[DeviceBackupInfo]:
+        """
+        Backup a batch of devices via a Cockpit agent with overlapping commands.
+
+        Same steps as backup_single_device_via_agent(), but the batch shares
+        one Nautobot query, one agent online check, one credential lookup and
+        one response subscription, and up to *max_in_flight* devices have a
+        command outstanding on the agent at any time.
+
+        Yields:
+            DeviceBackupInfo: One per device, in completion order
+        """
+        from services.cockpit_agent.cockpit_agent_service import CockpitAgentService
+
+        total_devices = total_devices or len(device_ids)
+        indexes = {
+            device_id: start_index + offset
+            for offset, device_id in enumerate(device_ids)
+        }
+        infos = {
+            device_id: DeviceBackupInfo(device_id=device_id) for device_id in device_ids
+        }
+
+        def fail(device_id: str, error: str) -> DeviceBackupInfo:
+            logger.error("[%s] ✗ Agent backup failed: %s", indexes[device_id], error)
+            infos[device_id].error = error
+            return infos[device_id]
+
+        logger.info(
+            "Backing up devices %s-%s/%s via agent %s (window %s)",
+            start_index,
+            start_index + len(device_ids) - 1,
+            total_devices,
+            agent_id,
+            max_in_flight,
+        )
+
+        # Step 1: Fetch all device info from Nautobot in one query
+        try:
+            devices = self.config_service.fetch_devices_from_nautobot(device_ids)
+        except Exception as e:
+            for device_id in device_ids:
+                yield fail(device_id, str(e))
+            return
+
+        # Step 2: Resolve agent and credential once for the batch
+        agent_svc = CockpitAgentService(db)
+        try:
+            if not agent_svc.check_agent_online(agent_id):
+                raise RuntimeError("Agent is offline or not responding")
+            username, password = agent_svc.resolve_credential(credential_id)
+        except Exception as e:
+            for device_id in device_ids:
+                yield fail(device_id, str(e))
+            return
+
+        ready = []
+        device_types = {}
+        for device_id in device_ids:
+            device = devices.get(device_id)
+            if not device:
+                yield fail(device_id, "Failed to fetch device data from Nautobot")
+                continue
+
+            info = infos[device_id]
+            info.device_name = device.get("name", device_id)
+            info.device_ip = (
+                device.get("primary_ip4", {}).get("address", "").split("/")[0]
+                if device.get("primary_ip4")
+                else None
+            )
+            info.platform = (
+                device.get("platform", {}).get("name", "unknown")
+                if device.get("platform")
+                else "unknown"
+            )
+            if not info.device_ip:
+                yield fail(device_id, "No primary IP address")
+                continue
+
+            info.nautobot_fetch_success = True
+            device_types[device_id] = self.platform_mapper.map_to_netmiko(info.platform)
+            ready.append(device_id)
+
+        def params_for(device_id: str) -> dict:
+            return {
+                "ip_address": infos[device_id].device_ip,
+                "device_type": device_types[device_id],
+                "credential_id": credential_id,
+                "username": username,
+                "password": password,
+                "privileged": False,
+            }
+
+        def finish(device_id: str, running_config: str, startup_config: str):
+            info = infos[device_id]
+            if running_config:
+                info.running_config_success = True
+                info.running_config_bytes = len(running_config)
+            if startup_config:
+                info.startup_config_success = True
+                info.startup_config_bytes = len(startup_config)
+
+            save_result = self.config_service.save_configs_to_disk(
+                running_config=running_config,
+                startup_config=startup_config,
+                device=devices[device_id],
+                repo_path=repo_dir,
+                current_date=current_date,
+                running_template=backup_running_config_path,
+                startup_template=backup_startup_config_path,
+                device_index=indexes[device_id],
+            )
+            info.running_config_file = save_result["running_file"]
+            info.startup_config_file = save_result["startup_file"]
+            logger.info(
+                "[%s] ✓ Agent backup completed for %s",
+                indexes[device_id],
+                info.device_name,
+            )
+            return info
+
+        # Step 3: Keep up to max_in_flight devices busy on the agent.  Each
+        # device sends get_running_config, then get_startup_config on success.
+        in_flight = {}  # command_id -> (device_id, stage)
+        running_configs = {}
+        queue = iter(ready)
+        with agent_svc.open_command_channel(agent_id) as channel:
+
+            def dispatch(device_id: str, command: str) -> Optional[str]:
+                """Send a command for a device; return an error message on failure."""
+                try:
+                    command_id = channel.send(
+                        command,
+                        params_for(device_id),
+                        sent_by="backup-job",
+                        timeout=AGENT_COMMAND_TIMEOUT,
+                    )
+                except Exception as e:
+                    return str(e)
+                in_flight[command_id] = (device_id, command)
+                return None
+
+            while True:
+                while len(in_flight) < max(1, max_in_flight):
+                    device_id = next(queue, None)
+                    if device_id is None:
+                        break
+                    error = dispatch(device_id, "get_running_config")
+                    if error is not None:
+                        yield fail(device_id, error)
+                if not in_flight:
+                    break
+
+                response = channel.next_response()
+                if response is None:
+                    continue
+                entry = in_flight.pop(response.get("command_id"), None)
+                if entry is None:
+                    # Late or duplicate reply for a command already handled
+                    logger.warning(
+                        "Ignoring agent response for unknown command %s",
+                        response.get("command_id"),
+                    )
+                    continue
+                device_id, stage = entry
+                ok = response.get("status") in ("success", "ok")
+
+                if stage == "get_running_config":
+                    if not ok:
+                        yield fail(
+                            device_id,
+                            "Agent failed to retrieve running config: %s"
+                            % response.get("error", response.get("status")),
+                        )
+                        continue
+                    infos[device_id].ssh_connection_success = True
+                    running_configs[device_id] = _agent_config_output(response)
+                    error = dispatch(device_id, "get_startup_config")
+                    if error is None:
+                        continue
+                    # Like the serial path, keep the running config and save
+                    # it with an empty startup config.
+                    logger.warning(
+                        "[%s] Startup config not retrieved via agent: %s",
+                        indexes[device_id],
+                        error,
+                    )
+                    try:
+                        yield finish(device_id, running_configs.pop(device_id), "")
+                    except Exception as e:
+                        yield fail(device_id, str(e))
+                    continue
+
+                startup_config = ""
+                if ok:
+                    startup_config = _agent_config_output(response)
+                else:
+                    logger.warning(
+                        "[%s] Startup config not retrieved via agent: %s",
+                        indexes[device_id],
+                        response.get("error", response.get("status")),
+                    )
+                try:
+                    yield finish(
+                        device_id, running_configs.pop(device_id), startup_config
+                    )
+                except Exception as e:
+                    yield fail(device_id, str(e))
+
     def update_nautobot_timestamps(
         self,
         devices: List[dict],
@@ -431,36 +660,44 @@ class DeviceBackupService:
             custom_field_name=custom_field_name,
         )
 
+        update_data = {"custom_fields": {custom_field_name: backup_date}}
+        updates = []
+        names = {}
         for device_info in devices:
             device_id = device_info.get("device_id")
             device_name = device_info.get("device_name", device_id)
+            if not device_id:
+                error_msg = (
+                    "Failed to update custom field for %s: missing device ID"
+                    % (device_name,)
+                )
+                logger.error("✗ %s", error_msg)
+                status.failed_count += 1
+                status.errors.append(error_msg)
+                continue
+            names[str(device_id)] = device_name
+            updates.append({"id": device_id, **update_data})
 
+        if updates:
+            logger.info("Updating custom field for %s devices in bulk", len(updates))
             try:
-                logger.info(
-                    "Updating custom field for device: %s (%s)", device_name, device_id
+                errors = asyncio.run(
+                    self.nautobot_service.bulk_update("dcim/devices/", updates)
                 )
+            except Exception as e:
+                errors = {device_id: str(e) for device_id in names}
 
-                update_data = {"custom_fields": {custom_field_name: backup_date}}
-
-                asyncio.run(
-                    self.nautobot_service.rest_request(
-                        endpoint="dcim/devices/%s/" % device_id,
-                        method="PATCH",
-                        data=update_data,
+            for device_id, device_name in names.items():
+                if device_id in errors:
+                    error_msg = "Failed to update custom field for %s: %s" % (
+                        device_name,
+                        errors[device_id],
                     )
-                )
-
-                logger.info("✓ Updated custom field for %s", device_name)
-                status.updated_count += 1
-
-            except Exception as e:
-                error_msg = "Failed to update custom field for %s: %s" % (
-                    device_name,
-                    str(e),
-                )
-                logger.error("✗ %s", error_msg)
-                status.failed_count += 1
-                status.errors.append(error_msg)
+                    logger.error("✗ %s", error_msg)
+                    status.failed_count += 1
+                    status.errors.append(error_msg)
+                else:
+                    status.updated_count += 1
 
         logger.info(
             "Custom field updates: %s successful, %s failed",
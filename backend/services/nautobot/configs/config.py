@@ -8,7 +8,7 @@ configurations from network devices via SSH (Netmiko).
 import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 import service_factory
 from services.nautobot.common.exceptions import NautobotAPIError
@@ -17,56 +17,58 @@ from utils.netmiko_platform_mapper import NetmikoPlatformMapper
 
 logger = logging.getLogger(__name__)
 
-
-class DeviceConfigService:
-    """
-    Service for retrieving device configurations.
-
-    Provides methods for:
-    - Fetching device details from Nautobot (via GraphQL)
-    - Connecting to devices and retrieving configs (via Netmiko/SSH)
-    - Parsing configuration output
-    - Saving configurations to disk
-    """
-
-    # GraphQL query for full device details (used for backup with templated paths)
-    DEVICE_QUERY_FULL = """
-    query getDevice($deviceId: ID!) {
-      device(id: $deviceId) {
+# Device fields requested for backups (templated paths use most of these)
+_DEVICE_FULL_FIELDS = """
+    id
+    name
+    hostname: name
+    asset_tag
+    serial
+    _custom_field_data
+    custom_field_data: _custom_field_data
+    primary_ip4 {
+      id
+      address
+      host
+      mask_length
+    }
+    platform {
+      id
+      name
+      manufacturer {
         id
         name
-        hostname: name
-        asset_tag
-        serial
-        _custom_field_data
-        custom_field_data: _custom_field_data
-        primary_ip4 {
-          id
-          address
-          host
-          mask_length
-        }
-        platform {
-          id
-          name
-          manufacturer {
-            id
-            name
-          }
-        }
-        device_type {
-          id
-          model
-          manufacturer {
-            id
-            name
-          }
-        }
-        role {
+      }
+    }
+    device_type {
+      id
+      model
+      manufacturer {
+        id
+        name
+      }
+    }
+    role {
+      id
+      name
+    }
+    location {
+      id
+      name
+      description
+      location_type {
+        id
+        name
+      }
+      parent {
+        id
+        name
+        description
+        location_type {
           id
           name
         }
-        location {
+        parent {
           id
           name
           description
@@ -74,53 +76,69 @@ class DeviceConfigService:
             id
             name
           }
-          parent {
-            id
-            name
-            description
-            location_type {
-              id
-              name
-            }
-            parent {
-              id
-              name
-              description
-              location_type {
-                id
-                name
-              }
-            }
-          }
-        }
-        tenant {
-          id
-          name
-          tenant_group {
-            id
-            name
-          }
-        }
-        rack {
-          id
-          name
-          rack_group {
-            id
-            name
-          }
-        }
-        status {
-          id
-          name
-        }
-        tags {
-          id
-          name
         }
       }
     }
+    tenant {
+      id
+      name
+      tenant_group {
+        id
+        name
+      }
+    }
+    rack {
+      id
+      name
+      rack_group {
+        id
+        name
+      }
+    }
+    status {
+      id
+      name
+    }
+    tags {
+      id
+      name
+    }
+"""
+
+
+class DeviceConfigService:
+    """
+    Service for retrieving device configurations.
+
+    Provides methods for:
+    - Fetching device details from Nautobot (via GraphQL)
+    - Connecting to devices and retrieving configs (via Netmiko/SSH)
+    - Parsing configuration output
+    - Saving configurations to disk
     """
 
+    # GraphQL query for full device details (used for backup with templated paths)
+    DEVICE_QUERY_FULL = (
+        """
+    query getDevice($deviceId: ID!) {
+      device(id: $deviceId) {"""
+        + _DEVICE_FULL_FIELDS
+        + """      }
+    }
+    """
+    )
+
+    # Same selection as DEVICE_QUERY_FULL for a batch of devices in one request
+    DEVICES_QUERY_FULL = (
+        """
+    query getDevices($deviceIds: [String]) {
+      devices(id: $deviceIds) {"""
+        + _DEVICE_FULL_FIELDS
+        + """      }
+    }
+    """
+    )
+
     # GraphQL query for basic device details (minimal data)
     DEVICE_QUERY_BASIC = """
     query getDevice($deviceId: ID!) {
@@ -238,6 +256,45 @@ class DeviceConfigService:
 
         return device
 
+    def fetch_devices_from_nautobot(self, device_ids: List[str]) -> Dict[str, dict]:
+        """
+        Fetch full device details for several devices in one GraphQL request.
+
+        Uses the same selection as DEVICE_QUERY_FULL.  Unlike
+        fetch_device_from_nautobot(), devices that are missing or have no
+        primary IP are not treated as errors here; callers decide per device.
+
+        Args:
+            device_ids: UUIDs of the devices in Nautobot
+
+        Returns:
+            dict: Device data keyed by device ID (missing devices are absent)
+
+        Raises:
+            ValueError: If the GraphQL query fails
+        """
+        if not device_ids:
+            return {}
+
+        logger.info("Fetching %s devices from Nautobot...", len(device_ids))
+
+        device_data = asyncio.run(
+            self.nautobot_service.graphql_query(
+                self.DEVICES_QUERY_FULL, {"deviceIds": list(device_ids)}
+            )
+        )
+
+        if not device_data or "data" not in device_data or device_data.get("errors"):
+            logger.error("✗ Failed to get device data from Nautobot")
+            logger.error("Response: %s", device_data)
+            raise ValueError("Failed to fetch device data from Nautobot")
+
+        devices = device_data["data"].get("devices") or []
+        logger.info(
+            "✓ Fetched %s/%s devices from Nautobot", len(devices), len(device_ids)
+        )
+        return {device["id"]: device for device in devices}
+
     def retrieve_device_configs(
         self,
         device_ip: str,
@@ -10,7 +10,7 @@ import re
 from typing import Any, Dict, List, Optional
 
 from models.nautobot import AddDeviceRequest, InterfaceData
-from repositories.audit_log.audit_log_repository import audit_log_repo
+from repositories.audit_log.audit_log_writer import audit_log_writer
 from services.nautobot.common.exceptions import NautobotAPIError
 from services.nautobot.common.validators import is_valid_uuid
 from services.nautobot.devices.common import DeviceCommonService
@@ -166,7 +166,7 @@ class DeviceCreationService:
                         break
 
             if device_created:
-                audit_log_repo.create_log(
+                audit_log_writer.write(
                     username=username,
                     user_id=user_id,
                     event_type="add-device",
@@ -181,7 +181,7 @@ class DeviceCreationService:
                 error_message = workflow_status["step1_device"].get(
                     "message", "Unknown error"
                 )
-                audit_log_repo.create_log(
+                audit_log_writer.write(
                     username=username,
                     user_id=user_id,
                     event_type="add-device",
@@ -2,16 +2,21 @@
 Device query service for Nautobot.
 
 Handles device listing with filtering, pagination, and caching.
+
+Device lists and details are read through CacheAside: on a miss only one
+request rebuilds a key, and expired entries keep being served while a
+background task refreshes them.
 """
 
 import logging
 from typing import Optional
 
 from services.nautobot.common.exceptions import NautobotAPIError
+from services.nautobot_helpers.cache_aside import CacheAside
 from services.nautobot_helpers.cache_helpers import (
     DEVICE_CACHE_TTL,
     cache_device_list,
-    get_cached_device_list,
+    get_device_details_cache_key,
     get_device_list_cache_key,
 )
 
@@ -197,6 +202,7 @@ class DeviceQueryService:
 
         self._nb = service_factory.build_nautobot_service()
         self._cache = service_factory.build_cache_service()
+        self._cache_aside = CacheAside(self._cache, DEVICE_CACHE_TTL)
 
     async def get_device_details(
         self,
@@ -219,18 +225,11 @@ class DeviceQueryService:
         Raises:
             ValueError: If device not found or query fails
         """
-        # Check cache first
-        cache_key = f"nautobot:device_details:{device_id}"
-        if use_cache:
-            cached_device = self._cache.get(cache_key)
-            if cached_device is not None:
-                logger.debug("Cache hit for device details: %s", device_id)
-                return cached_device
-        else:
+        cache_key = get_device_details_cache_key(device_id)
+        if not use_cache:
             logger.debug("Bypassing cache for device details: %s", device_id)
 
-        # Execute GraphQL query
-        try:
+        async def _load() -> dict:
             result = await self._nb.graphql_query(
                 DEVICE_DETAILS_QUERY,
                 {"deviceId": device_id},
@@ -244,14 +243,13 @@ class DeviceQueryService:
             if not result.get("data") or not result["data"].get("device"):
                 raise ValueError(f"Device {device_id} not found in Nautobot")
 
-            device = result["data"]["device"]
-
-            # Cache the result
-            self._cache.set(cache_key, device, DEVICE_CACHE_TTL)
-            logger.debug("Cached device details for: %s", device_id)
-
-            return device
+            logger.debug("Caching device details for: %s", device_id)
+            return result["data"]["device"]
 
+        try:
+            return await self._cache_aside.get_or_load(
+                cache_key, _load, force_refresh=not use_cache
+            )
         except Exception as e:
             logger.error("Error fetching device details for %s: %s", device_id, str(e))
             raise ValueError(f"Failed to fetch device details: {str(e)}")
@@ -289,26 +287,36 @@ class DeviceQueryService:
                 limit,
                 offset,
             )
-            if not reload:
-                cached_result = get_cached_device_list(cache_key)
-                if cached_result is not None:
-                    logger.debug("Cache hit for devices list: %s", cache_key)
-                    return cached_result
-            return await self._query_by_name_and_location(
-                name_ic, location_id, limit, offset, cache_key
+            return await self._cache_aside.get_or_load(
+                cache_key,
+                lambda: self._query_by_name_and_location(
+                    name_ic, location_id, limit, offset, cache_key
+                ),
+                force_refresh=reload,
             )
 
-        # Check cache first (legacy filter_type/filter_value path)
+        # Legacy filter_type/filter_value path
         cache_key = get_device_list_cache_key(filter_type, filter_value, limit, offset)
-
-        if not reload:
-            cached_result = get_cached_device_list(cache_key)
-            if cached_result is not None:
-                logger.debug("Cache hit for devices list: %s", cache_key)
-                return cached_result
-        else:
+        if reload:
             logger.debug("Reload requested, bypassing cache for: %s", cache_key)
 
+        return await self._cache_aside.get_or_load(
+            cache_key,
+            lambda: self._query_devices(
+                filter_type, filter_value, limit, offset, cache_key
+            ),
+            force_refresh=reload,
+        )
+
+    async def _query_devices(
+        self,
+        filter_type: Optional[str],
+        filter_value: Optional[str],
+        limit: Optional[int],
+        offset: Optional[int],
+        cache_key: str,
+    ) -> dict:
+        """Run the query matching a legacy filter_type/filter_value pair."""
         # Route to appropriate query method based on filter type
         if filter_type and filter_value:
             if filter_type == "name":
@@ -663,7 +671,11 @@ class DeviceQueryService:
         filter_type: Optional[str] = None,
         filter_value: Optional[str] = None,
     ) -> dict:
-        """Build standardized response with pagination info and cache the result."""
+        """Build standardized response with pagination info.
+
+        Devices are cached individually; the response itself is cached by
+        the caller's CacheAside.
+        """
         current_offset = offset or 0
         has_more = current_offset + len(devices) < total_count if limit else False
 
@@ -693,9 +705,7 @@ class DeviceQueryService:
             "previous": prev_url,
         }
 
-        # Cache the result
         logger.debug("Caching devices list: %s", cache_key)
-        self._cache.set(cache_key, response_data, DEVICE_CACHE_TTL)
         cache_device_list(cache_key, response_data["devices"])
 
         return response_data
@@ -6,6 +6,7 @@ import asyncio
 import csv
 import fnmatch
 import io
+import ipaddress
 import logging
 import os
 from dataclasses import dataclass
@@ -19,6 +20,7 @@ from services.git.shared_utils import git_repo_manager
 from services.nautobot import NautobotService
 from services.nautobot.devices.creation import DeviceCreationService
 from services.nautobot.devices.update import DeviceUpdateService
+from services.nautobot.resolvers.resolution_cache import warm_up_taxonomies
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,13 @@ query ($address: [String]) {
 }
 """
 
+# GraphQL collection returned by the lookup query of each import type
+_LOOKUP_COLLECTIONS = {
+    "devices": "devices",
+    "ip-prefixes": "prefixes",
+    "ip-addresses": "ip_addresses",
+}
+
 _NAUTOBOT_NULL_SENTINELS = {"NULL", "NoObject", "null", ""}
 
 _INTERFACE_FIELD_MAP: dict[str, str] = {
@@ -101,6 +110,15 @@ _DEVICE_CREATE_FIELDS = (
     "position",
 )
 
+# Pipelined mode: files with at least this many rows are resolved in bulk
+# and applied concurrently unless the caller picks a mode explicitly.
+_PIPELINE_MIN_ROWS = 100
+# Primary key values per bulk GraphQL lookup, and lookups in flight at once.
+_LOOKUP_CHUNK_SIZE = 250
+_LOOKUP_CONCURRENCY = 4
+# Objects created or updated concurrently per apply batch.
+_APPLY_BATCH_SIZE = 20
+
 
 @dataclass
 class ImportContext:
@@ -118,6 +136,22 @@ class ImportContext:
     default_prefix_length: str | None
 
 
+@dataclass
+class _ImportItem:
+    """One object to import in pipelined mode, with its precomputed outcome.
+
+    ``outcome`` is set up front for rows that are skipped or fail while being
+    prepared; the rest are filled in by the apply phase.
+    """
+
+    idx: int
+    identifier: str
+    lookup_key: tuple[str, str] | None = None
+    nautobot_data: dict[str, Any] | None = None
+    iface_config: list[dict] | None = None
+    outcome: tuple[str, dict] | None = None
+
+
 class CsvImportService:
     """Imports or updates Nautobot objects from CSV files in a Git repository."""
 
@@ -143,12 +177,19 @@ class CsvImportService:
         import_format: str = "generic",
         add_prefixes: bool = False,
         default_prefix_length: str | None = None,
+        pipelined: bool | None = None,
     ) -> dict:
         """Import or update Nautobot objects from CSV data.
 
         The CSV data comes either from files in a Git repository
         (source="git") or from the text blocks a Get Data agent returns
         for the configured flows (source="agent").
+
+        In pipelined mode each file's primary keys are resolved with a few
+        bulk GraphQL queries and the creates/updates run concurrently in
+        bounded batches inside one event loop; results keep input order.
+        ``pipelined=None`` picks it for files of ``_PIPELINE_MIN_ROWS`` rows
+        or more and processes smaller files row by row.
         """
         try:
             logger.info("=" * 80)
@@ -168,6 +209,7 @@ class CsvImportService:
             logger.info("Dry run: %s", dry_run)
             logger.info("Column mapping: %s", column_mapping)
             logger.info("Profile ID: %s", profile_id)
+            logger.info("Pipelined: %s", pipelined)
 
             if import_type not in _ENDPOINT_MAP:
                 return {
@@ -292,7 +334,40 @@ class CsvImportService:
                     )
                     continue
 
-                if import_format == "cockpit":
+                use_pipeline = (
+                    pipelined
+                    if pipelined is not None
+                    else len(rows) >= _PIPELINE_MIN_ROWS
+                )
+                if use_pipeline:
+                    if import_format == "cockpit":
+                        items = self._cockpit_items(
+                            rows, pk_csv_col, col_map, defaults, import_type, fp
+                        )
+                    else:
+                        items = self._generic_items(
+                            rows,
+                            pk_csv_col,
+                            col_map,
+                            defaults,
+                            import_type,
+                            import_format,
+                            fp,
+                        )
+                    asyncio.run(
+                        self._run_pipeline(
+                            ctx=ctx,
+                            items=items,
+                            import_type=import_type,
+                            update_existing=update_existing,
+                            import_unknown=import_unknown,
+                            fp=fp,
+                            file_idx=file_idx,
+                            total_files=total_files,
+                            task_context=task_context,
+                        )
+                    )
+                elif import_format == "cockpit":
                     self._process_cockpit_rows(
                         ctx=ctx,
                         rows=rows,
@@ -459,7 +534,17 @@ class CsvImportService:
 
             return error_result
 
-    def _process_single_object(
+    def _process_single_object(self, ctx: ImportContext, **kwargs: Any) -> None:
+        """Create or update one object and record the outcome on *ctx*."""
+        self._record(ctx, asyncio.run(self._apply_object(ctx, **kwargs)))
+
+    @staticmethod
+    def _record(ctx: ImportContext, outcome: tuple[str, dict]) -> None:
+        """Append a ``(bucket, entry)`` outcome to the matching ctx result list."""
+        bucket, entry = outcome
+        getattr(ctx, bucket).append(entry)
+
+    async def _apply_object(
         self,
         ctx: ImportContext,
         nautobot_data: dict[str, Any],
@@ -471,8 +556,12 @@ class CsvImportService:
         idx: int,
         identifier: str,
         iface_config: list[dict] | None = None,
-    ) -> None:
-        """Create or update a single Nautobot object based on whether it already exists."""
+    ) -> tuple[str, dict]:
+        """Create or update a single Nautobot object based on whether it already exists.
+
+        Returns the ``(bucket, entry)`` outcome instead of recording it, so
+        concurrent callers can record outcomes in input order.
+        """
         if import_type == "devices":
             if iface_config is None:
                 nautobot_data, iface_config = self._extract_interface_config(
@@ -492,46 +581,46 @@ class CsvImportService:
                         idx,
                         identifier,
                     )
-                    ctx.skipped.append(
+                    return (
+                        "skipped",
                         {
                             "file": fp,
                             "row": idx,
                             "identifier": identifier,
                             "id": existing_id,
                             "reason": "Already exists",
-                        }
+                        },
                     )
-                    return
 
                 if ctx.dry_run:
                     logger.info("[DRY RUN] Would update device %s", identifier)
-                    ctx.updated.append(
+                    return (
+                        "updated",
                         {
                             "file": fp,
                             "row": idx,
                             "identifier": identifier,
                             "id": existing_id,
                             "dry_run": True,
-                        }
+                        },
                     )
                 else:
-                    asyncio.run(
-                        ctx.device_update_service.update_device(
-                            device_identifier={"id": existing_id},
-                            update_data=nautobot_data,
-                            interfaces=iface_config,
-                            add_prefix=ctx.add_prefixes,
-                        )
+                    await ctx.device_update_service.update_device(
+                        device_identifier={"id": existing_id},
+                        update_data=nautobot_data,
+                        interfaces=iface_config,
+                        add_prefix=ctx.add_prefixes,
                     )
                     logger.info("Updated device %s", identifier)
-                    ctx.updated.append(
+                    return (
+                        "updated",
                         {
                             "file": fp,
                             "row": idx,
                             "identifier": identifier,
                             "id": existing_id,
                             "updated_fields": list(nautobot_data.keys()),
-                        }
+                        },
                     )
             else:
                 if not import_unknown:
@@ -542,28 +631,29 @@ class CsvImportService:
                         idx,
                         identifier,
                     )
-                    ctx.skipped.append(
+                    return (
+                        "skipped",
                         {
                             "file": fp,
                             "row": idx,
                             "identifier": identifier,
                             "reason": "Unknown object (import unknown disabled)",
-                        }
+                        },
                     )
-                    return
 
                 if ctx.dry_run:
                     logger.info("[DRY RUN] Would create device %s", identifier)
-                    ctx.created.append(
+                    return (
+                        "created",
                         {
                             "file": fp,
                             "row": idx,
                             "identifier": identifier,
                             "dry_run": True,
-                        }
+                        },
                     )
                 else:
-                    self._create_device(
+                    return await self._create_device(
                         ctx, nautobot_data, iface_config, fp, idx, identifier
                     )
         else:
@@ -575,44 +665,44 @@ class CsvImportService:
                         idx,
                         identifier,
                     )
-                    ctx.skipped.append(
+                    return (
+                        "skipped",
                         {
                             "file": fp,
                             "row": idx,
                             "identifier": identifier,
                             "id": existing_id,
                             "reason": "Already exists",
-                        }
+                        },
                     )
-                    return
 
                 if ctx.dry_run:
                     logger.info("[DRY RUN] Would update %s %s", import_type, identifier)
-                    ctx.updated.append(
+                    return (
+                        "updated",
                         {
                             "file": fp,
                             "row": idx,
                             "identifier": identifier,
                             "id": existing_id,
                             "dry_run": True,
-                        }
+                        },
                     )
                 else:
                     endpoint = "%s%s/" % (_ENDPOINT_MAP[import_type], existing_id)
-                    asyncio.run(
-                        ctx.nautobot_service.rest_request(
-                            endpoint, method="PATCH", data=nautobot_data
-                        )
+                    await ctx.nautobot_service.rest_request(
+                        endpoint, method="PATCH", data=nautobot_data
                     )
                     logger.info("Updated %s %s", import_type, identifier)
-                    ctx.updated.append(
+                    return (
+                        "updated",
                         {
                             "file": fp,
                             "row": idx,
                             "identifier": identifier,
                             "id": existing_id,
                             "updated_fields": list(nautobot_data.keys()),
-                        }
+                        },
                     )
             else:
                 if not import_unknown:
@@ -623,40 +713,45 @@ class CsvImportService:
                         idx,
                         identifier,
                     )
-                    ctx.skipped.append(
+                    return (
+                        "skipped",
                         {
                             "file": fp,
                             "row": idx,
                             "identifier": identifier,
                             "reason": "Unknown object (import unknown disabled)",
-                        }
+                        },
                     )
-                    return
 
                 if ctx.dry_run:
                     logger.info("[DRY RUN] Would create %s %s", import_type, identifier)
-                    ctx.created.append(
+                    return (
+                        "created",
                         {
                             "file": fp,
                             "row": idx,
                             "identifier": identifier,
                             "dry_run": True,
-                        }
+                        },
                     )
                 else:
-                    result = asyncio.run(
-                        ctx.nautobot_service.rest_request(
-                            _ENDPOINT_MAP[import_type],
-                            method="POST",
-                            data=nautobot_data,
-                        )
+                    result = await ctx.nautobot_service.rest_request(
+                        _ENDPOINT_MAP[import_type],
+                        method="POST",
+                        data=nautobot_data,
                     )
                     new_id = result.get("id") if isinstance(result, dict) else None
                     logger.info(
                         "Created %s %s (id=%s)", import_type, identifier, new_id
                     )
-                    ctx.created.append(
-                        {"file": fp, "row": idx, "identifier": identifier, "id": new_id}
+                    return (
+                        "created",
+                        {
+                            "file": fp,
+                            "row": idx,
+                            "identifier": identifier,
+                            "id": new_id,
+                        },
                     )
 
     def _process_cockpit_rows(
@@ -706,25 +801,9 @@ class CsvImportService:
                 )
 
                 first_row = device_rows[0]
-                csv_data = self._apply_column_mapping(first_row, col_map)
-                device_data_merged = self._merge_defaults(csv_data, defaults)
-
-                device_only_data, _ = self._extract_interface_config(device_data_merged)
-
-                iface_list: list[dict[str, Any]] = []
-                for row in device_rows:
-                    row_data = self._merge_defaults(
-                        self._apply_column_mapping(row, col_map), defaults
-                    )
-                    _, iface = self._extract_interface_config(row_data)
-                    if iface:
-                        iface_entry = iface[0].copy()
-                        set_primary = row.get("set_primary_ipv4", "").strip().lower()
-                        if "ip_address" in iface_entry:
-                            iface_entry["is_primary_ipv4"] = set_primary == "true"
-                        iface_list.append(iface_entry)
-
-                iface_config = iface_list if iface_list else None
+                device_only_data, iface_config = self._build_cockpit_device(
+                    device_rows, col_map, defaults
+                )
 
                 existing_id = asyncio.run(
                     self._lookup_object(
@@ -769,6 +848,220 @@ class CsvImportService:
                     }
                 )
 
+    def _build_cockpit_device(
+        self,
+        device_rows: list[dict[str, str]],
+        col_map: dict[str, str | None],
+        defaults: dict[str, str] | None,
+    ) -> tuple[dict[str, Any], list[dict[str, Any]] | None]:
+        """Merge a device's Cockpit-format rows into device data and interfaces."""
+        csv_data = self._apply_column_mapping(device_rows[0], col_map)
+        device_data_merged = self._merge_defaults(csv_data, defaults)
+
+        device_only_data, _ = self._extract_interface_config(device_data_merged)
+
+        iface_list: list[dict[str, Any]] = []
+        for row in device_rows:
+            row_data = self._merge_defaults(
+                self._apply_column_mapping(row, col_map), defaults
+            )
+            _, iface = self._extract_interface_config(row_data)
+            if iface:
+                iface_entry = iface[0].copy()
+                set_primary = row.get("set_primary_ipv4", "").strip().lower()
+                if "ip_address" in iface_entry:
+                    iface_entry["is_primary_ipv4"] = set_primary == "true"
+                iface_list.append(iface_entry)
+
+        return device_only_data, iface_list if iface_list else None
+
+    def _generic_items(
+        self,
+        rows: list[dict[str, str]],
+        pk_csv_col: str,
+        col_map: dict[str, str | None],
+        defaults: dict[str, str] | None,
+        import_type: str,
+        import_format: str,
+        fp: str,
+    ) -> list[_ImportItem]:
+        """Prepare one pipeline item per row of a generic/Nautobot-format file."""
+        items: list[_ImportItem] = []
+        for idx, raw_row in enumerate(rows, 1):
+            if import_format == "nautobot":
+                raw_row = self._filter_nautobot_nulls(raw_row)
+
+            pk_value = raw_row.get(pk_csv_col, "").strip()
+            item = _ImportItem(idx=idx, identifier=pk_value or "row-%s" % idx)
+            items.append(item)
+
+            if not pk_value:
+                logger.warning(
+                    "File %s row %s: empty primary key value, skipping", fp, idx
+                )
+                item.outcome = (
+                    "skipped",
+                    {"file": fp, "row": idx, "reason": "Empty primary key value"},
+                )
+                continue
+
+            try:
+                csv_data = self._apply_column_mapping(raw_row, col_map)
+                item.nautobot_data = self._merge_defaults(csv_data, defaults)
+                item.lookup_key = self._lookup_key(
+                    import_type, pk_value, raw_row, col_map
+                )
+            except Exception as e:
+                item.outcome = self._failure_outcome(fp, idx, item.identifier, e)
+        return items
+
+    def _cockpit_items(
+        self,
+        rows: list[dict[str, str]],
+        pk_csv_col: str,
+        col_map: dict[str, str | None],
+        defaults: dict[str, str] | None,
+        import_type: str,
+        fp: str,
+    ) -> list[_ImportItem]:
+        """Prepare one pipeline item per device of a Cockpit-format file."""
+        groups: dict[str, list[dict[str, str]]] = {}
+        for row in rows:
+            pk_val = row.get(pk_csv_col, "").strip()
+            if pk_val:
+                groups.setdefault(pk_val, []).append(row)
+
+        items: list[_ImportItem] = []
+        for dev_idx, (pk_value, device_rows) in enumerate(groups.items(), 1):
+            item = _ImportItem(idx=dev_idx, identifier=pk_value)
+            items.append(item)
+            try:
+                item.nautobot_data, item.iface_config = self._build_cockpit_device(
+                    device_rows, col_map, defaults
+                )
+                item.lookup_key = self._lookup_key(
+                    import_type, pk_value, device_rows[0], col_map
+                )
+            except Exception as e:
+                item.outcome = self._failure_outcome(fp, dev_idx, pk_value, e)
+        return items
+
+    async def _run_pipeline(
+        self,
+        ctx: ImportContext,
+        items: list[_ImportItem],
+        import_type: str,
+        update_existing: bool,
+        import_unknown: bool,
+        fp: str,
+        file_idx: int,
+        total_files: int,
+        task_context,
+    ) -> None:
+        """Resolve all primary keys in bulk, then apply objects in concurrent batches.
+
+        Outcomes are recorded on *ctx* batch by batch in input order. An object
+        whose primary key repeats one still pending in the current batch
+        starts a new batch, so it sees the ID created for the earlier row just
+        like the row-by-row path does.
+        """
+        if import_type == "devices" and not ctx.dry_run:
+            # Device creation resolves status/role/platform/type names per row
+            try:
+                await warm_up_taxonomies(ctx.nautobot_service)
+            except Exception as e:
+                logger.warning("Could not warm the resolution cache: %s", e)
+
+        existing_ids = await self._resolve_existing_ids(
+            ctx.nautobot_service,
+            import_type,
+            [item.lookup_key for item in items if item.outcome is None],
+        )
+
+        async def apply(item: _ImportItem) -> tuple[str, dict]:
+            try:
+                return await self._apply_object(
+                    ctx,
+                    nautobot_data=item.nautobot_data,
+                    existing_id=existing_ids.get(item.lookup_key),
+                    import_type=import_type,
+                    update_existing=update_existing,
+                    import_unknown=import_unknown,
+                    fp=fp,
+                    idx=item.idx,
+                    identifier=item.identifier,
+                    iface_config=item.iface_config,
+                )
+            except Exception as e:
+                return self._failure_outcome(fp, item.idx, item.identifier, e)
+
+        total_items = len(items)
+        start = 0
+        while start < total_items:
+            batch = self._next_batch(items, start)
+            pending = [item for item in batch if item.outcome is None]
+            outcomes = await asyncio.gather(*(apply(item) for item in pending))
+            for item, (bucket, entry) in zip(pending, outcomes):
+                item.outcome = (bucket, entry)
+                if bucket == "created" and entry.get("id"):
+                    existing_ids[item.lookup_key] = entry["id"]
+            for item in batch:
+                self._record(ctx, item.outcome)
+            start += len(batch)
+
+            progress = int((file_idx - 1) / total_files * 90) + int(
+                (start / total_items) * (90 / total_files)
+            )
+            task_context.update_state(
+                state="PROGRESS",
+                meta={
+                    "current": progress,
+                    "total": 100,
+                    "status": "File %s/%s: %s/%s objects processed"
+                    % (file_idx, total_files, start, total_items),
+                    "created": len(ctx.created),
+                    "updated": len(ctx.updated),
+                    "skipped": len(ctx.skipped),
+                    "failures": len(ctx.failures),
+                },
+            )
+
+    @staticmethod
+    def _next_batch(items: list[_ImportItem], start: int) -> list[_ImportItem]:
+        """Return the next apply batch starting at *start*.
+
+        The batch ends after ``_APPLY_BATCH_SIZE`` items or before a pending
+        item whose lookup key is already pending in the batch.
+        """
+        keys: set[tuple[str, str] | None] = set()
+        end = start
+        while end < len(items) and end - start < _APPLY_BATCH_SIZE:
+            item = items[end]
+            if item.outcome is None:
+                if item.lookup_key in keys:
+                    break
+                keys.add(item.lookup_key)
+            end += 1
+        return items[start:end]
+
+    @staticmethod
+    def _failure_outcome(
+        fp: str, idx: int, identifier: str, error: Exception
+    ) -> tuple[str, dict]:
+        """Log a failed row and return its ``failures`` outcome."""
+        logger.error(
+            "File %s row %s (%s) failed: %s",
+            fp,
+            idx,
+            identifier,
+            error,
+            exc_info=error,
+        )
+        return (
+            "failures",
+            {"file": fp, "row": idx, "identifier": identifier, "error": str(error)},
+        )
+
     @staticmethod
     def _extract_interface_config(
         nautobot_data: dict[str, Any],
@@ -1041,7 +1334,7 @@ class CsvImportService:
                 merged[key] = value
         return merged
 
-    def _create_device(
+    async def _create_device(
         self,
         ctx: ImportContext,
         nautobot_data: dict[str, Any],
@@ -1049,7 +1342,7 @@ class CsvImportService:
         fp: str,
         idx: int,
         identifier: str,
-    ) -> None:
+    ) -> tuple[str, dict]:
         """Create a device via DeviceCreationService — the same code path as the
         Add Device form and the CSV Updates tool's "Add Missing Devices"."""
         missing = [f for f in _DEVICE_REQUIRED_FIELDS if not nautobot_data.get(f)]
@@ -1061,36 +1354,37 @@ class CsvImportService:
                 identifier,
                 missing,
             )
-            ctx.skipped.append(
+            return (
+                "skipped",
                 {
                     "file": fp,
                     "row": idx,
                     "identifier": identifier,
                     "reason": "Missing required field(s) for creation: %s"
                     % ", ".join(missing),
-                }
+                },
             )
-            return
 
         request = self._build_add_device_request(ctx, nautobot_data, iface_config)
-        result = asyncio.run(
-            ctx.device_creation_service.create_device_with_interfaces(request)
+        result = await ctx.device_creation_service.create_device_with_interfaces(
+            request
         )
         if not result.get("success"):
-            ctx.failures.append(
+            return (
+                "failures",
                 {
                     "file": fp,
                     "row": idx,
                     "identifier": identifier,
                     "error": result.get("error") or "Device creation failed",
-                }
+                },
             )
-            return
 
         new_id = result.get("device_id")
         logger.info("Created device %s (id=%s)", identifier, new_id)
-        ctx.created.append(
-            {"file": fp, "row": idx, "identifier": identifier, "id": new_id}
+        return (
+            "created",
+            {"file": fp, "row": idx, "identifier": identifier, "id": new_id},
         )
 
     @staticmethod
@@ -1179,12 +1473,7 @@ class CsvImportService:
                 return None
 
             elif import_type == "ip-prefixes":
-                namespace_col = col_map.get("namespace", "namespace") or "namespace"
-                for csv_col, nb_field in col_map.items():
-                    if nb_field == "namespace":
-                        namespace_col = csv_col
-                        break
-                namespace_value = row.get(namespace_col, "Global").strip() or "Global"
+                namespace_value = self._namespace_value(row, col_map)
 
                 result = await nautobot_service.graphql_query(
                     _GRAPHQL_QUERY_PREFIXES,
@@ -1207,3 +1496,120 @@ class CsvImportService:
         except Exception as e:
             logger.warning("Lookup failed for %s '%s': %s", import_type, pk_value, e)
             return None
+
+    @staticmethod
+    def _namespace_value(row: dict[str, str], col_map: dict[str, str | None]) -> str:
+        """Return the row's namespace (via column_mapping), defaulting to Global."""
+        namespace_col = col_map.get("namespace", "namespace") or "namespace"
+        for csv_col, nb_field in col_map.items():
+            if nb_field == "namespace":
+                namespace_col = csv_col
+                break
+        return row.get(namespace_col, "Global").strip() or "Global"
+
+    @staticmethod
+    def _normalize_lookup_value(import_type: str, value: str) -> str:
+        """Canonicalize a primary key value so CSV and Nautobot spellings match."""
+        if import_type == "devices":
+            return value
+        try:
+            if import_type == "ip-prefixes":
+                return str(ipaddress.ip_network(value, strict=False))
+            if "/" in value:
+                return str(ipaddress.ip_interface(value))
+            return str(ipaddress.ip_address(value))
+        except ValueError:
+            return value
+
+    def _lookup_key(
+        self,
+        import_type: str,
+        pk_value: str,
+        row: dict[str, str],
+        col_map: dict[str, str | None],
+    ) -> tuple[str, str]:
+        """Return the ``(value, namespace)`` key used by pipelined lookups."""
+        namespace = (
+            self._namespace_value(row, col_map) if import_type == "ip-prefixes" else ""
+        )
+        return self._normalize_lookup_value(import_type, pk_value), namespace
+
+    async def _resolve_existing_ids(
+        self,
+        nautobot_service: NautobotService,
+        import_type: str,
+        keys: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], str]:
+        """Look up existing objects for many lookup keys with chunked GraphQL queries.
+
+        Uses the same queries as :meth:`_lookup_object` with up to
+        ``_LOOKUP_CHUNK_SIZE`` values per query. Keys that are not found, or
+        whose lookup failed, are left out, so those objects are treated as
+        new exactly as in the row-by-row path.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        by_namespace: dict[str, list[str]] = {}
+        for value, namespace in unique_keys:
+            by_namespace.setdefault(namespace, []).append(value)
+
+        semaphore = asyncio.Semaphore(_LOOKUP_CONCURRENCY)
+
+        async def lookup(values: list[str], namespace: str) -> dict:
+            try:
+                async with semaphore:
+                    if import_type == "devices":
+                        result = await nautobot_service.graphql_query(
+                            _GRAPHQL_QUERY_DEVICES, {"name": values}
+                        )
+                    elif import_type == "ip-prefixes":
+                        result = await nautobot_service.graphql_query(
+                            _GRAPHQL_QUERY_PREFIXES,
+                            {"prefix": values, "namespace": [namespace]},
+                        )
+                    else:
+                        result = await nautobot_service.graphql_query(
+                            _GRAPHQL_QUERY_IP_ADDRESSES, {"address": values}
+                        )
+                if "errors" in result:
+                    raise RuntimeError("GraphQL errors: %s" % result["errors"])
+                collection = _LOOKUP_COLLECTIONS[import_type]
+                records = (result.get("data") or {}).get(collection) or []
+            except Exception as e:
+                logger.warning(
+                    "Bulk lookup of %s %s failed: %s", len(values), import_type, e
+                )
+                return {}
+
+            found: dict[tuple[str, str], str] = {}
+            for record in records:
+                if import_type == "devices":
+                    record_values = [record["name"]]
+                elif import_type == "ip-prefixes":
+                    record_values = [record["prefix"]]
+                else:
+                    # An address without a mask matches any mask on that host.
+                    record_values = [record["address"], record["address"].split("/")[0]]
+                for record_value in record_values:
+                    key = (
+                        self._normalize_lookup_value(import_type, record_value),
+                        namespace,
+                    )
+                    found.setdefault(key, record["id"])
+            return found
+
+        lookups = [
+            lookup(values[i : i + _LOOKUP_CHUNK_SIZE], namespace)
+            for namespace, values in by_namespace.items()
+            for i in range(0, len(values), _LOOKUP_CHUNK_SIZE)
+        ]
+        existing_ids: dict[tuple[str, str], str] = {}
+        for found in await asyncio.gather(*lookups):
+            existing_ids.update(found)
+        logger.info(
+            "Resolved %s of %s %s primary key(s) with %s bulk lookup(s)",
+            sum(key in existing_ids for key in unique_keys),
+            len(unique_keys),
+            import_type,
+            len(lookups),
+        )
+        return existing_ids
@@ -7,12 +7,16 @@ import csv
 import io
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import service_factory
+from services.nautobot.common.utils import merge_update_data
 
 logger = logging.getLogger(__name__)
 
+# Prefixes whose notes are added at the same time
+NOTE_CONCURRENCY = 4
+
 
 class PrefixUpdateService:
     """Parses CSV content and applies updates to Nautobot IP prefixes."""
@@ -146,6 +150,7 @@ class PrefixUpdateService:
             successes = []
             failures = []
             skipped = []
+            pending = []
 
             for idx, row in enumerate(rows, 1):
                 prefix_value = row.get(prefix_col, "").strip()
@@ -379,88 +384,18 @@ class PrefixUpdateService:
                             }
                         )
                     else:
-                        updated_fields: list = []
-
-                        if update_data:
-                            logger.info("Updating prefix %s", identifier)
-                            logger.info("  - Sending to Nautobot API:")
-                            logger.info("    Endpoint: ipam/prefixes/%s/", prefix_uuid)
-                            logger.info("    Method: PATCH")
-                            logger.info("    Payload: %s", update_data)
-
-                            result = self._update_prefix(
-                                nautobot_client, prefix_uuid, update_data
-                            )
-
-                            if not result["success"]:
-                                failures.append(
-                                    {
-                                        "row": idx,
-                                        "prefix": prefix_value,
-                                        "namespace": namespace_value,
-                                        "uuid": prefix_uuid,
-                                        "error": result["error"],
-                                    }
-                                )
-                                logger.error(
-                                    "Failed to update prefix: %s", result["error"]
-                                )
-                                continue
-
-                            updated_fields.extend(update_data.keys())
-
-                        warnings: list = []
-
-                        if note_text:
-                            note_result = self._add_prefix_note(
-                                nautobot_client, prefix_uuid, note_text
-                            )
-                            if note_result["success"]:
-                                if note_result["created"]:
-                                    updated_fields.append("notes")
-                                else:
-                                    warnings.append(
-                                        "Note not created: an identical note already exists"
-                                    )
-                            else:
-                                if not update_data:
-                                    # Notes was the only mapped field for this
-                                    # row — nothing succeeded, so this is a
-                                    # failure, not a partial success.
-                                    failures.append(
-                                        {
-                                            "row": idx,
-                                            "prefix": prefix_value,
-                                            "namespace": namespace_value,
-                                            "uuid": prefix_uuid,
-                                            "error": "Note creation failed: %s"
-                                            % note_result["error"],
-                                        }
-                                    )
-                                    logger.error(
-                                        "Failed to create note for prefix %s: %s",
-                                        identifier,
-                                        note_result["error"],
-                                    )
-                                    continue
-                                warnings.append(
-                                    "Note creation failed: %s" % note_result["error"]
-                                )
-
-                        success_entry = {
-                            "row": idx,
-                            "prefix": prefix_value,
-                            "namespace": namespace_value,
-                            "uuid": prefix_uuid,
-                            "updated_fields": updated_fields,
-                        }
-                        if warnings:
-                            success_entry["warnings"] = warnings
-                        successes.append(success_entry)
-                        logger.info(
-                            "✓ Successfully updated prefix %s: %s fields",
-                            identifier,
-                            len(updated_fields),
+                        # Writes are deferred so all PATCHes go out as bulk
+                        # requests
+                        pending.append(
+                            {
+                                "row": idx,
+                                "prefix": prefix_value,
+                                "namespace": namespace_value,
+                                "uuid": prefix_uuid,
+                                "identifier": identifier,
+                                "update_data": update_data,
+                                "note_text": note_text,
+                            }
                         )
 
                 except Exception as e:
@@ -480,6 +415,28 @@ class PrefixUpdateService:
                         }
                     )
 
+            if pending:
+                logger.info("Applying %s prefix updates in bulk", len(pending))
+
+                def report(current: int, status: str) -> None:
+                    task_context.update_state(
+                        state="PROGRESS",
+                        meta={
+                            "current": current,
+                            "total": 100,
+                            "status": status,
+                            "successes": len(successes),
+                            "failures": len(failures),
+                            "skipped": len(skipped),
+                        },
+                    )
+
+                self._apply_pending_updates(
+                    nautobot_client, pending, successes, failures, report
+                )
+                successes.sort(key=lambda entry: entry["row"])
+                failures.sort(key=lambda entry: entry["row"])
+
             logger.info("-" * 80)
             logger.info("STEP 5: PREPARING RESULTS")
             logger.info("-" * 80)
@@ -633,39 +590,170 @@ class PrefixUpdateService:
             logger.error("Error finding prefix via GraphQL: %s", e, exc_info=True)
             return None, None
 
-    def _update_prefix(
+    async def _update_prefixes(
         self,
         nautobot_client,
-        prefix_uuid: str,
-        update_data: Dict[str, Any],
-    ) -> Dict[str, Any]:
-        """PATCH the prefix; return dict with 'success' and optional 'error'."""
+        updates: Dict[str, Dict[str, Any]],
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, str]:
+        """Bulk-PATCH prefixes keyed by UUID; return error messages keyed by UUID."""
+        logger.info("[API CALL] Bulk updating %s prefixes via REST API", len(updates))
         try:
-            endpoint = "ipam/prefixes/%s/" % prefix_uuid
-
-            logger.info("[API CALL] Updating prefix via REST API")
-            logger.info("[API CALL]   - Endpoint: %s", endpoint)
-            logger.info("[API CALL]   - Method: PATCH")
-            logger.info("[API CALL]   - Data: %s", update_data)
+            errors = await nautobot_client.bulk_update(
+                "ipam/prefixes/",
+                [{"id": uuid, **data} for uuid, data in updates.items()],
+                on_progress=on_progress,
+            )
+        except Exception as e:
+            errors = {uuid: str(e) for uuid in updates}
 
-            asyncio.run(
-                nautobot_client.rest_request(endpoint, method="PATCH", data=update_data)
+        for uuid, error_msg in errors.items():
+            logger.error("[API CALL] ✗ Failed to update prefix %s: %s", uuid, error_msg)
+            logger.error(
+                "[API CALL]   - Update data that caused error: %s", updates[uuid]
             )
+        return errors
 
-            logger.info("[API CALL] ✓ Update successful for prefix %s", prefix_uuid)
-            return {"success": True}
+    async def _send_pending_updates(
+        self,
+        nautobot_client,
+        pending: list,
+        report: Callable[[int, str], None],
+    ) -> Tuple[Dict[str, str], Dict[int, Dict[str, Any]]]:
+        """PATCH the deferred field updates in bulk, then add the notes.
 
-        except Exception as e:
-            error_msg = str(e)
-            logger.error(
-                "[API CALL] ✗ Failed to update prefix %s: %s", prefix_uuid, error_msg
+        Notes of different prefixes are added concurrently; the notes of one
+        prefix are added in row order, so a repeated note is still recognised
+        as a duplicate. Rows whose PATCH failed get no note. Rows targeting
+        the same prefix are merged into one update (later rows win per field
+        and custom field).
+
+        Returns:
+            (PATCH error messages keyed by UUID, note results keyed by the
+            row's index in *pending*)
+        """
+        updates: Dict[str, Dict[str, Any]] = {}
+        for entry in pending:
+            if entry["update_data"]:
+                merge_update_data(
+                    updates.setdefault(entry["uuid"], {}), entry["update_data"]
+                )
+
+        errors: Dict[str, str] = {}
+        if updates:
+
+            def patch_progress(done: int, total: int) -> None:
+                report(
+                    90 + 3 * done // total,
+                    "Updated %s/%s prefixes in Nautobot" % (done, total),
+                )
+
+            patch_progress(0, len(updates))
+            errors = await self._update_prefixes(
+                nautobot_client, updates, patch_progress
             )
-            logger.error(
-                "[API CALL]   - Update data that caused error: %s", update_data
+
+        notes_by_uuid: Dict[str, list] = {}
+        for index, entry in enumerate(pending):
+            if entry["note_text"] and not (
+                entry["update_data"] and entry["uuid"] in errors
+            ):
+                notes_by_uuid.setdefault(entry["uuid"], []).append(index)
+        total_notes = sum(len(indexes) for indexes in notes_by_uuid.values())
+        note_results: Dict[int, Dict[str, Any]] = {}
+        semaphore = asyncio.Semaphore(NOTE_CONCURRENCY)
+
+        async def add_notes(indexes: list) -> None:
+            async with semaphore:
+                for index in indexes:
+                    entry = pending[index]
+                    note_results[index] = await self._add_prefix_note(
+                        nautobot_client, entry["uuid"], entry["note_text"]
+                    )
+                    report(
+                        93 + 2 * len(note_results) // total_notes,
+                        "Added %s/%s notes" % (len(note_results), total_notes),
+                    )
+
+        await asyncio.gather(
+            *(add_notes(indexes) for indexes in notes_by_uuid.values())
+        )
+        return errors, note_results
+
+    def _apply_pending_updates(
+        self,
+        nautobot_client,
+        pending: list,
+        successes: list,
+        failures: list,
+        report: Callable[[int, str], None],
+    ) -> None:
+        """Send the deferred field updates in bulk, then add notes.
+
+        Rows whose PATCH failed are recorded as failures and get no note,
+        exactly as if they had been updated one at a time. *report* receives
+        the progress (90-95) and a status line while requests are sent.
+        """
+        errors, note_results = asyncio.run(
+            self._send_pending_updates(nautobot_client, pending, report)
+        )
+
+        for index, entry in enumerate(pending):
+            base = {
+                "row": entry["row"],
+                "prefix": entry["prefix"],
+                "namespace": entry["namespace"],
+                "uuid": entry["uuid"],
+            }
+            update_data = entry["update_data"]
+
+            if update_data and entry["uuid"] in errors:
+                failures.append({**base, "error": errors[entry["uuid"]]})
+                continue
+
+            updated_fields: list = list(update_data.keys())
+            warnings: list = []
+
+            note_result = note_results.get(index)
+            if note_result is not None:
+                if note_result["success"]:
+                    if note_result["created"]:
+                        updated_fields.append("notes")
+                    else:
+                        warnings.append(
+                            "Note not created: an identical note already exists"
+                        )
+                else:
+                    if not update_data:
+                        # Notes was the only mapped field for this row —
+                        # nothing succeeded, so this is a failure, not a
+                        # partial success.
+                        failures.append(
+                            {
+                                **base,
+                                "error": "Note creation failed: %s"
+                                % note_result["error"],
+                            }
+                        )
+                        logger.error(
+                            "Failed to create note for prefix %s: %s",
+                            entry["identifier"],
+                            note_result["error"],
+                        )
+                        continue
+                    warnings.append("Note creation failed: %s" % note_result["error"])
+
+            success_entry = {**base, "updated_fields": updated_fields}
+            if warnings:
+                success_entry["warnings"] = warnings
+            successes.append(success_entry)
+            logger.info(
+                "✓ Successfully updated prefix %s: %s fields",
+                entry["identifier"],
+                len(updated_fields),
             )
-            return {"success": False, "error": error_msg}
 
-    def _add_prefix_note(
+    async def _add_prefix_note(
         self, nautobot_client, prefix_uuid: str, note_text: str
     ) -> Dict[str, Any]:
         """
@@ -682,7 +770,7 @@ class PrefixUpdateService:
         """
         endpoint = "ipam/prefixes/%s/notes/?format=json" % prefix_uuid
         try:
-            existing = asyncio.run(nautobot_client.rest_request(endpoint, method="GET"))
+            existing = await nautobot_client.rest_request(endpoint, method="GET")
             if existing and existing.get("count", 0) > 0:
                 most_recent_text = existing["results"][0].get("note", "")
                 if most_recent_text == note_text:
@@ -692,10 +780,8 @@ class PrefixUpdateService:
                     )
                     return {"success": True, "created": False}
 
-            asyncio.run(
-                nautobot_client.rest_request(
-                    endpoint, method="POST", data={"note": note_text}
-                )
+            await nautobot_client.rest_request(
+                endpoint, method="POST", data={"note": note_text}
             )
             return {"success": True, "created": True}
 
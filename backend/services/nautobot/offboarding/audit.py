@@ -6,7 +6,7 @@ import logging
 from typing import Any, Dict
 
 from models.nautobot import OffboardDeviceRequest
-from repositories.audit_log.audit_log_repository import audit_log_repo
+from repositories.audit_log.audit_log_writer import audit_log_writer
 from services.nautobot.offboarding.types import OffboardingResult
 
 logger = logging.getLogger(__name__)
@@ -58,7 +58,7 @@ def log_offboarding_event(
     # Log with appropriate severity based on success
     severity = "info" if results["success"] else "warning"
 
-    audit_log_repo.create_log(
+    audit_log_writer.write(
         username=username,
         user_id=user_id,
         event_type="offboard-device",
@@ -70,4 +70,4 @@ def log_offboarding_event(
         extra_data=extra_data,
     )
 
-    logger.debug("Audit log entry created for device %s", results["device_id"])
+    logger.debug("Audit log entry queued for device %s", results["device_id"])
@@ -10,6 +10,7 @@ from fastapi import HTTPException
 from services.nautobot.common.exceptions import translate_http_exception
 from services.nautobot.offboarding.types import DEVICE_CACHE_TTL, OffboardingResult
 from services.nautobot_helpers import (
+    CacheAside,
     get_device_cache_key,
     get_device_details_cache_key,
     get_device_list_cache_key,
@@ -26,6 +27,8 @@ class DeviceCleanupManager:
 
         self._nb = service_factory.build_nautobot_service()
         self._cache = cache_service
+        # Device details and lists are written through CacheAside
+        self._cache_aside = CacheAside(cache_service, DEVICE_CACHE_TTL)
 
     async def delete_device(self, device_id: str) -> Dict[str, Any]:
         """Delete a device from Nautobot."""
@@ -86,13 +89,15 @@ class DeviceCleanupManager:
     def _invalidate_device_cache(self, device_id: str) -> None:
         """Delete all cached entries for a device."""
         self._cache.delete(get_device_cache_key(device_id))
-        self._cache.delete(get_device_details_cache_key(device_id))
-        self._cache.delete(get_device_list_cache_key())
+        self._cache_aside.invalidate(get_device_details_cache_key(device_id))
+        self._cache_aside.invalidate(get_device_list_cache_key())
 
     def _update_device_cache(self, device_id: str, device_data: Dict[str, Any]) -> None:
-        """Set device cache entries and invalidate list cache."""
+        """Set the device cache entry and invalidate details and list caches.
+
+        The PATCH response is a REST object, not the GraphQL shape cached as
+        device details, so the details are rebuilt on the next read.
+        """
         self._cache.set(get_device_cache_key(device_id), device_data, DEVICE_CACHE_TTL)
-        self._cache.set(
-            get_device_details_cache_key(device_id), device_data, DEVICE_CACHE_TTL
-        )
-        self._cache.delete(get_device_list_cache_key())
+        self._cache_aside.invalidate(get_device_details_cache_key(device_id))
+        self._cache_aside.invalidate(get_device_list_cache_key())
@@ -9,8 +9,9 @@ from fastapi import HTTPException
 
 from models.nautobot import OffboardDeviceRequest
 from services.nautobot.common.exceptions import translate_http_exception
-from services.nautobot.offboarding.types import OffboardingResult
+from services.nautobot.offboarding.types import DEVICE_CACHE_TTL, OffboardingResult
 from services.nautobot_helpers import (
+    CacheAside,
     get_device_cache_key,
     get_device_details_cache_key,
     get_device_list_cache_key,
@@ -28,6 +29,8 @@ class IPCleanupManager:
 
         self._nb = service_factory.build_nautobot_service()
         self._cache = cache_service
+        # Device details and lists are written through CacheAside
+        self._cache_aside = CacheAside(cache_service, DEVICE_CACHE_TTL)
 
     async def remove_interface_ips(
         self,
@@ -159,6 +162,6 @@ class IPCleanupManager:
 
         self._cache.delete(get_ip_address_cache_key(ip_id))
         self._cache.delete(get_device_cache_key(device_id))
-        self._cache.delete(get_device_details_cache_key(device_id))
-        self._cache.delete(get_device_list_cache_key())
+        self._cache_aside.invalidate(get_device_details_cache_key(device_id))
+        self._cache_aside.invalidate(get_device_list_cache_key())
         return result
@@ -7,6 +7,8 @@ This provides shared functionality for all resolver classes.
 import logging
 from typing import Any, Optional
 
+from .resolution_cache import resolution_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +36,9 @@ class BaseResolver:
         """
         Generic field-based resolution using GraphQL.
 
+        Answers (including "not found") are served from the shared
+        resolution cache; failed lookups are not cached.
+
         Args:
             resource_type: GraphQL resource type (e.g., "devices", "platforms")
             field_name: Field name to filter by (e.g., "name", "address")
@@ -47,11 +52,12 @@ class BaseResolver:
             >>> await resolver._resolve_by_field("platforms", "name", "ios", "id")
             '550e8400-e29b-41d4-a716-446655440000'
         """
-        try:
-            logger.debug(
-                "Resolving %s by %s='%s'", resource_type, field_name, field_value
-            )
+        values = [field_value] if isinstance(field_value, str) else field_value
+        cache_field = (
+            field_name if return_field == "id" else f"{field_name}->{return_field}"
+        )
 
+        async def lookup() -> Optional[str]:
             # Build GraphQL query dynamically
             query = f"""
             query GetResource($value: [String]) {{
@@ -60,21 +66,25 @@ class BaseResolver:
               }}
             }}
             """
-            variables = {
-                "value": [field_value] if isinstance(field_value, str) else field_value
-            }
-
-            result = await self.nautobot.graphql_query(query, variables)
+            result = await self.nautobot.graphql_query(query, {"value": values})
 
             if "errors" in result:
-                logger.error(
-                    "GraphQL error resolving %s: %s", resource_type, result["errors"]
-                )
-                return None
+                raise ValueError(f"GraphQL errors: {result['errors']}")
 
             resources = result.get("data", {}).get(resource_type, [])
             if resources and len(resources) > 0:
-                resolved_value = resources[0].get(return_field)
+                return resources[0].get(return_field)
+            return None
+
+        try:
+            logger.debug(
+                "Resolving %s by %s='%s'", resource_type, field_name, field_value
+            )
+            resolved_value = await resolution_cache.resolve(
+                resource_type, cache_field, ",".join(values), lookup
+            )
+
+            if resolved_value is not None:
                 logger.debug(
                     "Resolved %s '%s' -> %s", resource_type, field_value, resolved_value
                 )
@@ -7,6 +7,7 @@ from typing import Optional, Tuple
 
 from ..common.validators import is_valid_uuid
 from .base_resolver import BaseResolver
+from .resolution_cache import device_type_field, resolution_cache
 
 logger = logging.getLogger(__name__)
 
@@ -364,24 +365,21 @@ class DeviceResolver(BaseResolver):
                 """
                 variables = {"model": [model]}
 
-            result = await self.nautobot.graphql_query(query, variables)
-
-            if "errors" in result:
-                logger.error(
-                    "GraphQL error resolving device type: %s", result["errors"]
-                )
-                return None
+            async def lookup() -> Optional[str]:
+                result = await self.nautobot.graphql_query(query, variables)
+                if "errors" in result:
+                    raise ValueError(
+                        f"GraphQL error resolving device type: {result['errors']}"
+                    )
+                device_types = result.get("data", {}).get("device_types", [])
+                return device_types[0]["id"] if device_types else None
 
-            device_types = result.get("data", {}).get("device_types", [])
-            if device_types and len(device_types) > 0:
-                device_type = device_types[0]
-                device_type_id = device_type["id"]
-                mfr_name = device_type.get("manufacturer", {}).get("name", "unknown")
+            device_type_id = await resolution_cache.resolve(
+                "device_types", device_type_field(manufacturer), model, lookup
+            )
+            if device_type_id:
                 logger.info(
-                    "Resolved device type '%s' (%s) to UUID %s",
-                    model,
-                    mfr_name,
-                    device_type_id,
+                    "Resolved device type '%s' to UUID %s", model, device_type_id
                 )
                 return device_type_id
 
@@ -7,6 +7,7 @@ from typing import Optional
 
 from ..common.validators import is_valid_uuid
 from .base_resolver import BaseResolver
+from .resolution_cache import resolution_cache, status_field
 
 logger = logging.getLogger(__name__)
 
@@ -42,17 +43,25 @@ class MetadataResolver(BaseResolver):
             "Resolving status '%s' for content type '%s'", status_name, content_type
         )
 
-        # Query for statuses filtered by content type
-        endpoint = f"extras/statuses/?content_types={content_type}&format=json"
-        result = await self.nautobot.rest_request(endpoint=endpoint, method="GET")
+        field = status_field(content_type)
+        hit, status_id = resolution_cache.get("statuses", field, status_name.lower())
+        if not hit:
+            # Query for statuses filtered by content type; every status returned
+            # is cached, so later names of this content type are free
+            endpoint = f"extras/statuses/?content_types={content_type}&format=json"
+            result = await self.nautobot.rest_request(endpoint=endpoint, method="GET")
+
+            resolved = {}
+            if result and result.get("count", 0) > 0:
+                for status in result.get("results", []):
+                    resolved.setdefault(status.get("name", "").lower(), status["id"])
+            status_id = resolved.get(status_name.lower())
+            resolved.setdefault(status_name.lower(), None)
+            resolution_cache.set_many("statuses", field, resolved)
 
-        if result and result.get("count", 0) > 0:
-            for status in result.get("results", []):
-                if status.get("name", "").lower() == status_name.lower():
-                    logger.info(
-                        "Resolved status '%s' to UUID %s", status_name, status["id"]
-                    )
-                    return status["id"]
+        if status_id:
+            logger.info("Resolved status '%s' to UUID %s", status_name, status_id)
+            return status_id
 
         raise ValueError(
             f"Status '{status_name}' not found for content type '{content_type}'"
@@ -68,36 +77,15 @@ class MetadataResolver(BaseResolver):
         Returns:
             Role UUID if found, None otherwise
         """
-        try:
-            logger.info("Resolving role '%s'", role_name)
-
-            query = """
-            query GetRole($name: [String]) {
-              roles(name: $name) {
-                id
-                name
-              }
-            }
-            """
-            variables = {"name": [role_name]}
-            result = await self.nautobot.graphql_query(query, variables)
-
-            if "errors" in result:
-                logger.error("GraphQL error resolving role: %s", result["errors"])
-                return None
-
-            roles = result.get("data", {}).get("roles", [])
-            if roles and len(roles) > 0:
-                role_id = roles[0]["id"]
-                logger.info("Resolved role '%s' to UUID %s", role_name, role_id)
-                return role_id
-
-            logger.warning("Role not found: %s", role_name)
-            return None
-
-        except Exception as e:
-            logger.error("Error resolving role: %s", e, exc_info=True)
-            return None
+        query = """
+        query GetRole($name: [String]) {
+          roles(name: $name) {
+            id
+            name
+          }
+        }
+        """
+        return await self._resolve_name("roles", "role", role_name, query)
 
     async def resolve_platform_id(self, platform_name: str) -> Optional[str]:
         """
@@ -109,38 +97,15 @@ class MetadataResolver(BaseResolver):
         Returns:
             Platform UUID if found, None otherwise
         """
-        try:
-            logger.info("Resolving platform '%s'", platform_name)
-
-            query = """
-            query GetPlatform($name: [String]) {
-              platforms(name: $name) {
-                id
-                name
-              }
-            }
-            """
-            variables = {"name": [platform_name]}
-            result = await self.nautobot.graphql_query(query, variables)
-
-            if "errors" in result:
-                logger.error("GraphQL error resolving platform: %s", result["errors"])
-                return None
-
-            platforms = result.get("data", {}).get("platforms", [])
-            if platforms and len(platforms) > 0:
-                platform_id = platforms[0]["id"]
-                logger.info(
-                    "Resolved platform '%s' to UUID %s", platform_name, platform_id
-                )
-                return platform_id
-
-            logger.warning("Platform not found: %s", platform_name)
-            return None
-
-        except Exception as e:
-            logger.error("Error resolving platform: %s", e, exc_info=True)
-            return None
+        query = """
+        query GetPlatform($name: [String]) {
+          platforms(name: $name) {
+            id
+            name
+          }
+        }
+        """
+        return await self._resolve_name("platforms", "platform", platform_name, query)
 
     async def get_platform_name(self, platform_id: str) -> Optional[str]:
         """
@@ -181,38 +146,15 @@ class MetadataResolver(BaseResolver):
         Returns:
             Location UUID if found, None otherwise
         """
-        try:
-            logger.info("Resolving location '%s'", location_name)
-
-            query = """
-            query GetLocation($name: [String]) {
-              locations(name: $name) {
-                id
-                name
-              }
-            }
-            """
-            variables = {"name": [location_name]}
-            result = await self.nautobot.graphql_query(query, variables)
-
-            if "errors" in result:
-                logger.error("GraphQL error resolving location: %s", result["errors"])
-                return None
-
-            locations = result.get("data", {}).get("locations", [])
-            if locations and len(locations) > 0:
-                location_id = locations[0]["id"]
-                logger.info(
-                    "Resolved location '%s' to UUID %s", location_name, location_id
-                )
-                return location_id
-
-            logger.warning("Location not found: %s", location_name)
-            return None
-
-        except Exception as e:
-            logger.error("Error resolving location: %s", e, exc_info=True)
-            return None
+        query = """
+        query GetLocation($name: [String]) {
+          locations(name: $name) {
+            id
+            name
+          }
+        }
+        """
+        return await self._resolve_name("locations", "location", location_name, query)
 
     async def resolve_secrets_group_id(self, group_name: str) -> Optional[str]:
         """
@@ -224,39 +166,57 @@ class MetadataResolver(BaseResolver):
         Returns:
             Secrets group UUID if found, None otherwise
         """
-        try:
-            logger.info("Resolving secrets group '%s'", group_name)
-
-            query = """
-            query GetSecretsGroup($name: [String]) {
-              secrets_groups(name: $name) {
-                id
-                name
-              }
-            }
-            """
-            variables = {"name": [group_name]}
-            result = await self.nautobot.graphql_query(query, variables)
+        query = """
+        query GetSecretsGroup($name: [String]) {
+          secrets_groups(name: $name) {
+            id
+            name
+          }
+        }
+        """
+        return await self._resolve_name(
+            "secrets_groups", "secrets group", group_name, query
+        )
 
+    async def _resolve_name(
+        self, resource: str, label: str, name: str, query: str
+    ) -> Optional[str]:
+        """
+        Resolve a name to a UUID with a ``$name``-filtered GraphQL query.
+
+        Answers (including "not found") go through the shared resolution
+        cache; errors are logged, return None and are not cached.
+
+        Args:
+            resource: GraphQL collection queried (e.g. "roles")
+            label: Human-readable resource name for log messages
+            name: Name to resolve
+            query: GraphQL query taking a ``$name: [String]`` variable
+
+        Returns:
+            UUID if found, None otherwise
+        """
+
+        async def lookup() -> Optional[str]:
+            result = await self.nautobot.graphql_query(query, {"name": [name]})
             if "errors" in result:
-                logger.error(
-                    "GraphQL error resolving secrets group: %s", result["errors"]
-                )
-                return None
+                raise ValueError(f"GraphQL error resolving {label}: {result['errors']}")
+            items = result.get("data", {}).get(resource, [])
+            return items[0]["id"] if items else None
 
-            groups = result.get("data", {}).get("secrets_groups", [])
-            if groups and len(groups) > 0:
-                group_id = groups[0]["id"]
-                logger.info(
-                    "Resolved secrets group '%s' to UUID %s", group_name, group_id
-                )
-                return group_id
+        try:
+            logger.info("Resolving %s '%s'", label, name)
+            resolved_id = await resolution_cache.resolve(resource, "name", name, lookup)
+
+            if resolved_id:
+                logger.info("Resolved %s '%s' to UUID %s", label, name, resolved_id)
+                return resolved_id
 
-            logger.warning("Secrets group not found: %s", group_name)
+            logger.warning("%s not found: %s", label.capitalize(), name)
             return None
 
         except Exception as e:
-            logger.error("Error resolving secrets group: %s", e, exc_info=True)
+            logger.error("Error resolving %s: %s", label, e, exc_info=True)
             return None
 
     async def resolve_rack_id(
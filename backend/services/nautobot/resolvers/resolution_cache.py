@@ -0,0 +1,305 @@
+"""
+Shared name → UUID resolution cache for the Nautobot resolvers.
+
+Resolvers turn names such as "Active", "Network" or "Berlin" into Nautobot
+UUIDs.  Bulk operations resolve the same handful of names over and over, so
+results are cached in two layers, keyed by ``(resource, field, value)``:
+
+* an in-process LRU, checked first and kept short-lived so other processes'
+  changes show up quickly, and
+* Redis (through RedisCacheService), shared by API and Celery workers.
+
+"Not found" answers are cached too, for a shorter time.  Failed lookups are
+never cached.  Writes that Cockpit sends to the corresponding Nautobot
+endpoints (see ``ENDPOINT_RESOURCES``) drop the resource from the local LRU
+and from Redis; other processes drop their local copies when they expire.
+
+The small taxonomies (statuses, roles, platforms, device types) can be loaded
+in bulk with :func:`warm_up_taxonomies` before a large batch of creates.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Top-level RedisCacheService namespace of all resolution entries
+CACHE_NAMESPACE = "nautobot_ids"
+# Maximum number of entries kept in the in-process LRU
+DEFAULT_MAX_ENTRIES = 4096
+# Lifetime of an entry in the in-process LRU
+DEFAULT_LOCAL_TTL = 60.0  # seconds
+# Lifetime of a resolved ID in Redis
+DEFAULT_REDIS_TTL = 3600  # seconds
+# Lifetime of a "not found" answer, locally and in Redis
+DEFAULT_NEGATIVE_TTL = 60  # seconds
+# Delay before retrying Redis after it could not be reached
+REDIS_RETRY_DELAY = 30.0  # seconds
+
+# Nautobot REST list endpoint -> cached resources affected by writes to it
+ENDPOINT_RESOURCES: Dict[str, Tuple[str, ...]] = {
+    "extras/statuses": ("statuses",),
+    "extras/roles": ("roles",),
+    "dcim/platforms": ("platforms",),
+    "dcim/device-types": ("device_types",),
+    # Device types may be resolved by manufacturer name
+    "dcim/manufacturers": ("device_types",),
+    "dcim/locations": ("locations",),
+    "extras/secrets-groups": ("secrets_groups",),
+}
+
+# Resources that are cached: only those a Cockpit write can invalidate
+CACHED_RESOURCES = frozenset(r for rs in ENDPOINT_RESOURCES.values() for r in rs)
+
+CacheKey = Tuple[str, str, str]
+
+
+def _default_cache_service():
+    import service_factory
+
+    return service_factory.build_cache_service()
+
+
+class ResolutionCache:
+    """Two-level (LRU + Redis) cache of Nautobot name → UUID resolutions."""
+
+    def __init__(
+        self,
+        cache_service_factory: Optional[Callable[[], Any]] = _default_cache_service,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        local_ttl: float = DEFAULT_LOCAL_TTL,
+        redis_ttl: int = DEFAULT_REDIS_TTL,
+        negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+    ):
+        """Initialize the cache; Redis is connected on first use.
+
+        Args:
+            cache_service_factory: Returns the RedisCacheService used as the
+                shared layer, or None for a process-local cache
+            max_entries: Size of the in-process LRU
+            local_ttl: Seconds an entry is trusted in the in-process LRU
+            redis_ttl: Seconds a resolved ID is kept in Redis
+            negative_ttl: Seconds a "not found" answer is kept in either layer
+        """
+        self._cache_service_factory = cache_service_factory
+        self._max_entries = max_entries
+        self._local_ttl = local_ttl
+        self._redis_ttl = redis_ttl
+        self._negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        # key -> (expires_at, resolved id or None)
+        self._entries: OrderedDict[CacheKey, Tuple[float, Optional[str]]] = (
+            OrderedDict()
+        )
+        self._cache_service = None
+        self._redis_retry_at = 0.0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, resource: str, field: str, value: str) -> Tuple[bool, Optional[str]]:
+        """Return ``(hit, id)``; ``(True, None)`` is a cached "not found"."""
+        key = (resource, field, value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return True, entry[1]
+                del self._entries[key]
+
+        cache_service = self._shared()
+        if cache_service is None:
+            return False, None
+        cached = cache_service.get(self._redis_key(key))
+        if not isinstance(cached, dict) or "id" not in cached:
+            return False, None
+        self._store_local(key, cached["id"])
+        return True, cached["id"]
+
+    def set(
+        self, resource: str, field: str, value: str, resolved: Optional[str]
+    ) -> None:
+        """Cache the answer for one key; ``resolved=None`` means "not found"."""
+        self.set_many(resource, field, {value: resolved})
+
+    def set_many(
+        self, resource: str, field: str, resolved: Dict[str, Optional[str]]
+    ) -> None:
+        """Cache the answers for many values of one ``(resource, field)``."""
+        found: Dict[str, Any] = {}
+        missing: Dict[str, Any] = {}
+        for value, resolved_id in resolved.items():
+            key = (resource, field, value)
+            self._store_local(key, resolved_id)
+            target = found if resolved_id is not None else missing
+            target[self._redis_key(key)] = {"id": resolved_id}
+
+        cache_service = self._shared()
+        if cache_service is None:
+            return
+        if found:
+            cache_service.set_many(found, self._redis_ttl)
+        if missing:
+            cache_service.set_many(missing, self._negative_ttl)
+
+    async def resolve(
+        self,
+        resource: str,
+        field: str,
+        value: str,
+        loader: Callable[[], Awaitable[Optional[str]]],
+    ) -> Optional[str]:
+        """Return the cached answer for a key, calling *loader* on a miss.
+
+        *loader* returns the resolved ID or None when nothing matches; both are
+        cached.  Exceptions propagate and leave the cache unchanged.  Resources
+        outside ``CACHED_RESOURCES`` always go to *loader*.
+        """
+        if resource not in CACHED_RESOURCES:
+            return await loader()
+        hit, resolved = self.get(resource, field, value)
+        if hit:
+            logger.debug("Resolution cache hit: %s %s=%s", resource, field, value)
+            return resolved
+        resolved = await loader()
+        self.set(resource, field, value, resolved)
+        return resolved
+
+    def invalidate(self, *resources: str) -> None:
+        """Drop every cached answer of *resources* locally and in Redis."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] in resources]:
+                del self._entries[key]
+
+        cache_service = self._shared()
+        if cache_service is None:
+            return
+        for resource in resources:
+            cache_service.clear_namespace(f"{CACHE_NAMESPACE}:{resource}")
+        logger.debug("Resolution cache invalidated: %s", ", ".join(resources))
+
+    def invalidate_endpoint(self, endpoint: str) -> None:
+        """Invalidate the resources a write to the REST *endpoint* may change."""
+        path = endpoint.split("?", 1)[0].strip("/")
+        for prefix, resources in ENDPOINT_RESOURCES.items():
+            if path == prefix or path.startswith(prefix + "/"):
+                self.invalidate(*resources)
+                return
+
+    def clear(self) -> None:
+        """Drop every entry of the in-process LRU (Redis is left untouched)."""
+        with self._lock:
+            self._entries.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _redis_key(key: CacheKey) -> str:
+        return "%s:%s:%s:%s" % (CACHE_NAMESPACE, *key)
+
+    def _store_local(self, key: CacheKey, resolved: Optional[str]) -> None:
+        ttl = self._local_ttl
+        if resolved is None:
+            ttl = min(ttl, self._negative_ttl)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, resolved)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _shared(self):
+        """Return the RedisCacheService, or None while Redis is unavailable."""
+        if self._cache_service is not None or self._cache_service_factory is None:
+            return self._cache_service
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        try:
+            self._cache_service = self._cache_service_factory()
+        except Exception as e:
+            logger.warning("Resolution cache running without Redis: %s", e)
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_DELAY
+        return self._cache_service
+
+
+resolution_cache = ResolutionCache()
+
+
+_TAXONOMY_QUERY = """
+query WarmTaxonomies {
+  roles { id name }
+  platforms { id name }
+  device_types { id model manufacturer { name } }
+}
+"""
+
+
+def status_field(content_type: str) -> str:
+    """Cache field of statuses, which are resolved per content type."""
+    return "name@%s" % content_type
+
+
+def device_type_field(manufacturer: Optional[str]) -> str:
+    """Cache field of device types, optionally scoped to a manufacturer."""
+    return "model@%s" % manufacturer if manufacturer else "model"
+
+
+async def warm_up_taxonomies(
+    nautobot_service, cache: ResolutionCache = resolution_cache
+) -> Dict[str, int]:
+    """Load statuses, roles, platforms and device types into *cache* in bulk.
+
+    Uses one REST request for statuses and one GraphQL query for the rest.
+    Only positive answers are stored; names that are not loaded here still
+    resolve (and negative-cache) one at a time.
+
+    Returns:
+        Number of cached entries per resource
+    """
+    counts: Dict[str, int] = {}
+
+    statuses = await nautobot_service.rest_request(
+        "extras/statuses/?limit=0&format=json"
+    )
+    by_content_type: Dict[str, Dict[str, Optional[str]]] = {}
+    for status in (statuses or {}).get("results", []):
+        for content_type in status.get("content_types") or []:
+            # Status names resolve case-insensitively; the first match wins
+            by_content_type.setdefault(content_type, {}).setdefault(
+                status["name"].lower(), status["id"]
+            )
+    for content_type, resolved in by_content_type.items():
+        cache.set_many("statuses", status_field(content_type), resolved)
+    counts["statuses"] = sum(len(r) for r in by_content_type.values())
+
+    result = await nautobot_service.graphql_query(_TAXONOMY_QUERY)
+    if "errors" in result:
+        raise ValueError(f"GraphQL errors while warming taxonomies: {result['errors']}")
+    data = result.get("data") or {}
+
+    for resource in ("roles", "platforms"):
+        resolved = {}
+        for item in data.get(resource) or []:
+            resolved.setdefault(item["name"], item["id"])
+        cache.set_many(resource, "name", resolved)
+        counts[resource] = len(resolved)
+
+    by_field: Dict[str, Dict[str, Optional[str]]] = {}
+    for item in data.get("device_types") or []:
+        manufacturer = (item.get("manufacturer") or {}).get("name")
+        for field in {device_type_field(None), device_type_field(manufacturer)}:
+            by_field.setdefault(field, {}).setdefault(item["model"], item["id"])
+    for field, resolved in by_field.items():
+        cache.set_many("device_types", field, resolved)
+    counts["device_types"] = len(by_field.get(device_type_field(None), {}))
+
+    logger.info("Warmed resolution cache: %s", counts)
+    return counts
@@ -2,6 +2,7 @@
 Nautobot service helpers package.
 """
 
+from .cache_aside import CacheAside
 from .cache_helpers import (
     DEVICE_CACHE_TTL,
     cache_device,
@@ -15,6 +16,7 @@ from .cache_helpers import (
 )
 
 __all__ = [
+    "CacheAside",
     "DEVICE_CACHE_TTL",
     "get_device_cache_key",
     "get_device_details_cache_key",
@@ -0,0 +1,221 @@
+"""
+Cache-aside reads of Nautobot data with single-flight rebuilds.
+
+Values are stored in RedisCacheService wrapped in an envelope::
+
+    {"value": ..., "stored_at": <epoch>, "refresh_at": <epoch>}
+
+* Until ``refresh_at`` (the soft TTL) the value is fresh and returned as is.
+* After it, the value is still returned, but one background task rebuilds
+  the entry.  Redis drops the entry ``stale_ttl`` seconds later (hard TTL).
+* On a miss, exactly one caller rebuilds a key: the rebuild runs as a task
+  that concurrent callers in this process await (shielded, so one caller
+  going away does not cancel it for the others), and other processes wait
+  for the holder of the Redis rebuild lock to publish the new entry.
+* :meth:`CacheAside.invalidate` deletes an entry and leaves a marker, so a
+  rebuild that started before the invalidation does not write its (possibly
+  outdated) result back.
+
+Soft and hard expiry are jittered so that entries written together do not
+all expire at the same moment.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+# Seconds an entry may be served stale after its soft TTL
+DEFAULT_STALE_TTL = 5 * 60
+# Fraction by which the soft TTL is randomly shortened
+DEFAULT_JITTER = 0.1
+# Seconds after which an abandoned rebuild lock expires
+DEFAULT_LOCK_TTL = 30
+# Longest time a caller waits for another process to rebuild a key
+DEFAULT_LOCK_WAIT = 10.0  # seconds
+# Delay between two checks while waiting for another process
+LOCK_POLL_INTERVAL = 0.1  # seconds
+
+Loader = Callable[[], Awaitable[Any]]
+
+# Cache key -> task rebuilding it in this process.  Module-level so that
+# short-lived service instances (one per request) share rebuilds.
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+def _is_envelope(cached: Any) -> bool:
+    return isinstance(cached, dict) and "value" in cached and "refresh_at" in cached
+
+
+def _invalidation_key(key: str) -> str:
+    return f"{key}:invalidated"
+
+
+class CacheAside:
+    """Read-through cache over RedisCacheService with stampede protection."""
+
+    def __init__(
+        self,
+        cache_service,
+        ttl: int,
+        stale_ttl: int = DEFAULT_STALE_TTL,
+        jitter: float = DEFAULT_JITTER,
+        lock_ttl: int = DEFAULT_LOCK_TTL,
+        lock_wait: float = DEFAULT_LOCK_WAIT,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_service: RedisCacheService holding the entries and locks
+            ttl: Seconds an entry is fresh (soft TTL)
+            stale_ttl: Seconds an entry may be served stale afterwards
+            jitter: Fraction by which the soft TTL is randomly shortened
+            lock_ttl: Seconds after which an abandoned rebuild lock expires
+            lock_wait: Longest time to wait for another process's rebuild
+                before loading the value independently
+        """
+        self._cache = cache_service
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._jitter = jitter
+        self._lock_ttl = lock_ttl
+        self._lock_wait = lock_wait
+
+    async def get_or_load(
+        self, key: str, loader: Loader, force_refresh: bool = False
+    ) -> Any:
+        """Return the value of *key*, calling *loader* to rebuild it if needed.
+
+        Args:
+            key: Cache key (without prefix)
+            loader: Coroutine function returning the value; exceptions
+                propagate to every caller waiting on the same rebuild and
+                leave the cache unchanged
+            force_refresh: Skip the cached value and rebuild the key
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        stored_at = 0.0
+        if not force_refresh:
+            cached = self._cache.get(key)
+            if _is_envelope(cached):
+                if cached["refresh_at"] > time.time():
+                    return cached["value"]
+                logger.debug("Serving stale cache entry while refreshing: %s", key)
+                self._refresh_in_background(key, loader, cached["stored_at"])
+                return cached["value"]
+        else:
+            stored_at = time.time()
+        return await self._single_flight(key, loader, newer_than=stored_at)
+
+    def store(self, key: str, value: Any) -> None:
+        """Write *value* under *key* with jittered soft and hard expiry."""
+        now = time.time()
+        ttl = self._ttl * (1 - random.uniform(0, self._jitter))
+        envelope = {"value": value, "stored_at": now, "refresh_at": now + ttl}
+        self._cache.set(key, envelope, int(ttl + self._stale_ttl))
+
+    def invalidate(self, key: str) -> None:
+        """Delete *key* and keep rebuilds that started earlier from storing it.
+
+        Use this instead of a plain delete after writing to Nautobot.
+        """
+        self._cache.set(
+            _invalidation_key(key), uuid.uuid4().hex, int(self._ttl + self._stale_ttl)
+        )
+        self._cache.delete(key)
+        # Callers arriving from now on must not join an earlier rebuild
+        _inflight.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _single_flight(self, key: str, loader: Loader, newer_than: float) -> Any:
+        """Await this process's rebuild of *key*, starting one if needed."""
+        return await asyncio.shield(self._start_rebuild(key, loader, newer_than))
+
+    def _start_rebuild(
+        self, key: str, loader: Loader, newer_than: float
+    ) -> asyncio.Task:
+        """Return the task rebuilding *key* in this process, creating it once."""
+        task = _inflight.get(key)
+        # Celery tasks run each call in a fresh event loop; ignore tasks of others
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            return task
+        task = asyncio.ensure_future(self._rebuild(key, loader, newer_than))
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_rebuild_done, key))
+        return task
+
+    async def _rebuild(self, key: str, loader: Loader, newer_than: float) -> Any:
+        """Rebuild *key* under its Redis lock, or wait for the lock holder."""
+        token = self._cache.acquire_lock(key, self._lock_ttl)
+        if token is None and self._cache.is_locked(key):
+            found, value = await self._wait_for_peer(key, newer_than)
+            if found:
+                return value
+            logger.warning(
+                "No rebuilt entry for %s from other process, loading it", key
+            )
+
+        try:
+            marker = self._cache.get(_invalidation_key(key))
+            value = await loader()
+            if self._cache.get(_invalidation_key(key)) != marker:
+                logger.debug("Not caching %s, invalidated during rebuild", key)
+            else:
+                self.store(key, value)
+            return value
+        finally:
+            if token is not None:
+                self._cache.release_lock(key, token)
+
+    async def _wait_for_peer(self, key: str, newer_than: float):
+        """Poll Redis until another process publishes *key*.
+
+        Returns:
+            ``(True, value)`` once an entry stored after *newer_than* appears,
+            ``(False, None)`` if the lock is released without one or the
+            wait times out
+        """
+        deadline = time.monotonic() + self._lock_wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            cached = self._cache.get(key)
+            if _is_envelope(cached) and cached["stored_at"] > newer_than:
+                return True, cached["value"]
+            if not self._cache.is_locked(key):
+                break
+        return False, None
+
+    def _refresh_in_background(
+        self, key: str, loader: Loader, stored_at: float
+    ) -> None:
+        """Rebuild a stale *key* in a task unless a rebuild is already running."""
+        running = _inflight.get(key)
+        task = self._start_rebuild(key, loader, newer_than=stored_at)
+        if task is not running:
+            task.add_done_callback(_log_refresh_failure)
+
+
+def _rebuild_done(key: str, task: asyncio.Task) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # Callers see the outcome through the shield; retrieve it here so that an
+    # exception nobody awaited is not reported as "never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background cache refresh failed: %s", task.exception())
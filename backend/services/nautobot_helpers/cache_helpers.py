@@ -76,6 +76,13 @@ def cache_device_list(cache_key: str, devices: list) -> None:
             cache_device(device)
 
 
-def get_cached_device_list(cache_key: str) -> Optional[list]:
-    """Get cached device list."""
-    return _get_cache().get(cache_key)
+def get_cached_device_list(cache_key: str) -> Optional[dict]:
+    """Get cached device list, stale or not.
+
+    Device lists are written by DeviceQueryService through CacheAside, which
+    wraps them in an envelope carrying their refresh time.
+    """
+    cached = _get_cache().get(cache_key)
+    if isinstance(cached, dict) and "refresh_at" in cached:
+        return cached.get("value")
+    return cached
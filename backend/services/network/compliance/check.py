@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Pattern
 
 from netmiko import ConnectHandler
 from pysnmp.hlapi.v3arch import (
@@ -381,6 +381,7 @@ class ComplianceCheckService:
         pattern: str,
         pattern_type: str,
         description: Optional[str] = None,
+        regex: Optional[Pattern[str]] = None,
     ) -> Dict[str, Any]:
         """
         Check if a configuration pattern matches or doesn't match (mock implementation).
@@ -391,13 +392,14 @@ class ComplianceCheckService:
             pattern: Regex pattern to match
             pattern_type: 'must_match' or 'must_not_match'
             description: Pattern description
+            regex: *pattern* already compiled by compile_patterns()
 
         Returns:
             Dictionary with success status, message, and details
         """
         try:
-            # Compile regex pattern
-            regex = re.compile(pattern, re.MULTILINE)
+            if regex is None:
+                regex = re.compile(pattern, re.MULTILINE)
             matches = regex.findall(configuration)
 
             if pattern_type == "must_match":
@@ -485,6 +487,24 @@ class ComplianceCheckService:
                 },
             }
 
+    @staticmethod
+    def compile_patterns(patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Compile a pattern set once for checking many devices.
+
+        Returns copies of *patterns* with a ``regex`` entry holding the
+        compiled expression, or None when the pattern is invalid (the check
+        then reports the compile error per device, as before).
+        """
+        compiled = []
+        for pattern_info in patterns:
+            try:
+                regex = re.compile(pattern_info["pattern"], re.MULTILINE)
+            except re.error:
+                regex = None
+            compiled.append({**pattern_info, "regex": regex})
+        return compiled
+
     @staticmethod
     def check_configuration_mock(
         device_ip: str, device_name: str, patterns: List[Dict[str, Any]]
@@ -498,7 +518,8 @@ class ComplianceCheckService:
         Args:
             device_ip: IP address of the device
             device_name: Device name
-            patterns: List of regex patterns to check
+            patterns: List of regex patterns to check, optionally from
+                compile_patterns()
 
         Returns:
             Dictionary with check results
@@ -531,6 +552,7 @@ end
                 pattern=pattern_info["pattern"],
                 pattern_type=pattern_info["pattern_type"],
                 description=pattern_info.get("description"),
+                regex=pattern_info.get("regex"),
             )
             pattern_results.append(result)
 
@@ -0,0 +1,240 @@
+"""Concurrent compliance check runner.
+
+Runs the SSH, SNMP and configuration checks of ComplianceCheckService for
+many devices at once.  Netmiko logins are blocking, so they run on a
+bounded thread pool instead of the event loop; SNMP probes are native
+asyncio.  The regex set is compiled once per run rather than per device.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from models.settings import DeviceCheckRequest
+from services.network.compliance.check import ComplianceCheckService
+
+# Devices checked at the same time
+DEFAULT_DEVICE_CONCURRENCY = 20
+# Threads available for blocking Netmiko logins
+DEFAULT_SSH_WORKERS = 10
+
+
+def netmiko_device_type(platform: Optional[str]) -> str:
+    """Map a Nautobot platform name to a Netmiko device type."""
+    device_type = "cisco_ios"  # Default
+    if platform:
+        platform_lower = platform.lower()
+        if "juniper" in platform_lower or "junos" in platform_lower:
+            device_type = "juniper_junos"
+        elif "arista" in platform_lower or "eos" in platform_lower:
+            device_type = "arista_eos"
+        elif "cisco" in platform_lower:
+            if "nxos" in platform_lower:
+                device_type = "cisco_nxos"
+            elif "xr" in platform_lower:
+                device_type = "cisco_xr"
+    return device_type
+
+
+def _check_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "enabled": True,
+        "results": results,
+        "total": len(results),
+        "passed": sum(1 for r in results if r["success"]),
+        "failed": sum(1 for r in results if not r["success"]),
+    }
+
+
+class ComplianceRunner:
+    """Checks devices against one set of credentials, SNMP mappings and patterns."""
+
+    def __init__(
+        self,
+        login_credentials: Sequence[Dict[str, Any]] = (),
+        snmp_mappings: Sequence[Dict[str, Any]] = (),
+        regex_patterns: Sequence[Dict[str, Any]] = (),
+        check_ssh_logins: bool = False,
+        check_snmp_credentials: bool = False,
+        check_configuration: bool = False,
+        max_concurrency: int = DEFAULT_DEVICE_CONCURRENCY,
+        ssh_workers: int = DEFAULT_SSH_WORKERS,
+        service: Optional[ComplianceCheckService] = None,
+    ):
+        self.login_credentials = list(login_credentials)
+        self.snmp_mappings = list(snmp_mappings)
+        self.patterns = ComplianceCheckService.compile_patterns(list(regex_patterns))
+        self.check_ssh_logins = check_ssh_logins
+        self.check_snmp_credentials = check_snmp_credentials
+        self.check_configuration = check_configuration
+        self.max_concurrency = max_concurrency
+        self.ssh_workers = ssh_workers
+        self.service = service or ComplianceCheckService()
+        self._ssh_pool: Optional[ThreadPoolExecutor] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def stream(
+        self, devices: Sequence[DeviceCheckRequest]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield one result per device, in the order the checks finish."""
+        async with self._checks(devices) as tasks:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+
+    async def run(self, devices: Sequence[DeviceCheckRequest]) -> List[Dict[str, Any]]:
+        """Check all devices concurrently; results keep the order of *devices*."""
+        async with self._checks(devices) as tasks:
+            return list(await asyncio.gather(*tasks))
+
+    @asynccontextmanager
+    async def _checks(
+        self, devices: Sequence[DeviceCheckRequest]
+    ) -> AsyncIterator[List[asyncio.Future]]:
+        """Schedule the device checks, at most *max_concurrency* at a time."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def check(device: DeviceCheckRequest) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.check_device(device)
+
+        self._ssh_pool = ThreadPoolExecutor(
+            max_workers=self.ssh_workers, thread_name_prefix="compliance-ssh"
+        )
+        tasks = [asyncio.ensure_future(check(device)) for device in devices]
+        try:
+            yield tasks
+        finally:
+            # A client that disconnects mid-stream leaves checks pending
+            for task in tasks:
+                task.cancel()
+            self._ssh_pool.shutdown(wait=False, cancel_futures=True)
+            self._ssh_pool = None
+
+    def summarize(
+        self, total_devices: int, results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return {
+            "total_devices": total_devices,
+            "devices_checked": len([r for r in results if r["status"] != "skipped"]),
+            "devices_passed": len([r for r in results if r["status"] == "pass"]),
+            "devices_failed": len([r for r in results if r["status"] == "fail"]),
+            "devices_skipped": len([r for r in results if r["status"] == "skipped"]),
+            "checks_performed": {
+                "ssh_logins": self.check_ssh_logins,
+                "snmp_credentials": self.check_snmp_credentials,
+                "configuration": self.check_configuration,
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # Per-device checks
+    # ------------------------------------------------------------------
+
+    async def check_device(self, device: DeviceCheckRequest) -> Dict[str, Any]:
+        device_ip = device.primary_ip4
+        if not device_ip:
+            return {
+                "device_id": device.id,
+                "device_name": device.name,
+                "status": "skipped",
+                "message": "No primary IP address",
+                "checks": {},
+            }
+
+        # Strip CIDR notation if present (e.g., "192.168.1.1/24" -> "192.168.1.1")
+        device_ip = device_ip.split("/")[0]
+
+        device_result = {
+            "device_id": device.id,
+            "device_name": device.name,
+            "device_ip": device_ip,
+            "status": "checking",
+            "checks": {},
+        }
+
+        probes = {}
+        if self.check_ssh_logins:
+            probes["ssh_logins"] = self._check_ssh(device_ip, device.platform)
+        if self.check_snmp_credentials:
+            probes["snmp_credentials"] = self._check_snmp(device_ip)
+        for name, results in zip(probes, await asyncio.gather(*probes.values())):
+            device_result["checks"][name] = _check_summary(results)
+
+        if self.check_configuration:
+            config_result = self.service.check_configuration_mock(
+                device_ip=device_ip,
+                device_name=device.name,
+                patterns=self.patterns,
+            )
+            device_result["checks"]["configuration"] = {
+                "enabled": True,
+                "result": config_result,
+            }
+
+        # Determine overall device status
+        checks = device_result["checks"]
+        all_checks_passed = True
+        if self.check_ssh_logins and checks["ssh_logins"]["passed"] == 0:
+            all_checks_passed = False
+        if self.check_snmp_credentials and checks["snmp_credentials"]["passed"] == 0:
+            all_checks_passed = False
+        if (
+            self.check_configuration
+            and not checks["configuration"]["result"]["success"]
+        ):
+            all_checks_passed = False
+
+        device_result["status"] = "pass" if all_checks_passed else "fail"
+        return device_result
+
+    async def _check_ssh(
+        self, device_ip: str, platform: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Try each credential in turn; one device never sees parallel logins."""
+        loop = asyncio.get_running_loop()
+        device_type = netmiko_device_type(platform)
+        results = []
+        for cred in self.login_credentials:
+            result = await loop.run_in_executor(
+                self._ssh_pool,
+                lambda cred=cred: self.service.check_ssh_login(
+                    device_ip=device_ip,
+                    device_type=device_type,
+                    username=cred["username"],
+                    password=cred["password"],
+                ),
+            )
+            # Add credential name to result details
+            result["details"]["credential_name"] = cred.get("name", cred["username"])
+            results.append(result)
+        return results
+
+    async def _check_snmp(self, device_ip: str) -> List[Dict[str, Any]]:
+        async def probe(snmp: Dict[str, Any]) -> Dict[str, Any]:
+            if snmp["snmp_version"] in ["v1", "v2c"]:
+                version = 1 if snmp["snmp_version"] == "v1" else 2
+                result = await self.service.check_snmp_v1_v2c_async(
+                    device_ip=device_ip,
+                    community=snmp["snmp_community"],
+                    version=version,
+                )
+            else:
+                result = await self.service.check_snmp_v3_async(
+                    device_ip=device_ip,
+                    username=snmp["snmp_v3_user"],
+                    auth_protocol=snmp["snmp_v3_auth_protocol"],
+                    auth_password=snmp["snmp_v3_auth_password"],
+                    priv_protocol=snmp["snmp_v3_priv_protocol"],
+                    priv_password=snmp["snmp_v3_priv_password"],
+                )
+            # Add SNMP mapping name to result details
+            result["details"]["mapping_name"] = snmp.get("name", "Unknown")
+            return result
+
+        return list(await asyncio.gather(*(probe(s) for s in self.snmp_mappings)))
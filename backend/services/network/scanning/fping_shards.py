@@ -0,0 +1,202 @@
+"""Sharded fping engine for large network scans.
+
+Scan targets are kept as integer host ranges, one per CIDR, and turned into
+address strings one shard at a time.  Shards are pinged by several fping
+processes in parallel and their results are yielded as each shard finishes,
+so callers can report progress and condense unreachable ranges
+incrementally.  A /14 never exists in memory as a list of IP strings; only
+the shards in flight and the alive addresses do.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import logging
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Largest CIDR one scan accepts (a /14 has 262,144 addresses).
+MAX_SCAN_HOSTS = 1 << 18
+
+# Bounds for the number of addresses handed to one fping process.
+MIN_SHARD_SIZE = 256
+MAX_SHARD_SIZE = 4096
+
+PingFunc = Callable[[List[str]], Set[str]]
+
+
+@dataclass(frozen=True)
+class HostRange:
+    """Inclusive range of host addresses, stored as integers."""
+
+    start: int
+    end: int
+    version: int = 4
+
+    def __len__(self) -> int:
+        return self.end - self.start + 1
+
+    def address(self, value: int) -> str:
+        if self.version == 4:
+            return str(ipaddress.IPv4Address(value))
+        return str(ipaddress.IPv6Address(value))
+
+    def addresses(self) -> Iterator[str]:
+        """Yield the addresses of the range as strings, lazily."""
+        for value in range(self.start, self.end + 1):
+            yield self.address(value)
+
+    def format(self) -> str:
+        """Render as ``10.0.0.10``, ``10.0.0.10 - 12`` or ``10.0.0.250 - 10.0.1.2``."""
+        first = self.address(self.start)
+        if self.start == self.end:
+            return first
+        last = self.address(self.end)
+        if self.version == 4 and first.split(".")[:3] == last.split(".")[:3]:
+            return "%s - %s" % (first, last.split(".")[3])
+        return "%s - %s" % (first, last)
+
+
+def host_range(cidr: str, max_hosts: int = MAX_SCAN_HOSTS) -> HostRange:
+    """Return the scannable hosts of *cidr*, like ``ip_network(cidr).hosts()``.
+
+    Raises:
+        ValueError: If the CIDR is invalid or has more than *max_hosts*
+            addresses.
+    """
+    try:
+        network = ipaddress.ip_network(cidr, strict=False)
+    except ValueError as e:
+        raise ValueError(f"Invalid CIDR notation {cidr}: {e}")
+
+    if network.num_addresses > max_hosts:
+        raise ValueError(
+            f"Network too large: {cidr}. At most {max_hosts} addresses can be scanned"
+        )
+
+    start = int(network.network_address)
+    end = int(network.broadcast_address)
+    if network.version == 4 and network.prefixlen < 31:
+        start, end = start + 1, end - 1  # network and broadcast address
+    elif network.version == 6 and network.prefixlen < 127:
+        start += 1  # Subnet-Router anycast address
+    return HostRange(start, end, network.version)
+
+
+def shard_size_for(total: int, workers: int) -> int:
+    """Shard size giving each worker a few shards, within the size bounds."""
+    size = math.ceil(total / max(1, workers * 4))
+    return max(MIN_SHARD_SIZE, min(MAX_SHARD_SIZE, size))
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def iter_shards(
+    ranges: Dict[str, HostRange], shard_size: int
+) -> Iterator[Tuple[str, HostRange]]:
+    """Split each CIDR's host range into consecutive shards."""
+    for cidr, hosts in ranges.items():
+        for start in range(hosts.start, hosts.end + 1, shard_size):
+            end = min(start + shard_size - 1, hosts.end)
+            yield cidr, HostRange(start, end, hosts.version)
+
+
+@dataclass
+class ShardResult:
+    """Outcome of pinging one shard."""
+
+    cidr: str
+    hosts: HostRange
+    alive: List[str]
+
+    def unreachable(self) -> List[HostRange]:
+        """The shard's addresses that did not answer, as ranges."""
+        gaps: List[HostRange] = []
+        next_start = self.hosts.start
+        for value in sorted(int(ipaddress.ip_address(ip)) for ip in self.alive):
+            if value > next_start:
+                gaps.append(HostRange(next_start, value - 1, self.hosts.version))
+            next_start = value + 1
+        if next_start <= self.hosts.end:
+            gaps.append(HostRange(next_start, self.hosts.end, self.hosts.version))
+        return gaps
+
+
+def condense_ranges(ranges: Iterable[HostRange]) -> List[str]:
+    """Merge adjacent ranges and render them with :meth:`HostRange.format`."""
+    merged: List[HostRange] = []
+    for current in sorted(ranges, key=lambda r: (r.version, r.start)):
+        last = merged[-1] if merged else None
+        if last and last.version == current.version and current.start <= last.end + 1:
+            merged[-1] = HostRange(last.start, max(last.end, current.end), last.version)
+        else:
+            merged.append(current)
+    return [r.format() for r in merged]
+
+
+def fping_shards(
+    ranges: Dict[str, HostRange],
+    ping: PingFunc,
+    workers: int | None = None,
+    shard_size: int | None = None,
+) -> Iterator[ShardResult]:
+    """Ping all host ranges shard by shard with parallel fping processes.
+
+    *ping* receives the addresses of one shard and returns the alive ones
+    (e.g. ``_fping_networks``).  Up to *workers* shards run at once and only
+    twice that many are materialised at any time.  Results are yielded in
+    completion order.  A shard whose ping raises is reported with no alive
+    addresses.
+    """
+    total = sum(len(hosts) for hosts in ranges.values())
+    if not total:
+        return
+
+    workers = workers or default_workers()
+    shard_size = shard_size or shard_size_for(total, workers)
+    shards = iter_shards(ranges, shard_size)
+    logger.info(
+        "Pinging %s addresses in shards of %s with %s fping workers",
+        total,
+        shard_size,
+        workers,
+    )
+
+    def run(cidr: str, hosts: HostRange) -> ShardResult:
+        addresses = list(hosts.addresses())
+        answered = ping(addresses)
+        # ``ping`` may report addresses outside the shard; keep ours only
+        alive = [ip for ip in addresses if ip in answered]
+        return ShardResult(cidr, hosts, alive)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fping") as pool:
+        in_flight: Dict[Future, Tuple[str, HostRange]] = {}
+
+        def submit_next() -> None:
+            shard = next(shards, None)
+            if shard is not None:
+                in_flight[pool.submit(run, *shard)] = shard
+
+        for _ in range(workers * 2):
+            submit_next()
+
+        while in_flight:
+            done, _pending = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                cidr, hosts = in_flight.pop(future)
+                submit_next()
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(
+                        "fping shard %s of %s failed: %s", hosts.format(), cidr, e
+                    )
+                    result = ShardResult(cidr, hosts, [])
+                yield result
@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Set
 
 from utils.time import utc_now_naive
 
+from .fping_shards import fping_shards, host_range
+
 """Network Scan service for ICMP ping discovery operations.
 
 Extracted from scan_service.py to provide standalone network discovery functionality.
@@ -25,6 +27,8 @@ logger = logging.getLogger(__name__)
 PING_TIMEOUT_SECONDS = 1.5
 DEFAULT_MAX_CONCURRENCY = 10
 RETRY_ATTEMPTS = 3
+# A /16 (IPv4) is the largest network one scan accepts
+MAX_NETWORK_SCAN_HOSTS = 1 << 16
 
 
 @dataclass
@@ -84,9 +88,9 @@ class NetworkScanService:
         """
         start_time = utc_now_naive()
 
-        # Validate and expand CIDR to target IPs
+        # Validate the CIDR; addresses are generated lazily from the range
         try:
-            targets = self._expand_cidr_to_ips(cidr)
+            hosts = host_range(cidr, max_hosts=MAX_NETWORK_SCAN_HOSTS)
         except Exception as e:
             logger.error("Invalid CIDR %s: %s", cidr, e)
             return NetworkScanResult(
@@ -100,7 +104,7 @@ class NetworkScanService:
 
         # Initialize progress tracking
         progress = NetworkScanProgress(
-            total=len(targets), scanned=0, alive=0, unreachable=0
+            total=len(hosts), scanned=0, alive=0, unreachable=0
         )
 
         if scan_id:
@@ -109,7 +113,7 @@ class NetworkScanService:
         logger.info(
             "Starting network scan of %s with %s targets using %s",
             cidr,
-            len(targets),
+            len(hosts),
             ping_mode,
         )
 
@@ -117,19 +121,36 @@ class NetworkScanService:
 
         try:
             if ping_mode == "fping":
-                # Use fping for efficient bulk scanning with expanded IP list
-                alive_hosts = await asyncio.to_thread(self._fping_networks, targets)
-                progress.scanned = progress.total
-                progress.alive = len(alive_hosts)
-                progress.unreachable = progress.total - progress.alive
+                # Parallel fping processes over shards of the range
+                unreachable_ranges = []
+                shards = fping_shards({cidr: hosts}, self._fping_networks)
+                while True:
+                    shard = await asyncio.to_thread(next, shards, None)
+                    if shard is None:
+                        break
+                    alive_hosts.update(shard.alive)
+                    unreachable_ranges.extend(shard.unreachable())
+                    progress.scanned += len(shard.hosts)
+                    progress.alive += len(shard.alive)
+                    progress.unreachable = progress.scanned - progress.alive
+
+                    if progress_callback:
+                        try:
+                            await progress_callback(progress)
+                        except Exception as e:
+                            logger.warning("Progress callback failed: %s", e)
+
+                unreachable_ranges.sort(key=lambda r: r.start)
+                unreachable_hosts = [
+                    ip for r in unreachable_ranges for ip in r.addresses()
+                ]
             else:
                 # Use individual ping operations with concurrency control
+                targets = list(hosts.addresses())
                 alive_hosts = await self._ping_targets_concurrent(
                     targets, max_concurrent, timeout, progress, progress_callback
                 )
-
-            # Calculate unreachable hosts
-            unreachable_hosts = [ip for ip in targets if ip not in alive_hosts]
+                unreachable_hosts = [ip for ip in targets if ip not in alive_hosts]
 
             end_time = utc_now_naive()
             scan_duration = (end_time - start_time).total_seconds()
@@ -137,7 +158,7 @@ class NetworkScanService:
             result = NetworkScanResult(
                 cidr=cidr,
                 ping_mode=ping_mode,
-                total_targets=len(targets),
+                total_targets=len(hosts),
                 alive_hosts=sorted(list(alive_hosts)),
                 unreachable_hosts=unreachable_hosts,
                 scan_duration=scan_duration,
@@ -159,7 +180,7 @@ class NetworkScanService:
             return NetworkScanResult(
                 cidr=cidr,
                 ping_mode=ping_mode,
-                total_targets=len(targets),
+                total_targets=len(hosts),
                 error_message=str(e),
                 started_at=start_time,
                 completed_at=utc_now_naive(),
@@ -173,28 +194,6 @@ class NetworkScanService:
         """Get current progress for an active scan."""
         return self._active_scans.get(scan_id)
 
-    def _expand_cidr_to_ips(self, cidr: str) -> List[str]:
-        """Convert CIDR notation to list of IP addresses."""
-        try:
-            network = ipaddress.ip_network(cidr, strict=False)
-
-            # Safety check: enforce reasonable network sizes
-            if network.prefixlen < 16:  # Larger than /16 might be too big
-                raise ValueError(
-                    f"Network too large: {cidr}. Minimum prefix length is /16"
-                )
-
-            # Convert to list of IP strings
-            if network.prefixlen == 32:
-                # Single host
-                return [str(network.network_address)]
-            else:
-                # Network range - get all hosts
-                return [str(ip) for ip in network.hosts()]
-
-        except Exception as e:
-            raise ValueError(f"Invalid CIDR notation {cidr}: {e}")
-
     async def _ping_targets_concurrent(
         self,
         targets: List[str],
@@ -4,14 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import ipaddress
+import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
 logger = logging.getLogger(__name__)
 
+# Addresses per GraphQL lookup of existing IP records, and Nautobot lookups
+# in flight during the IP upsert stage.
+_IP_LOOKUP_CHUNK = 250
+_NAUTOBOT_LOOKUP_CONCURRENCY = 4
+
 
 class PrefixScanService:
     """Orchestrates prefix discovery, IP scanning, and Nautobot result updates."""
@@ -135,8 +141,6 @@ class PrefixScanService:
                     _jrs.mark_completed(job_run_id, result=result)
                 return result
 
-            from tasks.ping_network_task import _expand_cidr_to_ips
-
             total_ips_count = 0
             prefix_ip_counts = {}
 
@@ -289,136 +293,152 @@ class PrefixScanService:
 
                 return result
 
-            all_ips: List[str] = []
-            prefix_ips: Dict[str, List[str]] = {}
-
-            if task_context:
-                task_context.update_state(
-                    state="PROGRESS",
-                    meta={
-                        "status": "Expanding prefixes to IP addresses...",
-                        "current": 0,
-                        "total": len(cidrs),
-                    },
-                )
+            from services.network.scanning.fping_shards import (
+                HostRange,
+                condense_ranges,
+                host_range,
+            )
+            from tasks.ping_network_task import _fping_sharded, _resolve_dns_many
 
-            for _idx, cidr in enumerate(cidrs):
+            # Host ranges per prefix; addresses are only generated shard by shard
+            prefix_ranges: Dict[str, Optional[HostRange]] = {}
+            for cidr in cidrs:
                 try:
                     logger.info("Scanning network: %s", cidr)
-                    cidr_ips = _expand_cidr_to_ips(cidr)
-                    all_ips.extend(cidr_ips)
-                    prefix_ips[cidr] = cidr_ips
-                    logger.debug("Expanded %s to %s IPs", cidr, len(cidr_ips))
-                except Exception as e:
+                    prefix_ranges[cidr] = host_range(cidr)
+                except ValueError as e:
                     logger.error("Failed to expand prefix %s: %s", cidr, e)
-                    prefix_ips[cidr] = []
+                    prefix_ranges[cidr] = None
+
+            ranges = {cidr: hosts for cidr, hosts in prefix_ranges.items() if hosts}
+            total_ips = sum(len(hosts) for hosts in ranges.values())
 
             if task_context:
                 task_context.update_state(
                     state="PROGRESS",
                     meta={
-                        "status": "Pinging %s IP addresses..." % len(all_ips),
+                        "status": "Pinging %s IP addresses..." % total_ips,
                         "current": 0,
-                        "total": len(all_ips),
+                        "total": total_ips,
                     },
                 )
 
-            from tasks.ping_network_task import (
-                _condense_ip_ranges,
-                _fping_networks,
-                _resolve_dns,
-            )
+            def report(scanned: int, alive: int) -> None:
+                if task_context:
+                    task_context.update_state(
+                        state="PROGRESS",
+                        meta={
+                            "status": "Pinged %s/%s IP addresses, %s alive..."
+                            % (scanned, total_ips, alive),
+                            "current": scanned,
+                            "total": total_ips,
+                        },
+                    )
 
-            alive_ips = _fping_networks(
-                all_ips,
+            alive_by_prefix, unreachable_by_prefix = _fping_sharded(
+                ranges,
                 count=ping_count,
                 timeout=timeout_ms,
                 retry=retries,
                 interval=interval_ms,
+                on_progress=report,
             )
+            alive_ips = [ip for alive in alive_by_prefix.values() for ip in alive]
             logger.info(
                 "fping found %s alive hosts out of %s targets",
                 len(alive_ips),
-                len(all_ips),
+                total_ips,
             )
 
-            prefix_results: List[Dict[str, Any]] = []
-
-            for idx, (cidr, cidr_ips) in enumerate(prefix_ips.items()):
+            hostnames: Dict[str, str] = {}
+            if resolve_dns and alive_ips:
                 if task_context:
                     task_context.update_state(
                         state="PROGRESS",
                         meta={
-                            "status": "Processing prefix %s/%s..."
-                            % (idx + 1, len(cidrs)),
-                            "current": idx + 1,
-                            "total": len(cidrs),
+                            "status": "Resolving DNS names for %s hosts..."
+                            % len(alive_ips),
+                            "current": 0,
+                            "total": len(alive_ips),
                         },
                     )
+                hostnames = _resolve_dns_many(alive_ips)
+
+            prefix_results: List[Dict[str, Any]] = []
+            ip_upserts: List[Tuple[str, str, Optional[str]]] = []
 
+            for cidr, hosts in prefix_ranges.items():
                 reachable: List[Dict[str, str]] = []
-                unreachable: List[str] = []
-
-                for ip in cidr_ips:
-                    if ip in alive_ips:
-                        ip_data = {"ip": ip}
-                        hostname = None
-
-                        if resolve_dns:
-                            hostname = _resolve_dns(ip)
-                            if hostname:
-                                ip_data["hostname"] = hostname
-
-                        reachable.append(ip_data)
-
-                        if response_custom_field_name:
-                            try:
-                                self._update_ip_in_nautobot(
-                                    ip_address=ip,
-                                    prefix_cidr=cidr,
-                                    response_custom_field_name=response_custom_field_name,
-                                    dns_name=hostname,
-                                    set_active=set_reachable_ip_active,
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    "Failed to update IP %s in Nautobot: %s", ip, e
-                                )
-                    else:
-                        unreachable.append(ip)
 
-                unreachable_condensed = _condense_ip_ranges(unreachable)
+                for ip in alive_by_prefix.get(cidr, []):
+                    ip_data = {"ip": ip}
+                    hostname = hostnames.get(ip) or None
+                    if hostname:
+                        ip_data["hostname"] = hostname
 
-                if response_custom_field_name:
-                    try:
-                        self._update_prefix_last_scan(cidr)
-                    except Exception as e:
-                        logger.error(
-                            "Failed to update prefix %s last_scan: %s", cidr, e
-                        )
+                    reachable.append(ip_data)
+                    ip_upserts.append((ip, cidr, hostname))
 
+                total = len(hosts) if hosts else 0
                 prefix_results.append(
                     {
                         "prefix": cidr,
-                        "total_ips": len(cidr_ips),
+                        "total_ips": total,
                         "reachable_count": len(reachable),
-                        "unreachable_count": len(unreachable),
+                        "unreachable_count": total - len(reachable),
                         "reachable": reachable,
-                        "unreachable": unreachable_condensed,
+                        "unreachable": condense_ranges(
+                            unreachable_by_prefix.get(cidr, [])
+                        ),
                     }
                 )
 
+            nautobot_summary = None
+            if response_custom_field_name:
+                if task_context:
+                    task_context.update_state(
+                        state="PROGRESS",
+                        meta={
+                            "status": "Updating %s IP addresses in Nautobot..."
+                            % len(ip_upserts),
+                            "current": 0,
+                            "total": len(ip_upserts),
+                        },
+                    )
+                try:
+                    nautobot_summary = self._upsert_ips_in_nautobot(
+                        ip_upserts,
+                        response_custom_field_name=response_custom_field_name,
+                        set_active=set_reachable_ip_active,
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Failed to update IP addresses in Nautobot: %s",
+                        e,
+                        exc_info=True,
+                    )
+
+                for cidr in prefix_ranges:
+                    try:
+                        self._update_prefix_last_scan(cidr)
+                    except Exception as e:
+                        logger.error(
+                            "Failed to update prefix %s last_scan: %s", cidr, e
+                        )
+
             result = {
                 "success": True,
                 "custom_field_name": custom_field_name,
                 "custom_field_value": custom_field_value,
                 "prefixes": prefix_results,
                 "total_prefixes": len(cidrs),
-                "total_ips_scanned": len(all_ips),
+                "total_ips_scanned": total_ips,
                 "total_reachable": len(alive_ips),
-                "total_unreachable": len(all_ips) - len(alive_ips),
+                "total_unreachable": total_ips - len(alive_ips),
                 "resolve_dns": resolve_dns,
             }
+            if nautobot_summary is not None:
+                result["nautobot_ip_updates"] = nautobot_summary
 
             if created_job_run and job_run_id:
                 _jrs.mark_completed(job_run_id, result=result)
@@ -426,7 +446,7 @@ class PrefixScanService:
             logger.info(
                 "Scan prefixes task completed: %s/%s reachable",
                 len(alive_ips),
-                len(all_ips),
+                total_ips,
             )
             return result
 
@@ -570,175 +590,206 @@ class PrefixScanService:
             )
             return []
 
-    def _update_ip_in_nautobot(
+    def _upsert_ips_in_nautobot(
         self,
-        ip_address: str,
-        prefix_cidr: str,
+        entries: List[Tuple[str, str, Optional[str]]],
         response_custom_field_name: str,
-        dns_name: Optional[str] = None,
         set_active: bool = True,
-    ) -> bool:
-        """Create or update an IP address record via Nautobot REST API."""
-        import service_factory
-
-        nautobot_service = service_factory.build_nautobot_service()
+    ) -> Dict[str, int]:
+        """
+        Create or update the IP address records of reachable hosts.
 
-        current_date = datetime.now().strftime("%Y-%m-%d")
+        *entries* are ``(ip, scanned_prefix, dns_name)`` tuples.  Existing
+        addresses are looked up in bulk and PATCHed in chunks; new ones are
+        created in chunks under their most specific parent prefix.  The DNS
+        name is only set on newly created addresses.
 
-        try:
-            config = nautobot_service._get_config()
-            if not config["url"] or not config["token"]:
-                logger.error("Nautobot URL and token must be configured")
-                return False
+        Returns:
+            Counts of ``updated``, ``created`` and ``failed`` addresses.
+        """
+        summary = {"updated": 0, "created": 0, "failed": 0}
+        if not entries:
+            return summary
 
-            base_url = config["url"].rstrip("/")
-            headers = {
-                "Authorization": "Token %s" % config["token"],
-                "Content-Type": "application/json",
-            }
+        import service_factory
 
-            response = requests.get(
-                "%s/api/ipam/ip-addresses/" % base_url,
-                headers=headers,
-                params={"address": ip_address},
+        nautobot_service = service_factory.build_nautobot_service()
+        return asyncio.run(
+            self._upsert_ips_async(
+                nautobot_service, entries, response_custom_field_name, set_active
             )
-            response.raise_for_status()
-
-            results = response.json().get("results", [])
-
-            if results:
-                ip_id = results[0].get("id")
-                update_data = {
-                    "custom_fields": {response_custom_field_name: current_date}
-                }
-
-                if set_active:
-                    status_response = requests.get(
-                        "%s/api/extras/statuses/" % base_url,
-                        headers=headers,
-                        params={"name": "Active"},
-                    )
-                    status_response.raise_for_status()
-                    statuses = status_response.json().get("results", [])
-                    if statuses:
-                        status_id = statuses[0].get("id")
-                        update_data["status"] = status_id
-
-                response = requests.patch(
-                    "%s/api/ipam/ip-addresses/%s/" % (base_url, ip_id),
-                    headers=headers,
-                    json=update_data,
-                )
-
-                if not response.ok:
-                    logger.error(
-                        "Failed to update IP %s. Status: %s, Response: %s",
-                        ip_address,
-                        response.status_code,
-                        response.text,
-                    )
-
-                response.raise_for_status()
-
-                log_msg = "Updated IP %s - %s=%s" % (
-                    ip_address,
-                    response_custom_field_name,
-                    current_date,
-                )
-                if set_active:
-                    log_msg += ", status=Active"
-                logger.info(log_msg)
-                return True
-
-            else:
-                response = requests.get(
-                    "%s/api/ipam/prefixes/" % base_url,
-                    headers=headers,
-                    params={"contains": ip_address},
-                )
-                response.raise_for_status()
-
-                prefixes = response.json().get("results", [])
-
-                if not prefixes:
-                    logger.error(
-                        "No parent prefix found for IP %s in Nautobot", ip_address
-                    )
-                    return False
-
-                def get_prefix_len(p):
-                    try:
-                        return int(p.get("prefix", "").split("/")[1])
-                    except (ValueError, IndexError, AttributeError):
-                        return 0
-
-                prefixes.sort(key=get_prefix_len, reverse=True)
-
-                best_prefix = prefixes[0]
-                prefix_id = best_prefix.get("id")
-
-                response = requests.get(
-                    "%s/api/extras/statuses/" % base_url,
-                    headers=headers,
-                    params={"name": "Active"},
-                )
-                response.raise_for_status()
-
-                statuses = response.json().get("results", [])
-                if not statuses:
-                    logger.error("Active status not found in Nautobot")
-                    return False
-
-                status_id = statuses[0].get("id")
-
-                parent_prefix_cidr = best_prefix.get("prefix", "")
-                prefix_length = (
-                    parent_prefix_cidr.split("/")[1]
-                    if "/" in parent_prefix_cidr
-                    else "32"
-                )
+        )
 
-                ip_with_netmask = "%s/%s" % (ip_address, prefix_length)
+    async def _upsert_ips_async(
+        self,
+        nautobot_service,
+        entries: List[Tuple[str, str, Optional[str]]],
+        response_custom_field_name: str,
+        set_active: bool,
+    ) -> Dict[str, int]:
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        custom_fields = {response_custom_field_name: current_date}
 
-                create_data = {
-                    "address": ip_with_netmask,
+        existing = await self._lookup_ip_ids(
+            nautobot_service, [ip for ip, _cidr, _name in entries]
+        )
+        to_create = [entry for entry in entries if entry[0] not in existing]
+
+        status_id = None
+        if set_active or to_create:
+            status_id = await self._active_status_id(nautobot_service)
+
+        summary = {"updated": 0, "created": 0, "failed": 0}
+
+        updates = []
+        for ip, _cidr, _name in entries:
+            if ip not in existing:
+                continue
+            update = {"id": existing[ip], "custom_fields": custom_fields}
+            if set_active and status_id:
+                update["status"] = status_id
+            updates.append(update)
+
+        if updates:
+            errors = await nautobot_service.bulk_update("ipam/ip-addresses/", updates)
+            for ip_id, error in errors.items():
+                logger.error("Failed to update IP address %s: %s", ip_id, error)
+            summary["updated"] = len(updates) - len(errors)
+            summary["failed"] += len(errors)
+
+        if to_create and not status_id:
+            logger.error("Active status not found in Nautobot")
+            summary["failed"] += len(to_create)
+            to_create = []
+
+        creates = []
+        create_ips = []
+        if to_create:
+            parents = await self._lookup_parent_prefixes(
+                nautobot_service, sorted({cidr for _ip, cidr, _name in to_create})
+            )
+            for ip, cidr, dns_name in to_create:
+                parent = self._best_parent_prefix(ip, parents.get(cidr, []))
+                if parent is None:
+                    logger.error("No parent prefix found for IP %s in Nautobot", ip)
+                    summary["failed"] += 1
+                    continue
+                prefix_id, network = parent
+                create = {
+                    "address": "%s/%s" % (ip, network.prefixlen),
                     "status": {"id": status_id},
                     "parent": {"id": prefix_id},
-                    "custom_fields": {response_custom_field_name: current_date},
+                    "custom_fields": custom_fields,
                 }
-
                 if dns_name:
-                    create_data["dns_name"] = dns_name
-
-                response = requests.post(
-                    "%s/api/ipam/ip-addresses/" % base_url,
-                    headers=headers,
-                    json=create_data,
-                )
-
-                if not response.ok:
-                    logger.error(
-                        "Failed to create IP %s. Status: %s, Response: %s",
-                        ip_address,
-                        response.status_code,
-                        response.text,
-                    )
-
-                response.raise_for_status()
-
-                logger.info(
-                    "Created IP %s - %s=%s, status=Active",
-                    ip_address,
-                    response_custom_field_name,
-                    current_date,
-                )
-                return True
+                    create["dns_name"] = dns_name
+                creates.append(create)
+                create_ips.append(ip)
+
+        if creates:
+            errors = await nautobot_service.bulk_create("ipam/ip-addresses/", creates)
+            for index, error in errors.items():
+                logger.error("Failed to create IP %s: %s", create_ips[index], error)
+            summary["created"] = len(creates) - len(errors)
+            summary["failed"] += len(errors)
+
+        logger.info(
+            "Nautobot IP addresses: %s updated, %s created, %s failed",
+            summary["updated"],
+            summary["created"],
+            summary["failed"],
+        )
+        return summary
+
+    @staticmethod
+    async def _lookup_ip_ids(nautobot_service, ips: List[str]) -> Dict[str, str]:
+        """Map the given addresses to the IDs of their existing IP records."""
+        query = """
+    query ($address: [String]) {
+      ip_addresses(address: $address) {
+        id
+        host
+      }
+    }
+    """
+        semaphore = asyncio.Semaphore(_NAUTOBOT_LOOKUP_CONCURRENCY)
+
+        async def lookup(chunk: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                result = await nautobot_service.graphql_query(query, {"address": chunk})
+            if "errors" in result:
+                raise RuntimeError("GraphQL errors: %s" % result["errors"])
+            return (result.get("data") or {}).get("ip_addresses") or []
+
+        chunks = [
+            ips[i : i + _IP_LOOKUP_CHUNK] for i in range(0, len(ips), _IP_LOOKUP_CHUNK)
+        ]
+        ids: Dict[str, str] = {}
+        for records in await asyncio.gather(*(lookup(chunk) for chunk in chunks)):
+            for record in records:
+                ids.setdefault(record.get("host"), record.get("id"))
+        return ids
+
+    @staticmethod
+    async def _active_status_id(nautobot_service) -> Optional[str]:
+        response = await nautobot_service.rest_request("extras/statuses/?name=Active")
+        statuses = response.get("results", [])
+        return statuses[0].get("id") if statuses else None
+
+    @staticmethod
+    async def _lookup_parent_prefixes(
+        nautobot_service, cidrs: List[str]
+    ) -> Dict[str, List[Tuple[str, Any]]]:
+        """
+        For each scanned prefix, fetch the Nautobot prefixes an address in it
+        can belong to: the prefix itself, prefixes inside it and prefixes
+        containing it.  Returns ``(id, ip_network)`` pairs per scanned prefix.
+        """
+        semaphore = asyncio.Semaphore(_NAUTOBOT_LOOKUP_CONCURRENCY)
 
-        except Exception as e:
-            logger.error(
-                "Error processing IP %s in Nautobot: %s", ip_address, e, exc_info=True
-            )
-            return False
+        async def lookup(cidr: str) -> List[Tuple[str, Any]]:
+            network_address = cidr.split("/")[0]
+            query = """
+    query {
+      inner: prefixes(within_include: %s) {
+        id
+        prefix
+      }
+      outer: prefixes(contains: %s) {
+        id
+        prefix
+      }
+    }
+    """ % (json.dumps(cidr), json.dumps(network_address))
+            async with semaphore:
+                result = await nautobot_service.graphql_query(query)
+            data = result.get("data") or {}
+            candidates = []
+            for record in (data.get("inner") or []) + (data.get("outer") or []):
+                try:
+                    network = ipaddress.ip_network(record["prefix"], strict=False)
+                except (KeyError, TypeError, ValueError):
+                    continue
+                candidates.append((record.get("id"), network))
+            return candidates
+
+        results = await asyncio.gather(*(lookup(cidr) for cidr in cidrs))
+        return dict(zip(cidrs, results))
+
+    @staticmethod
+    def _best_parent_prefix(
+        ip: str, candidates: List[Tuple[str, Any]]
+    ) -> Optional[Tuple[str, Any]]:
+        """Return the most specific candidate prefix that contains *ip*."""
+        address = ipaddress.ip_address(ip)
+        containing = [
+            (prefix_id, network)
+            for prefix_id, network in candidates
+            if address.version == network.version and address in network
+        ]
+        if not containing:
+            return None
+        return max(containing, key=lambda candidate: candidate[1].prefixlen)
 
     def _update_prefix_last_scan(
         self,
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 import service_factory
 from models.snapshots import SnapshotExecuteRequest, SnapshotResponse
 from repositories.snapshots import SnapshotRepository, SnapshotTemplateRepository
+from services.git.file_catalog import invalidate_file_catalog
 from services.git.paths import repo_path
 from services.git.repository_service import (
     GitRepositoryService as GitRepositoryManager,
@@ -116,6 +117,7 @@ class SnapshotExecutionService:
 
             # Write content to file
             full_path.write_text(content, encoding="utf-8")
+            invalidate_file_catalog(git_repo_id)
             logger.info("Wrote snapshot to %s", full_path)
 
             # Commit and push the file
@@ -1,6 +1,14 @@
 """
 Cache service using Redis for persistent, distributed caching.
 Supports TTL, namespaces, statistics tracking, and works across multiple processes.
+
+Key enumeration never uses ``KEYS``: admin views and namespace invalidation
+walk either a per-namespace index (``<prefix>-zindex:<namespace>``, kept up
+to date by every write through this service) or cursor-based ``SCAN``, so
+they stay proportional to the cache and never block the Redis server that is
+shared with Celery.  The index is a sorted set scored by each key's expiry
+time; every write trims members whose key has expired, so the index does not
+outgrow the live entries of its namespace.
 """
 
 from __future__ import annotations
@@ -8,12 +16,37 @@ from __future__ import annotations
 import json
 import logging
 import time
-from typing import Any, Dict, List, Optional
+import uuid
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import redis
 
 logger = logging.getLogger(__name__)
 
+# Number of commands sent per pipeline round-trip in bulk writes.
+DEFAULT_PIPELINE_CHUNK_SIZE = 500
+
+# COUNT hint for SCAN/SSCAN cursors and batch size for per-key lookups.
+DEFAULT_SCAN_BATCH_SIZE = 500
+
+# Deletes a lock only while it still holds the caller's token.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class RedisCacheService:
     """Redis-based cache service with automatic serialization and TTL support."""
@@ -23,6 +56,8 @@ class RedisCacheService:
         redis_url: str,
         key_prefix: str = "cockpit-cache",
         ssl_params: Optional[Dict] = None,
+        use_namespace_index: bool = True,
+        scan_batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
     ):
         """Initialize Redis cache service.
 
@@ -30,6 +65,9 @@ class RedisCacheService:
             redis_url: Redis connection URL (use rediss:// scheme for TLS)
             key_prefix: Prefix for all cache keys to avoid collisions
             ssl_params: Optional SSL kwargs forwarded to redis.from_url()
+            use_namespace_index: Track keys in per-namespace sorted sets so that
+                enumeration is O(namespace); when False, fall back to SCAN
+            scan_batch_size: COUNT hint for SCAN cursors and lookup batches
         """
         self._redis = redis.from_url(
             redis_url, decode_responses=True, **(ssl_params or {})
@@ -37,6 +75,13 @@ class RedisCacheService:
         self._prefix = key_prefix
         self._stats_key = f"{key_prefix}:stats"
         self._start_time_key = f"{key_prefix}:start_time"
+        self._index_prefix = f"{key_prefix}-zindex"
+        self._index_built_key = f"{key_prefix}-zindex-built"
+        # Plain-set index of earlier versions, dropped when the index is rebuilt
+        self._legacy_index_prefix = f"{key_prefix}-index"
+        self._lock_prefix = f"{key_prefix}-lock"
+        self._use_index = use_namespace_index
+        self._scan_batch_size = scan_batch_size
 
         # Initialize start time if not set
         if not self._redis.exists(self._start_time_key):
@@ -48,10 +93,190 @@ class RedisCacheService:
         """Generate full Redis key with prefix."""
         return f"{self._prefix}:{key}"
 
+    def _user_key(self, redis_key: str) -> str:
+        """Strip the prefix from a full Redis key."""
+        if redis_key.startswith(f"{self._prefix}:"):
+            return redis_key[len(self._prefix) + 1 :]
+        return redis_key
+
+    @staticmethod
+    def _namespace_of(key: str) -> str:
+        """Top-level namespace of a user-facing key."""
+        return key.split(":")[0] if ":" in key else "default"
+
+    def _index_key(self, namespace: str) -> str:
+        """Redis key of the sorted set indexing a top-level namespace."""
+        return f"{self._index_prefix}:{namespace}"
+
+    def _index_entries(self, pipe, entries: Mapping[str, int]) -> None:
+        """Queue index updates for ``{key: ttl_seconds}`` on *pipe*.
+
+        Members are scored with their expiry time; members that expired
+        before now are trimmed from each touched namespace.
+        """
+        now = time.time()
+        by_namespace: Dict[str, Dict[str, float]] = {}
+        for key, ttl_seconds in entries.items():
+            by_namespace.setdefault(self._namespace_of(key), {})[key] = (
+                now + ttl_seconds if ttl_seconds >= 0 else float("inf")
+            )
+        for namespace, members in by_namespace.items():
+            index_key = self._index_key(namespace)
+            pipe.zadd(index_key, members)
+            pipe.zremrangebyscore(index_key, "-inf", now)
+
     def _incr_stat(self, stat_name: str, amount: int = 1):
         """Increment a statistics counter."""
         self._redis.hincrby(self._stats_key, stat_name, amount)
 
+    # ------------------------------------------------------------------
+    # Key enumeration (SCAN / namespace index)
+    # ------------------------------------------------------------------
+
+    def _scan(self, pattern: str) -> Iterator[str]:
+        """Iterate keys matching ``pattern`` with a non-blocking SCAN cursor."""
+        return self._redis.scan_iter(match=pattern, count=self._scan_batch_size)
+
+    def _ensure_index(self) -> None:
+        """Build the namespace index once if it has never been built."""
+        if not self._redis.exists(self._index_built_key):
+            self.rebuild_namespace_index()
+
+    def rebuild_namespace_index(self) -> int:
+        """Rebuild the per-namespace index from a full SCAN.
+
+        Runs automatically the first time the index is needed (or after the
+        Redis data set was flushed). Later writes keep the index current.
+
+        Returns:
+            Number of keys indexed
+        """
+        excluded = {self._stats_key, self._start_time_key}
+        indexed = 0
+        keys = (k for k in self._scan(f"{self._prefix}:*") if k not in excluded)
+        for batch in self._batched(keys):
+            ttl_pipe = self._redis.pipeline(transaction=False)
+            for redis_key in batch:
+                ttl_pipe.ttl(redis_key)
+            ttls = ttl_pipe.execute(raise_on_error=False)
+            live = {
+                self._user_key(redis_key): ttl
+                for redis_key, ttl in zip(batch, ttls)
+                if isinstance(ttl, int) and ttl != -2
+            }
+            if live:
+                pipe = self._redis.pipeline(transaction=False)
+                self._index_entries(pipe, live)
+                pipe.execute()
+                indexed += len(live)
+
+        for batch in self._batched(self._scan(f"{self._legacy_index_prefix}:*")):
+            self._redis.delete(*batch)
+        self._redis.set(self._index_built_key, str(time.time()))
+        logger.info("Rebuilt cache namespace index with %s keys", indexed)
+        return indexed
+
+    def _indexed_namespaces(self) -> Iterator[str]:
+        """Iterate top-level namespaces that have an index set."""
+        for index_key in self._scan(f"{self._index_prefix}:*"):
+            yield index_key[len(self._index_prefix) + 1 :]
+
+    def _iter_keys(self, namespace: Optional[str] = None) -> Iterator[str]:
+        """Iterate full Redis keys of cache entries, optionally in a namespace.
+
+        Index members may refer to keys that have since expired; callers that
+        need live keys only should filter through ``_describe_keys``.
+        """
+        if namespace is None:
+            if self._use_index:
+                self._ensure_index()
+                for top_level in list(self._indexed_namespaces()):
+                    for member, _ in self._redis.zscan_iter(
+                        self._index_key(top_level), count=self._scan_batch_size
+                    ):
+                        yield self._make_key(member)
+                return
+            excluded = {self._stats_key, self._start_time_key}
+            for redis_key in self._scan(f"{self._prefix}:*"):
+                if redis_key not in excluded:
+                    yield redis_key
+            return
+
+        if self._use_index:
+            self._ensure_index()
+            for member, _ in self._redis.zscan_iter(
+                self._index_key(namespace.split(":", 1)[0]),
+                match=f"{namespace}:*",
+                count=self._scan_batch_size,
+            ):
+                yield self._make_key(member)
+            return
+        yield from self._scan(self._make_key(f"{namespace}:*"))
+
+    def _batched(self, keys: Iterable[str]) -> Iterator[List[str]]:
+        """Group keys into lists of at most ``scan_batch_size``."""
+        batch: List[str] = []
+        for key in keys:
+            batch.append(key)
+            if len(batch) >= self._scan_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _describe_keys(
+        self, redis_keys: Iterable[str], with_size: bool = True
+    ) -> Iterator[Tuple[str, int, int]]:
+        """Yield (redis_key, ttl, size_bytes) for keys that still exist.
+
+        TTL and memory usage are fetched in pipelined batches. Keys that have
+        expired are dropped from the namespace index as they are found.
+        """
+        for batch in self._batched(redis_keys):
+            pipe = self._redis.pipeline(transaction=False)
+            for redis_key in batch:
+                pipe.ttl(redis_key)
+                if with_size:
+                    pipe.memory_usage(redis_key)
+            results = pipe.execute(raise_on_error=False)
+
+            step = 2 if with_size else 1
+            expired: Dict[str, List[str]] = {}
+            for i, redis_key in enumerate(batch):
+                ttl = results[i * step]
+                if isinstance(ttl, Exception) or ttl == -2:
+                    user_key = self._user_key(redis_key)
+                    expired.setdefault(self._namespace_of(user_key), []).append(
+                        user_key
+                    )
+                    continue
+                size = results[i * step + 1] if with_size else 0
+                if isinstance(size, Exception) or not size:
+                    size = 0
+                yield redis_key, ttl, size
+
+            if expired and self._use_index:
+                for namespace, members in expired.items():
+                    self._redis.zrem(self._index_key(namespace), *members)
+
+    def _delete_keys(self, redis_keys: Iterable[str]) -> int:
+        """Delete keys in pipelined batches and remove them from the index."""
+        count = 0
+        for batch in self._batched(redis_keys):
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.delete(*batch)
+            if self._use_index:
+                by_namespace: Dict[str, List[str]] = {}
+                for redis_key in batch:
+                    user_key = self._user_key(redis_key)
+                    by_namespace.setdefault(self._namespace_of(user_key), []).append(
+                        user_key
+                    )
+                for namespace, members in by_namespace.items():
+                    pipe.zrem(self._index_key(namespace), *members)
+            count += pipe.execute()[0]
+        return count
+
     def get(self, key: str) -> Optional[Any]:
         """Get cached value by key.
 
@@ -95,15 +320,102 @@ class RedisCacheService:
             redis_key = self._make_key(key)
             # Serialize to JSON
             serialized = json.dumps(data)
-            # Set with expiration
-            self._redis.setex(redis_key, ttl_seconds, serialized)
-            self._incr_stat("created")
+            # Set with expiration, index the key and count it in one round-trip
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.setex(redis_key, ttl_seconds, serialized)
+            if self._use_index:
+                self._index_entries(pipe, {key: ttl_seconds})
+            pipe.hincrby(self._stats_key, "created", 1)
+            pipe.execute()
 
         except (TypeError, ValueError) as e:
             logger.error("Failed to serialize cache data for key '%s': %s", key, e)
         except Exception as e:
             logger.error("Cache set error for key '%s': %s", key, e)
 
+    def set_many(
+        self,
+        items: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]],
+        ttl_seconds: int,
+        chunk_size: int = DEFAULT_PIPELINE_CHUNK_SIZE,
+    ) -> int:
+        """Set many cache values with the same TTL using pipelined writes.
+
+        Entries are sent as ``SETEX`` commands (plus the namespace index
+        update) in non-transactional pipelines of ``chunk_size`` entries, and
+        the ``created`` statistic is incremented once for the whole batch
+        instead of once per key.
+
+        Args:
+            items: Mapping or iterable of (key, data) pairs (keys without prefix)
+            ttl_seconds: Time to live in seconds
+            chunk_size: Number of entries per pipeline round-trip
+
+        Returns:
+            Number of entries written
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        pairs = items.items() if isinstance(items, Mapping) else items
+        written = 0
+        pending: Dict[str, int] = {}
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+
+            def flush() -> int:
+                if self._use_index:
+                    self._index_entries(pipe, pending)
+                pipe.execute()
+                count = len(pending)
+                pending.clear()
+                return count
+
+            for key, data in pairs:
+                try:
+                    serialized = json.dumps(data)
+                except (TypeError, ValueError) as e:
+                    logger.error(
+                        "Failed to serialize cache data for key '%s': %s", key, e
+                    )
+                    continue
+
+                pipe.setex(self._make_key(key), ttl_seconds, serialized)
+                pending[key] = ttl_seconds
+                if len(pending) >= chunk_size:
+                    written += flush()
+
+            if pending:
+                written += flush()
+
+        except Exception as e:
+            logger.error("Cache set_many error after %s entries: %s", written, e)
+
+        if written:
+            try:
+                self._incr_stat("created", written)
+            except Exception as e:
+                logger.error("Cache stats update error: %s", e)
+        return written
+
+    def stage_list(
+        self,
+        key: str,
+        ttl_seconds: int,
+        envelope: Optional[Mapping[str, Any]] = None,
+        field: str = "items",
+    ) -> StagedList:
+        """Start writing a list value piece by piece (see :class:`StagedList`).
+
+        Args:
+            key: Cache key (without prefix)
+            ttl_seconds: Time to live in seconds
+            envelope: When given, the value is this object with the list
+                stored under *field*, instead of the bare list
+            field: Name of the list in *envelope*
+        """
+        return StagedList(self, key, ttl_seconds, envelope, field)
+
     def delete(self, key: str) -> bool:
         """Delete a specific cache entry by key.
 
@@ -115,7 +427,7 @@ class RedisCacheService:
         """
         try:
             redis_key = self._make_key(key)
-            deleted = self._redis.delete(redis_key)
+            deleted = self._delete_keys([redis_key])
             if deleted:
                 self._incr_stat("cleared")
                 return True
@@ -125,6 +437,50 @@ class RedisCacheService:
             logger.error("Cache delete error for key '%s': %s", key, e)
             return False
 
+    def acquire_lock(self, key: str, ttl_seconds: int) -> Optional[str]:
+        """Try to take the short-lived rebuild lock of a cache key.
+
+        Locks live outside the cache prefix, so they never show up as entries.
+
+        Args:
+            key: Cache key (without prefix) the lock guards
+            ttl_seconds: Seconds after which an abandoned lock expires
+
+        Returns:
+            Token to pass to release_lock(), or None if the lock is held
+            elsewhere or Redis is unreachable
+        """
+        token = uuid.uuid4().hex
+        try:
+            if self._redis.set(
+                f"{self._lock_prefix}:{key}", token, nx=True, ex=ttl_seconds
+            ):
+                return token
+            return None
+        except Exception as e:
+            logger.error("Cache lock error for key '%s': %s", key, e)
+            return None
+
+    def release_lock(self, key: str, token: str) -> bool:
+        """Release a lock taken by acquire_lock() unless it has changed hands."""
+        try:
+            return bool(
+                self._redis.eval(
+                    _RELEASE_LOCK_SCRIPT, 1, f"{self._lock_prefix}:{key}", token
+                )
+            )
+        except Exception as e:
+            logger.error("Cache unlock error for key '%s': %s", key, e)
+            return False
+
+    def is_locked(self, key: str) -> bool:
+        """Return True while some process holds the lock of a cache key."""
+        try:
+            return bool(self._redis.exists(f"{self._lock_prefix}:{key}"))
+        except Exception as e:
+            logger.error("Cache lock check error for key '%s': %s", key, e)
+            return False
+
     def clear_namespace(self, namespace: str) -> int:
         """Clear all entries in a namespace.
 
@@ -135,16 +491,11 @@ class RedisCacheService:
             Number of keys deleted
         """
         try:
-            # Pattern to match namespace
-            pattern = self._make_key(f"{namespace}:*")
-            keys = self._redis.keys(pattern)
-
-            if keys:
-                count = self._redis.delete(*keys)
+            count = self._delete_keys(self._iter_keys(namespace))
+            if count:
                 self._incr_stat("cleared", count)
                 logger.info("Cleared %s keys from namespace '%s'", count, namespace)
-                return count
-            return 0
+            return count
 
         except Exception as e:
             logger.error("Cache clear_namespace error for '%s': %s", namespace, e)
@@ -157,20 +508,22 @@ class RedisCacheService:
             Number of keys deleted
         """
         try:
-            # Get all cache keys except stats
-            pattern = f"{self._prefix}:*"
-            keys = self._redis.keys(pattern)
-
-            # Exclude stats and start_time keys
+            # SCAN rather than the index so untracked keys are removed too
             excluded = {self._stats_key, self._start_time_key}
-            keys = [k for k in keys if k not in excluded]
+            keys = (k for k in self._scan(f"{self._prefix}:*") if k not in excluded)
+            count = self._delete_keys(keys)
+
+            # Every entry is gone, so the (now empty) index is complete
+            if self._use_index:
+                for prefix in (self._index_prefix, self._legacy_index_prefix):
+                    for batch in self._batched(self._scan(f"{prefix}:*")):
+                        self._redis.delete(*batch)
+                self._redis.set(self._index_built_key, str(time.time()))
 
-            if keys:
-                count = self._redis.delete(*keys)
+            if count:
                 self._incr_stat("cleared", count)
                 logger.info("Cleared all cache: %s keys deleted", count)
-                return count
-            return 0
+            return count
 
         except Exception as e:
             logger.error("Cache clear_all error: %s", e)
@@ -181,12 +534,6 @@ class RedisCacheService:
         try:
             now = time.time()
 
-            # Get all cache keys (excluding stats)
-            pattern = f"{self._prefix}:*"
-            all_keys = self._redis.keys(pattern)
-            excluded = {self._stats_key, self._start_time_key}
-            cache_keys = [k for k in all_keys if k not in excluded]
-
             # Get stats from Redis hash
             stats_data = self._redis.hgetall(self._stats_key)
             hits = int(stats_data.get("hits", 0))
@@ -198,56 +545,29 @@ class RedisCacheService:
             start_time_str = self._redis.get(self._start_time_key)
             start_time = float(start_time_str) if start_time_str else now
 
-            # Calculate total size (approximate using Redis memory usage)
+            # Walk live cache keys once: total size, namespaces, user keys
             total_size = 0
-            for key in cache_keys:
-                try:
-                    # Get memory usage for this key
-                    mem = self._redis.memory_usage(key)
-                    if mem:
-                        total_size += mem
-                except Exception:
-                    pass
-
-            # Group by namespace
             namespaces = {}
-            for key in cache_keys:
-                # Remove prefix to get user-facing key
-                user_key = (
-                    key[len(self._prefix) + 1 :]
-                    if key.startswith(f"{self._prefix}:")
-                    else key
-                )
-                namespace = user_key.split(":")[0] if ":" in user_key else "default"
-
+            user_keys = []
+            for redis_key, _ttl, size in self._describe_keys(self._iter_keys()):
+                user_key = self._user_key(redis_key)
+                namespace = self._namespace_of(user_key)
                 if namespace not in namespaces:
                     namespaces[namespace] = {"count": 0, "size_bytes": 0}
                 namespaces[namespace]["count"] += 1
-
-                # Add memory usage to namespace
-                try:
-                    mem = self._redis.memory_usage(key)
-                    if mem:
-                        namespaces[namespace]["size_bytes"] += mem
-                except Exception:
-                    pass
+                namespaces[namespace]["size_bytes"] += size
+                total_size += size
+                user_keys.append(user_key)
 
             # Calculate hit rate
             total_requests = hits + misses
             hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
 
-            # Get user-facing keys (without prefix)
-            user_keys = [
-                k[len(self._prefix) + 1 :]
-                for k in cache_keys
-                if k.startswith(f"{self._prefix}:")
-            ]
-
             return {
                 "overview": {
-                    "total_items": len(cache_keys),
+                    "total_items": len(user_keys),
                     "valid_items": len(
-                        cache_keys
+                        user_keys
                     ),  # Redis auto-expires, so all are valid
                     "expired_items": 0,  # Redis handles expiration automatically
                     "total_size_bytes": total_size,
@@ -285,39 +605,16 @@ class RedisCacheService:
             List of cache entry details
         """
         try:
-            time.time()
             entries = []
 
-            # Get all cache keys
-            pattern = f"{self._prefix}:*"
-            all_keys = self._redis.keys(pattern)
-            excluded = {self._stats_key, self._start_time_key}
-            cache_keys = [k for k in all_keys if k not in excluded]
-
-            for redis_key in cache_keys:
+            for redis_key, ttl, size_bytes in self._describe_keys(self._iter_keys()):
                 # Get user-facing key
-                user_key = (
-                    redis_key[len(self._prefix) + 1 :]
-                    if redis_key.startswith(f"{self._prefix}:")
-                    else redis_key
-                )
-                namespace = user_key.split(":")[0] if ":" in user_key else "default"
-
-                # Get TTL
-                ttl = self._redis.ttl(redis_key)
-                if ttl < 0:
-                    ttl = -1  # -1 means no expiration, -2 means doesn't exist
-
-                # Get memory usage
-                try:
-                    size_bytes = self._redis.memory_usage(redis_key) or 0
-                except Exception:
-                    size_bytes = 0
+                user_key = self._user_key(redis_key)
 
                 entries.append(
                     {
                         "key": user_key,
-                        "namespace": namespace,
+                        "namespace": self._namespace_of(user_key),
                         "created_at": 0,  # Not tracked in Redis version
                         "expires_at": 0,  # Not available
                         "last_accessed": 0,  # Not tracked
@@ -351,33 +648,13 @@ class RedisCacheService:
             entries = []
             total_size = 0
 
-            # Get keys matching this namespace
-            pattern = self._make_key(f"{namespace}:*")
-            keys = self._redis.keys(pattern)
-
-            for redis_key in keys:
-                # Get user-facing key
-                user_key = (
-                    redis_key[len(self._prefix) + 1 :]
-                    if redis_key.startswith(f"{self._prefix}:")
-                    else redis_key
-                )
-
-                # Get TTL
-                ttl = self._redis.ttl(redis_key)
-                if ttl < 0:
-                    ttl = -1
-
-                # Get memory usage
-                try:
-                    size_bytes = self._redis.memory_usage(redis_key) or 0
-                    total_size += size_bytes
-                except Exception:
-                    size_bytes = 0
-
+            for redis_key, ttl, size_bytes in self._describe_keys(
+                self._iter_keys(namespace)
+            ):
+                total_size += size_bytes
                 entries.append(
                     {
-                        "key": user_key,
+                        "key": self._user_key(redis_key),
                         "created_at": 0,
                         "expires_at": 0,
                         "last_accessed": 0,
@@ -428,10 +705,9 @@ class RedisCacheService:
             uptime = now - start_time
 
             # Get current entry count
-            pattern = f"{self._prefix}:*"
-            all_keys = self._redis.keys(pattern)
-            excluded = {self._stats_key, self._start_time_key}
-            cache_keys = [k for k in all_keys if k not in excluded]
+            current_entries = sum(
+                1 for _ in self._describe_keys(self._iter_keys(), with_size=False)
+            )
 
             total_requests = hits + misses
 
@@ -449,7 +725,7 @@ class RedisCacheService:
                 "expired_entries": 0,  # Redis handles automatically
                 "entries_created": created,
                 "entries_cleared": cleared,
-                "current_entries": len(cache_keys),
+                "current_entries": current_entries,
             }
 
         except Exception as e:
@@ -475,3 +751,87 @@ class RedisCacheService:
         """
         logger.info("cleanup_expired called - Redis handles expiration automatically")
         return 0
+
+
+class StagedList:
+    """A list cache value written in pieces and published by :meth:`commit`.
+
+    Each :meth:`extend` appends its items as JSON to a staging key, so only
+    the items of one call are held in memory.  :meth:`commit` renames the
+    staging key over the cache key: readers see either the previous value
+    or the complete new one.  A staging key left behind by a crash expires
+    with the TTL of the value.
+    """
+
+    def __init__(
+        self,
+        cache: RedisCacheService,
+        key: str,
+        ttl_seconds: int,
+        envelope: Optional[Mapping[str, Any]],
+        field: str,
+    ):
+        self._cache = cache
+        self._key = key
+        self._ttl = ttl_seconds
+        self._staging_key = f"{cache._make_key(key)}:staging:{uuid.uuid4().hex}"
+        if envelope is None:
+            self._head, self._tail = "[", "]"
+        else:
+            document = {k: v for k, v in envelope.items() if k != field}
+            document[field] = []
+            # '{..., "<field>": []}' is split around the empty list
+            self._head, self._tail = json.dumps(document)[:-2], "]}"
+        self.count = 0
+        self._failed = False
+
+    def extend(self, items: Iterable[Any]) -> int:
+        """Append *items*. Returns the number appended."""
+        if self._failed:
+            return 0
+        try:
+            parts = [json.dumps(item) for item in items]
+            if not parts:
+                return 0
+            pipe = self._cache._redis.pipeline(transaction=False)
+            pipe.append(
+                self._staging_key,
+                (self._head if not self.count else ",") + ",".join(parts),
+            )
+            pipe.expire(self._staging_key, self._ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.error("Failed to stage cache data for key '%s': %s", self._key, e)
+            self._failed = True
+            return 0
+        self.count += len(parts)
+        return len(parts)
+
+    def commit(self) -> bool:
+        """Publish the list under its key. False if it could not be written."""
+        if self._failed:
+            self.discard()
+            return False
+        try:
+            pipe = self._cache._redis.pipeline(transaction=True)
+            pipe.append(
+                self._staging_key, self._tail if self.count else self._head + self._tail
+            )
+            pipe.rename(self._staging_key, self._cache._make_key(self._key))
+            pipe.expire(self._cache._make_key(self._key), self._ttl)
+            if self._cache._use_index:
+                self._cache._index_entries(pipe, {self._key: self._ttl})
+            pipe.hincrby(self._cache._stats_key, "created", 1)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error("Cache commit error for key '%s': %s", self._key, e)
+            self.discard()
+            return False
+
+    def discard(self) -> None:
+        """Drop what was staged; the cached value is left as it is."""
+        try:
+            self._cache._redis.delete(self._staging_key)
+        except Exception as e:
+            logger.debug("Could not drop staged cache data for '%s': %s", self._key, e)
@@ -22,13 +22,18 @@ from services.settings.nautobot_service import NautobotSettingsService
 from services.settings.network_defaults_service import NetworkDefaultsService
 from services.settings.oidc_service import OidcService
 from services.settings.server_defaults_service import ServerDefaultsService
+from services.settings.settings_cache import settings_cache
 from services.settings.system_service import SystemSettingsService
 
 logger = logging.getLogger(__name__)
 
 
 class SettingsManager:
-    """Thin facade over domain-scoped settings services."""
+    """Thin facade over domain-scoped settings services.
+
+    Reads are served from the process-wide ``settings_cache``; every update
+    invalidates the changed section in all processes.
+    """
 
     def __init__(self) -> None:
         try:
@@ -61,22 +66,31 @@ class SettingsManager:
         env_settings = nautobot_settings_from_env()
         if env_settings:
             return env_settings
-        return self._nautobot.get()
+        return settings_cache.get("nautobot", self._nautobot.get)
 
     def update_nautobot_settings(self, settings: Dict[str, Any]) -> bool:
-        return self._nautobot.update(settings)
+        try:
+            return self._nautobot.update(settings)
+        finally:
+            settings_cache.invalidate("nautobot")
 
     def get_network_defaults(self) -> Dict[str, Any]:
-        return self._network_defaults.get()
+        return settings_cache.get("network_defaults", self._network_defaults.get)
 
     def update_network_defaults(self, defaults: Dict[str, Any]) -> bool:
-        return self._network_defaults.update(defaults)
+        try:
+            return self._network_defaults.update(defaults)
+        finally:
+            settings_cache.invalidate("network_defaults")
 
     def get_server_defaults(self) -> Dict[str, Any]:
-        return self._server_defaults.get()
+        return settings_cache.get("server_defaults", self._server_defaults.get)
 
     def update_server_defaults(self, defaults: Dict[str, Any]) -> bool:
-        return self._server_defaults.update(defaults)
+        try:
+            return self._server_defaults.update(defaults)
+        finally:
+            settings_cache.invalidate("server_defaults")
 
     # --- CheckMK ---
 
@@ -86,37 +100,52 @@ class SettingsManager:
         env_settings = checkmk_settings_from_env()
         if env_settings:
             return env_settings
-        return self._checkmk.get()
+        return settings_cache.get("checkmk", self._checkmk.get)
 
     def update_checkmk_settings(self, settings: Dict[str, Any]) -> bool:
-        return self._checkmk.update(settings)
+        try:
+            return self._checkmk.update(settings)
+        finally:
+            settings_cache.invalidate("checkmk")
 
     # --- Cache ---
 
     def get_cache_settings(self) -> Dict[str, Any]:
-        return self._cache.get()
+        return settings_cache.get("cache", self._cache.get)
 
     def update_cache_settings(self, settings: Dict[str, Any]) -> bool:
-        return self._cache.update(settings)
+        try:
+            return self._cache.update(settings)
+        finally:
+            settings_cache.invalidate("cache")
 
     # --- Celery ---
 
     def get_celery_settings(self) -> Dict[str, Any]:
-        return self._celery.get()
+        return settings_cache.get("celery", self._celery.get)
 
     def update_celery_settings(self, settings: Dict[str, Any]) -> bool:
-        return self._celery.update(settings)
+        try:
+            return self._celery.update(settings)
+        finally:
+            settings_cache.invalidate("celery")
 
     def ensure_builtin_queues(self) -> bool:
-        return self._celery.ensure_builtin_queues()
+        try:
+            return self._celery.ensure_builtin_queues()
+        finally:
+            settings_cache.invalidate("celery")
 
     # --- Agents ---
 
     def get_agents_settings(self) -> Dict[str, Any]:
-        return self._agents.get()
+        return settings_cache.get("agents", self._agents.get)
 
     def update_agents_settings(self, settings: Dict[str, Any]) -> bool:
-        return self._agents.update(settings)
+        try:
+            return self._agents.update(settings)
+        finally:
+            settings_cache.invalidate("agents")
 
     # --- OIDC ---
 
@@ -167,4 +196,7 @@ class SettingsManager:
         return self._system.health_check()
 
     def reset_to_defaults(self) -> bool:
-        return self._system.reset_to_defaults()
+        try:
+            return self._system.reset_to_defaults()
+        finally:
+            settings_cache.invalidate()
@@ -13,6 +13,7 @@ from repositories.settings.settings_repository import (
 )
 from services.settings.defaults import NetworkDefaults, ServerDefaults
 from services.settings.exceptions import ProfileValidationError
+from services.settings.settings_cache import settings_cache
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,9 @@ FIELD_KEYS = (
 
 BUILT_IN_KEYS = {"network": "Network", "server": "Server"}
 
+# settings_cache section served from each built-in profile row
+BUILT_IN_CACHE_SECTIONS = {"network": "network_defaults", "server": "server_defaults"}
+
 
 class ProfileService:
     def __init__(self) -> None:
@@ -83,7 +87,11 @@ class ProfileService:
                     )
                 update_kwargs["name"] = new_name
 
-        row = self._repo.update(profile_id, **update_kwargs)
+        try:
+            row = self._repo.update(profile_id, **update_kwargs)
+        finally:
+            if existing.built_in_key:
+                self._invalidate_defaults(existing.built_in_key)
         logger.info("Profile %s updated", profile_id)
         return self._to_dict(row)
 
@@ -121,8 +129,16 @@ class ProfileService:
             values["csv_quote_char"] = values["csv_quote_char"] or '"'
 
             self._repo.create(name=display_name, built_in_key=key, **values)
+            self._invalidate_defaults(key)
             logger.info("Seeded built-in '%s' profile", display_name)
 
+    @staticmethod
+    def _invalidate_defaults(built_in_key: str) -> None:
+        """Drop the cached defaults backed by a built-in profile in all processes."""
+        section = BUILT_IN_CACHE_SECTIONS.get(built_in_key)
+        if section:
+            settings_cache.invalidate(section)
+
     def _to_dict(self, row) -> Dict[str, Any]:
         data = {key: getattr(row, key) for key in FIELD_KEYS}
         data.update(
@@ -0,0 +1,206 @@
+"""Process-wide cache of settings read through SettingsManager.
+
+Settings live in PostgreSQL and change rarely, but hot paths such as
+``NautobotService._get_config`` read them on every request.  Each process
+keeps the last value of every settings section in memory.  Updates made
+through SettingsManager publish the changed section on a Redis pub/sub
+channel; every process (API workers and Celery workers alike) listens on
+that channel and drops its copy, so the next read goes to the database.
+
+Entries are versioned: a read that raced with an invalidation is returned
+but not stored.  While the listener is not connected (Redis down, or not
+yet subscribed) entries expire after a few seconds instead, so a process
+never serves settings much older than the last change it missed.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SETTINGS_CHANNEL = "cockpit-settings:changed"
+# Message meaning "every section changed"
+ALL_SECTIONS = "*"
+# Upper bound on the age of an entry while change notifications arrive
+DEFAULT_MAX_AGE = 300.0  # seconds
+# Age limit while notifications may be missed
+DEFAULT_UNSUBSCRIBED_MAX_AGE = 5.0  # seconds
+# Delay before the listener reconnects after losing Redis
+RECONNECT_DELAY = 5.0  # seconds
+
+
+def _default_redis():
+    import redis
+
+    from config import settings
+
+    return redis.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        socket_connect_timeout=2,
+        health_check_interval=30,
+        **settings.redis_ssl_params,
+    )
+
+
+class SettingsCache:
+    """In-memory settings sections, invalidated through Redis pub/sub."""
+
+    def __init__(
+        self,
+        redis_factory: Optional[Callable[[], Any]] = _default_redis,
+        channel: str = SETTINGS_CHANNEL,
+        max_age: float = DEFAULT_MAX_AGE,
+        unsubscribed_max_age: float = DEFAULT_UNSUBSCRIBED_MAX_AGE,
+    ):
+        """Initialize the cache; the listener starts with the first read.
+
+        Args:
+            redis_factory: Returns the Redis client used to publish and
+                listen, or None for a process-local cache
+            channel: Pub/sub channel carrying the changed section names
+            max_age: Seconds an entry is trusted while subscribed
+            unsubscribed_max_age: Seconds an entry is trusted otherwise
+        """
+        self._redis_factory = redis_factory
+        self._channel = channel
+        self._max_age = max_age
+        self._unsubscribed_max_age = unsubscribed_max_age
+        self._lock = threading.Lock()
+        # section -> (version, loaded_at, value)
+        self._entries: Dict[str, Tuple[Tuple[int, int], float, Any]] = {}
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._subscribed = False
+        self._listener_pid: Optional[int] = None
+        self._publisher = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, section: str, loader: Callable[[], Any]) -> Any:
+        """Return *section*, calling *loader* only if it is not cached.
+
+        The value is copied, so callers may modify what they get.
+        """
+        self._ensure_listening()
+        with self._lock:
+            version = self._version(section)
+            entry = self._entries.get(section)
+            max_age = self._max_age if self._subscribed else self._unsubscribed_max_age
+        if (
+            entry is not None
+            and entry[0] == version
+            and time.monotonic() - entry[1] < max_age
+        ):
+            return copy.deepcopy(entry[2])
+
+        value = loader()
+        with self._lock:
+            # Skip storing a value that an invalidation overtook meanwhile
+            if self._version(section) == version:
+                self._entries[section] = (version, time.monotonic(), value)
+        return copy.deepcopy(value)
+
+    def invalidate(self, *sections: str) -> None:
+        """Drop *sections* (all of them if none given) in every process."""
+        names = list(sections) or [ALL_SECTIONS]
+        self._drop(names)
+        client = self._publisher_client()
+        if client is None:
+            return
+        try:
+            for name in names:
+                client.publish(self._channel, name)
+        except Exception as e:
+            logger.warning("Could not publish settings change: %s", e)
+            self._publisher = None
+
+    def clear(self) -> None:
+        """Drop every section in this process only."""
+        self._drop([ALL_SECTIONS])
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _version(self, section: str) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(section, 0)
+
+    def _drop(self, sections) -> None:
+        with self._lock:
+            for section in sections:
+                if section == ALL_SECTIONS:
+                    self._epoch += 1
+                    self._entries.clear()
+                else:
+                    self._generations[section] = self._generations.get(section, 0) + 1
+                    self._entries.pop(section, None)
+
+    def _publisher_client(self):
+        if self._redis_factory is None:
+            return None
+        if self._publisher is None:
+            try:
+                self._publisher = self._redis_factory()
+            except Exception as e:
+                logger.warning("Could not connect to Redis for settings changes: %s", e)
+                return None
+        return self._publisher
+
+    def _ensure_listening(self) -> None:
+        if self._redis_factory is None or self._listener_pid == os.getpid():
+            return
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            # First read in this process, or in a forked child whose copy of
+            # the parent's entries cannot be trusted without a listener
+            self._listener_pid = os.getpid()
+            self._subscribed = False
+            self._publisher = None
+            self._epoch += 1
+            self._entries.clear()
+        threading.Thread(
+            target=self._listen, name="settings-cache-listener", daemon=True
+        ).start()
+
+    def _listen(self) -> None:
+        pid = os.getpid()
+        warned = False
+        while self._listener_pid == pid:
+            pubsub = None
+            try:
+                pubsub = self._redis_factory().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                # Changes made while unsubscribed were missed
+                self._drop([ALL_SECTIONS])
+                self._subscribed = True
+                warned = False
+                logger.debug("Listening for settings changes on %s", self._channel)
+                while self._listener_pid == pid:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._drop([message["data"]])
+            except Exception as e:
+                log = logger.debug if warned else logger.warning
+                log("Settings change listener disconnected: %s", e)
+                warned = True
+            finally:
+                self._subscribed = False
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            time.sleep(RECONNECT_DELAY)
+
+
+settings_cache = SettingsCache()
@@ -18,6 +18,7 @@ from models.backup_models import (
     GitStatus,
     TimestampUpdateStatus,
 )
+from services.git.file_catalog import invalidate_file_catalog
 from services.nautobot.configs.backup import DeviceBackupService
 
 logger = logging.getLogger(__name__)
@@ -76,6 +77,7 @@ def finalize_backup_task(
             repo_dir = Path(repo_config["repo_dir"])
             repository = repo_config["repository"]
             current_date = repo_config["current_date"]
+            invalidate_file_catalog(repository.get("id"))
 
             from git import Repo
 
@@ -162,6 +164,27 @@ def finalize_backup_task(
     return final_result
 
 
+def increment_job_progress(job_run_id: int, total_devices: int) -> None:
+    """Count one more finished device in the job run's Redis progress counter."""
+    try:
+        from celery_app import celery_app
+
+        redis_client = celery_app.backend.client
+        progress_key = f"cockpit-ng:job-progress:{job_run_id}"
+        completed = redis_client.incr(progress_key)
+        redis_client.expire(progress_key, 3600)  # Expire after 1 hour
+
+        progress_pct = int((completed / total_devices) * 100)
+        logger.info(
+            "Progress: %s/%s devices backed up (%s%%)",
+            completed,
+            total_devices,
+            progress_pct,
+        )
+    except Exception as e:
+        logger.warning("Failed to update progress counter: %s", e)
+
+
 @shared_task(name="tasks.backup_single_device_task", bind=True)
 def backup_single_device_task(
     self,
@@ -199,23 +222,7 @@ def backup_single_device_task(
     """
     # Update progress if job_run_id provided (Celery-specific functionality)
     if job_run_id:
-        try:
-            from celery_app import celery_app
-
-            redis_client = celery_app.backend.client
-            progress_key = f"cockpit-ng:job-progress:{job_run_id}"
-            completed = redis_client.incr(progress_key)
-            redis_client.expire(progress_key, 3600)  # Expire after 1 hour
-
-            progress_pct = int((completed / total_devices) * 100)
-            logger.info(
-                "Progress: %s/%s devices backed up (%s%%)",
-                completed,
-                total_devices,
-                progress_pct,
-            )
-        except Exception as e:
-            logger.warning("Failed to update progress counter: %s", e)
+        increment_job_progress(job_run_id, total_devices)
 
     # Delegate to service layer
     backup_service = DeviceBackupService()
@@ -505,6 +512,7 @@ def backup_devices_task(
 
         try:
             if backed_up_devices:
+                invalidate_file_catalog(repository.get("id"))
                 commit_message = f"Backup config {current_date}"
                 logger.info("Committing and pushing with message: '%s'", commit_message)
                 logger.info("  - Auth type: %s", repository.get("auth_type") or "token")
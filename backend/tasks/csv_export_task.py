@@ -179,6 +179,7 @@ def _run_csv_export(
             meta={"current": 60, "total": 100, "status": "Syncing Git repository..."},
         )
 
+        from services.git.file_catalog import invalidate_file_catalog
         from services.git.paths import repo_path as get_repo_path
         from services.git.shared_utils import git_repo_manager
 
@@ -214,6 +215,7 @@ def _run_csv_export(
 
         with open(full_file_path, "w", encoding="utf-8") as f:
             f.write(csv_content)
+        invalidate_file_catalog(repo_id)
 
         logger.info("Written CSV to %s", full_file_path)
 
@@ -9,6 +9,10 @@ backup_devices_task in tasks/backup_tasks.py (Path A) directly.
 Both execution paths delegate to DeviceBackupService.backup_single_device():
 - Parallel path (parallel_tasks > 1): via Celery chord using backup_single_device_task
 - Sequential path (parallel_tasks == 1): direct call to DeviceBackupService
+
+Agent-based backups (backup_agent_id set) run in this task: parallel_tasks > 1
+keeps that many devices in flight on the agent via
+DeviceBackupService.backup_devices_via_agent(); otherwise one device at a time.
 """
 
 import logging
@@ -17,8 +21,14 @@ from typing import Any, Dict, Optional
 
 from git.exc import GitCommandError
 
+from services.git.file_catalog import invalidate_file_catalog
+
 logger = logging.getLogger(__name__)
 
+# Devices per batch in windowed agent backups (one DB session and one
+# Nautobot query per batch)
+AGENT_BACKUP_BATCH_SIZE = 50
+
 
 def execute_backup(
     schedule_id: Optional[int],
@@ -376,8 +386,59 @@ def execute_backup(
 
         backup_service = DeviceBackupService()
 
-        # Agent-based backup: always sequential (one device at a time via agent)
-        if backup_agent_id:
+        # Agent-based backup, windowed: batches share one DB session and one
+        # Nautobot query, with up to parallel_tasks devices in flight
+        if backup_agent_id and parallel_tasks > 1:
+            logger.info(
+                "Using agent-based backup via agent %s (%s in flight, batches of %s)",
+                backup_agent_id,
+                parallel_tasks,
+                AGENT_BACKUP_BATCH_SIZE,
+            )
+
+            from core.database import get_db_session
+            from tasks.backup_tasks import increment_job_progress
+
+            completed = 0
+            for start in range(0, total_devices, AGENT_BACKUP_BATCH_SIZE):
+                batch = device_ids[start : start + AGENT_BACKUP_BATCH_SIZE]
+                db = get_db_session()
+                try:
+                    for device_backup_info in backup_service.backup_devices_via_agent(
+                        agent_id=backup_agent_id,
+                        db=db,
+                        device_ids=batch,
+                        repo_dir=repo_dir,
+                        credential_id=credential_id,
+                        current_date=current_date,
+                        backup_running_config_path=backup_running_config_path,
+                        backup_startup_config_path=backup_startup_config_path,
+                        max_in_flight=parallel_tasks,
+                        start_index=start + 1,
+                        total_devices=total_devices,
+                    ):
+                        info_dict = device_backup_info.to_dict()
+                        if device_backup_info.is_successful():
+                            backed_up_devices.append(info_dict)
+                        else:
+                            failed_devices.append(info_dict)
+
+                        completed += 1
+                        if job_run_id:
+                            increment_job_progress(job_run_id, total_devices)
+                        task_context.update_state(
+                            state="PROGRESS",
+                            meta={
+                                "current": 20 + int((completed / total_devices) * 70),
+                                "total": 100,
+                                "status": f"Backed up {completed}/{total_devices} devices via agent...",
+                            },
+                        )
+                finally:
+                    db.close()
+
+        # Agent-based backup, sequential (one device at a time via agent)
+        elif backup_agent_id:
             logger.info(
                 "Using agent-based backup via agent %s (sequential)", backup_agent_id
             )
@@ -537,6 +598,7 @@ def execute_backup(
 
         try:
             if backed_up_devices:
+                invalidate_file_catalog(repository.get("id"))
                 commit_message = f"Backup config {current_date}"
                 logger.info("Committing and pushing with message: '%s'", commit_message)
                 logger.info("  - Auth type: %s", repository.get("auth_type", "token"))
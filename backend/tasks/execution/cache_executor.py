@@ -81,11 +81,14 @@ def execute_cache_devices(
             meta={"current": 70, "total": 100, "status": "Caching device data..."},
         )
 
-        for device in devices:
-            device_id = device.get("id")
-            if device_id:
-                cache_key = f"nautobot:devices:{device_id}"
-                cache_service.set(cache_key, device, 30 * 60)
+        cache_service.set_many(
+            (
+                (f"nautobot:devices:{device['id']}", device)
+                for device in devices
+                if device.get("id")
+            ),
+            30 * 60,
+        )
 
         return {
             "success": True,
@@ -510,6 +510,10 @@ def execute_get_client_data(
         # Keep only the 5 most recent sessions to prevent unbounded table growth
         repo.delete_old_sessions(keep=5)
 
+        # Materialize the correlated view of this session for the client table
+        if arp_count or mac_count:
+            repo.refresh_client_data()
+
         logger.info("=" * 80)
         logger.info("GET CLIENT DATA COMPLETE")
         logger.info("Session ID: %s", session_id)
@@ -33,6 +33,7 @@ def import_or_update_from_csv_task(
     import_format: str = "generic",
     add_prefixes: bool = False,
     default_prefix_length: str | None = None,
+    pipelined: bool | None = None,
 ) -> dict:
     """Celery task wrapper — delegates to CsvImportService."""
     return _csv_import_service.run_import(
@@ -56,4 +57,5 @@ def import_or_update_from_csv_task(
         import_format=import_format,
         add_prefixes=add_prefixes,
         default_prefix_length=default_prefix_length,
+        pipelined=pipelined,
     )
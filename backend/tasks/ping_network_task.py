@@ -3,6 +3,7 @@ Ping Network Task for Celery
 Pings CIDR networks and optionally resolves DNS names.
 """
 
+import asyncio
 import ipaddress
 import logging
 import math
@@ -10,14 +11,33 @@ import os
 import socket
 import subprocess
 import tempfile
-from typing import Any, Dict, List, Set
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from celery import shared_task
 
 import service_factory
+from services.network.scanning.fping_shards import (
+    HostRange,
+    condense_ranges,
+    fping_shards,
+    host_range,
+)
 
 logger = logging.getLogger(__name__)
 
+# Reverse-DNS stage: lookups in flight, seconds to wait for one lookup, and how
+# long an answer (including "no name") is reused by later scans in this worker.
+DNS_RESOLVE_WORKERS = 32
+DNS_RESOLVE_TIMEOUT = 2.0
+DNS_CACHE_TTL = 600
+DNS_CACHE_MAX_ENTRIES = 65536
+
+_dns_cache: Dict[str, Tuple[float, str]] = {}
+_dns_cache_lock = threading.Lock()
+
 
 def _expand_cidr_to_ips(cidr: str) -> List[str]:
     """Convert CIDR notation to list of IP addresses."""
@@ -262,6 +282,46 @@ def _fping_networks(
     return alive_ips
 
 
+def _fping_sharded(
+    ranges: Dict[str, HostRange],
+    count: int = 3,
+    timeout: int = 500,
+    retry: int = 3,
+    interval: int = 10,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[Dict[str, List[str]], Dict[str, List[HostRange]]]:
+    """Ping host ranges with parallel fping processes, one shard at a time.
+
+    Args:
+        ranges: Host range per CIDR (see ``host_range``)
+        count, timeout, retry, interval: fping options, as for _fping_networks
+        on_progress: Called with (addresses scanned, alive so far) after
+            every shard
+
+    Returns:
+        Alive addresses (in address order) and unreachable ranges, per CIDR.
+    """
+    alive: Dict[str, List[str]] = {cidr: [] for cidr in ranges}
+    unreachable: Dict[str, List[HostRange]] = {cidr: [] for cidr in ranges}
+    scanned = 0
+    alive_count = 0
+
+    def ping(addresses: List[str]) -> Set[str]:
+        return _fping_networks(addresses, count, timeout, retry, interval)
+
+    for shard in fping_shards(ranges, ping):
+        alive[shard.cidr].extend(shard.alive)
+        unreachable[shard.cidr].extend(shard.unreachable())
+        scanned += len(shard.hosts)
+        alive_count += len(shard.alive)
+        if on_progress:
+            on_progress(scanned, alive_count)
+
+    for addresses in alive.values():
+        addresses.sort(key=ipaddress.ip_address)
+    return alive, unreachable
+
+
 def _resolve_dns(ip: str) -> str:
     """Resolve DNS name for an IP address."""
     try:
@@ -274,62 +334,84 @@ def _resolve_dns(ip: str) -> str:
         return ""
 
 
-def _condense_ip_ranges(ips: List[str]) -> List[str]:
-    """
-    Condense consecutive IP addresses into ranges.
-    Example: ['192.168.1.10', '192.168.1.11', '192.168.1.12'] -> ['192.168.1.10 - 12']
+def _resolve_dns_many(
+    ips: Iterable[str],
+    max_workers: int = DNS_RESOLVE_WORKERS,
+    timeout: float = DNS_RESOLVE_TIMEOUT,
+) -> Dict[str, str]:
+    """Resolve DNS names for many IP addresses concurrently.
+
+    Lookups run on a pool of ``max_workers`` threads. A lookup that takes
+    longer than ``timeout`` seconds yields "" (and is not cached); its thread
+    keeps its pool slot until ``gethostbyaddr`` returns, so a slow resolver
+    cannot push more than ``max_workers`` lookups at it. Answers are cached
+    for ``DNS_CACHE_TTL`` seconds.
+
+    Returns:
+        Hostname per IP address, "" when the address has no name.
     """
-    if not ips:
-        return []
-
-    # Sort IPs
-    sorted_ips = sorted(ips, key=lambda x: ipaddress.ip_address(x))
-
-    condensed = []
-    range_start = None
-    range_end = None
-    prev_ip_obj = None
-
-    for ip_str in sorted_ips:
-        ip_obj = ipaddress.ip_address(ip_str)
-
-        if prev_ip_obj is None:
-            # First IP in range
-            range_start = ip_str
-            range_end = ip_str
-        elif int(ip_obj) == int(prev_ip_obj) + 1:
-            # Consecutive IP - extend range
-            range_end = ip_str
-        else:
-            # Gap detected - save previous range and start new one
-            if range_start == range_end:
-                condensed.append(range_start)
+    results: Dict[str, str] = {}
+    pending: List[str] = []
+    now = time.monotonic()
+    with _dns_cache_lock:
+        for ip in dict.fromkeys(ips):
+            cached = _dns_cache.get(ip)
+            if cached and cached[0] > now:
+                results[ip] = cached[1]
             else:
-                # Extract last octet for condensed format
-                start_parts = range_start.split(".")
-                end_parts = range_end.split(".")
-                if start_parts[:3] == end_parts[:3]:
-                    condensed.append(f"{range_start} - {end_parts[3]}")
-                else:
-                    condensed.append(f"{range_start} - {range_end}")
-
-            range_start = ip_str
-            range_end = ip_str
-
-        prev_ip_obj = ip_obj
-
-    # Add final range
-    if range_start == range_end:
-        condensed.append(range_start)
-    else:
-        start_parts = range_start.split(".")
-        end_parts = range_end.split(".")
-        if start_parts[:3] == end_parts[:3]:
-            condensed.append(f"{range_start} - {end_parts[3]}")
-        else:
-            condensed.append(f"{range_start} - {range_end}")
+                pending.append(ip)
+
+    if not pending:
+        return results
 
-    return condensed
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(pending)), thread_name_prefix="dns"
+    )
+
+    async def resolve_all() -> Dict[str, str]:
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(max_workers)
+        resolved: Dict[str, str] = {}
+
+        async def resolve(ip: str) -> None:
+            await slots.acquire()
+            lookup = loop.run_in_executor(executor, _resolve_dns, ip)
+            lookup.add_done_callback(lambda _future: slots.release())
+            try:
+                resolved[ip] = await asyncio.wait_for(asyncio.shield(lookup), timeout)
+            except asyncio.TimeoutError:
+                logger.debug("DNS lookup for %s timed out after %ss", ip, timeout)
+                results[ip] = ""
+
+        await asyncio.gather(*(resolve(ip) for ip in pending))
+        return resolved
+
+    try:
+        resolved = asyncio.run(resolve_all())
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    expires = time.monotonic() + DNS_CACHE_TTL
+    with _dns_cache_lock:
+        if len(_dns_cache) + len(resolved) > DNS_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for ip in [ip for ip, (exp, _name) in _dns_cache.items() if exp <= now]:
+                del _dns_cache[ip]
+            while (
+                _dns_cache and len(_dns_cache) + len(resolved) > DNS_CACHE_MAX_ENTRIES
+            ):
+                del _dns_cache[next(iter(_dns_cache))]
+        for ip, hostname in resolved.items():
+            _dns_cache[ip] = (expires, hostname)
+
+    results.update(resolved)
+    logger.info(
+        "Resolved %s addresses (%s from cache, %s named)",
+        len(results),
+        len(results) - len(pending),
+        sum(1 for name in results.values() if name),
+    )
+    return results
 
 
 @shared_task(bind=True, name="tasks.ping_network_task")
@@ -382,85 +464,84 @@ def ping_network_task(
             resolve_dns,
         )
 
-        # Expand all CIDRs to IP lists
-        all_ips: List[str] = []
-        network_ips: Dict[str, List[str]] = {}
-
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "status": "Expanding CIDR networks...",
-                "current": 0,
-                "total": len(cidrs),
-                "networks_processed": 0,
-            },
-        )
-
-        for _idx, cidr in enumerate(cidrs):
+        # Host ranges per CIDR; addresses are only generated shard by shard
+        network_ranges: Dict[str, Optional[HostRange]] = {}
+        for cidr in cidrs:
             try:
-                cidr_ips = _expand_cidr_to_ips(cidr)
-                all_ips.extend(cidr_ips)
-                network_ips[cidr] = cidr_ips
-                logger.debug("Expanded %s to %s IPs", cidr, len(cidr_ips))
-            except Exception as e:
+                network_ranges[cidr] = host_range(cidr)
+            except ValueError as e:
                 logger.error("Failed to expand CIDR %s: %s", cidr, e)
-                network_ips[cidr] = []
+                network_ranges[cidr] = None
+
+        ranges = {cidr: hosts for cidr, hosts in network_ranges.items() if hosts}
+        total_ips = sum(len(hosts) for hosts in ranges.values())
 
-        # Ping all IPs using fping
         self.update_state(
             state="PROGRESS",
             meta={
-                "status": f"Pinging {len(all_ips)} IP addresses...",
+                "status": f"Pinging {total_ips} IP addresses...",
                 "current": 0,
-                "total": len(all_ips),
+                "total": total_ips,
                 "networks_processed": 0,
             },
         )
 
-        alive_ips = _fping_networks(all_ips, count, timeout, retry, interval)
+        def report(scanned: int, alive: int) -> None:
+            self.update_state(
+                state="PROGRESS",
+                meta={
+                    "status": f"Pinged {scanned}/{total_ips} IP addresses, "
+                    f"{alive} alive...",
+                    "current": scanned,
+                    "total": total_ips,
+                    "networks_processed": 0,
+                },
+            )
+
+        alive_by_network, unreachable_by_network = _fping_sharded(
+            ranges, count, timeout, retry, interval, on_progress=report
+        )
+        alive_ips = [ip for alive in alive_by_network.values() for ip in alive]
         logger.info(
-            "fping found %s alive hosts out of %s targets", len(alive_ips), len(all_ips)
+            "fping found %s alive hosts out of %s targets", len(alive_ips), total_ips
         )
 
-        # Process results per network
-        network_results: List[Dict[str, Any]] = []
-
-        for idx, (cidr, cidr_ips) in enumerate(network_ips.items()):
+        hostnames: Dict[str, str] = {}
+        if resolve_dns and alive_ips:
             self.update_state(
                 state="PROGRESS",
                 meta={
-                    "status": f"Processing network {idx + 1}/{len(cidrs)}...",
-                    "current": idx + 1,
-                    "total": len(cidrs),
-                    "networks_processed": idx,
+                    "status": f"Resolving DNS names for {len(alive_ips)} hosts...",
+                    "current": 0,
+                    "total": len(alive_ips),
+                    "networks_processed": 0,
                 },
             )
+            hostnames = _resolve_dns_many(alive_ips)
 
-            reachable: List[Dict[str, str]] = []
-            unreachable: List[str] = []
-
-            for ip in cidr_ips:
-                if ip in alive_ips:
-                    ip_data = {"ip": ip}
-                    if resolve_dns:
-                        hostname = _resolve_dns(ip)
-                        if hostname:
-                            ip_data["hostname"] = hostname
-                    reachable.append(ip_data)
-                else:
-                    unreachable.append(ip)
-
-            # Condense unreachable ranges
-            unreachable_condensed = _condense_ip_ranges(unreachable)
+        # Process results per network
+        network_results: List[Dict[str, Any]] = []
 
+        for cidr, hosts in network_ranges.items():
+            reachable: List[Dict[str, str]] = []
+            for ip in alive_by_network.get(cidr, []):
+                ip_data = {"ip": ip}
+                hostname = hostnames.get(ip)
+                if hostname:
+                    ip_data["hostname"] = hostname
+                reachable.append(ip_data)
+
+            total = len(hosts) if hosts else 0
             network_results.append(
                 {
                     "network": cidr,
-                    "total_ips": len(cidr_ips),
+                    "total_ips": total,
                     "reachable_count": len(reachable),
-                    "unreachable_count": len(unreachable),
+                    "unreachable_count": total - len(reachable),
                     "reachable": reachable,
-                    "unreachable": unreachable_condensed,
+                    "unreachable": condense_ranges(
+                        unreachable_by_network.get(cidr, [])
+                    ),
                 }
             )
 
@@ -468,9 +549,9 @@ def ping_network_task(
             "success": True,
             "networks": network_results,
             "total_networks": len(cidrs),
-            "total_ips_scanned": len(all_ips),
+            "total_ips_scanned": total_ips,
             "total_reachable": len(alive_ips),
-            "total_unreachable": len(all_ips) - len(alive_ips),
+            "total_unreachable": total_ips - len(alive_ips),
             "resolve_dns": resolve_dns,
         }
 
@@ -478,7 +559,7 @@ def ping_network_task(
         _jrs.mark_completed(job_run_id, result=result)
 
         logger.info(
-            "Ping network task completed: %s/%s reachable", len(alive_ips), len(all_ips)
+            "Ping network task completed: %s/%s reachable", len(alive_ips), total_ips
         )
         return result
 
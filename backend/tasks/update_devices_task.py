@@ -275,8 +275,8 @@ def update_devices_task(
                     # Log device update to audit log
                     if username and not dry_run:
                         try:
-                            from repositories.audit_log.audit_log_repository import (
-                                audit_log_repo,
+                            from repositories.audit_log.audit_log_writer import (
+                                audit_log_writer,
                             )
 
                             # Prepare extra data with updated fields
@@ -289,7 +289,7 @@ def update_devices_task(
                             if result["warnings"]:
                                 extra_data["warnings"] = result["warnings"]
 
-                            audit_log_repo.create_log(
+                            audit_log_writer.write(
                                 username=username,
                                 user_id=user_id,
                                 event_type="bulk-edit",
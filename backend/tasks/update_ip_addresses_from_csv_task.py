@@ -4,7 +4,7 @@ Celery task for updating Nautobot IP addresses from CSV data.
 This task handles CSV-formatted IP address updates and:
 1. Parses CSV content
 2. Looks up IP addresses by address + namespace combination
-3. Updates IP addresses using the Nautobot REST API
+3. Updates IP addresses using Nautobot REST bulk PATCH requests
 4. Tracks Celery progress
 5. Aggregates results
 
@@ -24,14 +24,18 @@ import csv
 import io
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import service_factory
 from celery_app import celery_app
 from services.nautobot import NautobotService
+from services.nautobot.common.utils import merge_update_data
 
 logger = logging.getLogger(__name__)
 
+# IP addresses whose notes are added at the same time
+NOTE_CONCURRENCY = 4
+
 
 @celery_app.task(name="tasks.update_ip_addresses_from_csv", bind=True)
 def update_ip_addresses_from_csv_task(
@@ -179,6 +183,7 @@ def update_ip_addresses_from_csv_task(
         successes = []
         failures = []
         skipped = []
+        pending = []
 
         for idx, row in enumerate(rows, 1):
             # Extract values using mapped column names
@@ -357,92 +362,17 @@ def update_ip_addresses_from_csv_task(
                         }
                     )
                 else:
-                    updated_fields: list[str] = []
-
-                    if update_data:
-                        logger.info("Updating IP address %s", identifier)
-                        logger.info(
-                            "  - Endpoint: ipam/ip-addresses/%s/", ip_address_uuid
-                        )
-                        logger.info("  - Method: PATCH")
-                        logger.info("  - Payload: %s", update_data)
-
-                        result = asyncio.run(
-                            _update_ip_address(
-                                nautobot_service, ip_address_uuid, update_data
-                            )
-                        )
-
-                        if not result["success"]:
-                            failures.append(
-                                {
-                                    "row": idx,
-                                    "address": address_value,
-                                    "namespace": namespace_value,
-                                    "uuid": ip_address_uuid,
-                                    "error": result["error"],
-                                }
-                            )
-                            logger.error(
-                                "Failed to update IP address: %s", result["error"]
-                            )
-                            continue
-
-                        updated_fields.extend(update_data.keys())
-
-                    warnings: list[str] = []
-
-                    if note_text:
-                        note_result = asyncio.run(
-                            _add_ip_address_note(
-                                nautobot_service, ip_address_uuid, note_text
-                            )
-                        )
-                        if note_result["success"]:
-                            if note_result["created"]:
-                                updated_fields.append("notes")
-                            else:
-                                warnings.append(
-                                    "Note not created: an identical note already exists"
-                                )
-                        else:
-                            if not update_data:
-                                # Notes was the only mapped field for this row —
-                                # nothing succeeded, so this is a failure, not a
-                                # partial success.
-                                failures.append(
-                                    {
-                                        "row": idx,
-                                        "address": address_value,
-                                        "namespace": namespace_value,
-                                        "uuid": ip_address_uuid,
-                                        "error": f"Note creation failed: {note_result['error']}",
-                                    }
-                                )
-                                logger.error(
-                                    "Failed to create note for IP address %s: %s",
-                                    identifier,
-                                    note_result["error"],
-                                )
-                                continue
-                            warnings.append(
-                                f"Note creation failed: {note_result['error']}"
-                            )
-
-                    success_entry = {
-                        "row": idx,
-                        "address": address_value,
-                        "namespace": namespace_value,
-                        "uuid": ip_address_uuid,
-                        "updated_fields": updated_fields,
-                    }
-                    if warnings:
-                        success_entry["warnings"] = warnings
-                    successes.append(success_entry)
-                    logger.info(
-                        "✓ Successfully updated IP address %s: %s fields",
-                        identifier,
-                        len(updated_fields),
+                    # Writes are deferred so all PATCHes go out as bulk requests
+                    pending.append(
+                        {
+                            "row": idx,
+                            "address": address_value,
+                            "namespace": namespace_value,
+                            "uuid": ip_address_uuid,
+                            "identifier": identifier,
+                            "update_data": update_data,
+                            "note_text": note_text,
+                        }
                     )
 
             except Exception as e:
@@ -462,6 +392,28 @@ def update_ip_addresses_from_csv_task(
                     }
                 )
 
+        if pending:
+            logger.info("Applying %s IP address updates in bulk", len(pending))
+
+            def report(current: int, status: str) -> None:
+                self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "current": current,
+                        "total": 100,
+                        "status": status,
+                        "successes": len(successes),
+                        "failures": len(failures),
+                        "skipped": len(skipped),
+                    },
+                )
+
+            _apply_pending_updates(
+                nautobot_service, pending, successes, failures, report
+            )
+            successes.sort(key=lambda entry: entry["row"])
+            failures.sort(key=lambda entry: entry["row"])
+
         # STEP 5: Prepare results
         logger.info("-" * 80)
         logger.info("STEP 5: PREPARING RESULTS")
@@ -630,45 +582,171 @@ async def _find_ip_address_by_address_and_namespace_graphql(
         return None, None
 
 
-async def _update_ip_address(
-    nautobot_service: NautobotService, ip_address_uuid: str, update_data: Dict[str, Any]
-) -> Dict[str, Any]:
+async def _update_ip_addresses(
+    nautobot_service: NautobotService,
+    updates: Dict[str, Dict[str, Any]],
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, str]:
     """
-    Update an IP address in Nautobot using the REST API.
-
-    This uses the nautobot_service.rest_request method directly,
-    which is the same underlying method used by the REST endpoint.
+    Update IP addresses in Nautobot with bulk PATCH requests.
 
     Args:
         nautobot_service: NautobotService instance
-        ip_address_uuid: UUID of the IP address to update
-        update_data: Data to update
+        updates: Update data keyed by IP address UUID
+        on_progress: Called with (done, total) after each bulk request
 
     Returns:
-        dict with 'success' and 'error' keys
+        Error messages keyed by IP address UUID (empty when all succeeded)
     """
+    logger.info("[API CALL] Bulk updating %s IP addresses via REST API", len(updates))
     try:
-        endpoint = f"ipam/ip-addresses/{ip_address_uuid}/"
+        errors = await nautobot_service.bulk_update(
+            "ipam/ip-addresses/",
+            [{"id": uuid, **data} for uuid, data in updates.items()],
+            on_progress=on_progress,
+        )
+    except Exception as e:
+        errors = {uuid: str(e) for uuid in updates}
 
-        logger.info("[API CALL] Updating IP address via REST API")
-        logger.info("[API CALL]   - Endpoint: %s", endpoint)
-        logger.info("[API CALL]   - Method: PATCH")
-        logger.info("[API CALL]   - Data: %s", update_data)
+    for uuid, error_msg in errors.items():
+        logger.error("[API CALL] ✗ Failed to update IP address %s: %s", uuid, error_msg)
+        logger.error("[API CALL]   - Update data that caused error: %s", updates[uuid])
+    return errors
 
-        await nautobot_service.rest_request(endpoint, method="PATCH", data=update_data)
 
-        logger.info("[API CALL] ✓ Update successful for IP address %s", ip_address_uuid)
-        return {"success": True}
+async def _send_pending_updates(
+    nautobot_service: NautobotService,
+    pending: list[Dict[str, Any]],
+    report: Callable[[int, str], None],
+) -> Tuple[Dict[str, str], Dict[int, Dict[str, Any]]]:
+    """
+    PATCH the deferred field updates in bulk, then add the notes.
 
-    except Exception as e:
-        error_msg = str(e)
-        logger.error(
-            "[API CALL] ✗ Failed to update IP address %s: %s",
-            ip_address_uuid,
-            error_msg,
+    Notes of different IP addresses are added concurrently; the notes of
+    one IP address are added in row order, so a repeated note is still
+    recognised as a duplicate.  Rows whose PATCH failed get no note.
+
+    Returns:
+        (PATCH error messages keyed by UUID, note results keyed by the
+        row's index in *pending*)
+    """
+    # Rows targeting the same IP address are merged into one update (later
+    # rows win per field and custom field, as with sequential PATCHes)
+    updates: Dict[str, Dict[str, Any]] = {}
+    for entry in pending:
+        if entry["update_data"]:
+            merge_update_data(
+                updates.setdefault(entry["uuid"], {}), entry["update_data"]
+            )
+
+    errors: Dict[str, str] = {}
+    if updates:
+
+        def patch_progress(done: int, total: int) -> None:
+            report(
+                90 + 3 * done // total,
+                f"Updated {done}/{total} IP addresses in Nautobot",
+            )
+
+        patch_progress(0, len(updates))
+        errors = await _update_ip_addresses(nautobot_service, updates, patch_progress)
+
+    notes_by_uuid: Dict[str, list[int]] = {}
+    for index, entry in enumerate(pending):
+        if entry["note_text"] and not (
+            entry["update_data"] and entry["uuid"] in errors
+        ):
+            notes_by_uuid.setdefault(entry["uuid"], []).append(index)
+    total_notes = sum(len(indexes) for indexes in notes_by_uuid.values())
+    note_results: Dict[int, Dict[str, Any]] = {}
+    semaphore = asyncio.Semaphore(NOTE_CONCURRENCY)
+
+    async def add_notes(indexes: list[int]) -> None:
+        async with semaphore:
+            for index in indexes:
+                entry = pending[index]
+                note_results[index] = await _add_ip_address_note(
+                    nautobot_service, entry["uuid"], entry["note_text"]
+                )
+                report(
+                    93 + 2 * len(note_results) // total_notes,
+                    f"Added {len(note_results)}/{total_notes} notes",
+                )
+
+    await asyncio.gather(*(add_notes(indexes) for indexes in notes_by_uuid.values()))
+    return errors, note_results
+
+
+def _apply_pending_updates(
+    nautobot_service: NautobotService,
+    pending: list[Dict[str, Any]],
+    successes: list[Dict[str, Any]],
+    failures: list[Dict[str, Any]],
+    report: Callable[[int, str], None],
+) -> None:
+    """
+    Send the deferred field updates in bulk, then add notes.
+
+    Rows whose PATCH failed are recorded as failures and get no note, exactly
+    as if they had been updated one at a time.  *report* receives the
+    progress (90-95) and a status line while requests are sent.
+    """
+    errors, note_results = asyncio.run(
+        _send_pending_updates(nautobot_service, pending, report)
+    )
+
+    for index, entry in enumerate(pending):
+        base = {
+            "row": entry["row"],
+            "address": entry["address"],
+            "namespace": entry["namespace"],
+            "uuid": entry["uuid"],
+        }
+        update_data = entry["update_data"]
+
+        if update_data and entry["uuid"] in errors:
+            failures.append({**base, "error": errors[entry["uuid"]]})
+            continue
+
+        updated_fields: list[str] = list(update_data.keys())
+        warnings: list[str] = []
+
+        note_result = note_results.get(index)
+        if note_result is not None:
+            if note_result["success"]:
+                if note_result["created"]:
+                    updated_fields.append("notes")
+                else:
+                    warnings.append(
+                        "Note not created: an identical note already exists"
+                    )
+            else:
+                if not update_data:
+                    # Notes was the only mapped field for this row — nothing
+                    # succeeded, so this is a failure, not a partial success.
+                    failures.append(
+                        {
+                            **base,
+                            "error": f"Note creation failed: {note_result['error']}",
+                        }
+                    )
+                    logger.error(
+                        "Failed to create note for IP address %s: %s",
+                        entry["identifier"],
+                        note_result["error"],
+                    )
+                    continue
+                warnings.append(f"Note creation failed: {note_result['error']}")
+
+        success_entry = {**base, "updated_fields": updated_fields}
+        if warnings:
+            success_entry["warnings"] = warnings
+        successes.append(success_entry)
+        logger.info(
+            "✓ Successfully updated IP address %s: %s fields",
+            entry["identifier"],
+            len(updated_fields),
         )
-        logger.error("[API CALL]   - Update data that caused error: %s", update_data)
-        return {"success": False, "error": error_msg}
 
 
 async def _add_ip_address_note(
@@ -103,6 +103,26 @@ def pytest_runtest_setup(item):
         )
 
 
+@pytest.fixture(autouse=True)
+def _clear_settings_cache():
+    """Keep settings cached by one test from leaking into the next."""
+    from services.settings.settings_cache import settings_cache
+
+    settings_cache.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _isolate_resolution_cache(monkeypatch):
+    """Keep name → UUID resolutions process-local and per-test."""
+    from services.nautobot.resolvers.resolution_cache import resolution_cache
+
+    monkeypatch.setattr(resolution_cache, "_cache_service_factory", None)
+    monkeypatch.setattr(resolution_cache, "_cache_service", None)
+    resolution_cache.clear()
+    yield
+
+
 @pytest.fixture
 def mock_nautobot_service():
     """
@@ -117,9 +137,31 @@ def mock_nautobot_service():
     service.rest_request = AsyncMock()
     # For sync methods (legacy)
     service.execute_graphql_query = Mock()
+    _bind_real_paging(service)
     return service
 
 
+def _bind_real_paging(service: MagicMock) -> None:
+    """Route the mock's paged-fetch and bulk APIs through the real NautobotService logic.
+
+    Paged helpers call ``self.graphql_query`` and ``bulk_update`` calls
+    ``self.rest_request``, so tests that stub those keep working for callers
+    that iterate pages or bulk-update.
+    """
+    from services.nautobot.client import NautobotService
+
+    service._client = MagicMock()
+    service._temporary_client_users = 0
+    for name in (
+        "paginate_graphql",
+        "iter_device_pages",
+        "_fetch_graphql_page",
+        "_pooled_client",
+        "bulk_update",
+    ):
+        setattr(service, name, getattr(NautobotService, name).__get__(service))
+
+
 @pytest.fixture
 def mock_netmiko_service():
     """Mock NetmikoService for testing."""
@@ -17,7 +17,12 @@ from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 
 from core.database import Base
-from core.models.client_data import ClientHostname, ClientIpAddress, ClientMacAddress
+from core.models.client_data import (
+    ClientDataRow,
+    ClientHostname,
+    ClientIpAddress,
+    ClientMacAddress,
+)
 from core.models.servers import Server, ServerFactsHistory, ServerOpenPortsHistory
 from core.models.user_field_mappings import UserFieldMapping
 
@@ -65,7 +70,10 @@ def postgres_engine_client_data(postgres_engine_integration):
         ClientIpAddress.__table__,
         ClientMacAddress.__table__,
         ClientHostname.__table__,
+        ClientDataRow.__table__,
     ]
+    with postgres_engine_integration.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(postgres_engine_integration, tables=tables)
     return postgres_engine_integration
 
@@ -75,7 +83,7 @@ def _truncate_client_data_tables(postgres_engine_client_data):
     with postgres_engine_client_data.begin() as conn:
         conn.execute(
             text(
-                "TRUNCATE TABLE client_hostnames, client_mac_addresses, client_ip_addresses RESTART IDENTITY CASCADE"
+                "TRUNCATE TABLE client_data_rows, client_hostnames, client_mac_addresses, client_ip_addresses RESTART IDENTITY CASCADE"
             )
         )
     yield
@@ -333,3 +333,122 @@ class TestDeleteRecordsOlderThanPg:
         with postgres_engine_client_data.connect() as conn:
             n = conn.execute(text("SELECT COUNT(*) FROM client_mac_addresses")).scalar()
         assert n == 1
+
+
+@pytest.mark.integration
+class TestClientDataRowsPg:
+    def _collect(
+        self, repo: ClientDataRepository, count: int, collected_at: datetime = T1
+    ) -> str:
+        sid = _sid()
+        repo.bulk_insert_mac_addresses(
+            [
+                {
+                    "session_id": sid,
+                    "mac_address": f"aaaa.bbbb.{i:04x}",
+                    "vlan": "10",
+                    "port": f"Gi1/0/{i}",
+                    "device_name": "access-sw",
+                    "device_ip": "10.0.0.2",
+                    "collected_at": collected_at,
+                }
+                for i in range(count)
+            ]
+        )
+        repo.bulk_insert_ip_addresses(
+            [
+                {
+                    "session_id": sid,
+                    "ip_address": f"192.0.2.{i}",
+                    "mac_address": f"aaaa.bbbb.{i:04x}",
+                    "interface": "Vlan10",
+                    "vrf": None,
+                    "device_name": "core-rtr",
+                    "device_ip": "10.0.0.1",
+                    "collected_at": collected_at,
+                }
+                for i in range(count - 1)  # last MAC has no ARP entry
+            ]
+        )
+        repo.bulk_insert_hostnames(
+            [
+                {
+                    "session_id": sid,
+                    "ip_address": "192.0.2.3",
+                    "hostname": "printer-3.example",
+                    "device_name": "core-rtr",
+                    "device_ip": "10.0.0.1",
+                    "collected_at": collected_at,
+                }
+            ]
+        )
+        return sid
+
+    def test_refresh_materializes_latest_session(
+        self, client_data_repository_pg: ClientDataRepository
+    ) -> None:
+        repo = client_data_repository_pg
+        self._collect(repo, 3)
+        repo.refresh_client_data()
+        sid = self._collect(repo, 6, collected_at=T2)
+
+        assert repo.refresh_client_data() == 11
+
+        items, total = repo.get_client_data(page_size=100)
+        assert total == 11
+        assert {row["session_id"] for row in items} == {sid}
+        assert [row["position"] for row in items] == list(range(1, 12))
+        # L2-only device gets the IP seen by the router
+        sw = [row for row in items if row["device_name"] == "access-sw"]
+        assert sw[0]["ip_address"] == "192.0.2.0"
+        assert sw[0]["port"] == "Gi1/0/0"
+        assert sw[-1]["ip_address"] is None
+
+    def test_filters_and_keyset_pagination(
+        self, client_data_repository_pg: ClientDataRepository
+    ) -> None:
+        repo = client_data_repository_pg
+        self._collect(repo, 6)
+        # Startup materializes data collected before any refresh
+        assert repo.materialize_if_empty() == 11
+        assert repo.materialize_if_empty() == 0
+
+        items, total = repo.get_client_data(hostname="PRINTER")
+        assert total == 2
+        assert {row["ip_address"] for row in items} == {"192.0.2.3"}
+
+        first, total = repo.get_client_data(device_name="access", page_size=4)
+        second, _ = repo.get_client_data(
+            device_name="access", page_size=4, cursor=first[-1]["position"]
+        )
+        assert total == 6
+        by_offset, _ = repo.get_client_data(device_name="access", page=2, page_size=4)
+        assert second == by_offset
+        assert [row["port"] for row in first + second] == [
+            f"Gi1/0/{i}" for i in range(6)
+        ]
+
+    def test_cidr_and_oui_search_on_address_columns(
+        self, client_data_repository_pg: ClientDataRepository
+    ) -> None:
+        repo = client_data_repository_pg
+        self._collect(repo, 6)
+        repo.refresh_client_data()
+
+        items, total = repo.get_client_data(ip_address="192.0.2.0/31")
+        assert total == 4
+        assert {row["ip_address"] for row in items} == {"192.0.2.0", "192.0.2.1"}
+
+        items, total = repo.get_client_data(mac_address="aa:aa:bb")
+        assert total == 11
+        assert items[0]["mac_address"] == "aa:aa:bb:bb:00:00"
+
+        _, total = repo.get_client_data(mac_address="BBBB.0005")
+        assert total == 1
+        _, total = repo.get_client_data(mac_address="bb:00:05")
+        assert total == 0
+
+        hist = repo.get_client_history(mac_address="AAAA-BBBB-0003")["mac_history"]
+        # ARP for this MAC was seen on another device than the MAC table entry
+        assert [row["ip_address"] for row in hist] == [None]
+        assert hist[0]["mac_address"] == "aa:aa:bb:bb:00:03"
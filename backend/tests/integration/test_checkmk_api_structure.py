@@ -131,7 +131,8 @@ class TestCheckMKAPIResponseStructure:
         }
         mock_config.get_comparison_keys.return_value = ["attributes", "folder"]
         mock_config.get_ignore_attributes.return_value = ["tag_address_family"]
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.__aenter__.return_value = mock_client
         mock_client.get_host.return_value = mock_checkmk_response
         with (
             patch(
@@ -140,7 +141,9 @@ class TestCheckMKAPIResponseStructure:
             patch(
                 "service_factory.build_checkmk_config_service", return_value=mock_config
             ),
-            patch("service_factory.build_checkmk_client", return_value=mock_client),
+            patch(
+                "service_factory.build_async_checkmk_client", return_value=mock_client
+            ),
         ):
             # Perform comparison
             result = await service.compare_device_config(
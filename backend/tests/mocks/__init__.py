@@ -8,6 +8,7 @@ from .fake_checkmk_client import (
     HOST_GROUP_NETWORK,
     HOST_GROUP_SERVERS,
     TAG_GROUP_AGENT_ID,
+    FakeAsyncCheckMKClient,
     FakeCheckMKClient,
 )
 from .fake_job_repositories import (
@@ -40,6 +41,7 @@ __all__ = [
     "FakeUserRepository",
     "FakeRBACRepository",
     "FakeCheckMKClient",
+    "FakeAsyncCheckMKClient",
     "FOLDER_ROOT",
     "FOLDER_DC1",
     "FOLDER_DC2",
@@ -1,14 +1,14 @@
 """In-memory cache fake for unit testing.
 
-Drop-in replacement for RedisCacheService's ``get``/``set``/``delete`` surface,
-without a real Redis connection or TTL expiry. Keeps unit tests isolated from
-each other (a real cache would leak state across test runs since it's backed
-by a shared external process).
+Drop-in replacement for RedisCacheService's ``get``/``set``/``set_many``/
+``delete`` surface, without a real Redis connection or TTL expiry. Keeps
+unit tests isolated from each other (a real cache would leak state across
+test runs since it's backed by a shared external process).
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
 
 
 class FakeCacheService:
@@ -21,6 +21,16 @@ class FakeCacheService:
     def set(self, key: str, data: Any, ttl_seconds: int) -> None:
         self._store[key] = data
 
+    def set_many(
+        self,
+        items: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]],
+        ttl_seconds: int,
+        chunk_size: int = 500,
+    ) -> int:
+        pairs = list(items.items() if isinstance(items, Mapping) else items)
+        self._store.update(pairs)
+        return len(pairs)
+
     def delete(self, key: str) -> bool:
         return self._store.pop(key, None) is not None
 
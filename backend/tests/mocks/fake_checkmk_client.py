@@ -834,3 +834,40 @@ class FakeCheckMKClient:
     @staticmethod
     def _pending_changes_data(client: FakeCheckMKClient) -> list:
         return client._pending_changes
+
+
+class FakeAsyncCheckMKClient:
+    """AsyncCheckMKClient counterpart of FakeCheckMKClient.
+
+    Every client method is a coroutine over the wrapped FakeCheckMKClient, so
+    seeding and ``call_log`` assertions go through ``fake``::
+
+        fake = FakeCheckMKClient()
+        fake.seed_host("router1", {"ipaddress": "10.0.0.1"})
+        with patch(
+            "service_factory.build_async_checkmk_client",
+            return_value=FakeAsyncCheckMKClient(fake),
+        ):
+            ...
+    """
+
+    def __init__(self, fake: FakeCheckMKClient | None = None):
+        self.fake = fake or FakeCheckMKClient()
+        self.closed = False
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self.fake, name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return method(*args, **kwargs)
+
+        return call
+
+    async def __aenter__(self) -> FakeAsyncCheckMKClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        self.closed = True
@@ -0,0 +1,207 @@
+"""In-memory Redis fake for unit testing.
+
+Implements the subset of the redis-py client used by RedisCacheService:
+strings with TTL, hashes, sets, sorted sets, cursor iteration and pipelines
+(MULTI is not emulated). TTLs do not count down; use ``expire_now()`` to
+simulate a key expiring. ``KEYS`` deliberately raises so tests catch
+blocking enumeration.
+
+Usage::
+
+    fake = FakeRedis()
+    with patch("services.settings.cache.redis.from_url", return_value=fake):
+        svc = RedisCacheService("redis://localhost")
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self._strings: Dict[str, str] = {}
+        self._hashes: Dict[str, Dict[str, str]] = {}
+        self._sets: Dict[str, Set[str]] = {}
+        self._zsets: Dict[str, Dict[str, float]] = {}
+        self._ttls: Dict[str, int] = {}
+        self.scan_calls = 0
+
+    # ── Test helpers ──────────────────────────────────────────────────────────
+
+    def expire_now(self, key: str) -> None:
+        """Simulate Redis expiring ``key``."""
+        self._strings.pop(key, None)
+        self._ttls.pop(key, None)
+
+    def _all_keys(self) -> List[str]:
+        return [*self._strings, *self._hashes, *self._sets, *self._zsets]
+
+    # ── Strings ───────────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[str]:
+        return self._strings.get(key)
+
+    def set(self, key: str, value: Any) -> bool:
+        self._strings[key] = str(value)
+        self._ttls.pop(key, None)
+        return True
+
+    def setex(self, key: str, ttl: int, value: Any) -> bool:
+        self._strings[key] = str(value)
+        self._ttls[key] = ttl
+        return True
+
+    def append(self, key: str, value: str) -> int:
+        self._strings[key] = self._strings.get(key, "") + value
+        return len(self._strings[key])
+
+    def rename(self, src: str, dst: str) -> bool:
+        if src not in self._strings:
+            raise KeyError(src)
+        self._strings[dst] = self._strings.pop(src)
+        if src in self._ttls:
+            self._ttls[dst] = self._ttls.pop(src)
+        else:
+            self._ttls.pop(dst, None)
+        return True
+
+    def expire(self, key: str, ttl: int) -> bool:
+        if key not in set(self._all_keys()):
+            return False
+        self._ttls[key] = ttl
+        return True
+
+    def exists(self, *keys: str) -> int:
+        existing = set(self._all_keys())
+        return sum(1 for k in keys if k in existing)
+
+    def delete(self, *keys: str) -> int:
+        count = 0
+        for key in keys:
+            for store in (self._strings, self._hashes, self._sets, self._zsets):
+                if key in store:
+                    del store[key]
+                    count += 1
+            self._ttls.pop(key, None)
+        return count
+
+    def ttl(self, key: str) -> int:
+        if key not in set(self._all_keys()):
+            return -2
+        return self._ttls.get(key, -1)
+
+    def memory_usage(self, key: str) -> Optional[int]:
+        value = self._strings.get(key)
+        return len(value) if value is not None else None
+
+    # ── Hashes ────────────────────────────────────────────────────────────────
+
+    def hincrby(self, name: str, field: str, amount: int = 1) -> int:
+        bucket = self._hashes.setdefault(name, {})
+        bucket[field] = str(int(bucket.get(field, 0)) + amount)
+        return int(bucket[field])
+
+    def hgetall(self, name: str) -> Dict[str, str]:
+        return dict(self._hashes.get(name, {}))
+
+    # ── Sets ──────────────────────────────────────────────────────────────────
+
+    def sadd(self, name: str, *members: str) -> int:
+        bucket = self._sets.setdefault(name, set())
+        added = len(set(members) - bucket)
+        bucket.update(members)
+        return added
+
+    def srem(self, name: str, *members: str) -> int:
+        bucket = self._sets.get(name, set())
+        removed = len(bucket & set(members))
+        bucket.difference_update(members)
+        if not bucket:
+            self._sets.pop(name, None)
+        return removed
+
+    def smembers(self, name: str) -> Set[str]:
+        return set(self._sets.get(name, set()))
+
+    # ── Sorted sets ───────────────────────────────────────────────────────────
+
+    def zadd(self, name: str, mapping: Dict[str, float]) -> int:
+        bucket = self._zsets.setdefault(name, {})
+        added = len(set(mapping) - set(bucket))
+        bucket.update({m: float(score) for m, score in mapping.items()})
+        return added
+
+    def zrem(self, name: str, *members: str) -> int:
+        bucket = self._zsets.get(name, {})
+        removed = sum(1 for m in members if bucket.pop(m, None) is not None)
+        if not bucket:
+            self._zsets.pop(name, None)
+        return removed
+
+    def zremrangebyscore(self, name: str, min: Any, max: Any) -> int:
+        low, high = float(min), float(max)
+        bucket = self._zsets.get(name, {})
+        doomed = [m for m, score in bucket.items() if low <= score <= high]
+        return self.zrem(name, *doomed) if doomed else 0
+
+    def zscore(self, name: str, member: str) -> Optional[float]:
+        return self._zsets.get(name, {}).get(member)
+
+    def zmembers(self, name: str) -> Set[str]:
+        """Test helper: members of a sorted set, regardless of score."""
+        return set(self._zsets.get(name, {}))
+
+    # ── Iteration ─────────────────────────────────────────────────────────────
+
+    def keys(self, pattern: str = "*") -> List[str]:
+        raise AssertionError("KEYS blocks Redis; use SCAN instead")
+
+    def scan_iter(
+        self, match: Optional[str] = None, count: Optional[int] = None
+    ) -> Iterator[str]:
+        self.scan_calls += 1
+        for key in list(self._all_keys()):
+            if match is None or fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def sscan_iter(
+        self, name: str, match: Optional[str] = None, count: Optional[int] = None
+    ) -> Iterator[str]:
+        for member in list(self._sets.get(name, set())):
+            if match is None or fnmatch.fnmatchcase(member, match):
+                yield member
+
+    def zscan_iter(
+        self, name: str, match: Optional[str] = None, count: Optional[int] = None
+    ) -> Iterator[tuple]:
+        for member, score in list(self._zsets.get(name, {}).items()):
+            if match is None or fnmatch.fnmatchcase(member, match):
+                yield member, score
+
+    # ── Pipelines ─────────────────────────────────────────────────────────────
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them against the parent FakeRedis on execute()."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._commands: List[tuple] = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._redis, name)
+
+        def _queue(*args: Any, **kwargs: Any) -> FakePipeline:
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return _queue
+
+    def execute(self, raise_on_error: bool = True) -> List[Any]:
+        commands, self._commands = self._commands, []
+        return [method(*args, **kwargs) for method, args, kwargs in commands]
@@ -0,0 +1,172 @@
+"""Unit tests for AsyncCheckMKClient: pooled requests, ETag handling, fan-out.
+
+All tests run offline against an ``httpx.MockTransport``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from services.checkmk.client import AsyncCheckMKClient
+from services.checkmk.exceptions import CheckMKAPIError
+
+
+def _make_client(handler) -> AsyncCheckMKClient:
+    client = AsyncCheckMKClient(
+        host="checkmk.test",
+        site_name="monitoring",
+        username="testuser",
+        password="testpass",
+        protocol="https",
+        verify_ssl=False,
+    )
+    client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), headers=client.default_headers
+    )
+    return client
+
+
+@pytest.mark.unit
+@pytest.mark.checkmk
+async def test_get_all_hosts_sends_auth_and_drops_none_params():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"value": [{"id": "h1"}]})
+
+    async with _make_client(handler) as client:
+        result = await client.get_all_hosts(effective_attributes=True)
+
+    request = seen[0]
+    assert request.url.path.endswith("domain-types/host_config/collections/all")
+    assert request.headers["Authorization"] == "Bearer testuser testpass"
+    assert request.url.params["effective_attributes"] == "true"
+    assert "site" not in request.url.params
+    assert result == {"value": [{"id": "h1"}]}
+
+
+@pytest.mark.unit
+@pytest.mark.checkmk
+async def test_get_host_404_raises_api_error_with_status():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"title": "Not Found"})
+
+    async with _make_client(handler) as client:
+        with pytest.raises(CheckMKAPIError) as exc_info:
+            await client.get_host("missing")
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.unit
+@pytest.mark.checkmk
+async def test_transport_error_becomes_api_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    async with _make_client(handler) as client:
+        assert await client.test_connection() is False
+        with pytest.raises(CheckMKAPIError, match="Request failed"):
+            await client.get_version()
+
+
+@pytest.mark.unit
+@pytest.mark.checkmk
+async def test_update_host_fetches_etag_and_sends_if_match():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.headers.get("If-Match")))
+        if request.method == "GET":
+            return httpx.Response(200, json={}, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"id": "h1"})
+
+    async with _make_client(handler) as client:
+        await client.update_host("h1", {"alias": "x"})
+
+    assert calls == [("GET", None), ("PUT", '"v1"')]
+
+
+@pytest.mark.unit
+@pytest.mark.checkmk
+async def test_stale_fetched_etag_is_refreshed_once():
+    versions = iter(['"v1"', '"v2"'])
+    puts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json={}, headers={"ETag": next(versions)})
+        puts.append(request.headers["If-Match"])
+        if request.headers["If-Match"] == '"v1"':
+            return httpx.Response(412, json={"title": "Precondition Failed"})
+        return httpx.Response(200, json={"id": "h1"})
+
+    async with _make_client(handler) as client:
+        await client.update_host("h1", {"alias": "x"})
+
+    assert puts == ['"v1"', '"v2"']
+
+
+@pytest.mark.unit
+@pytest.mark.checkmk
+async def test_explicit_etag_412_is_not_retried():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(412, json={"title": "Precondition Failed"})
+
+    async with _make_client(handler) as client:
+        with pytest.raises(CheckMKAPIError) as exc_info:
+            await client.update_host("h1", {"alias": "x"}, etag='"old"')
+
+    assert exc_info.value.status_code == 412
+
+
+@pytest.mark.unit
+@pytest.mark.checkmk
+async def test_concurrent_updates_to_same_host_are_serialized():
+    """Each PUT is sent with the ETag produced by the previous write."""
+    state = {"version": 1}
+    log = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            etag = f'"v{state["version"]}"'
+            await asyncio.sleep(0)  # let other updates interleave if unlocked
+            return httpx.Response(200, json={}, headers={"ETag": etag})
+        if request.headers["If-Match"] != f'"v{state["version"]}"':
+            return httpx.Response(412, json={"title": "Precondition Failed"})
+        state["version"] += 1
+        log.append(json.loads(request.content)["attributes"]["alias"])
+        return httpx.Response(200, json={})
+
+    async with _make_client(handler) as client:
+        await asyncio.gather(
+            *(client.update_host("h1", {"alias": str(i)}) for i in range(5))
+        )
+
+    assert sorted(log) == ["0", "1", "2", "3", "4"]
+    assert state["version"] == 6
+
+
+@pytest.mark.unit
+@pytest.mark.checkmk
+async def test_bulk_operation_runs_concurrently_and_records_failures():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "DELETE":
+            return httpx.Response(404, json={"title": "Not Found"})
+        return httpx.Response(200, json={"id": "new"})
+
+    operations = [
+        {"type": "create_host", "params": {"hostname": "a"}},
+        {"type": "delete_host", "params": {"hostname": "b"}},
+        {"type": "bogus"},
+    ]
+    async with _make_client(handler) as client:
+        results = await client.bulk_operation(operations)
+
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[2]["result"] == {"error": "Unknown operation type: bogus"}
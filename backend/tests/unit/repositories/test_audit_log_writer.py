@@ -0,0 +1,284 @@
+"""Unit tests for repositories/audit_log/audit_log_writer.py.
+
+The repository is a mock and Redis is a small in-memory stand-in, so no
+database or Redis server is needed.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from repositories.audit_log import audit_log_writer as writer_module
+from repositories.audit_log.audit_log_writer import AuditLogWriter
+
+_IDLE = 3600  # flush interval that never fires during a test
+
+
+class _FakeRedis:
+    """The list/key subset of redis-py the writer uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+        return len(self.data[key])
+
+    def ltrim(self, key, start, end):
+        if key in self.data:
+            items = self.data[key]
+            self.data[key] = items[start:] if end == -1 else items[start : end + 1]
+
+    def lrange(self, key, start, end):
+        items = self.data.get(key, [])
+        return list(items[start:] if end == -1 else items[start : end + 1])
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def expire(self, key, seconds):
+        return int(key in self.data)
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def rename(self, src, dst):
+        if src not in self.data:
+            raise KeyError(src)
+        self.data[dst] = self.data.pop(src)
+
+    def scan_iter(self, match=None, count=None):
+        return [k for k in list(self.data) if fnmatch.fnmatch(k, match)]
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *a, **kw: self.calls.append((name, a, kw))
+
+    def execute(self):
+        for name, args, kwargs in self.calls:
+            getattr(self.client, name)(*args, **kwargs)
+
+
+def _writer(repo, redis_client=None, **kwargs):
+    kwargs.setdefault("flush_interval", _IDLE)
+    return AuditLogWriter(
+        repository=repo,
+        redis_factory=(lambda: redis_client) if redis_client else None,
+        key_prefix="test-audit",
+        **kwargs,
+    )
+
+
+def _journal(redis_client, writer):
+    return redis_client.data.get(writer._journal_key, [])
+
+
+@pytest.mark.unit
+def test_full_batch_is_written_by_background_thread_in_one_insert():
+    repo = MagicMock()
+    inserted = threading.Event()
+    repo.create_logs.side_effect = lambda rows: inserted.set()
+    writer = _writer(repo, batch_size=3)
+
+    for i in range(3):
+        writer.write(username="alice", event_type="login", message=f"event {i}")
+
+    assert inserted.wait(5)
+    rows = repo.create_logs.call_args.args[0]
+    assert [r["message"] for r in rows] == ["event 0", "event 1", "event 2"]
+    assert repo.create_logs.call_count == 1
+
+
+@pytest.mark.unit
+def test_flush_writes_queued_rows_and_trims_journal():
+    repo = MagicMock()
+    redis_client = _FakeRedis()
+    writer = _writer(repo, redis_client, batch_size=2)
+
+    writer.write(
+        username="bob",
+        event_type="bulk-edit",
+        message="updated",
+        user_id=7,
+        extra_data={"fields": ["name"]},
+    )
+    writer.write(username="bob", event_type="bulk-edit", message="again")
+    writer.write(username="bob", event_type="bulk-edit", message="third")
+
+    # Waking the thread for the full batch races with this explicit flush;
+    # either way every row is written exactly once.
+    writer.flush()
+
+    rows = [row for c in repo.create_logs.call_args_list for row in c.args[0]]
+    assert [r["message"] for r in rows] == ["updated", "again", "third"]
+    assert rows[0]["user_id"] == 7
+    assert json.loads(rows[0]["extra_data"]) == {"fields": ["name"]}
+    assert rows[1]["extra_data"] is None
+    assert isinstance(rows[0]["created_at"], datetime)
+    assert writer.pending() == 0
+    assert _journal(redis_client, writer) == []
+
+
+@pytest.mark.unit
+def test_rows_stay_queued_and_journaled_while_database_is_down():
+    repo = MagicMock()
+    repo.create_logs.side_effect = ConnectionError("database down")
+    redis_client = _FakeRedis()
+    writer = _writer(repo, redis_client)
+
+    writer.write(username="carol", event_type="login", message="one")
+    writer.write(username="carol", event_type="login", message="two")
+
+    assert writer.flush() == 0
+    assert writer.pending() == 2
+    assert len(_journal(redis_client, writer)) == 2
+
+    repo.create_logs.side_effect = None
+    assert writer.flush() == 2
+    assert writer.pending() == 0
+    assert _journal(redis_client, writer) == []
+
+
+@pytest.mark.unit
+def test_row_rejected_by_database_is_dropped_without_blocking_the_rest():
+    stored = []
+
+    def create_logs(rows):
+        if len(rows) > 1:
+            raise ValueError("batch contains a bad row")
+        if rows[0]["message"] == "bad":
+            raise ValueError("foreign key violation")
+        stored.extend(rows)
+
+    repo = MagicMock()
+    repo.create_logs.side_effect = create_logs
+    writer = _writer(repo)
+
+    for message in ("good", "bad", "fine"):
+        writer.write(username="dave", event_type="login", message=message)
+
+    assert writer.flush() == 3
+    assert [r["message"] for r in stored] == ["good", "fine"]
+    assert writer.pending() == 0
+
+
+def _row(message):
+    return {
+        "username": "erin",
+        "user_id": None,
+        "event_type": "login",
+        "message": message,
+        "ip_address": None,
+        "resource_type": None,
+        "resource_id": None,
+        "resource_name": None,
+        "severity": "info",
+        "extra_data": None,
+        "created_at": "2026-01-02T03:04:05+00:00",
+    }
+
+
+@pytest.mark.unit
+def test_orphaned_journal_is_replayed_and_live_journal_left_alone():
+    redis_client = _FakeRedis()
+    row = _row("lost in crash")
+    redis_client.rpush("test-audit:journal:dead-host:1:a", json.dumps(row))
+    redis_client.rpush("test-audit:journal:live-host:2:b", json.dumps(row))
+    redis_client.set("test-audit:alive:live-host:2:b", "1")
+
+    repo = MagicMock()
+    writer = _writer(repo, redis_client)
+    writer._ensure_started()
+
+    assert writer._recover_orphans() == 1
+    rows = repo.create_logs.call_args.args[0]
+    assert rows[0]["message"] == "lost in crash"
+    assert rows[0]["created_at"] == datetime.fromisoformat(row["created_at"])
+    assert not any(":dead-host:" in key for key in redis_client.data)
+    assert not any(":recovering:" in key for key in redis_client.data)
+    assert "test-audit:journal:live-host:2:b" in redis_client.data
+    assert not any(":claim:" in key for key in redis_client.data)
+
+
+@pytest.mark.unit
+def test_replay_abandoned_by_a_crashed_writer_is_claimed_again():
+    redis_client = _FakeRedis()
+    redis_client.rpush("test-audit:recovering:abandoned", json.dumps(_row("a")))
+    redis_client.rpush("test-audit:recovering:in-progress", json.dumps(_row("b")))
+    redis_client.set("test-audit:claim:in-progress", "1")
+
+    repo = MagicMock()
+    writer = _writer(repo, redis_client)
+    writer._ensure_started()
+
+    assert writer._recover_orphans() == 1
+    assert repo.create_logs.call_args.args[0][0]["message"] == "a"
+    assert "test-audit:recovering:abandoned" not in redis_client.data
+    assert "test-audit:claim:abandoned" not in redis_client.data
+    assert "test-audit:recovering:in-progress" in redis_client.data
+
+
+@pytest.mark.unit
+def test_failed_replay_keeps_the_rest_claimable():
+    redis_client = _FakeRedis()
+    for message in ("one", "two"):
+        redis_client.rpush(
+            "test-audit:journal:dead-host:1:a", json.dumps(_row(message))
+        )
+
+    repo = MagicMock()
+    repo.create_logs.side_effect = [None, ConnectionError("database down")]
+    writer = _writer(repo, redis_client, batch_size=1)
+    writer._ensure_started()
+
+    assert writer._recover_orphans() == 0
+    (key,) = [k for k in redis_client.data if ":recovering:" in k]
+    assert [json.loads(p)["message"] for p in redis_client.data[key]] == ["two"]
+    assert not any(":claim:" in k for k in redis_client.data)
+
+    repo.create_logs.side_effect = None
+    assert writer._recover_orphans() == 1
+    assert not any(":recovering:" in k for k in redis_client.data)
+
+
+@pytest.mark.unit
+def test_slow_flush_renews_the_heartbeat(monkeypatch):
+    redis_client = _FakeRedis()
+    repo = MagicMock()
+    writer = _writer(repo, redis_client)
+    writer.write(username="frank", event_type="login", message="slow")
+    redis_client.delete(writer._alive_key)
+
+    # Every renewal is due; the insert outlasts the heartbeat set before it
+    repo.create_logs.side_effect = lambda rows: redis_client.delete(writer._alive_key)
+    monkeypatch.setattr(writer_module, "RECOVERY_INTERVAL", 0)
+
+    assert writer.flush() == 1
+    assert redis_client.exists(writer._alive_key)
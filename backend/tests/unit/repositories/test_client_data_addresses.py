@@ -0,0 +1,110 @@
+"""Unit tests for client data address normalization and search clauses."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from core.models import ClientDataRow
+from repositories.client_data.client_data_repository import (
+    ClientDataRepository,
+    _ip_condition,
+    _mac_condition,
+    _normalize_ip,
+    _normalize_mac,
+)
+
+
+def _sql(clause) -> tuple[str, dict]:
+    compiled = clause.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    ["aabb.cc00.0100", "AA:BB:CC:00:01:00", "aa-bb-cc-00-01-00", "aabbcc000100"],
+)
+def test_normalize_mac_accepts_common_notations(value) -> None:
+    assert _normalize_mac(value) == "aa:bb:cc:00:01:00"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", [None, "", "incomplete", "aabb.cc00.01"])
+def test_normalize_mac_rejects_non_macs(value) -> None:
+    assert _normalize_mac(value) is None
+
+
+@pytest.mark.unit
+def test_normalize_ip() -> None:
+    assert _normalize_ip(" 10.0.0.1 ") == "10.0.0.1"
+    assert _normalize_ip("2001:DB8::1") == "2001:db8::1"
+    assert _normalize_ip("10.0.0.256") is None
+    assert _normalize_ip(None) is None
+
+
+@pytest.mark.unit
+def test_bulk_insert_normalizes_and_skips_invalid_addresses() -> None:
+    session = MagicMock()
+    session.__enter__.return_value = session
+    records = [
+        {
+            "session_id": "s1",
+            "ip_address": "10.0.0.1",
+            "mac_address": "AABB.CC00.0100",
+            "device_name": "r1",
+            "device_ip": "bogus",
+        },
+        {
+            "session_id": "s1",
+            "ip_address": "10.0.0.2",
+            "mac_address": "Incomplete",
+            "device_name": "r1",
+        },
+        {"session_id": "s1", "ip_address": "not-an-ip", "device_name": "r1"},
+    ]
+
+    with patch(
+        "repositories.client_data.client_data_repository.get_db_session",
+        return_value=session,
+    ):
+        count = ClientDataRepository().bulk_insert_ip_addresses(records)
+
+    assert count == 2
+    _model, rows = session.bulk_insert_mappings.call_args[0]
+    assert [(r["ip_address"], r["mac_address"], r["device_ip"]) for r in rows] == [
+        ("10.0.0.1", "aa:bb:cc:00:01:00", None),
+        ("10.0.0.2", None, None),
+    ]
+    assert records[0]["mac_address"] == "AABB.CC00.0100"
+
+
+@pytest.mark.unit
+def test_ip_condition_uses_containment_for_cidr() -> None:
+    sql, params = _sql(_ip_condition(ClientDataRow.ip_address, "10.1.7.9/16"))
+    assert sql == "client_data_rows.ip_address <<= CAST(%(param_1)s AS INET)"
+    assert params == {"param_1": "10.1.0.0/16"}
+
+    sql, params = _sql(_ip_condition(ClientDataRow.ip_address, "10.1."))
+    assert sql.startswith("host(client_data_rows.ip_address) ILIKE")
+    assert list(params.values()) == ["%10.1.%"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value, pattern",
+    [
+        ("00:1B:54", "001b54%"),
+        ("00-1b-54-", "001b54%"),
+        ("bb:cc0", "%bbcc0%"),
+        ("cc00.01", "%cc0001%"),
+    ],
+)
+def test_mac_condition_matches_digits(value, pattern) -> None:
+    sql, params = _sql(_mac_condition(ClientDataRow.mac_address, value))
+    assert sql.startswith(
+        "replace(CAST(client_data_rows.mac_address AS TEXT), ':', '') LIKE"
+    )
+    assert list(params.values()) == [pattern]
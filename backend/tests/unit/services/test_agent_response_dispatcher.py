@@ -0,0 +1,160 @@
+"""Unit tests for services/cockpit_agent/response_dispatcher.py.
+
+Redis pub/sub is replaced by an in-memory stand-in fed by the tests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+
+import pytest
+import redis
+
+from services.cockpit_agent.response_dispatcher import AgentResponseDispatcher
+
+
+class _FakePubSub:
+    """Queue-backed pub/sub that confirms subscriptions like Redis does."""
+
+    def __init__(self) -> None:
+        self.messages: queue.Queue = queue.Queue()
+        self.channels: list[str] = []
+        self.unsubscribed: list[str] = []
+
+    def subscribe(self, channel: str) -> None:
+        self.channels.append(channel)
+        self.messages.put({"type": "subscribe", "channel": channel, "data": 1})
+
+    def unsubscribe(self, channel: str) -> None:
+        self.unsubscribed.append(channel)
+
+    def get_message(self, timeout: float = 0.0):
+        try:
+            item = self.messages.get(timeout=min(timeout, 0.05))
+        except queue.Empty:
+            return None
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def close(self) -> None:
+        pass
+
+    def publish(self, agent_id: str, payload: dict) -> None:
+        self.messages.put(
+            {
+                "type": "message",
+                "channel": f"cockpit-agent-response:{agent_id}",
+                "data": json.dumps(payload),
+            }
+        )
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.pubsubs: list[_FakePubSub] = []
+
+    def pubsub(self) -> _FakePubSub:
+        pubsub = _FakePubSub()
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+
+@pytest.fixture
+def broker() -> _FakeRedis:
+    return _FakeRedis()
+
+
+@pytest.fixture
+def dispatcher(broker: _FakeRedis):
+    dispatcher = AgentResponseDispatcher(redis_factory=lambda: broker)
+    yield dispatcher
+    dispatcher.close()
+
+
+@pytest.mark.unit
+def test_commands_share_one_connection_and_one_subscription_per_agent(
+    broker: _FakeRedis, dispatcher: AgentResponseDispatcher
+) -> None:
+    futures = {
+        f"cmd-{i}": dispatcher.expect("agent-1" if i < 3 else "agent-2", f"cmd-{i}")
+        for i in range(5)
+    }
+    pubsub = broker.pubsubs[0]
+
+    assert len(broker.pubsubs) == 1
+    assert pubsub.channels == [
+        "cockpit-agent-response:agent-1",
+        "cockpit-agent-response:agent-2",
+    ]
+    assert dispatcher.in_flight == 5
+
+    pubsub.publish("agent-2", {"command_id": "cmd-4", "status": "success"})
+    pubsub.publish("agent-1", {"command_id": "cmd-1", "status": "error"})
+
+    assert futures["cmd-4"].result(timeout=5)["status"] == "success"
+    assert futures["cmd-1"].result(timeout=5)["status"] == "error"
+    assert not futures["cmd-0"].done()
+
+
+@pytest.mark.unit
+def test_progress_and_unknown_commands_are_not_delivered(
+    broker: _FakeRedis, dispatcher: AgentResponseDispatcher
+) -> None:
+    future = dispatcher.expect("agent-1", "cmd-1")
+    pubsub = broker.pubsubs[0]
+
+    pubsub.publish("agent-1", {"command_id": "cmd-1", "type": "progress"})
+    pubsub.publish("agent-1", {"command_id": "someone-else", "status": "success"})
+    pubsub.publish("agent-1", {"command_id": "cmd-1", "status": "success"})
+
+    response = future.result(timeout=5)
+    assert response == {"command_id": "cmd-1", "status": "success"}
+
+
+@pytest.mark.unit
+def test_last_discard_unsubscribes_the_agent_channel(
+    broker: _FakeRedis, dispatcher: AgentResponseDispatcher
+) -> None:
+    dispatcher.expect("agent-1", "cmd-1")
+    dispatcher.expect("agent-1", "cmd-2")
+    pubsub = broker.pubsubs[0]
+
+    dispatcher.discard("agent-1", "cmd-1")
+    assert pubsub.unsubscribed == []
+
+    dispatcher.discard("agent-1", "cmd-2")
+    dispatcher.discard("agent-1", "cmd-2")  # repeated discard is harmless
+    assert pubsub.unsubscribed == ["cockpit-agent-response:agent-1"]
+    assert dispatcher.in_flight == 0
+
+    # A new command subscribes again
+    dispatcher.expect("agent-1", "cmd-3")
+    assert pubsub.channels.count("cockpit-agent-response:agent-1") == 2
+
+
+@pytest.mark.unit
+def test_lost_connection_fails_pending_commands(
+    broker: _FakeRedis, dispatcher: AgentResponseDispatcher
+) -> None:
+    future = dispatcher.expect("agent-1", "cmd-1")
+
+    broker.pubsubs[0].messages.put(redis.ConnectionError("connection reset"))
+
+    with pytest.raises(redis.ConnectionError):
+        future.result(timeout=5)
+
+
+@pytest.mark.unit
+async def test_expect_async_waits_for_the_subscription(
+    broker: _FakeRedis, dispatcher: AgentResponseDispatcher
+) -> None:
+    future = await dispatcher.expect_async("agent-1", "cmd-1")
+
+    assert broker.pubsubs[0].channels == ["cockpit-agent-response:agent-1"]
+    broker.pubsubs[0].publish("agent-1", {"command_id": "cmd-1", "status": "ok"})
+
+    response = await asyncio.wait_for(asyncio.wrap_future(future), 5)
+    assert response["status"] == "ok"
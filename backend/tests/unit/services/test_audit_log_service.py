@@ -1,6 +1,6 @@
 """Unit tests for services/audit/audit_log_service.py.
 
-All tests run offline — the repository is injected via DI.
+All tests run offline — the writer is injected via DI.
 """
 
 from __future__ import annotations
@@ -13,36 +13,35 @@ from services.audit.audit_log_service import AuditLogService
 
 
 def _make_service() -> tuple[AuditLogService, MagicMock]:
-    mock_repo = MagicMock()
-    return AuditLogService(repository=mock_repo), mock_repo
+    mock_writer = MagicMock()
+    return AuditLogService(writer=mock_writer), mock_writer
 
 
 # ── log_event ──────────────────────────────────────────────────────────────────
 
 
 @pytest.mark.unit
-def test_log_event_delegates_to_repository():
-    """log_event passes all kwargs to repository.create_log."""
-    svc, mock_repo = _make_service()
+def test_log_event_delegates_to_writer():
+    """log_event passes all kwargs to writer.write."""
+    svc, mock_writer = _make_service()
     svc.log_event(action="login", username="admin")
-    mock_repo.create_log.assert_called_once_with(action="login", username="admin")
+    mock_writer.write.assert_called_once_with(action="login", username="admin")
 
 
 @pytest.mark.unit
-def test_log_event_returns_repository_result():
-    """Return value from repository.create_log is forwarded unchanged."""
-    svc, mock_repo = _make_service()
-    mock_repo.create_log.return_value = "audit-entry"
-    result = svc.log_event(action="delete")
-    assert result == "audit-entry"
+def test_log_event_returns_none():
+    """log_event only queues the row; nothing is returned."""
+    svc, mock_writer = _make_service()
+    mock_writer.write.return_value = "ignored"
+    assert svc.log_event(action="delete") is None
 
 
 @pytest.mark.unit
 def test_log_event_multiple_kwargs():
-    """All supplied kwargs reach the repository."""
-    svc, mock_repo = _make_service()
+    """All supplied kwargs reach the writer."""
+    svc, mock_writer = _make_service()
     svc.log_event(action="create", username="bob", resource="device", severity="info")
-    mock_repo.create_log.assert_called_once_with(
+    mock_writer.write.assert_called_once_with(
         action="create", username="bob", resource="device", severity="info"
     )
 
@@ -50,15 +49,15 @@ def test_log_event_multiple_kwargs():
 @pytest.mark.unit
 def test_log_event_no_kwargs():
     """log_event with no kwargs is valid (delegates empty call)."""
-    svc, mock_repo = _make_service()
+    svc, mock_writer = _make_service()
     svc.log_event()
-    mock_repo.create_log.assert_called_once_with()
+    mock_writer.write.assert_called_once_with()
 
 
 @pytest.mark.unit
-def test_log_event_repository_exception_propagates():
-    """Exceptions from the repository bubble up to the caller."""
-    svc, mock_repo = _make_service()
-    mock_repo.create_log.side_effect = RuntimeError("DB offline")
-    with pytest.raises(RuntimeError, match="DB offline"):
+def test_log_event_writer_exception_propagates():
+    """Exceptions from the writer bubble up to the caller."""
+    svc, mock_writer = _make_service()
+    mock_writer.write.side_effect = RuntimeError("bad kwargs")
+    with pytest.raises(RuntimeError, match="bad kwargs"):
         svc.log_event(action="x")
@@ -8,46 +8,118 @@ import pytest
 
 from services.background_jobs.device_cache_jobs import cache_all_devices_task
 from services.background_jobs.location_cache_jobs import cache_all_locations_task
+from services.settings.cache import RedisCacheService
 from tests.helpers.asyncio_run import mock_asyncio_run_returning
+from tests.mocks.fake_redis import FakeRedis
+
+
+def _paged_nautobot(*pages: list, ip_pages: tuple = ()) -> MagicMock:
+    """Nautobot service mock whose iter_device_pages yields ``pages``.
+
+    ``paginate_graphql`` (used for the IP prefix index) yields ``ip_pages``.
+    """
+
+    async def _iter_device_pages(fields: str):
+        for page in pages:
+            yield page
+
+    async def _paginate_graphql(query: str, collection: str):
+        for page in ip_pages:
+            yield page
+
+    nautobot = MagicMock()
+    nautobot.iter_device_pages = _iter_device_pages
+    nautobot.paginate_graphql = _paginate_graphql
+    return nautobot
 
 
 @pytest.mark.unit
 def test_cache_all_devices_task_success() -> None:
-    graphql_result = {
-        "data": {
-            "devices": [
-                {"id": "1", "name": "sw1", "role": {"name": "access"}},
-            ]
-        }
+    nautobot = _paged_nautobot(
+        [{"id": "1", "name": "sw1", "role": {"name": "access"}}],
+        [{"id": "2", "name": "sw2"}, {"name": "no-id"}],
+        ip_pages=(
+            [
+                {
+                    "address": "10.0.0.1/24",
+                    "parent": {
+                        "prefix": "10.0.0.0/24",
+                        "namespace": {"name": "Global"},
+                    },
+                    "interface_assignments": [{"interface": {"device": {"id": "1"}}}],
+                    "primary_ip4_for": [{"id": "1"}],
+                },
+                {"address": "10.0.0.9/24", "interface_assignments": []},
+            ],
+        ),
+    )
+    fake = FakeRedis()
+    with patch("services.settings.cache.redis.from_url", return_value=fake):
+        cache = RedisCacheService("redis://localhost")
+
+    with (
+        patch("service_factory.build_nautobot_service", return_value=nautobot),
+        patch("service_factory.build_cache_service", return_value=cache),
+        patch.object(cache_all_devices_task, "update_state"),
+    ):
+        out = cache_all_devices_task.run()
+
+    assert out["status"] == "completed_with_errors"
+    assert out["cached"] == 2
+    assert out["failed"] == 1
+    assert out["total"] == 3
+    assert cache.get("nautobot:devices:2")["name"] == "sw2"
+    assert [d["name"] for d in cache.get("nautobot:devices:all")] == ["sw1", "sw2"]
+    version = cache.get("nautobot:devices:all:version")
+    assert version
+    assert cache.get("nautobot:devices:ip_index") == {
+        "version": version,
+        "records": [["10.0.0.1/24", "10.0.0.0/24", "Global", ["1"], ["1"]]],
     }
-    cache = MagicMock()
+    # Staging keys were renamed into place
+    assert not [key for key in fake._strings if ":staging:" in key]
+
+
+@pytest.mark.unit
+def test_cache_all_devices_task_keeps_previous_index_when_ip_fetch_fails() -> None:
+    nautobot = _paged_nautobot([{"id": "1", "name": "sw1"}])
+
+    async def _failing_ip_pages(query: str, collection: str):
+        yield []
+        raise RuntimeError("timeout")
+
+    nautobot.paginate_graphql = _failing_ip_pages
+    fake = FakeRedis()
+    with patch("services.settings.cache.redis.from_url", return_value=fake):
+        cache = RedisCacheService("redis://localhost")
+    cache.set("nautobot:devices:ip_index", {"version": "old", "records": []}, 60)
 
     with (
-        patch("service_factory.build_nautobot_service"),
+        patch("service_factory.build_nautobot_service", return_value=nautobot),
         patch("service_factory.build_cache_service", return_value=cache),
-        patch(
-            "services.background_jobs.device_cache_jobs.asyncio.run",
-            side_effect=mock_asyncio_run_returning(graphql_result),
-        ),
         patch.object(cache_all_devices_task, "update_state"),
     ):
         out = cache_all_devices_task.run()
 
     assert out["status"] == "completed"
-    assert out["cached"] == 1
-    cache.set.assert_called()
+    assert [d["name"] for d in cache.get("nautobot:devices:all")] == ["sw1"]
+    assert cache.get("nautobot:devices:ip_index")["version"] == "old"
+    assert not [key for key in fake._strings if ":staging:" in key]
 
 
 @pytest.mark.unit
 def test_cache_all_devices_task_graphql_error() -> None:
-    bad_result = {"errors": [{"message": "syntax"}]}
+    from services.nautobot.common.exceptions import NautobotAPIError
+
+    async def _failing_pages(fields: str):
+        raise NautobotAPIError("GraphQL errors: syntax")
+        yield  # pragma: no cover
+
+    nautobot = MagicMock()
+    nautobot.iter_device_pages = _failing_pages
     with (
-        patch("service_factory.build_nautobot_service"),
+        patch("service_factory.build_nautobot_service", return_value=nautobot),
         patch("service_factory.build_cache_service"),
-        patch(
-            "services.background_jobs.device_cache_jobs.asyncio.run",
-            side_effect=mock_asyncio_run_returning(bad_result),
-        ),
         patch.object(cache_all_devices_task, "update_state"),
     ):
         out = cache_all_devices_task.run()
@@ -75,7 +147,14 @@ def test_cache_all_locations_task_success() -> None:
 
     assert out["status"] == "completed"
     assert out["cached"] == 1
-    cache.set.assert_called_once()
+    cache.set_many.assert_called_once()
+    entries = cache.set_many.call_args[0][0]
+    assert set(entries) == {
+        "nautobot:locations:list",
+        "nautobot:locations:closure",
+        "nautobot:locations:loc-1",
+    }
+    assert entries["nautobot:locations:closure"] == {"DC1": ["DC1"]}
 
 
 @pytest.mark.unit
@@ -0,0 +1,214 @@
+"""Unit tests for services/nautobot_helpers/cache_aside.py.
+
+Redis is replaced by a dict-backed stand-in for RedisCacheService.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from services.nautobot_helpers import cache_aside
+from services.nautobot_helpers.cache_aside import CacheAside
+
+
+class _FakeCacheService:
+    """Dict-backed subset of RedisCacheService, including rebuild locks."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.locks = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, data, ttl_seconds):
+        self.data[key] = data
+        self.ttls[key] = ttl_seconds
+
+    def delete(self, key):
+        return self.data.pop(key, None) is not None
+
+    def acquire_lock(self, key, ttl_seconds):
+        if key in self.locks:
+            return None
+        self.locks[key] = "token-%s" % key
+        return self.locks[key]
+
+    def release_lock(self, key, token):
+        if self.locks.get(key) != token:
+            return False
+        del self.locks[key]
+        return True
+
+    def is_locked(self, key):
+        return key in self.locks
+
+
+class _CountingLoader:
+    """Loader returning successive values, yielding once so callers overlap."""
+
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        value = self.values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+def _envelope(value, age, ttl=60):
+    now = time.time()
+    return {"value": value, "stored_at": now - age, "refresh_at": now - age + ttl}
+
+
+@pytest.mark.unit
+class TestCacheAside:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        cache = _FakeCacheService()
+        loader = _CountingLoader({"devices": [1]})
+        aside = CacheAside(cache, ttl=60)
+
+        results = await asyncio.gather(
+            *(aside.get_or_load("nautobot:devices:list:all", loader) for _ in range(5))
+        )
+
+        assert results == [{"devices": [1]}] * 5
+        assert loader.calls == 1
+        assert cache.data["nautobot:devices:list:all"]["value"] == {"devices": [1]}
+        assert cache.locks == {}
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_served_from_cache(self):
+        cache = _FakeCacheService()
+        cache.data["k"] = _envelope("cached", age=1)
+        loader = _CountingLoader("fresh")
+
+        assert await CacheAside(cache, ttl=60).get_or_load("k", loader) == "cached"
+        assert loader.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_while_one_refresh_runs(self):
+        cache = _FakeCacheService()
+        cache.data["k"] = _envelope("stale", age=120)
+        loader = _CountingLoader("fresh")
+        aside = CacheAside(cache, ttl=60)
+
+        assert await aside.get_or_load("k", loader) == "stale"
+        assert await aside.get_or_load("k", loader) == "stale"
+        await asyncio.gather(*cache_aside._inflight.values())
+
+        assert loader.calls == 1
+        assert await aside.get_or_load("k", loader) == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_waits_for_rebuild_in_other_process(self, monkeypatch):
+        monkeypatch.setattr(cache_aside, "LOCK_POLL_INTERVAL", 0)
+        cache = _FakeCacheService()
+        cache.locks["k"] = "other-process"
+        loader = _CountingLoader("ours")
+        aside = CacheAside(cache, ttl=60)
+
+        async def _peer():
+            await asyncio.sleep(0)
+            cache.data["k"] = _envelope("theirs", age=0)
+            del cache.locks["k"]
+
+        result, _ = await asyncio.gather(aside.get_or_load("k", loader), _peer())
+
+        assert result == "theirs"
+        assert loader.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_loads_itself_when_peer_gives_up(self, monkeypatch):
+        monkeypatch.setattr(cache_aside, "LOCK_POLL_INTERVAL", 0)
+        cache = _FakeCacheService()
+        cache.locks["k"] = "other-process"
+        loader = _CountingLoader("ours")
+        aside = CacheAside(cache, ttl=60, lock_wait=0.01)
+
+        assert await aside.get_or_load("k", loader) == "ours"
+        assert loader.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_all_waiters_and_is_not_cached(self):
+        cache = _FakeCacheService()
+        loader = _CountingLoader(RuntimeError("nautobot down"), "recovered")
+        aside = CacheAside(cache, ttl=60)
+
+        results = await asyncio.gather(
+            aside.get_or_load("k", loader),
+            aside.get_or_load("k", loader),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert "k" not in cache.data and cache.locks == {}
+        assert await aside.get_or_load("k", loader) == "recovered"
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_skips_fresh_entry(self):
+        cache = _FakeCacheService()
+        cache.data["k"] = _envelope("cached", age=1)
+        loader = _CountingLoader("fresh")
+
+        aside = CacheAside(cache, ttl=60)
+        assert await aside.get_or_load("k", loader, force_refresh=True) == "fresh"
+        assert cache.data["k"]["value"] == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_other_waiters(self):
+        cache = _FakeCacheService()
+        release = asyncio.Event()
+
+        async def _loader():
+            await release.wait()
+            return "value"
+
+        aside = CacheAside(cache, ttl=60)
+        owner = asyncio.ensure_future(aside.get_or_load("k", _loader))
+        waiter = asyncio.ensure_future(aside.get_or_load("k", _loader))
+        await asyncio.sleep(0)
+
+        owner.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await waiter == "value"
+        assert owner.cancelled()
+        assert cache.data["k"]["value"] == "value"
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_rebuild_is_not_overwritten(self):
+        cache = _FakeCacheService()
+        aside = CacheAside(cache, ttl=60)
+
+        async def _loader():
+            aside.invalidate("k")  # e.g. a device PATCH while Nautobot answers
+            return "pre-change"
+
+        assert await aside.get_or_load("k", _loader) == "pre-change"
+        assert "k" not in cache.data
+
+        loader = _CountingLoader("post-change")
+        assert await aside.get_or_load("k", loader) == "post-change"
+        assert cache.data["k"]["value"] == "post-change"
+
+    def test_store_jitters_soft_and_hard_expiry(self):
+        cache = _FakeCacheService()
+        aside = CacheAside(cache, ttl=100, stale_ttl=30, jitter=0.2)
+
+        aside.store("k", "v")
+
+        envelope = cache.data["k"]
+        soft_ttl = envelope["refresh_at"] - envelope["stored_at"]
+        assert 80 <= soft_ttl <= 100
+        assert cache.ttls["k"] == int(soft_ttl + 30)
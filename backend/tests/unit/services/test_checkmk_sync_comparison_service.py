@@ -4,7 +4,7 @@ All tests run offline — no real CheckMK or Nautobot instance required.
 
 Patching strategy:
   - service_factory.build_checkmk_config_service  → _FakeConfig
-  - service_factory.build_checkmk_client          → FakeCheckMKClient
+  - service_factory.build_async_checkmk_client    → FakeAsyncCheckMKClient
   - service_factory.build_nautobot_service        → AsyncMock
 
 DeviceComparisonService receives a query_service at construction; tests supply
@@ -17,17 +17,21 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from models.nb2cmk import DeviceComparison
 from services.checkmk.sync.comparison import DeviceComparisonService
-from tests.mocks import FakeCheckMKClient
+from tests.mocks import FakeAsyncCheckMKClient, FakeCheckMKClient
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
 _PATCH_CONFIG = "service_factory.build_checkmk_config_service"
-_PATCH_CLIENT = "service_factory.build_checkmk_client"
+_PATCH_CLIENT = "service_factory.build_async_checkmk_client"
 _PATCH_NAUTOBOT = "service_factory.build_nautobot_service"
 
 
+def _patch_client(fake: FakeCheckMKClient):
+    """Serve ``fake`` through the async CheckMK client factory."""
+    return patch(_PATCH_CLIENT, return_value=FakeAsyncCheckMKClient(fake))
+
+
 class _FakeConfig:
     """Minimal in-memory config for comparison tests."""
 
@@ -267,7 +271,7 @@ class TestCompareDeviceConfig:
     ) -> None:
         """FakeCheckMKClient with no hosts seeded → result='host_not_found'."""
         svc, _, fake_client = self._setup()
-        with patch(_PATCH_CLIENT, return_value=fake_client):
+        with _patch_client(fake_client):
             result = await svc.compare_device_config("device-uuid")
         assert result.result == "host_not_found"
         assert "router1" in result.diff
@@ -281,7 +285,7 @@ class TestCompareDeviceConfig:
         svc, _, fake_client = self._setup(normalized)
         # CheckMK host has same folder and attributes
         fake_client.seed_host("router1", {"ipaddress": "10.0.0.1"}, folder="/dc1")
-        with patch(_PATCH_CLIENT, return_value=fake_client):
+        with _patch_client(fake_client):
             result = await svc.compare_device_config("device-uuid")
         assert result.result == "equal"
         assert result.diff == ""
@@ -294,7 +298,7 @@ class TestCompareDeviceConfig:
         normalized = _normalized(folder="/dc1", attributes={"ipaddress": "10.0.0.1"})
         svc, _, fake_client = self._setup(normalized)
         fake_client.seed_host("router1", {"ipaddress": "10.0.0.2"}, folder="/dc1")
-        with patch(_PATCH_CLIENT, return_value=fake_client):
+        with _patch_client(fake_client):
             result = await svc.compare_device_config("device-uuid")
         assert result.result == "diff"
         assert "ipaddress" in result.diff
@@ -307,7 +311,7 @@ class TestCompareDeviceConfig:
         normalized = _normalized(folder="/dc1", attributes={})
         svc, _, fake_client = self._setup(normalized)
         fake_client.seed_host("router1", {}, folder="/dc2")
-        with patch(_PATCH_CLIENT, return_value=fake_client):
+        with _patch_client(fake_client):
             result = await svc.compare_device_config("device-uuid")
         assert result.result == "diff"
         assert "folder" in result.diff
@@ -320,7 +324,7 @@ class TestCompareDeviceConfig:
         normalized = _normalized(folder="/dc1", attributes={"ipaddress": "10.0.0.1"})
         svc, _, fake_client = self._setup(normalized)
         fake_client.seed_host("router1", {"ipaddress": "10.0.0.1"}, folder="/dc1")
-        with patch(_PATCH_CLIENT, return_value=fake_client):
+        with _patch_client(fake_client):
             result = await svc.compare_device_config("device-uuid")
         assert "attributes" in result.normalized_config
         assert result.checkmk_config is not None
@@ -337,7 +341,7 @@ class TestCompareDeviceConfig:
         mock_query.get_device_normalized = AsyncMock(return_value=bad_normalized)
         svc = _make_service(query_service=mock_query)
         fake_client = FakeCheckMKClient()
-        with patch(_PATCH_CLIENT, return_value=fake_client):
+        with _patch_client(fake_client):
             with pytest.raises(HTTPException) as exc_info:
                 await svc.compare_device_config("device-uuid")
         assert exc_info.value.status_code == 400
@@ -357,7 +361,7 @@ class TestCompareDeviceConfig:
             {"ipaddress": "10.0.0.1", "meta_data": {"created_at": "2024-01-01"}},
             folder="/dc1",
         )
-        with patch(_PATCH_CLIENT, return_value=fake_client):
+        with _patch_client(fake_client):
             result = await svc.compare_device_config("device-uuid")
         # meta_data difference should not affect result when it's stripped
         assert result.result == "equal"
@@ -384,28 +388,36 @@ def _nautobot_device(
     }
 
 
+def _bulk_query(devices: list[dict], error: Exception | None = None) -> MagicMock:
+    """Query service mock serving ``devices`` as one page for the bulk engine.
+
+    Each device normalizes to ``_normalized(hostname=<device name>)``.
+    """
+
+    async def _pages():
+        if error is not None:
+            raise error
+        yield devices
+
+    mock_query = MagicMock()
+    mock_query.iter_normalization_pages = _pages
+    mock_query.normalize_device_data = MagicMock(
+        side_effect=lambda device: _normalized(hostname=device["name"])
+    )
+    return mock_query
+
+
 class TestGetDevicesDiff:
-    """Tests for the get_devices_diff facade method."""
+    """Tests for the get_devices_diff facade method (bulk comparison engine)."""
 
     @pytest.mark.asyncio
     @pytest.mark.unit
     @pytest.mark.checkmk
     async def test_device_with_host_not_found_status_mapped_to_missing(self) -> None:
-        """compare_device_config returns 'host_not_found' → checkmk_status='missing'."""
-        svc = _make_service()
-        mock_nautobot = AsyncMock()
-        mock_nautobot.graphql_query.return_value = {
-            "data": {"devices": [_nautobot_device()]}
-        }
-        comparison = DeviceComparison(
-            result="host_not_found",
-            diff="Host 'router1' not found in CheckMK",
-        )
-        with patch(_PATCH_NAUTOBOT, return_value=mock_nautobot):
-            with patch.object(
-                svc, "compare_device_config", new=AsyncMock(return_value=comparison)
-            ):
-                result = await svc.get_devices_diff()
+        """Host absent from get_all_hosts → checkmk_status='missing'."""
+        svc = _make_service(query_service=_bulk_query([_nautobot_device()]))
+        with _patch_client(FakeCheckMKClient()):
+            result = await svc.get_devices_diff()
 
         assert result.total == 1
         assert result.devices[0]["checkmk_status"] == "missing"
@@ -414,18 +426,12 @@ class TestGetDevicesDiff:
     @pytest.mark.unit
     @pytest.mark.checkmk
     async def test_device_with_equal_status_preserved(self) -> None:
-        """compare_device_config returns 'equal' → checkmk_status='equal'."""
-        svc = _make_service()
-        mock_nautobot = AsyncMock()
-        mock_nautobot.graphql_query.return_value = {
-            "data": {"devices": [_nautobot_device()]}
-        }
-        comparison = DeviceComparison(result="equal")
-        with patch(_PATCH_NAUTOBOT, return_value=mock_nautobot):
-            with patch.object(
-                svc, "compare_device_config", new=AsyncMock(return_value=comparison)
-            ):
-                result = await svc.get_devices_diff()
+        """Matching CheckMK host → checkmk_status='equal'."""
+        svc = _make_service(query_service=_bulk_query([_nautobot_device()]))
+        fake_client = FakeCheckMKClient()
+        fake_client.seed_host("router1", {"ipaddress": "10.0.0.1"}, folder="/dc1")
+        with _patch_client(fake_client):
+            result = await svc.get_devices_diff()
 
         assert result.devices[0]["checkmk_status"] == "equal"
 
@@ -433,83 +439,101 @@ class TestGetDevicesDiff:
     @pytest.mark.unit
     @pytest.mark.checkmk
     async def test_device_with_diff_status_preserved(self) -> None:
-        """compare_device_config returns 'diff' → checkmk_status='diff'."""
-        svc = _make_service()
-        mock_nautobot = AsyncMock()
-        mock_nautobot.graphql_query.return_value = {
-            "data": {"devices": [_nautobot_device()]}
-        }
-        comparison = DeviceComparison(
-            result="diff", diff="attributes.'ipaddress': differs"
-        )
-        with patch(_PATCH_NAUTOBOT, return_value=mock_nautobot):
-            with patch.object(
-                svc, "compare_device_config", new=AsyncMock(return_value=comparison)
-            ):
-                result = await svc.get_devices_diff()
+        """Differing CheckMK host → checkmk_status='diff'."""
+        svc = _make_service(query_service=_bulk_query([_nautobot_device()]))
+        fake_client = FakeCheckMKClient()
+        fake_client.seed_host("router1", {"ipaddress": "10.0.0.2"}, folder="/dc1")
+        with _patch_client(fake_client):
+            result = await svc.get_devices_diff()
 
         assert result.devices[0]["checkmk_status"] == "diff"
+        assert "ipaddress" in result.devices[0]["diff"]
 
     @pytest.mark.asyncio
     @pytest.mark.unit
     @pytest.mark.checkmk
     async def test_compare_error_sets_error_status(self) -> None:
-        """Unexpected exception in compare_device_config → checkmk_status='error'."""
-        svc = _make_service()
-        mock_nautobot = AsyncMock()
-        mock_nautobot.graphql_query.return_value = {
-            "data": {"devices": [_nautobot_device()]}
-        }
-        with patch(_PATCH_NAUTOBOT, return_value=mock_nautobot):
-            with patch.object(
-                svc,
-                "compare_device_config",
-                new=AsyncMock(side_effect=RuntimeError("unexpected")),
-            ):
-                result = await svc.get_devices_diff()
+        """Unexpected exception during normalization → checkmk_status='error'."""
+        mock_query = _bulk_query([_nautobot_device()])
+        mock_query.normalize_device_data.side_effect = RuntimeError("unexpected")
+        svc = _make_service(query_service=mock_query)
+        with _patch_client(FakeCheckMKClient()):
+            result = await svc.get_devices_diff()
 
         assert result.devices[0]["checkmk_status"] == "error"
+        assert "unexpected" in result.devices[0]["diff"]
 
     @pytest.mark.asyncio
     @pytest.mark.unit
     @pytest.mark.checkmk
     async def test_multiple_devices_all_included_in_result(self) -> None:
-        """Multiple Nautobot devices → all present in DeviceListWithStatus."""
-        svc = _make_service()
-        mock_nautobot = AsyncMock()
-        mock_nautobot.graphql_query.return_value = {
-            "data": {
-                "devices": [
+        """Multiple Nautobot devices → all present, in Nautobot order."""
+        svc = _make_service(
+            query_service=_bulk_query(
+                [
                     _nautobot_device("id1", "router1"),
                     _nautobot_device("id2", "switch1"),
                     _nautobot_device("id3", "firewall1"),
                 ]
-            }
-        }
-        comparison = DeviceComparison(result="equal")
-        with patch(_PATCH_NAUTOBOT, return_value=mock_nautobot):
-            with patch.object(
-                svc, "compare_device_config", new=AsyncMock(return_value=comparison)
-            ):
-                result = await svc.get_devices_diff()
+            )
+        )
+        with _patch_client(FakeCheckMKClient()):
+            result = await svc.get_devices_diff()
 
         assert result.total == 3
-        names = {d["name"] for d in result.devices}
-        assert names == {"router1", "switch1", "firewall1"}
+        assert [d["name"] for d in result.devices] == [
+            "router1",
+            "switch1",
+            "firewall1",
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    @pytest.mark.checkmk
+    async def test_checkmk_hosts_fetched_once(self) -> None:
+        """All hosts come from one get_all_hosts call; get_host is never used."""
+        svc = _make_service(
+            query_service=_bulk_query(
+                [_nautobot_device("id1", "router1"), _nautobot_device("id2", "sw1")]
+            )
+        )
+        fake_client = FakeCheckMKClient()
+        fake_client.seed_host("router1", {"ipaddress": "10.0.0.1"}, folder="/dc1")
+        with _patch_client(fake_client):
+            await svc.get_devices_diff()
+
+        methods = [method for method, _ in fake_client.call_log]
+        assert methods.count("get_all_hosts") == 1
+        assert "get_host" not in methods
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    @pytest.mark.checkmk
+    async def test_checkmk_hosts_fetched_with_async_client(self) -> None:
+        """The host fetch uses the async client and closes it afterwards."""
+        svc = _make_service(query_service=_bulk_query([_nautobot_device()]))
+        client = FakeAsyncCheckMKClient()
+        with patch(_PATCH_CLIENT, return_value=client):
+            result = await svc.get_devices_diff()
+
+        assert result.devices[0]["checkmk_status"] == "missing"
+        assert client.closed is True
 
     @pytest.mark.asyncio
     @pytest.mark.unit
     @pytest.mark.checkmk
     async def test_graphql_errors_raise_http_500(self) -> None:
-        """GraphQL response containing 'errors' → HTTPException 500 raised."""
+        """Nautobot paging failure → HTTPException 500 raised."""
         from fastapi import HTTPException
 
-        svc = _make_service()
-        mock_nautobot = AsyncMock()
-        mock_nautobot.graphql_query.return_value = {
-            "errors": [{"message": "query failed"}]
-        }
-        with patch(_PATCH_NAUTOBOT, return_value=mock_nautobot):
+        from services.nautobot.common.exceptions import NautobotAPIError
+
+        svc = _make_service(
+            query_service=_bulk_query(
+                [], error=NautobotAPIError("GraphQL errors: query failed")
+            )
+        )
+        with _patch_client(FakeCheckMKClient()):
             with pytest.raises(HTTPException) as exc_info:
                 await svc.get_devices_diff()
 
@@ -520,10 +544,11 @@ class TestGetDevicesDiff:
     @pytest.mark.checkmk
     async def test_result_includes_ignored_attributes_from_config(self) -> None:
         """DeviceListWithStatus.ignored_attributes reflects the config."""
-        svc = _make_service(ignore_attributes=["meta_data", "labels"])
-        mock_nautobot = AsyncMock()
-        mock_nautobot.graphql_query.return_value = {"data": {"devices": []}}
-        with patch(_PATCH_NAUTOBOT, return_value=mock_nautobot):
+        svc = _make_service(
+            query_service=_bulk_query([]),
+            ignore_attributes=["meta_data", "labels"],
+        )
+        with _patch_client(FakeCheckMKClient()):
             result = await svc.get_devices_diff()
 
         assert "meta_data" in result.ignored_attributes
@@ -50,12 +50,13 @@ async def test_add_device_success(ops: DeviceSyncOperations) -> None:
     folder_svc.create_path = AsyncMock(return_value=True)
     ops._folder = folder_svc
 
-    client = MagicMock()
+    client = AsyncMock()
+    client.__aenter__.return_value = client
     client.create_host.return_value = {"id": "host-1"}
     client.start_service_discovery.return_value = {"started": True}
 
     with (
-        patch("service_factory.build_checkmk_client", return_value=client),
+        patch("service_factory.build_async_checkmk_client", return_value=client),
         patch(
             "services.checkmk.sync.operations.get_device_site_from_normalized_data",
             return_value="site1",
@@ -65,7 +66,8 @@ async def test_add_device_success(ops: DeviceSyncOperations) -> None:
 
     assert result.success is True
     assert result.hostname == "router-01"
-    client.create_host.assert_called_once()
+    client.create_host.assert_awaited_once()
+    client.__aexit__.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -80,14 +82,15 @@ async def test_update_device_moves_host_when_folder_changes(
     folder_svc.create_path = AsyncMock(return_value=True)
     ops._folder = folder_svc
 
-    client = MagicMock()
+    client = AsyncMock()
+    client.__aenter__.return_value = client
     client.get_host.return_value = {
         "extensions": {"folder": "/~old-site"},
     }
     client.update_host.return_value = {"updated": True}
 
     with (
-        patch("service_factory.build_checkmk_client", return_value=client),
+        patch("service_factory.build_async_checkmk_client", return_value=client),
         patch(
             "services.checkmk.sync.operations.get_device_site_from_normalized_data",
             return_value="site1",
@@ -101,7 +104,7 @@ async def test_update_device_moves_host_when_folder_changes(
 
     assert result.success is True
     assert result.folder_changed is True
-    client.move_host.assert_called_once()
+    client.move_host.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -112,11 +115,12 @@ async def test_update_device_host_not_found_in_checkmk(
     from services.checkmk.exceptions import CheckMKAPIError
 
     ops.query_service.get_device_normalized = AsyncMock(return_value=_normalized())
-    client = MagicMock()
+    client = AsyncMock()
+    client.__aenter__.return_value = client
     client.get_host.side_effect = CheckMKAPIError("404 not found", status_code=404)
 
     with (
-        patch("service_factory.build_checkmk_client", return_value=client),
+        patch("service_factory.build_async_checkmk_client", return_value=client),
         patch(
             "services.checkmk.sync.operations.get_device_site_from_normalized_data",
             return_value="site1",
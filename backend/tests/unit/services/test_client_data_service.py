@@ -56,6 +56,7 @@ def test_get_client_data_delegates_all_filters():
         hostname="myhost",
         page=2,
         page_size=25,
+        cursor=120,
     )
 
     mock_repo.get_client_data.assert_called_once_with(
@@ -68,6 +69,7 @@ def test_get_client_data_delegates_all_filters():
         hostname="myhost",
         page=2,
         page_size=25,
+        cursor=120,
     )
 
 
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
+from concurrent.futures import Future
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,12 +14,37 @@ import redis
 from services.cockpit_agent.cockpit_agent_service import CockpitAgentService
 
 
+class _StubDispatcher:
+    """Hands out plain futures that tests resolve by hand."""
+
+    def __init__(self) -> None:
+        self.futures: dict[str, Future] = {}
+        self.discarded: list[str] = []
+
+    def expect(self, agent_id: str, command_id: str) -> Future:
+        return self.futures.setdefault(command_id, Future())
+
+    async def expect_async(self, agent_id: str, command_id: str) -> Future:
+        return self.expect(agent_id, command_id)
+
+    def discard(self, agent_id: str, command_id: str) -> None:
+        self.discarded.append(command_id)
+
+    def resolve(self, command_id: str, **response) -> None:
+        self.futures[command_id].set_result({"command_id": command_id, **response})
+
+
 @pytest.fixture
-def service() -> CockpitAgentService:
+def dispatcher() -> _StubDispatcher:
+    return _StubDispatcher()
+
+
+@pytest.fixture
+def service(dispatcher: _StubDispatcher) -> CockpitAgentService:
     db = MagicMock()
     with patch.object(CockpitAgentService, "_get_redis_client") as redis_factory:
         redis_factory.return_value = MagicMock()
-        svc = CockpitAgentService(db)
+        svc = CockpitAgentService(db, dispatcher=dispatcher)
     svc.repository = MagicMock()
     # Commands are HMAC-signed/encrypted with the agent's shared secret,
     # which must be a real string (MagicMock breaks hashing).
@@ -78,28 +106,17 @@ def test_send_git_pull_success(service: CockpitAgentService) -> None:
 
 
 @pytest.mark.unit
-def test_wait_for_response_success(service: CockpitAgentService) -> None:
-    pubsub = MagicMock()
-    pubsub.get_message.return_value = {
-        "type": "message",
-        "data": json.dumps(
-            {
-                "command_id": "cmd-1",
-                "status": "success",
-                "output": "done",
-                "execution_time_ms": 12,
-            }
-        ),
-    }
-
-    redis_sub = MagicMock()
-    redis_sub.pubsub.return_value = pubsub
+def test_wait_for_response_success(
+    service: CockpitAgentService, dispatcher: _StubDispatcher
+) -> None:
+    dispatcher.expect("agent-1", "cmd-1")
+    dispatcher.resolve("cmd-1", status="success", output="done", execution_time_ms=12)
 
-    with patch("redis.from_url", return_value=redis_sub):
-        result = service.wait_for_response("agent-1", "cmd-1", timeout=5)
+    result = service.wait_for_response("agent-1", "cmd-1", timeout=5)
 
     assert result["status"] == "success"
     service.repository.update_command_result.assert_called_once()
+    assert dispatcher.discarded == ["cmd-1"]
 
 
 @pytest.mark.unit
@@ -136,17 +153,83 @@ def test_list_agents_scans_redis_keys(service: CockpitAgentService) -> None:
 
 
 @pytest.mark.unit
-def test_wait_for_response_timeout(service: CockpitAgentService) -> None:
-    pubsub = MagicMock()
-    pubsub.get_message.return_value = None
+def test_wait_for_response_timeout(
+    service: CockpitAgentService, dispatcher: _StubDispatcher
+) -> None:
+    result = service.wait_for_response("agent-1", "cmd-1", timeout=0)
 
-    redis_sub = MagicMock()
-    redis_sub.pubsub.return_value = pubsub
+    assert result["status"] == "timeout"
+    assert dispatcher.discarded == ["cmd-1"]
 
-    with patch("redis.from_url", return_value=redis_sub):
-        result = service.wait_for_response("agent-1", "cmd-1", timeout=0)
 
-    assert result["status"] == "timeout"
+@pytest.mark.unit
+def test_send_command_and_wait_registers_before_sending(
+    service: CockpitAgentService, dispatcher: _StubDispatcher
+) -> None:
+    def send(agent_id, command, params, sent_by, command_id):
+        # The reply may arrive before send_command even returns
+        assert command_id in dispatcher.futures
+        dispatcher.resolve(command_id, status="success", output={"ok": True})
+        return command_id
+
+    with patch.object(service, "send_command", side_effect=send):
+        result = service.send_command_and_wait("agent-1", "ping", {}, "alice")
+
+    assert result["status"] == "success"
+    assert dispatcher.discarded == [result["command_id"]]
+    stored = service.repository.update_command_result.call_args.kwargs
+    assert stored["output"] == json.dumps({"ok": True})
+
+
+@pytest.mark.unit
+def test_send_command_and_wait_records_redis_error(
+    service: CockpitAgentService, dispatcher: _StubDispatcher
+) -> None:
+    def send(agent_id, command, params, sent_by, command_id):
+        dispatcher.futures[command_id].set_exception(redis.ConnectionError("lost"))
+        return command_id
+
+    with (
+        patch.object(service, "send_command", side_effect=send),
+        pytest.raises(redis.ConnectionError),
+    ):
+        service.send_command_and_wait("agent-1", "ping", {}, "alice")
+
+    assert service.repository.update_command_result.call_args.kwargs["status"] == (
+        "error"
+    )
+    assert len(dispatcher.discarded) == 1
+
+
+@pytest.mark.unit
+async def test_send_command_and_wait_async(
+    service: CockpitAgentService, dispatcher: _StubDispatcher
+) -> None:
+    sent = []
+    loop_thread = threading.current_thread()
+
+    def send(agent_id, command, params, sent_by, command_id):
+        # Publishing and the command history write stay off the event loop
+        assert threading.current_thread() is not loop_thread
+        sent.append(command_id)
+        return command_id
+
+    with patch.object(service, "send_command", side_effect=send):
+        task = asyncio.ensure_future(
+            service.send_command_and_wait_async("agent-1", "ping", {}, "alice")
+        )
+        while not sent:
+            await asyncio.sleep(0.01)
+        dispatcher.resolve(sent[0], status="success")
+        result = await task
+
+        timed_out = await service.send_command_and_wait_async(
+            "agent-1", "ping", {}, "alice", timeout=0
+        )
+
+    assert result["status"] == "success"
+    assert timed_out["status"] == "timeout"
+    assert dispatcher.discarded == sent
 
 
 @pytest.mark.unit
@@ -320,3 +403,70 @@ def test_send_get_data_success(service: CockpitAgentService) -> None:
         sent_by="alice",
         timeout=90,
     )
+
+
+@pytest.mark.unit
+def test_command_channel_returns_responses_in_completion_order(
+    service: CockpitAgentService, dispatcher: _StubDispatcher
+) -> None:
+    with patch.object(service, "send_command"):
+        with service.open_command_channel("agent-1") as channel:
+            first = channel.send("get_running_config", {}, "alice", timeout=60)
+            second = channel.send("get_running_config", {}, "alice", timeout=60)
+            dispatcher.resolve(second, status="success")
+            responses = [channel.next_response()]
+            dispatcher.resolve(first, status="error")
+            while channel.pending:
+                response = channel.next_response()
+                if response is not None:
+                    responses.append(response)
+
+    assert [(r["command_id"], r["status"]) for r in responses] == [
+        (second, "success"),
+        (first, "error"),
+    ]
+    assert service.repository.update_command_result.call_count == 2
+    assert sorted(dispatcher.discarded) == sorted([first, second])
+
+
+@pytest.mark.unit
+def test_command_channel_times_out_each_command_separately(
+    service: CockpitAgentService, dispatcher: _StubDispatcher
+) -> None:
+    with patch.object(service, "send_command"):
+        with service.open_command_channel("agent-1") as channel:
+            first = channel.send("get_running_config", {}, "alice", timeout=0)
+            second = channel.send("get_running_config", {}, "alice", timeout=60)
+            response = channel.next_response()
+
+    assert response["command_id"] == first
+    assert response["status"] == "timeout"
+    # The second command was still pending when the channel closed
+    statuses = [
+        c.kwargs["status"]
+        for c in service.repository.update_command_result.call_args_list
+    ]
+    assert statuses == ["timeout", "error"]
+    assert dispatcher.discarded == [first, second]
+
+
+@pytest.mark.unit
+def test_command_channel_reports_resolve_errors_per_command(
+    service: CockpitAgentService, dispatcher: _StubDispatcher
+) -> None:
+    with (
+        patch.object(service, "send_command"),
+        patch.object(
+            service, "_resolve_response", side_effect=RuntimeError("redis down")
+        ),
+    ):
+        with service.open_command_channel("agent-1") as channel:
+            command_id = channel.send("get_running_config", {}, "alice", timeout=60)
+            dispatcher.resolve(command_id, status="success")
+            response = channel.next_response()
+
+    assert response == {
+        "command_id": command_id,
+        "status": "error",
+        "error": "redis down",
+    }
@@ -239,3 +239,27 @@ async def test_check_snmp_v3_async_error_indication() -> None:
 
     assert result["success"] is False
     assert "auth failure" in result["message"]
+
+
+@pytest.mark.unit
+def test_compile_patterns_compiles_once_and_keeps_invalid_errors() -> None:
+    patterns = ComplianceCheckService.compile_patterns(
+        [
+            {"pattern": r"hostname\s+\w+", "pattern_type": "must_match"},
+            {"pattern": r"([", "pattern_type": "must_match"},
+        ]
+    )
+    assert patterns[0]["regex"].pattern == r"hostname\s+\w+"
+    assert patterns[1]["regex"] is None
+
+    with patch("services.network.compliance.check.re.compile") as compile_:
+        ComplianceCheckService.check_configuration_mock(
+            "10.0.0.1", "router1", patterns[:1]
+        )
+    compile_.assert_not_called()
+
+    result = ComplianceCheckService.check_configuration_mock(
+        "10.0.0.1", "router1", patterns
+    )
+    assert result["passed"] == 1
+    assert result["pattern_results"][1]["status"] == "error"
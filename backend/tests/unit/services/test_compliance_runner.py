@@ -0,0 +1,165 @@
+"""Unit tests for services/network/compliance/runner.py."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from models.settings import DeviceCheckRequest
+from services.network.compliance.runner import ComplianceRunner, netmiko_device_type
+
+
+def _device(index: int, ip: str | None = "10.0.0.{}/24") -> DeviceCheckRequest:
+    return DeviceCheckRequest(
+        id=f"dev-{index}",
+        name=f"router{index}",
+        primary_ip4=ip.format(index) if ip else None,
+        platform="cisco_nxos",
+    )
+
+
+def _service(ssh_delay: float = 0.0, snmp_delay: float = 0.0) -> MagicMock:
+    service = MagicMock()
+    lock = threading.Lock()
+    service.ssh_state = {"running": 0, "peak": 0, "calls": []}
+
+    def check_ssh_login(device_ip, device_type, username, password):
+        state = service.ssh_state
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            state["calls"].append((device_ip, device_type, username))
+        time.sleep(ssh_delay)
+        with lock:
+            state["running"] -= 1
+        return {"success": username == "good", "details": {}}
+
+    async def check_snmp(device_ip, **kwargs):
+        await asyncio.sleep(snmp_delay)
+        return {"success": True, "details": {}}
+
+    service.check_ssh_login.side_effect = check_ssh_login
+    service.check_snmp_v1_v2c_async.side_effect = check_snmp
+    service.check_snmp_v3_async.side_effect = check_snmp
+    return service
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "platform, expected",
+    [
+        (None, "cisco_ios"),
+        ("Juniper JunOS", "juniper_junos"),
+        ("arista_eos", "arista_eos"),
+        ("Cisco NXOS", "cisco_nxos"),
+        ("cisco_xr", "cisco_xr"),
+        ("cisco_ios", "cisco_ios"),
+    ],
+)
+def test_netmiko_device_type(platform, expected) -> None:
+    assert netmiko_device_type(platform) == expected
+
+
+@pytest.mark.unit
+async def test_run_checks_devices_concurrently_in_input_order() -> None:
+    service = _service(ssh_delay=0.05)
+    runner = ComplianceRunner(
+        login_credentials=[
+            {"name": "bad creds", "username": "bad", "password": "x"},
+            {"username": "good", "password": "y"},
+        ],
+        snmp_mappings=[
+            {"name": "v2", "snmp_version": "v2c", "snmp_community": "public"},
+            {
+                "snmp_version": "v3",
+                "snmp_v3_user": "u",
+                "snmp_v3_auth_protocol": "SHA",
+                "snmp_v3_auth_password": "a",
+                "snmp_v3_priv_protocol": "AES",
+                "snmp_v3_priv_password": "p",
+            },
+        ],
+        check_ssh_logins=True,
+        check_snmp_credentials=True,
+        max_concurrency=8,
+        ssh_workers=4,
+        service=service,
+    )
+    devices = [_device(i) for i in range(8)] + [_device(8, ip=None)]
+
+    started = time.monotonic()
+    results = await runner.run(devices)
+    elapsed = time.monotonic() - started
+
+    # 16 logins of 50ms on 4 threads, not one after another
+    assert elapsed < 0.6
+    assert 1 < service.ssh_state["peak"] <= 4
+    assert [r["device_id"] for r in results] == [d.id for d in devices]
+    assert results[-1]["status"] == "skipped"
+
+    first = results[0]
+    assert first["device_ip"] == "10.0.0.0"
+    assert first["status"] == "pass"
+    ssh = first["checks"]["ssh_logins"]
+    assert (ssh["total"], ssh["passed"], ssh["failed"]) == (2, 1, 1)
+    assert [r["details"]["credential_name"] for r in ssh["results"]] == [
+        "bad creds",
+        "good",
+    ]
+    snmp = first["checks"]["snmp_credentials"]
+    assert [r["details"]["mapping_name"] for r in snmp["results"]] == [
+        "v2",
+        "Unknown",
+    ]
+    assert ("10.0.0.0", "cisco_nxos", "bad") in service.ssh_state["calls"]
+
+    summary = runner.summarize(len(devices), results)
+    assert summary["devices_checked"] == 8
+    assert summary["devices_passed"] == 8
+    assert summary["devices_skipped"] == 1
+    assert summary["checks_performed"]["ssh_logins"] is True
+
+
+@pytest.mark.unit
+async def test_stream_yields_results_as_devices_finish() -> None:
+    service = _service()
+    delays = {"10.0.0.0": 0.15, "10.0.0.1": 0.0, "10.0.0.2": 0.05}
+
+    async def check_snmp(device_ip, **kwargs):
+        await asyncio.sleep(delays[device_ip])
+        return {"success": device_ip != "10.0.0.2", "details": {}}
+
+    service.check_snmp_v1_v2c_async.side_effect = check_snmp
+    runner = ComplianceRunner(
+        snmp_mappings=[{"snmp_version": "v1", "snmp_community": "public"}],
+        check_snmp_credentials=True,
+        service=service,
+    )
+
+    results = [r async for r in runner.stream([_device(i) for i in range(3)])]
+
+    assert [r["device_id"] for r in results] == ["dev-1", "dev-2", "dev-0"]
+    assert [r["status"] for r in results] == ["pass", "fail", "pass"]
+
+
+@pytest.mark.unit
+async def test_configuration_check_uses_patterns_compiled_once() -> None:
+    runner = ComplianceRunner(
+        regex_patterns=[
+            {"pattern": r"^hostname\s+\S+", "pattern_type": "must_match"},
+            {"pattern": r"^no service pad", "pattern_type": "must_match"},
+        ],
+        check_configuration=True,
+    )
+    regexes = [p["regex"] for p in runner.patterns]
+
+    results = await runner.run([_device(i) for i in range(3)])
+
+    assert [p["regex"] for p in runner.patterns] == regexes
+    config = results[0]["checks"]["configuration"]["result"]
+    assert (config["passed"], config["failed"]) == (1, 1)
+    assert {r["status"] for r in results} == {"fail"}
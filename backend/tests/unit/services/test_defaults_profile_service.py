@@ -0,0 +1,113 @@
+"""Unit tests for services/settings/profile_service.py (defaults profiles)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from models.settings import ProfileUpdateRequest
+from routers.settings.profiles import update_profile
+from services.settings.defaults import NetworkDefaults
+from services.settings.network_defaults_service import NetworkDefaultsService
+from services.settings.profile_service import FIELD_KEYS, ProfileService
+from services.settings.settings_cache import settings_cache
+
+
+class _FakeProfileRepository:
+    """In-memory ProfileRepository shared by every instance."""
+
+    rows: dict = {}
+
+    def get_by_id(self, profile_id):
+        return self.rows.get(profile_id)
+
+    def get_by_built_in_key(self, key):
+        return next((r for r in self.rows.values() if r.built_in_key == key), None)
+
+    def name_exists(self, name, exclude_id=None):
+        return any(
+            r.name.lower() == name.lower() and r.id != exclude_id
+            for r in self.rows.values()
+        )
+
+    def create(self, name, built_in_key, **fields):
+        row = SimpleNamespace(
+            id=len(self.rows) + 1, name=name, built_in_key=built_in_key, **fields
+        )
+        self.rows[row.id] = row
+        return row
+
+    def update(self, profile_id, **fields):
+        row = self.rows[profile_id]
+        for key, value in fields.items():
+            setattr(row, key, value)
+        return row
+
+
+@pytest.fixture
+def profile_repo():
+    _FakeProfileRepository.rows = {}
+    with (
+        patch(
+            "services.settings.profile_service.ProfileRepository",
+            _FakeProfileRepository,
+        ),
+        patch(
+            "services.settings.network_defaults_service.ProfileRepository",
+            _FakeProfileRepository,
+        ),
+    ):
+        yield _FakeProfileRepository()
+
+
+def _network_defaults() -> dict:
+    service = NetworkDefaultsService(NetworkDefaults())
+    return settings_cache.get("network_defaults", service.get)
+
+
+@pytest.mark.unit
+async def test_put_on_built_in_profile_is_visible_on_next_read(profile_repo) -> None:
+    fields = {key: "" for key in FIELD_KEYS}
+    row = profile_repo.create("Network", "network", **{**fields, "platform": "ios"})
+    assert _network_defaults()["platform"] == "ios"
+
+    await update_profile(
+        row.id,
+        ProfileUpdateRequest(platform="nxos"),
+        current_user={"sub": "alice"},
+        profiles=ProfileService(),
+    )
+
+    assert _network_defaults()["platform"] == "nxos"
+
+
+@pytest.mark.unit
+def test_seeding_built_in_profiles_invalidates_cached_defaults(profile_repo) -> None:
+    assert _network_defaults()["csv_delimiter"] == ","
+    with patch.object(settings_cache, "invalidate") as invalidate:
+        with (
+            patch(
+                "services.settings.profile_service.NetworkDefaultRepository"
+            ) as network_repo,
+            patch(
+                "services.settings.profile_service.ServerDefaultRepository"
+            ) as server_repo,
+        ):
+            network_repo.return_value.get_defaults.return_value = None
+            server_repo.return_value.get_defaults.return_value = None
+            ProfileService().ensure_builtin_profiles_seeded()
+
+    invalidated = [call.args for call in invalidate.call_args_list]
+    assert invalidated == [("network_defaults",), ("server_defaults",)]
+
+
+@pytest.mark.unit
+def test_updating_custom_profile_leaves_cached_defaults(profile_repo) -> None:
+    row = profile_repo.create("Lab", None, **{key: "" for key in FIELD_KEYS})
+
+    with patch.object(settings_cache, "invalidate") as invalidate:
+        ProfileService().update(row.id, name=None, fields={"platform": "eos"})
+
+    invalidate.assert_not_called()
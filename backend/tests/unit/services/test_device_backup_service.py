@@ -0,0 +1,172 @@
+"""Unit tests for DeviceBackupService.backup_devices_via_agent()."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.nautobot.configs.backup import DeviceBackupService
+
+
+class _FakeChannel:
+    """Agent channel that answers the most recently sent command first."""
+
+    def __init__(self, fail_running_for=(), stray_responses=()):
+        self.fail_running_for = set(fail_running_for)
+        self.stray_responses = list(stray_responses)
+        self.sent = []
+        self.pending_commands = []
+        self.max_pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return None
+
+    def send(self, command, params, sent_by, timeout=30):
+        command_id = f"cmd-{len(self.sent)}"
+        self.sent.append((command, params["ip_address"]))
+        self.pending_commands.append((command_id, command, params["ip_address"]))
+        self.max_pending = max(self.max_pending, len(self.pending_commands))
+        return command_id
+
+    def next_response(self):
+        if self.stray_responses:
+            return self.stray_responses.pop()
+        if not self.pending_commands:
+            return None
+        command_id, command, ip = self.pending_commands.pop()
+        if command == "get_running_config" and ip in self.fail_running_for:
+            return {"command_id": command_id, "status": "error", "error": "auth"}
+        return {
+            "command_id": command_id,
+            "status": "success",
+            "output": {"output": f"{command} {ip}"},
+        }
+
+
+def _device(device_id: str, ip: str | None) -> dict:
+    return {
+        "id": device_id,
+        "name": f"r-{device_id}",
+        "primary_ip4": {"address": f"{ip}/24"} if ip else None,
+        "platform": {"name": "cisco_ios"},
+    }
+
+
+def _service(devices: dict) -> DeviceBackupService:
+    service = DeviceBackupService(nautobot_service=MagicMock())
+    service.config_service = MagicMock()
+    service.config_service.fetch_devices_from_nautobot.return_value = devices
+    service.config_service.save_configs_to_disk.side_effect = lambda **kw: {
+        "running_file": f"{kw['device']['name']}.running",
+        "startup_file": f"{kw['device']['name']}.startup",
+    }
+    return service
+
+
+def _run(service, channel, device_ids, online=True, **kwargs):
+    agent_svc = MagicMock()
+    agent_svc.check_agent_online.return_value = online
+    agent_svc.resolve_credential.return_value = ("admin", "secret")
+    agent_svc.open_command_channel.return_value = channel
+    with patch(
+        "services.cockpit_agent.cockpit_agent_service.CockpitAgentService",
+        return_value=agent_svc,
+    ):
+        results = list(
+            service.backup_devices_via_agent(
+                agent_id="agent-1",
+                db=MagicMock(),
+                device_ids=device_ids,
+                repo_dir=MagicMock(),
+                credential_id=7,
+                current_date="20260101_000000",
+                **kwargs,
+            )
+        )
+    return agent_svc, results
+
+
+@pytest.mark.unit
+def test_backup_devices_via_agent_windows_commands_and_isolates_failures() -> None:
+    devices = {
+        "d1": _device("d1", "10.0.0.1"),
+        "d2": _device("d2", "10.0.0.2"),
+        "d3": _device("d3", None),
+        "d5": _device("d5", "10.0.0.5"),
+    }
+    service = _service(devices)
+    channel = _FakeChannel(fail_running_for={"10.0.0.2"})
+
+    agent_svc, results = _run(
+        service, channel, ["d1", "d2", "d3", "d4", "d5"], max_in_flight=2
+    )
+
+    by_id = {info.device_id: info for info in results}
+    assert sorted(by_id) == ["d1", "d2", "d3", "d4", "d5"]
+    assert by_id["d1"].is_successful()
+    assert by_id["d1"].running_config_bytes == len("get_running_config 10.0.0.1")
+    assert by_id["d1"].startup_config_file == "r-d1.startup"
+    assert by_id["d5"].is_successful()
+    assert "auth" in by_id["d2"].error
+    assert by_id["d3"].error == "No primary IP address"
+    assert by_id["d4"].error == "Failed to fetch device data from Nautobot"
+
+    # One Nautobot query, one credential lookup, never more than two in flight
+    service.config_service.fetch_devices_from_nautobot.assert_called_once()
+    agent_svc.resolve_credential.assert_called_once_with(7)
+    assert channel.max_pending == 2
+    assert ("get_startup_config", "10.0.0.2") not in channel.sent
+
+
+@pytest.mark.unit
+def test_backup_devices_via_agent_offline_agent_fails_whole_batch() -> None:
+    service = _service({"d1": _device("d1", "10.0.0.1")})
+    channel = _FakeChannel()
+
+    agent_svc, results = _run(service, channel, ["d1", "d2"], online=False)
+
+    assert [info.error for info in results] == [
+        "Agent is offline or not responding",
+        "Agent is offline or not responding",
+    ]
+    assert channel.sent == []
+
+
+@pytest.mark.unit
+def test_backup_devices_via_agent_ignores_late_or_duplicate_replies() -> None:
+    service = _service({"d1": _device("d1", "10.0.0.1")})
+    stray = {"command_id": "cmd-from-earlier-run", "status": "success"}
+    channel = _FakeChannel(stray_responses=[stray])
+
+    _, results = _run(service, channel, ["d1"])
+
+    assert [info.device_id for info in results] == ["d1"]
+    assert results[0].is_successful()
+
+
+@pytest.mark.unit
+def test_backup_devices_via_agent_keeps_running_config_if_startup_send_fails() -> None:
+    service = _service({"d1": _device("d1", "10.0.0.1")})
+    channel = _FakeChannel()
+    send = channel.send
+
+    def send_or_fail(command, params, sent_by, timeout=30):
+        if command == "get_startup_config":
+            raise ConnectionError("redis down")
+        return send(command, params, sent_by, timeout)
+
+    channel.send = send_or_fail
+
+    _, results = _run(service, channel, ["d1"])
+
+    assert len(results) == 1
+    assert results[0].error is None
+    assert results[0].running_config_success
+    assert not results[0].startup_config_success
+    kwargs = service.config_service.save_configs_to_disk.call_args.kwargs
+    assert kwargs["running_config"] == "get_running_config 10.0.0.1"
+    assert kwargs["startup_config"] == ""
@@ -67,7 +67,7 @@ def fake_nb() -> FakeNautobotService:
 def creation_service(fake_nb):
     """DeviceCreationService with FakeNautobotService injected via service_factory patch."""
     with patch("service_factory.build_nautobot_service", return_value=fake_nb):
-        with patch("services.nautobot.devices.creation.audit_log_repo", MagicMock()):
+        with patch("services.nautobot.devices.creation.audit_log_writer", MagicMock()):
             yield DeviceCreationService()
 
 
@@ -253,7 +253,7 @@ async def test_create_device_duplicate_returns_error():
     """When Nautobot returns a duplicate error, result should indicate failure."""
     fake_dup = FakeNautobotService(error_on={("dcim/devices", "POST"): "duplicate"})
     with patch("service_factory.build_nautobot_service", return_value=fake_dup):
-        with patch("services.nautobot.devices.creation.audit_log_repo", MagicMock()):
+        with patch("services.nautobot.devices.creation.audit_log_writer", MagicMock()):
             service = DeviceCreationService()
 
     with pytest.raises(Exception) as exc_info:
@@ -0,0 +1,97 @@
+"""Unit tests for services/network/scanning/fping_shards.py."""
+
+from __future__ import annotations
+
+import ipaddress
+import threading
+
+import pytest
+
+from services.network.scanning.fping_shards import (
+    HostRange,
+    condense_ranges,
+    fping_shards,
+    host_range,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "cidr", ["192.168.1.0/24", "10.0.0.0/31", "10.0.0.7/32", "2001:db8::/126"]
+)
+def test_host_range_matches_ipaddress_hosts(cidr):
+    network = ipaddress.ip_network(cidr)
+    expected = [str(ip) for ip in network.hosts()] or [str(network.network_address)]
+
+    assert list(host_range(cidr).addresses()) == expected
+
+
+@pytest.mark.unit
+def test_host_range_rejects_oversized_and_invalid_networks():
+    with pytest.raises(ValueError, match="too large"):
+        host_range("10.0.0.0/13")
+    with pytest.raises(ValueError, match="Invalid CIDR"):
+        host_range("10.0.0.300/24")
+
+
+@pytest.mark.unit
+def test_condense_ranges_merges_adjacent_shard_gaps():
+    first = int(ipaddress.ip_address("10.0.0.1"))
+    ranges = [
+        HostRange(first + 10, first + 20),
+        HostRange(first, first + 4),
+        HostRange(first + 5, first + 8),
+        HostRange(first + 254, first + 300),
+    ]
+
+    assert condense_ranges(ranges) == [
+        "10.0.0.1 - 9",
+        "10.0.0.11 - 21",
+        "10.0.0.255 - 10.0.1.45",
+    ]
+
+
+@pytest.mark.unit
+def test_fping_shards_streams_a_slash14_in_bounded_parallel_shards():
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0, "largest": 0, "scanned": 0}
+    alive_marker = {"10.4.0.1", "10.5.128.77", "10.7.255.254"}
+
+    def ping(addresses):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            state["largest"] = max(state["largest"], len(addresses))
+        try:
+            return {ip for ip in addresses if ip in alive_marker} | {"192.0.2.1"}
+        finally:
+            with lock:
+                state["running"] -= 1
+
+    ranges = {"10.4.0.0/14": host_range("10.4.0.0/14")}
+    alive = []
+    gaps = []
+    for shard in fping_shards(ranges, ping, workers=4, shard_size=4096):
+        state["scanned"] += len(shard.hosts)
+        alive.extend(shard.alive)
+        gaps.extend(shard.unreachable())
+
+    assert state["scanned"] == (1 << 18) - 2
+    assert state["largest"] == 4096
+    assert state["peak"] <= 4
+    assert sorted(alive) == sorted(alive_marker)
+    assert condense_ranges(gaps) == [
+        "10.4.0.2 - 10.5.128.76",
+        "10.5.128.78 - 10.7.255.253",
+    ]
+
+
+@pytest.mark.unit
+def test_fping_shards_reports_failed_shard_as_unreachable():
+    def ping(addresses):
+        raise RuntimeError("fping crashed")
+
+    results = list(fping_shards({"10.0.0.0/30": host_range("10.0.0.0/30")}, ping))
+
+    assert [r.alive for r in results] == [[]]
+    assert condense_ranges(results[0].unreachable()) == ["10.0.0.1 - 2"]
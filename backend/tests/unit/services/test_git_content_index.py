@@ -0,0 +1,283 @@
+"""Unit tests for the persistent git content index and index-backed search."""
+
+from __future__ import annotations
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+from git import Repo
+
+from models.git_content_search import GitContentSearchRequest
+from services.git import content_index, file_catalog
+from services.git.content_index import GitContentIndex, refresh_content_index
+from services.git.file_search_service import GitFileSearchService
+
+_REPO = {"id": 7, "name": "device-configs", "branch": "main"}
+
+
+def _commit(repo: Repo, files: dict, message: str) -> str:
+    workdir = repo.working_tree_dir
+    for name, content in files.items():
+        path = f"{workdir}/{name}"
+        if content is None:
+            repo.index.remove([name], working_tree=True)
+            continue
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        repo.index.add([name])
+    return repo.index.commit(message).hexsha
+
+
+def _age_files(repo: Repo) -> None:
+    """Move working file mtimes out of the racily-clean window."""
+    past = time.time() - 60
+    for name in os.listdir(repo.working_tree_dir):
+        if not name.startswith("."):
+            os.utime(os.path.join(repo.working_tree_dir, name), (past, past))
+
+
+def _wait_for_index() -> None:
+    for thread in list(content_index._refreshes.values()):
+        thread.join(timeout=10)
+
+
+@pytest.fixture(autouse=True)
+def _clear_file_catalogs():
+    file_catalog._catalogs.clear()
+    yield
+    file_catalog._catalogs.clear()
+
+
+@pytest.fixture
+def git_repo(tmp_path) -> Repo:
+    repo = Repo.init(tmp_path / "repo")
+    with repo.config_writer() as cfg:
+        cfg.set_value("user", "name", "test")
+        cfg.set_value("user", "email", "test@example.com")
+    _commit(
+        repo,
+        {
+            "r1.cfg": "hostname r1\nsnmp-server community public\n",
+            "r2.cfg": "hostname r2\nntp server 10.0.0.1\n",
+        },
+        "initial",
+    )
+    return repo
+
+
+@pytest.mark.unit
+def test_index_filters_blobs_by_trigrams(git_repo, tmp_path) -> None:
+    with GitContentIndex(tmp_path / "idx.sqlite3") as index:
+        index.refresh(git_repo)
+        files = index.files()
+
+        assert sorted(files) == ["r1.cfg", "r2.cfg"]
+        assert index.matching_blobs("SNMP-Server") == {files["r1.cfg"]}
+        assert index.matching_blobs("hostname") == set(files.values())
+        assert index.matching_blobs("bgp") == set()
+        assert index.matching_blobs("r1") is None
+
+
+@pytest.mark.unit
+def test_index_refresh_applies_diff_incrementally(git_repo, tmp_path) -> None:
+    with GitContentIndex(tmp_path / "idx.sqlite3") as index:
+        index.refresh(git_repo)
+        head = _commit(
+            git_repo,
+            {"r2.cfg": None, "r3.cfg": "hostname r3\nlogging host 10.1.1.1\n"},
+            "replace r2",
+        )
+
+        with patch.object(
+            GitContentIndex, "_ls_tree", wraps=GitContentIndex._ls_tree
+        ) as ls_tree:
+            index.refresh(git_repo)
+
+        assert index.indexed_commit() == head
+        assert sorted(index.files()) == ["r1.cfg", "r3.cfg"]
+        assert ls_tree.call_args.args[2] == ["r2.cfg", "r3.cfg"]
+        assert index.matching_blobs("logging host") == {index.files()["r3.cfg"]}
+
+
+@pytest.mark.unit
+def test_refresh_content_index_skips_repositories_without_index(
+    git_repo, tmp_path
+) -> None:
+    with patch("config.settings") as settings:
+        settings.data_directory = str(tmp_path / "data")
+        refresh_content_index(_REPO, git_repo)
+
+    assert not (tmp_path / "data" / "git_index").exists()
+
+
+def _search(git_repo, tmp_path, request):
+    svc = GitFileSearchService()
+    with (
+        patch(
+            "services.git.file_search_service.git_repo_manager.get_repository",
+            return_value=_REPO,
+        ),
+        patch(
+            "services.git.file_search_service.git_repo_path",
+            return_value=git_repo.working_tree_dir,
+        ),
+        patch(
+            "services.git.file_search_service.get_git_repo_by_id",
+            return_value=git_repo,
+        ),
+        patch("config.settings") as settings,
+    ):
+        settings.allowed_file_extensions = [".cfg"]
+        settings.data_directory = str(tmp_path / "data")
+        return svc.search_file_content(1, request)["data"]
+
+
+@pytest.mark.unit
+def test_current_search_reads_only_candidate_and_dirty_files(
+    git_repo, tmp_path
+) -> None:
+    _age_files(git_repo)
+    # Uncommitted edit: the HEAD blob has no match but the working file does
+    with open(f"{git_repo.working_tree_dir}/r2.cfg", "a", encoding="utf-8") as f:
+        f.write("snmp-server community private\n")
+
+    with patch.object(
+        GitFileSearchService,
+        "_read_text_file",
+        wraps=GitFileSearchService._read_text_file,
+    ) as read:
+        data = _search(git_repo, tmp_path, GitContentSearchRequest(query="snmp"))
+        _wait_for_index()
+
+    # No index yet: every file is scanned while it is built in the background
+    assert data["files_scanned"] == 2
+    assert [m["file_path"] for m in data["matches"]] == ["r1.cfg", "r2.cfg"]
+    assert read.call_count == 2
+
+    with patch.object(
+        GitFileSearchService,
+        "_read_text_file",
+        wraps=GitFileSearchService._read_text_file,
+    ) as read:
+        data = _search(git_repo, tmp_path, GitContentSearchRequest(query="snmp"))
+
+    assert [m["file_path"] for m in data["matches"]] == ["r1.cfg", "r2.cfg"]
+    assert read.call_count == 2
+
+    with patch.object(
+        GitFileSearchService,
+        "_read_text_file",
+        wraps=GitFileSearchService._read_text_file,
+    ) as read:
+        data = _search(git_repo, tmp_path, GitContentSearchRequest(query="logging"))
+
+    assert data["total_matches"] == 0
+    assert read.call_count == 1  # only the modified r2.cfg
+
+
+@pytest.mark.unit
+def test_history_search_opens_only_matching_blobs(git_repo, tmp_path) -> None:
+    _commit(git_repo, {"r1.cfg": "hostname r1\n"}, "drop snmp")
+    _commit(git_repo, {"r1.cfg": "hostname r1-new\n"}, "rename")
+
+    request = GitContentSearchRequest(query="community", include_history=True)
+    _search(git_repo, tmp_path, request)
+    _wait_for_index()
+
+    with patch.object(
+        GitFileSearchService,
+        "_read_blob_text",
+        wraps=GitFileSearchService._read_blob_text,
+    ) as read:
+        data = _search(git_repo, tmp_path, request)
+
+    assert data["total_matches"] == 1
+    assert data["matches"][0]["commit_message"] == "initial"
+    # The old blobs were read once to index them; their text was reused
+    assert read.call_count == 0
+
+    with patch.object(
+        GitFileSearchService,
+        "_read_blob_text",
+        wraps=GitFileSearchService._read_blob_text,
+    ) as read:
+        data = _search(git_repo, tmp_path, request)
+
+    assert data["total_matches"] == 1
+    assert read.call_count == 1
+
+
+@pytest.mark.unit
+def test_refresh_prunes_blobs_of_removed_files(git_repo, tmp_path) -> None:
+    old_r1 = git_repo.head.commit.tree["r1.cfg"].hexsha
+    with GitContentIndex(tmp_path / "idx.sqlite3") as index:
+        index.refresh(git_repo)
+        r2 = index.files()["r2.cfg"]
+        _commit(git_repo, {"r1.cfg": "hostname r1\n"}, "drop snmp")
+        index.refresh(git_repo)
+        index.ensure_blobs(git_repo, "r1.cfg", [old_r1])
+
+        _commit(git_repo, {"r2.cfg": None}, "remove r2")
+        index.refresh(git_repo)
+
+        # r1's history blob is kept, r2's blob and postings are gone
+        assert index.matching_blobs("community") == {old_r1}
+        assert index.matching_blobs("ntp server") == set()
+        assert r2 not in index._known({r2})
+
+        _commit(git_repo, {"r1.cfg": None}, "remove r1")
+        index.refresh(git_repo)
+
+        assert index.matching_blobs("hostname") == set()
+        assert index._conn.execute("SELECT COUNT(*) FROM postings").fetchone() == (0,)
+
+
+@pytest.mark.unit
+def test_unchanged_files_follow_working_copy(git_repo, tmp_path) -> None:
+    _age_files(git_repo)
+    root = git_repo.working_tree_dir
+    paths = ["r1.cfg", "r2.cfg", "untracked.cfg"]
+    with GitContentIndex(tmp_path / "idx.sqlite3") as index:
+        index.refresh(git_repo)
+        assert index.unchanged_files(root, ["r2.cfg"]) == {
+            "r2.cfg": index.files()["r2.cfg"]
+        }
+        assert sorted(index.unchanged_files(root, paths)) == ["r1.cfg", "r2.cfg"]
+
+        with open(f"{root}/r2.cfg", "a", encoding="utf-8") as f:
+            f.write("logging host 10.1.1.1\n")
+        assert sorted(index.unchanged_files(root, paths)) == ["r1.cfg"]
+
+        # Reverting the edit counts once the working copy is checked again
+        git_repo.git.checkout("--", "r2.cfg")
+        _age_files(git_repo)
+        index.refresh(git_repo)
+        assert sorted(index.unchanged_files(root, paths)) == ["r1.cfg", "r2.cfg"]
+
+
+@pytest.mark.unit
+def test_current_search_stats_only_ruled_out_candidates(git_repo, tmp_path) -> None:
+    _commit(git_repo, {"r3.cfg": "hostname r3\n", "notes.txt": "ntp\n"}, "more")
+    _age_files(git_repo)
+    with open(f"{git_repo.working_tree_dir}/new.cfg", "w", encoding="utf-8") as f:
+        f.write("ntp server 10.0.0.2\n")
+    request = GitContentSearchRequest(query="ntp server")
+    _search(git_repo, tmp_path, request)
+    _wait_for_index()
+
+    with (
+        patch("services.git.file_search_service.os.walk") as walk,
+        patch.object(content_index, "_stat", wraps=content_index._stat) as stat,
+    ):
+        data = _search(git_repo, tmp_path, request)
+
+    # The untracked new.cfg comes from the file catalog's working tree overlay
+    assert [m["file_path"] for m in data["matches"]] == ["new.cfg", "r2.cfg"]
+    walk.assert_not_called()
+    # r2.cfg may match and new.cfg is not indexed, so both are read unchecked
+    assert sorted(call.args[1] for call in stat.call_args_list) == [
+        "r1.cfg",
+        "r3.cfg",
+    ]
@@ -76,6 +76,7 @@ def test_search_file_content_current_mode(tmp_path) -> None:
             ):
                 with patch("config.settings") as settings:
                     settings.allowed_file_extensions = [".cfg"]
+                    settings.data_directory = str(tmp_path / "data")
                     result = svc.search_file_content(1, request)
 
     assert result["success"] is True
@@ -122,6 +123,7 @@ def test_search_file_content_path_filter_excludes_files(tmp_path) -> None:
             ):
                 with patch("config.settings") as settings:
                     settings.allowed_file_extensions = [".cfg"]
+                    settings.data_directory = str(tmp_path / "data")
                     result = svc.search_file_content(1, request)
 
     assert result["data"]["total_matches"] == 1
@@ -163,6 +165,7 @@ def test_search_file_content_history_mode(tmp_path) -> None:
             ):
                 with patch("config.settings") as settings:
                     settings.allowed_file_extensions = [".cfg"]
+                    settings.data_directory = str(tmp_path / "data")
                     result = svc.search_file_content(1, request)
 
     assert result["data"]["search_mode"] == "history"
@@ -262,3 +265,190 @@ def test_search_file_content_diff_mode_ignores_unchanged_lines() -> None:
                 result = svc.search_file_content(1, request)
 
     assert result["data"]["total_matches"] == 0
+
+
+@pytest.mark.unit
+def test_search_file_content_history_reads_each_blob_once(tmp_path) -> None:
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    (repo_dir / "router.cfg").write_text("current\n", encoding="utf-8")
+
+    blob = MagicMock()
+    blob.hexsha = "f" * 40
+    blob.data_stream.read.return_value = b"hostname r1\nlegacy line\n"
+
+    commits = []
+    for idx, char in enumerate("cde"):
+        commit = MagicMock()
+        commit.hexsha = char * 40
+        commit.message = f"backup {idx}"
+        commit.committed_datetime.isoformat.return_value = f"2024-01-0{idx + 1}"
+        commit.tree.__truediv__.return_value = blob
+        commits.append(commit)
+
+    mock_repo = MagicMock()
+    mock_repo.iter_commits.return_value = commits
+
+    svc = GitFileService()
+    request = GitContentSearchRequest(query="legacy", include_history=True)
+
+    with patch(
+        "services.git.file_search_service.git_repo_manager.get_repository",
+        return_value=_REPO,
+    ):
+        with patch(
+            "services.git.file_search_service.git_repo_path", return_value=str(repo_dir)
+        ):
+            with patch(
+                "services.git.file_search_service.get_git_repo_by_id",
+                return_value=mock_repo,
+            ):
+                with patch("config.settings") as settings:
+                    settings.allowed_file_extensions = [".cfg"]
+                    settings.data_directory = str(tmp_path / "data")
+                    result = svc.search_file_content(1, request)
+
+    matches = result["data"]["matches"]
+    assert [m["commit"] for m in matches] == ["cccccccc", "dddddddd", "eeeeeeee"]
+    assert {m["file_path"] for m in matches} == {"router.cfg"}
+    assert matches[1]["commit_message"] == "backup 1"
+    assert all(m["line_number"] == 2 for m in matches)
+    blob.data_stream.read.assert_called_once()
+
+
+@pytest.mark.unit
+def test_blob_text_cache_evicts_least_recently_used() -> None:
+    from services.git.file_search_service import _BlobTextCache
+
+    cache = _BlobTextCache(max_chars=10)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    assert cache.get("a") == (True, "aaaa")  # "b" is now least recent
+
+    cache.put("c", "cccc")
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, "aaaa")
+    assert cache.get("c") == (True, "cccc")
+
+
+def _current_search(repo_dir, request):
+    mock_repo = MagicMock()
+    mock_repo.head.commit.hexsha = "a" * 40
+    svc = GitFileService()
+    with (
+        patch(
+            "services.git.file_search_service.git_repo_manager.get_repository",
+            return_value=_REPO,
+        ),
+        patch(
+            "services.git.file_search_service.git_repo_path",
+            return_value=str(repo_dir),
+        ),
+        patch(
+            "services.git.file_search_service.get_git_repo_by_id",
+            return_value=mock_repo,
+        ),
+        patch("config.settings") as settings,
+    ):
+        settings.allowed_file_extensions = [".cfg"]
+        settings.data_directory = str(repo_dir.parent / "data")
+        return svc.search_file_content(1, request)["data"]
+
+
+@pytest.fixture
+def three_configs(tmp_path):
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    for name in ("a", "b", "c"):
+        (repo_dir / f"{name}.cfg").write_text(
+            f"interface {name}1\nhostname {name}\ninterface {name}2\n",
+            encoding="utf-8",
+        )
+    return repo_dir
+
+
+@pytest.mark.unit
+def test_streaming_search_stops_once_page_is_full(three_configs) -> None:
+    data = _current_search(
+        three_configs, GitContentSearchRequest(query="interface", limit=3, stream=True)
+    )
+
+    assert [(m["file_path"], m["line_number"]) for m in data["matches"]] == [
+        ("a.cfg", 1),
+        ("a.cfg", 3),
+        ("b.cfg", 1),
+    ]
+    assert data["truncated"] is True
+    assert data["files_scanned"] == 2
+    assert data["total_is_estimate"] is True
+    assert data["total_matches"] == 6
+    assert data["next_cursor"]
+
+
+@pytest.mark.unit
+def test_streaming_search_resumes_from_cursor(three_configs) -> None:
+    first = _current_search(
+        three_configs, GitContentSearchRequest(query="interface", limit=3, stream=True)
+    )
+    second = _current_search(
+        three_configs,
+        GitContentSearchRequest(
+            query="interface", limit=3, stream=True, cursor=first["next_cursor"]
+        ),
+    )
+
+    assert [(m["file_path"], m["line_number"]) for m in second["matches"]] == [
+        ("b.cfg", 3),
+        ("c.cfg", 1),
+        ("c.cfg", 3),
+    ]
+    assert second["truncated"] is False
+    assert second["next_cursor"] is None
+    assert second["total_is_estimate"] is False
+
+
+@pytest.mark.unit
+def test_streaming_search_count_total_is_exact(three_configs) -> None:
+    data = _current_search(
+        three_configs,
+        GitContentSearchRequest(
+            query="interface", limit=1, stream=True, count_total=True
+        ),
+    )
+
+    assert len(data["matches"]) == 1
+    assert data["total_matches"] == 6
+    assert data["total_is_estimate"] is False
+    assert data["truncated"] is True
+
+
+@pytest.mark.unit
+def test_streaming_search_rejects_invalid_cursor(three_configs) -> None:
+    request = GitContentSearchRequest(query="interface", stream=True, cursor="!!")
+
+    with pytest.raises(HTTPException) as exc:
+        _current_search(three_configs, request)
+
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.unit
+def test_streaming_search_rejects_offset_with_cursor(three_configs) -> None:
+    first = _current_search(
+        three_configs, GitContentSearchRequest(query="interface", limit=3, stream=True)
+    )
+    request = GitContentSearchRequest(
+        query="interface", offset=3, stream=True, cursor=first["next_cursor"]
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        _current_search(three_configs, request)
+
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.unit
+def test_content_search_request_cursor_requires_stream() -> None:
+    with pytest.raises(ValidationError):
+        GitContentSearchRequest(query="interface", cursor="abc")
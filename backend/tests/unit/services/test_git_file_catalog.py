@@ -0,0 +1,231 @@
+"""Unit tests for the git file catalog and the listings served from it."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from git import Repo
+
+from services.git import file_catalog
+from services.git.file_catalog import get_file_catalog, invalidate_file_catalog
+from services.git.file_list_service import GitFileListService
+
+_REPO = {"id": 11, "name": "device-configs", "branch": "main"}
+
+
+def _commit(repo: Repo, files: dict, message: str) -> str:
+    workdir = repo.working_tree_dir
+    for name, content in files.items():
+        path = os.path.join(workdir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        repo.index.add([name])
+    return repo.index.commit(message).hexsha
+
+
+@pytest.fixture
+def git_repo(tmp_path) -> Repo:
+    repo = Repo.init(tmp_path / "repo")
+    with repo.config_writer() as cfg:
+        cfg.set_value("user", "name", "test")
+        cfg.set_value("user", "email", "test@example.com")
+    _commit(
+        repo,
+        {
+            "README.md": "configs\n",
+            ".gitignore": "*.tmp\n",
+            "site-a/core/r1.cfg": "hostname r1\n",
+            "site-a/core/r2.cfg": "hostname r2\n",
+            "site-a/access/sw1.cfg": "hostname sw1\n",
+            "Site-B/router-b1.cfg": "hostname router-b1\n",
+        },
+        "initial",
+    )
+    yield repo
+    invalidate_file_catalog(_REPO["id"])
+
+
+def _call(git_repo, method, *args, **kwargs):
+    svc = GitFileListService()
+    with (
+        patch(
+            "services.git.file_list_service.git_repo_manager.get_repository",
+            return_value=_REPO,
+        ),
+        patch(
+            "services.git.file_list_service.git_repo_path",
+            return_value=git_repo.working_tree_dir,
+        ),
+        patch(
+            "services.git.file_list_service.get_git_repo_by_id",
+            return_value=git_repo,
+        ),
+    ):
+        return getattr(svc, method)(_REPO["id"], *args, **kwargs)
+
+
+@pytest.mark.unit
+def test_catalog_lists_head_tree_with_sizes(git_repo) -> None:
+    catalog = get_file_catalog(_REPO["id"], git_repo.working_tree_dir)
+
+    assert catalog.paths == [
+        "README.md",
+        "Site-B/router-b1.cfg",
+        "site-a/access/sw1.cfg",
+        "site-a/core/r1.cfg",
+        "site-a/core/r2.cfg",
+    ]
+    assert catalog.sizes["site-a/core/r1.cfg"] == len("hostname r1\n")
+    assert catalog.directories[""] == (["site-a", "Site-B"], ["README.md"])
+    assert catalog.directories["site-a"] == (["access", "core"], [])
+    assert catalog.is_directory("site-a/core")
+    assert catalog.is_file("site-a/core/r1.cfg")
+
+
+@pytest.mark.unit
+def test_catalog_is_reused_until_head_moves(git_repo) -> None:
+    workdir = git_repo.working_tree_dir
+    first = get_file_catalog(_REPO["id"], workdir)
+
+    with patch.object(
+        file_catalog, "build_file_catalog", wraps=file_catalog.build_file_catalog
+    ) as build:
+        assert get_file_catalog(_REPO["id"], workdir) is first
+        assert build.call_count == 0
+
+        _commit(git_repo, {"site-c/r9.cfg": "hostname r9\n"}, "add r9")
+        second = get_file_catalog(_REPO["id"], workdir)
+
+    assert build.call_count == 1
+    assert "site-c/r9.cfg" in second.paths
+
+
+def _edit_working_tree(workdir: str) -> None:
+    with open(os.path.join(workdir, "site-a/core/r1.cfg"), "a") as handle:
+        handle.write("interface lo0\n")
+    os.remove(os.path.join(workdir, "site-a/core/r2.cfg"))
+    os.makedirs(os.path.join(workdir, "site-d/new"))
+    with open(os.path.join(workdir, "site-d/new/r7.cfg"), "w") as handle:
+        handle.write("hostname r7\n")
+    with open(os.path.join(workdir, "scratch.tmp"), "w") as handle:
+        handle.write("ignored\n")
+
+
+def _wait_for_overlay() -> None:
+    for thread in list(file_catalog._overlay_refreshes.values()):
+        thread.join(timeout=10)
+
+
+@pytest.mark.unit
+def test_catalog_includes_uncommitted_changes(git_repo) -> None:
+    workdir = git_repo.working_tree_dir
+    first = get_file_catalog(_REPO["id"], workdir)
+    _edit_working_tree(workdir)
+
+    # A write through Cockpit drops the entry; the rebuild sees the changes
+    invalidate_file_catalog(_REPO["id"])
+    catalog = get_file_catalog(_REPO["id"], workdir)
+
+    assert catalog is not first
+    assert "site-a/core/r2.cfg" not in catalog.paths
+    assert catalog.sizes["site-a/core/r1.cfg"] == len("hostname r1\ninterface lo0\n")
+    assert catalog.sizes["site-d/new/r7.cfg"] == len("hostname r7\n")
+    assert catalog.directories["site-d"] == (["new"], [])
+    assert "scratch.tmp" not in catalog.paths
+    assert get_file_catalog(_REPO["id"], workdir) is catalog
+
+
+@pytest.mark.unit
+def test_catalog_lookup_does_not_check_working_tree(git_repo) -> None:
+    workdir = git_repo.working_tree_dir
+    first = get_file_catalog(_REPO["id"], workdir)
+    _edit_working_tree(workdir)
+
+    with patch.object(
+        file_catalog, "working_tree_changes", wraps=file_catalog.working_tree_changes
+    ) as status:
+        assert get_file_catalog(_REPO["id"], workdir) is first
+
+    status.assert_not_called()
+
+
+@pytest.mark.unit
+def test_catalog_overlay_refreshes_in_background(git_repo) -> None:
+    workdir = git_repo.working_tree_dir
+    first = get_file_catalog(_REPO["id"], workdir)
+    _edit_working_tree(workdir)
+
+    with patch.object(file_catalog, "OVERLAY_INTERVAL", 0):
+        # The stale entry is served while the working tree is re-checked
+        assert get_file_catalog(_REPO["id"], workdir) is first
+        _wait_for_overlay()
+
+    catalog = get_file_catalog(_REPO["id"], workdir)
+    assert catalog is not first
+    assert catalog.sizes["site-d/new/r7.cfg"] == len("hostname r7\n")
+    assert "site-a/core/r2.cfg" not in catalog.paths
+
+
+@pytest.mark.unit
+def test_catalog_is_none_outside_git(tmp_path) -> None:
+    assert get_file_catalog(99, str(tmp_path)) is None
+
+
+@pytest.mark.unit
+def test_search_files_matches_paths_from_catalog(git_repo) -> None:
+    with patch("services.git.file_list_service.os.walk") as walk:
+        result = _call(git_repo, "search_files", query="R1")
+        by_directory = _call(git_repo, "search_files", query="site-b")
+
+    walk.assert_not_called()
+    data = result["data"]
+    assert data["total_count"] == 5
+    assert [f["path"] for f in data["files"]] == ["site-a/core/r1.cfg"]
+    assert [f["path"] for f in by_directory["data"]["files"]] == [
+        "Site-B/router-b1.cfg"
+    ]
+    assert data["files"][0] == {
+        "name": "r1.cfg",
+        "path": "site-a/core/r1.cfg",
+        "directory": "site-a/core",
+        "size": len("hostname r1\n"),
+    }
+
+
+@pytest.mark.unit
+def test_directory_tree_from_catalog(git_repo) -> None:
+    tree = _call(git_repo, "get_directory_tree", path="site-a")
+
+    assert tree["name"] == "site-a"
+    assert tree["repository_name"] == "device-configs"
+    assert [(c["path"], c["file_count"]) for c in tree["children"]] == [
+        ("site-a/access", 1),
+        ("site-a/core", 2),
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        _call(git_repo, "get_directory_tree", path="README.md")
+    assert exc_info.value.status_code == 400
+
+    with pytest.raises(HTTPException) as exc_info:
+        _call(git_repo, "get_directory_tree", path="missing")
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.unit
+def test_directory_files_from_catalog(git_repo) -> None:
+    result = _call(git_repo, "get_directory_files", path="site-a/core")
+
+    assert result["directory_exists"] is True
+    assert [(f["name"], f["size"]) for f in result["files"]] == [
+        ("r1.cfg", len("hostname r1\n")),
+        ("r2.cfg", len("hostname r2\n")),
+    ]
+    assert result["files"][0]["last_commit"]["message"] == "initial"
+
+    missing = _call(git_repo, "get_directory_files", path="site-z")
+    assert missing["directory_exists"] is False
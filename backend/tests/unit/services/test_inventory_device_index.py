@@ -0,0 +1,344 @@
+"""
+Unit tests for the in-process device index used by inventory filtering.
+
+Covers DeviceIndex posting sets, the version-stamped process-wide index
+shared by DeviceCacheLoader, the location closure table, the IP prefix
+interval index, and InventoryEvaluator resolving indexed, location and
+prefix conditions with set algebra.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from models.inventory import LogicalCondition, LogicalOperation
+from services.inventory import device_index, prefix_index
+from services.inventory.device_cache import DeviceCacheLoader
+from services.inventory.device_index import (
+    BULK_CACHE_KEY,
+    BULK_VERSION_KEY,
+    DeviceIndex,
+)
+from services.inventory.evaluator import InventoryEvaluator
+from services.inventory.inventory import InventoryService
+from services.inventory.location_tree import (
+    LOCATION_CLOSURE_KEY,
+    build_location_closure,
+)
+from services.inventory.prefix_index import IP_INDEX_KEY, PrefixIndex
+from services.inventory.query_service import InventoryQueryService
+from tests.mocks.fake_cache_service import FakeCacheService
+
+RAW_DEVICES = [
+    {
+        "id": "dev-1",
+        "name": "lab-rtr-01",
+        "role": "router",
+        "status": "Active",
+        "platform": "cisco_ios",
+        "location": "Berlin",
+        "tags": ["core", "prod"],
+        "primary_ip4": "10.0.0.1",
+    },
+    {
+        "id": "dev-2",
+        "name": "lab-sw-01",
+        "role": "switch",
+        "status": "Active",
+        "platform": "cisco_ios",
+        "location": "Berlin",
+        "tags": ["prod"],
+        "primary_ip4": None,
+    },
+    {
+        "id": "dev-3",
+        "name": "dc-rtr-01",
+        "role": "router",
+        "status": "Planned",
+        "platform": "junos",
+        "location": "Munich",
+        "tags": [],
+        "primary_ip4": "10.0.1.1",
+    },
+]
+
+
+def _devices():
+    return [DeviceCacheLoader.parse_device(d) for d in RAW_DEVICES]
+
+
+LOCATIONS = [
+    {"id": "loc-de", "name": "Germany", "parent": None},
+    {"id": "loc-ber", "name": "Berlin", "parent": {"id": "loc-de"}},
+    {"id": "loc-muc", "name": "Munich", "parent": {"id": "loc-de"}},
+]
+
+
+# [address, parent prefix, namespace, interface device IDs, primary-for IDs]
+IP_RECORDS = [
+    ["10.0.0.1/24", "10.0.0.0/24", "Global", ["dev-1"], ["dev-1"]],
+    ["10.0.0.2/24", "10.0.0.0/24", "Global", ["dev-2"], []],
+    ["10.0.1.1/25", "10.0.1.0/25", "Global", ["dev-3"], ["dev-3"]],
+    ["10.0.1.1/25", "10.0.1.0/25", "Lab", ["dev-2"], []],
+]
+
+
+def _warm_cache(version="v1", locations=LOCATIONS, ip_version="v1"):
+    cache = FakeCacheService()
+    cache.set(BULK_CACHE_KEY, RAW_DEVICES, 3600)
+    cache.set(BULK_VERSION_KEY, version, 3600)
+    if locations is not None:
+        cache.set(LOCATION_CLOSURE_KEY, build_location_closure(locations), 600)
+    if ip_version is not None:
+        cache.set(IP_INDEX_KEY, {"version": ip_version, "records": IP_RECORDS}, 3600)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_index():
+    device_index.reset_shared_index()
+    prefix_index.reset_shared_index()
+    yield
+    device_index.reset_shared_index()
+    prefix_index.reset_shared_index()
+
+
+@pytest.mark.unit
+class TestDeviceIndex:
+    def test_lookup_returns_posting_sets(self):
+        index = DeviceIndex(_devices())
+
+        assert index.lookup("role", "router") == {"dev-1", "dev-3"}
+        assert index.lookup("tag", "prod") == {"dev-1", "dev-2"}
+        assert index.lookup("platform", "unknown") == frozenset()
+
+    def test_lookup_contains_is_case_insensitive(self):
+        index = DeviceIndex(_devices())
+
+        assert index.lookup_contains("name", "RTR") == {"dev-1", "dev-3"}
+
+    def test_with_primary_ip(self):
+        index = DeviceIndex(_devices())
+
+        assert index.with_primary_ip(True) == {"dev-1", "dev-3"}
+        assert index.with_primary_ip(False) == {"dev-2"}
+
+    def test_devices_for_skips_unknown_ids(self):
+        index = DeviceIndex(_devices())
+
+        assert [d.id for d in index.devices_for(["dev-2", "missing"])] == ["dev-2"]
+
+
+@pytest.mark.unit
+class TestSharedIndex:
+    @pytest.mark.asyncio
+    async def test_loaders_reuse_index_for_same_version(self):
+        cache = _warm_cache("v1")
+
+        first = await DeviceCacheLoader(cache).get_index()
+        cache.set(BULK_CACHE_KEY, [], 3600)  # would be an empty index if re-parsed
+        second = await DeviceCacheLoader(cache).get_index()
+
+        assert second is first
+        assert len(second) == 3
+
+    @pytest.mark.asyncio
+    async def test_new_version_rebuilds_index(self):
+        cache = _warm_cache("v1")
+        first = await DeviceCacheLoader(cache).get_index()
+
+        cache.set(BULK_CACHE_KEY, RAW_DEVICES[:1], 3600)
+        cache.set(BULK_VERSION_KEY, "v2", 3600)
+        second = await DeviceCacheLoader(cache).get_index()
+
+        assert second is not first
+        assert second.all_ids == {"dev-1"}
+
+    @pytest.mark.asyncio
+    async def test_unversioned_index_is_not_shared(self):
+        loader = DeviceCacheLoader(None)
+        loader.set_devices(_devices())
+
+        assert (await loader.get_index()) is not None
+        assert device_index.get_shared_index("") is None
+
+
+@pytest.mark.unit
+class TestIndexedConditions:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.query_service = InventoryQueryService(_warm_cache())
+        self.evaluator = InventoryEvaluator(self.query_service)
+
+    @pytest.mark.asyncio
+    async def test_equals_condition_returns_ids_without_device_data(self):
+        ids, op_count, devices = await self.evaluator._execute_condition(
+            LogicalCondition(field="role", operator="equals", value="router")
+        )
+
+        assert ids == {"dev-1", "dev-3"}
+        assert op_count == 1
+        assert devices == {}
+
+    @pytest.mark.asyncio
+    async def test_not_equals_is_complement(self):
+        ids, _, _ = await self.evaluator._execute_condition(
+            LogicalCondition(field="tag", operator="not_equals", value="prod")
+        )
+
+        assert ids == {"dev-3"}
+
+    @pytest.mark.asyncio
+    async def test_name_not_contains(self):
+        ids, _, _ = await self.evaluator._execute_condition(
+            LogicalCondition(field="name", operator="not_contains", value="lab")
+        )
+
+        assert ids == {"dev-3"}
+
+    @pytest.mark.asyncio
+    async def test_whitespace_value_matches_nothing(self):
+        ids, _, _ = await self.evaluator._execute_condition(
+            LogicalCondition(field="role", operator="not_equals", value="  ")
+        )
+
+        assert ids == set()
+
+    @pytest.mark.asyncio
+    async def test_preview_resolves_indexed_ids_to_devices(self):
+        service = InventoryService(cache_service=_warm_cache())
+
+        with patch.object(
+            service.query_service, "_query_all_devices_live", new=AsyncMock()
+        ) as live:
+            devices, op_count = await service.preview_inventory(
+                [
+                    LogicalOperation(
+                        operation_type="AND",
+                        conditions=[
+                            LogicalCondition(
+                                field="status", operator="equals", value="Active"
+                            ),
+                            LogicalCondition(
+                                field="has_primary", operator="equals", value="true"
+                            ),
+                        ],
+                    )
+                ]
+            )
+
+        live.assert_not_called()
+        assert [d.name for d in devices] == ["lab-rtr-01"]
+        assert op_count == 2
+
+
+@pytest.mark.unit
+class TestLocationTree:
+    def test_closure_includes_self_and_descendants(self):
+        closure = build_location_closure(LOCATIONS)
+
+        assert closure == {
+            "Germany": ["Berlin", "Germany", "Munich"],
+            "Berlin": ["Berlin"],
+            "Munich": ["Munich"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_parent_location_matches_devices_in_children(self):
+        evaluator = InventoryEvaluator(InventoryQueryService(_warm_cache()))
+
+        ids, _, _ = await evaluator._execute_condition(
+            LogicalCondition(field="location", operator="equals", value="Germany")
+        )
+        negated, _, _ = await evaluator._execute_condition(
+            LogicalCondition(field="location", operator="not_equals", value="Berlin")
+        )
+
+        assert ids == {"dev-1", "dev-2", "dev-3"}
+        assert negated == {"dev-3"}
+
+    @pytest.mark.asyncio
+    async def test_location_contains_uses_index(self):
+        evaluator = InventoryEvaluator(InventoryQueryService(_warm_cache()))
+
+        ids, _, _ = await evaluator._execute_condition(
+            LogicalCondition(field="location", operator="contains", value="mun")
+        )
+
+        assert ids == {"dev-3"}
+
+    @pytest.mark.asyncio
+    async def test_missing_closure_falls_back_to_nautobot(self, mock_nautobot_service):
+        query_service = InventoryQueryService(_warm_cache(locations=None))
+        mock_nautobot_service.graphql_query = AsyncMock(
+            return_value={"data": {"devices": [{"id": "dev-9", "name": "new"}]}}
+        )
+
+        with patch(
+            "service_factory.build_nautobot_service",
+            return_value=mock_nautobot_service,
+        ):
+            devices = await query_service._query_devices_by_location("Germany")
+
+        mock_nautobot_service.graphql_query.assert_awaited_once()
+        assert [d.id for d in devices] == ["dev-9"]
+
+
+@pytest.mark.unit
+class TestPrefixIndex:
+    def test_within_include_matches_parent_prefixes_inside_cidr(self):
+        index = PrefixIndex(IP_RECORDS)
+
+        assert index.match("10.0.0.0/16") == {"dev-1", "dev-2", "dev-3"}
+        assert index.match("10.0.0.0/24") == {"dev-1", "dev-2"}
+
+    def test_within_excludes_the_prefix_itself(self):
+        index = PrefixIndex(IP_RECORDS)
+
+        assert index.match("10.0.1.0/25", operator="within") == frozenset()
+        assert index.match("10.0.1.0/24", operator="within") == {"dev-2", "dev-3"}
+
+    def test_exact_and_namespace(self):
+        index = PrefixIndex(IP_RECORDS)
+
+        assert index.match("10.0.1.0/25", "Lab", operator="exact") == {"dev-2"}
+
+    def test_match_primary_only_counts_primary_devices(self):
+        index = PrefixIndex(IP_RECORDS)
+
+        assert index.match_primary("10.0.0.0/23") == {"dev-1", "dev-3"}
+
+    def test_invalid_cidr_raises(self):
+        with pytest.raises(ValueError):
+            PrefixIndex(IP_RECORDS).match("not-a-prefix")
+
+    @pytest.mark.asyncio
+    async def test_evaluator_uses_index_for_ip_prefix(self):
+        evaluator = InventoryEvaluator(InventoryQueryService(_warm_cache()))
+
+        ids, _, devices = await evaluator._execute_condition(
+            LogicalCondition(
+                field="ip_prefix", operator="within_include", value="10.0.1.0/24 Lab"
+            )
+        )
+
+        assert ids == {"dev-2"}
+        assert devices == {}
+
+    @pytest.mark.asyncio
+    async def test_stale_index_falls_back_to_nautobot(self, mock_nautobot_service):
+        query_service = InventoryQueryService(_warm_cache(ip_version="old"))
+        mock_nautobot_service.graphql_query = AsyncMock(
+            return_value={"data": {"ip_addresses": []}}
+        )
+
+        with patch(
+            "service_factory.build_nautobot_service",
+            return_value=mock_nautobot_service,
+        ):
+            devices = await query_service._query_devices_by_primary_prefix(
+                "10.0.0.0/24"
+            )
+
+        mock_nautobot_service.graphql_query.assert_awaited_once()
+        assert devices == []
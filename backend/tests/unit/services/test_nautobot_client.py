@@ -88,6 +88,29 @@ async def test_rest_request_204_returns_success_message() -> None:
     assert result["status"] == "success"
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rest_write_invalidates_cached_resolutions() -> None:
+    from services.nautobot.resolvers.resolution_cache import resolution_cache
+
+    svc = NautobotService()
+    mock_response = MagicMock(status_code=200)
+    mock_response.json.return_value = {"id": "role-1", "name": "Core"}
+    resolution_cache.set("roles", "name", "Edge", "role-1")
+
+    with (
+        patch.object(svc, "_get_config", return_value=_config()),
+        patch.object(svc, "_do_request", AsyncMock(return_value=mock_response)),
+    ):
+        await svc.rest_request("extras/roles/", method="GET")
+        assert resolution_cache.get("roles", "name", "Edge") == (True, "role-1")
+        await svc.rest_request(
+            "extras/roles/role-1/", method="PATCH", data={"name": "Core"}
+        )
+
+    assert resolution_cache.get("roles", "name", "Edge") == (False, None)
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_test_connection_success() -> None:
@@ -125,3 +148,142 @@ async def test_graphql_query_timeout_raises_api_error() -> None:
     ):
         with pytest.raises(NautobotAPIError, match="timed out"):
             await svc.graphql_query("query {}", {})
+
+
+def _page_responder(total: int):
+    """graphql_query side effect serving ``total`` devices via limit/offset."""
+
+    async def _graphql(query: str, variables: dict) -> dict:
+        start = variables["offset"]
+        stop = min(start + variables["limit"], total)
+        return {"data": {"devices": [{"id": str(i)} for i in range(start, stop)]}}
+
+    return _graphql
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_iter_device_pages_yields_all_pages_in_order() -> None:
+    svc = NautobotService()
+    graphql = AsyncMock(side_effect=_page_responder(25))
+
+    with patch.object(svc, "graphql_query", graphql):
+        pages = [
+            page
+            async for page in svc.iter_device_pages(
+                "id", page_size=10, max_concurrency=3
+            )
+        ]
+
+    assert [len(p) for p in pages] == [10, 10, 5]
+    assert [d["id"] for p in pages for d in p] == [str(i) for i in range(25)]
+    # One probe page, then a parallel wave of three pages.
+    assert graphql.await_count == 4
+    assert svc._client is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_iter_device_pages_single_request_for_small_collection() -> None:
+    svc = NautobotService()
+    graphql = AsyncMock(side_effect=_page_responder(3))
+
+    with patch.object(svc, "graphql_query", graphql):
+        pages = [page async for page in svc.iter_device_pages("id", page_size=10)]
+
+    assert [len(p) for p in pages] == [3]
+    graphql.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_paginate_graphql_raises_on_graphql_errors() -> None:
+    svc = NautobotService()
+    graphql = AsyncMock(return_value={"errors": [{"message": "bad"}]})
+
+    with patch.object(svc, "graphql_query", graphql):
+        with pytest.raises(NautobotAPIError, match="GraphQL errors"):
+            async for _ in svc.iter_device_pages("id"):
+                pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bulk_update_sends_chunked_list_patches() -> None:
+    svc = NautobotService()
+    rest = AsyncMock(return_value=[])
+    updates = [{"id": str(i), "description": "x"} for i in range(5)]
+
+    progress = []
+
+    with patch.object(svc, "rest_request", rest):
+        errors = await svc.bulk_update(
+            "/dcim/devices",
+            updates,
+            chunk_size=2,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+
+    assert errors == {}
+    # One report per chunk, the last one once every update was sent
+    assert len(progress) == 3
+    assert progress[-1] == (5, 5)
+    # Two full chunks as list PATCHes, the trailing single update as a plain PATCH
+    endpoints = sorted(call.args[0] for call in rest.await_args_list)
+    assert endpoints == ["dcim/devices/", "dcim/devices/", "dcim/devices/4/"]
+    assert rest.await_args_list[0].kwargs["method"] == "PATCH"
+    assert svc._client is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bulk_update_isolates_failures_of_rejected_chunk() -> None:
+    svc = NautobotService()
+
+    async def _rest(endpoint, method="GET", data=None):
+        if endpoint == "dcim/devices/" or endpoint == "dcim/devices/b/":
+            raise NautobotAPIError("REST request failed with status 400")
+        return {}
+
+    rest = AsyncMock(side_effect=_rest)
+    updates = [{"id": "a", "status": "x"}, {"id": "b", "status": "y"}]
+
+    with patch.object(svc, "rest_request", rest):
+        errors = await svc.bulk_update("dcim/devices/", updates)
+
+    assert errors == {"b": "REST request failed with status 400"}
+    assert rest.await_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bulk_update_requires_ids() -> None:
+    svc = NautobotService()
+
+    with pytest.raises(NautobotValidationError, match="'id'"):
+        await svc.bulk_update("dcim/devices/", [{"status": "x"}])
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bulk_create_posts_chunks_and_isolates_failures() -> None:
+    svc = NautobotService()
+
+    async def _rest(endpoint, method="GET", data=None):
+        if isinstance(data, list) and len(data) == 2 and data[1]["address"] == "b":
+            raise NautobotAPIError("REST request failed with status 400")
+        if isinstance(data, dict) and data["address"] == "b":
+            raise NautobotAPIError("REST request failed with status 400")
+        return data
+
+    rest = AsyncMock(side_effect=_rest)
+    objects = [{"address": name} for name in ("a", "b", "c", "d")]
+
+    with patch.object(svc, "rest_request", rest):
+        errors = await svc.bulk_create("/ipam/ip-addresses", objects, chunk_size=2)
+
+    assert errors == {1: "REST request failed with status 400"}
+    # Two list POSTs, then the rejected first chunk one object at a time
+    assert rest.await_count == 4
+    assert {call.args[0] for call in rest.await_args_list} == {"ipam/ip-addresses/"}
+    assert svc._client is None
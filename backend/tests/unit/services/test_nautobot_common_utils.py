@@ -8,6 +8,7 @@ from services.nautobot.common.utils import (
     extract_id_from_url,
     extract_nested_value,
     flatten_nested_fields,
+    merge_update_data,
     normalize_tags,
     prepare_update_data,
 )
@@ -74,3 +75,18 @@ def test_extract_id_from_url() -> None:
 
     assert extract_id_from_url(url) == uuid
     assert extract_id_from_url("/api/dcim/devices/") is None
+
+
+@pytest.mark.unit
+def test_merge_update_data_merges_nested_objects() -> None:
+    first = {"status": "active", "custom_fields": {"a": "1"}, "tags": ["x"]}
+    merged = merge_update_data(
+        dict(first), {"status": "reserved", "custom_fields": {"b": "2"}, "tags": ["y"]}
+    )
+
+    assert merged == {
+        "status": "reserved",
+        "custom_fields": {"a": "1", "b": "2"},
+        "tags": ["y"],
+    }
+    assert first["custom_fields"] == {"a": "1"}
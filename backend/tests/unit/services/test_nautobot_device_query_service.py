@@ -5,6 +5,7 @@ All tests run offline - no real Nautobot instance required.
 
 from __future__ import annotations
 
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -55,7 +56,11 @@ async def test_get_device_details_returns_cached_device() -> None:
     mock_nb = MagicMock()
     mock_nb.graphql_query = AsyncMock()
     mock_cache = MagicMock()
-    mock_cache.get.return_value = cached
+    mock_cache.get.return_value = {
+        "value": cached,
+        "stored_at": time.time(),
+        "refresh_at": time.time() + 60,
+    }
     svc = _service(mock_nb, mock_cache)
 
     result = await svc.get_device_details(DEVICE_ID)
@@ -115,9 +120,6 @@ async def test_get_devices_all_paginated_builds_navigation_links() -> None:
     svc = _service(mock_nb)
 
     with (
-        patch(
-            "services.nautobot.devices.query.get_cached_device_list", return_value=None
-        ),
         patch("services.nautobot.devices.query.cache_device_list") as cache_list,
     ):
         result = await svc.get_devices(limit=1, offset=0, reload=True)
@@ -145,9 +147,6 @@ async def test_get_devices_name_filter_uses_count_then_data_query() -> None:
     svc = _service(mock_nb)
 
     with (
-        patch(
-            "services.nautobot.devices.query.get_cached_device_list", return_value=None
-        ),
         patch("services.nautobot.devices.query.cache_device_list"),
     ):
         result = await svc.get_devices(filter_type="name", filter_value="core-router")
@@ -171,9 +170,6 @@ async def test_get_devices_location_filter_flattens_location_devices() -> None:
     svc = _service(mock_nb)
 
     with (
-        patch(
-            "services.nautobot.devices.query.get_cached_device_list", return_value=None
-        ),
         patch("services.nautobot.devices.query.cache_device_list"),
     ):
         result = await svc.get_devices(filter_type="location", filter_value="DC1")
@@ -192,9 +188,6 @@ async def test_get_devices_graphql_errors_raise_nautobot_api_error() -> None:
     svc = _service(mock_nb)
 
     with (
-        patch(
-            "services.nautobot.devices.query.get_cached_device_list", return_value=None
-        ),
         patch("services.nautobot.devices.query.cache_device_list"),
         pytest.raises(NautobotAPIError, match="GraphQL errors"),
     ):
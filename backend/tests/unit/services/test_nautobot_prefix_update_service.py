@@ -5,6 +5,7 @@ All tests run offline - no real Nautobot instance required.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -147,23 +148,77 @@ def test_find_prefix_by_prefix_and_namespace_returns_first_match() -> None:
 
 @pytest.mark.unit
 @pytest.mark.nautobot
-def test_update_prefix_returns_success_on_rest_patch() -> None:
-    """REST PATCH success is returned as a simple success dict."""
-    mock_nb = MagicMock()
-    mock_nb.rest_request = AsyncMock(return_value={"id": PREFIX_ID})
+def test_update_prefixes_patches_single_prefix(mock_nautobot_service) -> None:
+    """A single update is sent as a plain REST PATCH and reports no errors."""
+    mock_nautobot_service.rest_request = AsyncMock(return_value={"id": PREFIX_ID})
     svc = PrefixUpdateService()
 
-    # The Celery-facing service bridges to async Nautobot clients with asyncio.run().
-    result = svc._update_prefix(mock_nb, PREFIX_ID, {"description": "updated"})
+    errors = asyncio.run(
+        svc._update_prefixes(
+            mock_nautobot_service, {PREFIX_ID: {"description": "updated"}}
+        )
+    )
 
-    assert result == {"success": True}
-    mock_nb.rest_request.assert_awaited_once_with(
+    assert errors == {}
+    mock_nautobot_service.rest_request.assert_awaited_once_with(
         f"ipam/prefixes/{PREFIX_ID}/",
         method="PATCH",
         data={"description": "updated"},
     )
 
 
+@pytest.mark.unit
+@pytest.mark.nautobot
+def test_run_update_bulk_patch_failure_is_reported_per_row(
+    mock_nautobot_service,
+) -> None:
+    """A rejected bulk PATCH is retried per prefix; only the bad row fails."""
+    bad_id = "af000000-0000-0000-0001-000000000002"
+
+    async def _graphql(query, variables):
+        prefix = variables["ip_prefix"][0]
+        prefix_id = PREFIX_ID if prefix == "10.0.0.0/24" else bad_id
+        return {"data": {"prefixes": [{"id": prefix_id, "prefix": prefix}]}}
+
+    async def _rest(endpoint, method="GET", data=None):
+        if endpoint == "ipam/prefixes/" or bad_id in endpoint:
+            raise RuntimeError("invalid status")
+        return {}
+
+    mock_nautobot_service.graphql_query = AsyncMock(side_effect=_graphql)
+    mock_nautobot_service.rest_request = AsyncMock(side_effect=_rest)
+    mock_job_runs = MagicMock()
+    mock_job_runs.get_job_run_by_celery_id.return_value = None
+    svc = PrefixUpdateService()
+
+    with (
+        patch(
+            "service_factory.build_nautobot_service",
+            return_value=mock_nautobot_service,
+        ),
+        patch("service_factory.build_job_run_service", return_value=mock_job_runs),
+    ):
+        result = svc.run_update(
+            task_context=_task(),
+            csv_content="prefix,namespace,description\n"
+            "10.0.0.0/24,Global,ok\n10.0.1.0/24,Global,bad\n",
+            dry_run=False,
+        )
+
+    assert result["summary"]["successful"] == 1
+    assert result["summary"]["failed"] == 1
+    assert result["successes"][0]["row"] == 1
+    assert result["failures"][0] == {
+        "row": 2,
+        "prefix": "10.0.1.0/24",
+        "namespace": "Global",
+        "uuid": bad_id,
+        "error": "invalid status",
+    }
+    # One rejected bulk request, then one PATCH per prefix
+    assert mock_nautobot_service.rest_request.await_count == 3
+
+
 @pytest.mark.unit
 @pytest.mark.nautobot
 def test_run_update_dry_run_records_planned_update() -> None:
@@ -295,7 +350,7 @@ def test_add_prefix_note_creates_when_no_existing_notes() -> None:
     )
     svc = PrefixUpdateService()
 
-    result = svc._add_prefix_note(mock_nb, PREFIX_ID, "hello")
+    result = asyncio.run(svc._add_prefix_note(mock_nb, PREFIX_ID, "hello"))
 
     assert result == {"success": True, "created": True}
     assert mock_nb.rest_request.await_count == 2
@@ -314,7 +369,7 @@ def test_add_prefix_note_skips_duplicate() -> None:
     )
     svc = PrefixUpdateService()
 
-    result = svc._add_prefix_note(mock_nb, PREFIX_ID, "same text")
+    result = asyncio.run(svc._add_prefix_note(mock_nb, PREFIX_ID, "same text"))
 
     assert result == {"success": True, "created": False}
     mock_nb.rest_request.assert_awaited_once()
@@ -333,7 +388,7 @@ def test_add_prefix_note_creates_when_most_recent_differs() -> None:
     )
     svc = PrefixUpdateService()
 
-    result = svc._add_prefix_note(mock_nb, PREFIX_ID, "new text")
+    result = asyncio.run(svc._add_prefix_note(mock_nb, PREFIX_ID, "new text"))
 
     assert result == {"success": True, "created": True}
     assert mock_nb.rest_request.await_count == 2
@@ -347,7 +402,7 @@ def test_add_prefix_note_returns_failure_on_exception() -> None:
     mock_nb.rest_request = AsyncMock(side_effect=RuntimeError("boom"))
     svc = PrefixUpdateService()
 
-    result = svc._add_prefix_note(mock_nb, PREFIX_ID, "hello")
+    result = asyncio.run(svc._add_prefix_note(mock_nb, PREFIX_ID, "hello"))
 
     assert result == {"success": False, "error": "boom"}
 
@@ -355,7 +410,7 @@ def test_add_prefix_note_returns_failure_on_exception() -> None:
 @pytest.mark.unit
 @pytest.mark.nautobot
 def test_run_update_notes_only_row_succeeds() -> None:
-    """A row where only 'notes' is mapped succeeds without calling the PATCH helper."""
+    """A row where only 'notes' is mapped succeeds without a PATCH."""
     mock_nb = MagicMock()
     mock_nb.graphql_query = AsyncMock(
         return_value={
@@ -380,7 +435,7 @@ def test_run_update_notes_only_row_succeeds() -> None:
         patch.object(
             svc, "_add_prefix_note", return_value={"success": True, "created": True}
         ) as add_note,
-        patch.object(svc, "_update_prefix") as update_prefix,
+        patch.object(svc, "_update_prefixes") as update_prefixes,
     ):
         result = svc.run_update(
             task_context=_task(),
@@ -391,7 +446,7 @@ def test_run_update_notes_only_row_succeeds() -> None:
 
     assert result["summary"]["successful"] == 1
     assert result["successes"][0]["updated_fields"] == ["notes"]
-    update_prefix.assert_not_called()
+    update_prefixes.assert_not_called()
     add_note.assert_called_once()
 
 
@@ -461,7 +516,7 @@ def test_run_update_partial_note_failure_becomes_warning() -> None:
     with (
         patch("service_factory.build_nautobot_service", return_value=mock_nb),
         patch("service_factory.build_job_run_service", return_value=mock_job_runs),
-        patch.object(svc, "_update_prefix", return_value={"success": True}),
+        patch.object(svc, "_update_prefixes", return_value={}),
         patch.object(
             svc, "_add_prefix_note", return_value={"success": False, "error": "boom"}
         ),
@@ -6,7 +6,7 @@ from collections.abc import Coroutine
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
@@ -177,59 +177,69 @@ async def test_cancel_job_cancels_running_task() -> None:
     assert "job-1" not in svc._running_jobs
 
 
+class _FakeEngine:
+    """Stands in for BulkComparisonEngine; emits ``rows`` or raises ``error``."""
+
+    def __init__(self, rows: list[dict], error: Exception | None = None) -> None:
+        self._rows = rows
+        self._error = error
+        self.discovered = 0
+        self.processed = 0
+
+    async def run(self, on_result=None, should_stop=None) -> list[dict]:
+        if self._error is not None:
+            raise self._error
+        self.discovered = len(self._rows)
+        for row in self._rows:
+            self.processed += 1
+            on_result(row)
+        return self._rows
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_process_devices_diff_completes_job() -> None:
     mock_db = MagicMock()
     mock_sync = MagicMock()
-    comparison = MagicMock()
-    comparison.result = "equal"
-    comparison.diff = ""
-    comparison.normalized_config = {}
-    comparison.checkmk_config = {}
-    mock_sync.compare_device_config = AsyncMock(return_value=comparison)
-
-    nautobot = MagicMock()
-    nautobot.graphql_query = AsyncMock(
-        return_value={
-            "data": {
-                "devices": [
-                    {
-                        "id": "uuid-1",
-                        "name": "router1",
-                        "role": {"name": "core"},
-                        "location": {"name": "DC"},
-                        "status": {"name": "active"},
-                    }
-                ]
+    mock_sync.build_comparison_engine.return_value = _FakeEngine(
+        [
+            {
+                "id": "uuid-1",
+                "name": "router1",
+                "checkmk_status": "equal",
+                "diff": "",
+                "normalized_config": {},
+                "checkmk_config": {},
             }
-        }
+        ]
     )
 
     svc = _service(mock_db, mock_sync)
 
-    with (
-        patch("service_factory.build_nautobot_service", return_value=nautobot),
-        patch("asyncio.sleep", new_callable=AsyncMock),
-    ):
-        await svc._process_devices_diff("job-diff-1")
+    await svc._process_devices_diff("job-diff-1")
 
     mock_db.update_job_status.assert_any_call("job-diff-1", JobStatus.RUNNING)
     mock_db.update_job_status.assert_any_call("job-diff-1", JobStatus.COMPLETED)
     mock_db.add_device_result.assert_called_once()
+    mock_db.update_job_progress.assert_called_with(
+        "job-diff-1", 1, 1, "Completed device comparison for 1 devices"
+    )
 
 
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_process_devices_diff_graphql_error_marks_failed() -> None:
+    from services.nautobot.common.exceptions import NautobotAPIError
+
     mock_db = MagicMock()
-    nautobot = MagicMock()
-    nautobot.graphql_query = AsyncMock(return_value={"errors": [{"message": "bad"}]})
+    mock_sync = MagicMock()
+    mock_sync.build_comparison_engine.return_value = _FakeEngine(
+        [], error=NautobotAPIError("GraphQL errors: [{'message': 'bad'}]")
+    )
 
-    svc = _service(mock_db)
+    svc = _service(mock_db, mock_sync)
 
-    with patch("service_factory.build_nautobot_service", return_value=nautobot):
-        await svc._process_devices_diff("job-bad")
+    await svc._process_devices_diff("job-bad")
 
     mock_db.update_job_status.assert_called_with(
         "job-bad",
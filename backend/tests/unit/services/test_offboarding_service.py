@@ -124,7 +124,7 @@ def mock_cache():
 @pytest.fixture(autouse=True)
 def _mock_offboarding_audit_repo():
     """Keep unit tests offline when a real PostgreSQL test DB is configured."""
-    with patch("services.nautobot.offboarding.audit.audit_log_repo", MagicMock()):
+    with patch("services.nautobot.offboarding.audit.audit_log_writer", MagicMock()):
         yield
 
 
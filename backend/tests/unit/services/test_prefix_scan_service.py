@@ -67,21 +67,9 @@ class TestExecuteWithPrefixes:
 
         with ExitStack() as stack:
             stack.enter_context(patch(_PATCH_JRS, return_value=_jrs_mock()))
-            stack.enter_context(
-                patch(
-                    "tasks.ping_network_task._expand_cidr_to_ips",
-                    return_value=["10.0.0.1", "10.0.0.2"],
-                )
-            )
             stack.enter_context(
                 patch("tasks.ping_network_task._fping_networks", return_value=alive)
             )
-            stack.enter_context(
-                patch(
-                    "tasks.ping_network_task._condense_ip_ranges",
-                    side_effect=lambda x: x,
-                )
-            )
             stack.enter_context(
                 patch("tasks.ping_network_task._resolve_dns", return_value=None)
             )
@@ -100,7 +88,8 @@ class TestExecuteWithPrefixes:
         assert result["success"] is True
         assert result["total_prefixes"] == 1
         assert result["total_reachable"] == 1
-        assert result["total_unreachable"] == 1
+        assert result["total_unreachable"] == 253
+        assert result["prefixes"][0]["unreachable"] == ["10.0.0.2 - 254"]
 
     def test_resolve_dns_called_when_enabled(self):
         svc = _make_svc()
@@ -109,21 +98,9 @@ class TestExecuteWithPrefixes:
 
         with ExitStack() as stack:
             stack.enter_context(patch(_PATCH_JRS, return_value=_jrs_mock()))
-            stack.enter_context(
-                patch(
-                    "tasks.ping_network_task._expand_cidr_to_ips",
-                    return_value=["10.0.0.1"],
-                )
-            )
             stack.enter_context(
                 patch("tasks.ping_network_task._fping_networks", return_value=alive)
             )
-            stack.enter_context(
-                patch(
-                    "tasks.ping_network_task._condense_ip_ranges",
-                    side_effect=lambda x: x,
-                )
-            )
             stack.enter_context(patch("tasks.ping_network_task._resolve_dns", dns_mock))
             result = svc.execute(
                 custom_field_name="cf",
@@ -142,21 +119,9 @@ class TestExecuteWithPrefixes:
 
         with ExitStack() as stack:
             stack.enter_context(patch(_PATCH_JRS, return_value=_jrs_mock()))
-            stack.enter_context(
-                patch(
-                    "tasks.ping_network_task._expand_cidr_to_ips",
-                    return_value=["10.0.0.1"],
-                )
-            )
             stack.enter_context(
                 patch("tasks.ping_network_task._fping_networks", return_value=set())
             )
-            stack.enter_context(
-                patch(
-                    "tasks.ping_network_task._condense_ip_ranges",
-                    side_effect=lambda x: x,
-                )
-            )
             stack.enter_context(
                 patch("tasks.ping_network_task._resolve_dns", return_value=None)
             )
@@ -169,56 +134,34 @@ class TestExecuteWithPrefixes:
 
         task_ctx.update_state.assert_called()
 
-    def test_exception_returns_failure_result(self):
+    def test_invalid_prefix_is_reported_without_failing_scan(self):
         svc = _make_svc()
 
         with patch(_PATCH_JRS, return_value=_jrs_mock()):
-            with patch(
-                "tasks.ping_network_task._expand_cidr_to_ips",
-                side_effect=RuntimeError("expand failed"),
-            ):
-                # Must also patch _fping_networks to avoid import error
-                with patch(
-                    "tasks.ping_network_task._fping_networks", return_value=set()
-                ):
-                    with patch(
-                        "tasks.ping_network_task._condense_ip_ranges",
-                        side_effect=lambda x: x,
-                    ):
-                        result = svc.execute(
-                            custom_field_name="cf",
-                            custom_field_value="v",
-                            explicit_prefixes=["10.0.0.0/24"],
-                        )
-
-        assert (
-            result["success"] is True
-        )  # expand errors are caught per-prefix, not global
+            with patch("tasks.ping_network_task._fping_networks", return_value=set()):
+                result = svc.execute(
+                    custom_field_name="cf",
+                    custom_field_value="v",
+                    explicit_prefixes=["not-a-prefix", "10.0.0.0/30"],
+                )
+
+        # expand errors are caught per-prefix, not global
+        assert result["success"] is True
+        assert [p["total_ips"] for p in result["prefixes"]] == [0, 2]
+        assert result["prefixes"][1]["unreachable"] == ["10.0.0.1 - 2"]
 
     def test_nautobot_update_called_when_response_field_set(self):
         svc = _make_svc()
-        nb_update = MagicMock(return_value=True)
-        svc._update_ip_in_nautobot = nb_update
+        nb_update = MagicMock(return_value={"updated": 1, "created": 0, "failed": 0})
+        svc._upsert_ips_in_nautobot = nb_update
         svc._update_prefix_last_scan = MagicMock(return_value=True)
         alive = {"10.0.0.1"}
 
         with ExitStack() as stack:
             stack.enter_context(patch(_PATCH_JRS, return_value=_jrs_mock()))
-            stack.enter_context(
-                patch(
-                    "tasks.ping_network_task._expand_cidr_to_ips",
-                    return_value=["10.0.0.1"],
-                )
-            )
             stack.enter_context(
                 patch("tasks.ping_network_task._fping_networks", return_value=alive)
             )
-            stack.enter_context(
-                patch(
-                    "tasks.ping_network_task._condense_ip_ranges",
-                    side_effect=lambda x: x,
-                )
-            )
             stack.enter_context(
                 patch("tasks.ping_network_task._resolve_dns", return_value=None)
             )
@@ -229,10 +172,81 @@ class TestExecuteWithPrefixes:
                 response_custom_field_name="cf_last_seen",
             )
 
-        nb_update.assert_called()
+        nb_update.assert_called_once()
+        assert nb_update.call_args.args[0] == [("10.0.0.1", "10.0.0.0/30", None)]
         svc._update_prefix_last_scan.assert_called()
 
 
+@pytest.mark.unit
+class TestUpsertIpsInNautobot:
+    def _nautobot(self, existing):
+        nb = MagicMock()
+
+        async def _graphql(query, variables=None):
+            if "ip_addresses" in query:
+                return {
+                    "data": {
+                        "ip_addresses": [
+                            {"id": existing[ip], "host": ip}
+                            for ip in variables["address"]
+                            if ip in existing
+                        ]
+                    }
+                }
+            return {
+                "data": {
+                    "inner": [
+                        {"id": "pfx-24", "prefix": "10.0.0.0/24"},
+                        {"id": "pfx-28", "prefix": "10.0.0.0/28"},
+                    ],
+                    "outer": [{"id": "pfx-16", "prefix": "10.0.0.0/16"}],
+                }
+            }
+
+        nb.graphql_query = AsyncMock(side_effect=_graphql)
+        nb.rest_request = AsyncMock(return_value={"results": [{"id": "st-active"}]})
+        nb.bulk_update = AsyncMock(return_value={})
+        nb.bulk_create = AsyncMock(return_value={})
+        return nb
+
+    def test_updates_existing_and_creates_new_in_bulk(self):
+        svc = _make_svc()
+        nb = self._nautobot({"10.0.0.1": "ip-1"})
+        entries = [
+            ("10.0.0.1", "10.0.0.0/24", "r1.example.com"),
+            ("10.0.0.2", "10.0.0.0/24", "r2.example.com"),
+            ("10.0.0.200", "10.0.0.0/24", None),
+        ]
+
+        with patch(_PATCH_NB, return_value=nb):
+            summary = svc._upsert_ips_in_nautobot(entries, "last_seen")
+
+        assert summary == {"updated": 1, "created": 2, "failed": 0}
+        assert nb.graphql_query.await_count == 2  # one IP lookup, one prefix lookup
+        updates = nb.bulk_update.await_args.args[1]
+        assert [(u["id"], u["status"]) for u in updates] == [("ip-1", "st-active")]
+        creates = nb.bulk_create.await_args.args[1]
+        assert [(c["address"], c["parent"]["id"]) for c in creates] == [
+            ("10.0.0.2/28", "pfx-28"),
+            ("10.0.0.200/24", "pfx-24"),
+        ]
+        assert creates[0]["dns_name"] == "r2.example.com"
+        assert "dns_name" not in creates[1]
+
+    def test_counts_failed_creates(self):
+        svc = _make_svc()
+        nb = self._nautobot({})
+        nb.bulk_create = AsyncMock(return_value={0: "400 duplicate"})
+
+        with patch(_PATCH_NB, return_value=nb):
+            summary = svc._upsert_ips_in_nautobot(
+                [("10.0.0.5", "10.0.0.0/24", None)], "last_seen", set_active=False
+            )
+
+        assert summary == {"updated": 0, "created": 0, "failed": 1}
+        nb.bulk_update.assert_not_awaited()
+
+
 @pytest.mark.unit
 class TestExecuteSplitJob:
     def test_splits_into_subtasks_when_max_ips_exceeded(self):
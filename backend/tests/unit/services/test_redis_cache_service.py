@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from services.settings.cache import RedisCacheService
+from tests.mocks.fake_redis import FakeRedis
 
 
 def _redis_mock() -> MagicMock:
@@ -64,14 +65,14 @@ def test_get_deletes_invalid_json() -> None:
 
 @pytest.mark.unit
 def test_set_serializes_with_ttl() -> None:
-    redis = _redis_mock()
+    redis = FakeRedis()
     svc = _service(redis)
 
     svc.set("key", {"a": 1}, ttl_seconds=120)
 
-    redis.setex.assert_called_once()
-    args = redis.setex.call_args[0]
-    assert args[1] == 120
+    assert json.loads(redis.get("cockpit-cache:key")) == {"a": 1}
+    assert redis.ttl("cockpit-cache:key") == 120
+    assert redis.hgetall("cockpit-cache:stats")["created"] == "1"
 
 
 @pytest.mark.unit
@@ -85,14 +86,17 @@ def test_delete_returns_true_when_key_removed() -> None:
 
 @pytest.mark.unit
 def test_clear_namespace_deletes_matching_keys() -> None:
-    redis = _redis_mock()
-    redis.keys.return_value = ["cockpit-cache:ns:1", "cockpit-cache:ns:2"]
-    redis.delete.return_value = 2
+    redis = FakeRedis()
     svc = _service(redis)
+    svc.set("ns:1", 1, 60)
+    svc.set("ns:2", 2, 60)
+    svc.set("other:1", 3, 60)
 
     count = svc.clear_namespace("ns")
 
     assert count == 2
+    assert redis.exists("cockpit-cache:other:1") == 1
+    assert redis.zmembers("cockpit-cache-zindex:ns") == set()
 
 
 @pytest.mark.unit
@@ -109,20 +113,16 @@ def test_stats_returns_overview() -> None:
 
 @pytest.mark.unit
 def test_get_entries_lists_keys() -> None:
-    redis = _redis_mock()
-    redis.keys.return_value = [
-        "cockpit-cache:stats",
-        "cockpit-cache:start_time",
-        "cockpit-cache:ns:k1",
-    ]
-    redis.ttl.return_value = 120
-    redis.memory_usage.return_value = 256
+    redis = FakeRedis()
     svc = _service(redis)
+    svc.set("ns:k1", "value", 120)
 
     entries = svc.get_entries()
 
     assert len(entries) == 1
     assert entries[0]["namespace"] == "ns"
+    assert entries[0]["ttl_seconds"] == 120
+    assert entries[0]["size_bytes"] > 0
 
 
 @pytest.mark.unit
@@ -138,33 +138,30 @@ def test_get_performance_metrics() -> None:
 
 @pytest.mark.unit
 def test_clear_all_deletes_cache_keys() -> None:
-    redis = _redis_mock()
-    redis.keys.return_value = [
-        "cockpit-cache:stats",
-        "cockpit-cache:start_time",
-        "cockpit-cache:a",
-        "cockpit-cache:b",
-    ]
-    redis.delete.return_value = 2
+    redis = FakeRedis()
     svc = _service(redis)
+    svc.set("a", 1, 60)
+    svc.set("b", 2, 60)
 
     count = svc.clear_all()
 
     assert count == 2
+    assert redis.exists("cockpit-cache:stats", "cockpit-cache:start_time") == 2
+    assert svc.get_entries() == []
 
 
 @pytest.mark.unit
 def test_get_namespace_info_returns_entries() -> None:
-    redis = _redis_mock()
-    redis.keys.return_value = ["cockpit-cache:nautobot:devices:all"]
-    redis.ttl.return_value = 90
-    redis.memory_usage.return_value = 512
+    redis = FakeRedis()
     svc = _service(redis)
+    svc.set("nautobot:devices:all", [1, 2], 90)
+    svc.set("nautobot:locations:list", [], 90)
 
-    info = svc.get_namespace_info("nautobot")
+    info = svc.get_namespace_info("nautobot:devices")
 
     assert info["total_entries"] == 1
-    assert info["entries"][0]["key"].startswith("nautobot:")
+    assert info["entries"][0]["key"] == "nautobot:devices:all"
+    assert info["entries"][0]["ttl_seconds"] == 90
 
 
 @pytest.mark.unit
@@ -173,3 +170,188 @@ def test_cleanup_expired_is_noop() -> None:
     svc = _service(redis)
 
     assert svc.cleanup_expired() == 0
+
+
+@pytest.mark.unit
+def test_set_many_pipelines_in_chunks_and_counts_once() -> None:
+    redis = _redis_mock()
+    pipe = MagicMock()
+    redis.pipeline.return_value = pipe
+    svc = _service(redis)
+
+    written = svc.set_many(
+        {f"nautobot:devices:{i}": {"id": i} for i in range(5)},
+        ttl_seconds=60,
+        chunk_size=2,
+    )
+
+    assert written == 5
+    redis.pipeline.assert_called_once_with(transaction=False)
+    assert pipe.setex.call_count == 5
+    assert pipe.execute.call_count == 3
+    assert pipe.setex.call_args_list[0][0] == (
+        "cockpit-cache:nautobot:devices:0",
+        60,
+        json.dumps({"id": 0}),
+    )
+    redis.setex.assert_not_called()
+    redis.hincrby.assert_called_once_with("cockpit-cache:stats", "created", 5)
+
+
+@pytest.mark.unit
+def test_set_many_skips_unserializable_entries() -> None:
+    redis = _redis_mock()
+    pipe = MagicMock()
+    redis.pipeline.return_value = pipe
+    svc = _service(redis)
+
+    written = svc.set_many([("ok", 1), ("bad", object())], ttl_seconds=60)
+
+    assert written == 1
+    assert pipe.setex.call_count == 1
+
+
+@pytest.mark.unit
+def test_namespace_index_prunes_expired_members() -> None:
+    redis = FakeRedis()
+    svc = _service(redis)
+    svc.set("ns:live", 1, 60)
+    svc.set("ns:gone", 2, 60)
+    redis.expire_now("cockpit-cache:ns:gone")
+
+    info = svc.get_namespace_info("ns")
+
+    assert [e["key"] for e in info["entries"]] == ["ns:live"]
+    assert redis.zmembers("cockpit-cache-zindex:ns") == {"ns:live"}
+
+
+@pytest.mark.unit
+def test_namespace_index_is_built_once_from_scan() -> None:
+    redis = FakeRedis()
+    redis.setex("cockpit-cache:legacy:1", 60, "1")
+    svc = _service(redis)
+
+    assert svc.clear_namespace("legacy") == 1
+    scans = redis.scan_calls
+    svc.set("legacy:2", 2, 60)
+    assert svc.clear_namespace("legacy") == 1
+    assert redis.scan_calls == scans
+
+
+@pytest.mark.unit
+def test_stats_without_index_uses_scan() -> None:
+    redis = FakeRedis()
+    with patch("services.settings.cache.redis.from_url", return_value=redis):
+        svc = RedisCacheService("redis://localhost", use_namespace_index=False)
+    svc.set("ns:a", "x", 60)
+    svc.set("other:b", "y", 60)
+
+    result = svc.stats()
+
+    assert result["overview"]["total_items"] == 2
+    assert set(result["namespaces"]) == {"ns", "other"}
+    assert svc.clear_namespace("ns") == 1
+    assert redis.zmembers("cockpit-cache-zindex:ns") == set()
+
+
+@pytest.mark.unit
+def test_acquire_lock_sets_key_outside_cache_prefix() -> None:
+    redis = _redis_mock()
+    redis.set.return_value = True
+    svc = _service(redis)
+
+    token = svc.acquire_lock("nautobot:devices:list:all", 30)
+
+    assert token
+    redis.set.assert_called_with(
+        "cockpit-cache-lock:nautobot:devices:list:all", token, nx=True, ex=30
+    )
+    redis.set.return_value = None
+    assert svc.acquire_lock("nautobot:devices:list:all", 30) is None
+
+
+@pytest.mark.unit
+def test_release_lock_compares_token() -> None:
+    redis = _redis_mock()
+    redis.eval.return_value = 1
+    svc = _service(redis)
+
+    assert svc.release_lock("k", "token") is True
+    args = redis.eval.call_args.args
+    assert args[1:] == (1, "cockpit-cache-lock:k", "token")
+
+
+@pytest.mark.unit
+def test_namespace_index_is_trimmed_on_write_once_entries_expire() -> None:
+    redis = FakeRedis()
+    svc = _service(redis)
+    with patch("services.settings.cache.time.time", return_value=1000.0):
+        svc.set("nautobot_ids:roles:name:a", "1", 60)
+        svc.set("nautobot_ids:roles:name:b", "2", 3600)
+
+    with patch("services.settings.cache.time.time", return_value=1100.0):
+        svc.set("nautobot_ids:roles:name:c", "3", 60)
+
+    assert redis.zmembers("cockpit-cache-zindex:nautobot_ids") == {
+        "nautobot_ids:roles:name:b",
+        "nautobot_ids:roles:name:c",
+    }
+    assert (
+        redis.zscore("cockpit-cache-zindex:nautobot_ids", "nautobot_ids:roles:name:c")
+        == 1160.0
+    )
+
+
+@pytest.mark.unit
+def test_index_rebuild_drops_legacy_index_sets() -> None:
+    redis = FakeRedis()
+    redis.setex("cockpit-cache:ns:1", 60, "1")
+    redis.sadd("cockpit-cache-index:ns", "ns:1", "ns:long-gone")
+    svc = _service(redis)
+
+    assert svc.rebuild_namespace_index() == 1
+    assert redis.exists("cockpit-cache-index:ns") == 0
+    assert redis.zmembers("cockpit-cache-zindex:ns") == {"ns:1"}
+
+
+@pytest.mark.unit
+def test_staged_list_is_published_on_commit() -> None:
+    fake = FakeRedis()
+    svc = _service(fake)
+    svc.set("nautobot:devices:ip_index", {"version": "old", "records": []}, 60)
+
+    staged = svc.stage_list(
+        "nautobot:devices:ip_index", 600, envelope={"version": "v2"}, field="records"
+    )
+    staged.extend([["10.0.0.1/24"], ["10.0.0.2/24"]])
+    staged.extend(iter(()))
+    staged.extend([["10.0.0.3/24"]])
+
+    # Readers keep seeing the previous value until the commit
+    assert svc.get("nautobot:devices:ip_index")["version"] == "old"
+    assert staged.commit() is True
+    assert svc.get("nautobot:devices:ip_index") == {
+        "version": "v2",
+        "records": [["10.0.0.1/24"], ["10.0.0.2/24"], ["10.0.0.3/24"]],
+    }
+    assert staged.count == 3
+    assert fake.ttl("cockpit-cache:nautobot:devices:ip_index") == 600
+    assert fake.zmembers("cockpit-cache-zindex:nautobot") == {
+        "nautobot:devices:ip_index"
+    }
+
+
+@pytest.mark.unit
+def test_staged_list_commits_empty_list_and_discards() -> None:
+    fake = FakeRedis()
+    svc = _service(fake)
+
+    empty = svc.stage_list("nautobot:devices:all", 600)
+    assert empty.commit() is True
+    assert svc.get("nautobot:devices:all") == []
+
+    dropped = svc.stage_list("nautobot:devices:all", 600)
+    dropped.extend([{"id": "1"}])
+    dropped.discard()
+    assert svc.get("nautobot:devices:all") == []
+    assert not [key for key in fake._strings if ":staging:" in key]
@@ -0,0 +1,216 @@
+"""Unit tests for services/nautobot/resolvers/resolution_cache.py.
+
+Redis is replaced by a dict-backed stand-in for RedisCacheService.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.nautobot.resolvers.metadata_resolver import MetadataResolver
+from services.nautobot.resolvers.resolution_cache import (
+    ResolutionCache,
+    device_type_field,
+    resolution_cache,
+    status_field,
+    warm_up_taxonomies,
+)
+
+ROLE_ID = "60000000-0000-0000-0000-000000000001"
+ACTIVE_ID = "10000000-0000-0000-0000-000000000001"
+PLANNED_ID = "10000000-0000-0000-0000-000000000002"
+
+
+class _FakeCacheService:
+    """Dict-backed subset of RedisCacheService (TTL ignored)."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set_many(self, items, ttl_seconds):
+        self.data.update(items)
+        return len(items)
+
+    def clear_namespace(self, namespace):
+        doomed = [k for k in self.data if k.startswith(namespace + ":")]
+        for key in doomed:
+            del self.data[key]
+        return len(doomed)
+
+
+def _role_result(*roles):
+    return {"data": {"roles": [{"id": rid, "name": name} for name, rid in roles]}}
+
+
+@pytest.mark.unit
+class TestResolutionCache:
+    @pytest.mark.asyncio
+    async def test_resolve_calls_loader_once_per_key(self):
+        cache = ResolutionCache(cache_service_factory=None)
+        loader = AsyncMock(return_value=ROLE_ID)
+
+        assert await cache.resolve("roles", "name", "Network", loader) == ROLE_ID
+        assert await cache.resolve("roles", "name", "Network", loader) == ROLE_ID
+        loader.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_cached(self):
+        cache = ResolutionCache(cache_service_factory=None)
+        loader = AsyncMock(return_value=None)
+
+        assert await cache.resolve("roles", "name", "Ghost", loader) is None
+        assert await cache.resolve("roles", "name", "Ghost", loader) is None
+        loader.assert_awaited_once()
+        assert cache.get("roles", "name", "Ghost") == (True, None)
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_is_not_cached(self):
+        cache = ResolutionCache(cache_service_factory=None)
+        loader = AsyncMock(side_effect=[RuntimeError("down"), ROLE_ID])
+
+        with pytest.raises(RuntimeError):
+            await cache.resolve("roles", "name", "Network", loader)
+        assert await cache.resolve("roles", "name", "Network", loader) == ROLE_ID
+
+    @pytest.mark.asyncio
+    async def test_resources_without_invalidation_are_not_cached(self):
+        cache = ResolutionCache(cache_service_factory=None)
+        loader = AsyncMock(return_value="device-uuid")
+
+        await cache.resolve("devices", "name", "router1", loader)
+        await cache.resolve("devices", "name", "router1", loader)
+        assert loader.await_count == 2
+
+    def test_redis_layer_is_shared_between_processes(self):
+        shared = _FakeCacheService()
+        writer = ResolutionCache(cache_service_factory=lambda: shared)
+        reader = ResolutionCache(cache_service_factory=lambda: shared)
+
+        writer.set("platforms", "name", "ios", "platform-uuid")
+        assert reader.get("platforms", "name", "ios") == (True, "platform-uuid")
+
+    def test_write_to_endpoint_invalidates_locally_and_in_redis(self):
+        shared = _FakeCacheService()
+        cache = ResolutionCache(cache_service_factory=lambda: shared)
+        cache.set("roles", "name", "Network", ROLE_ID)
+        cache.set("platforms", "name", "ios", "platform-uuid")
+
+        cache.invalidate_endpoint(f"extras/roles/{ROLE_ID}/")
+
+        assert cache.get("roles", "name", "Network") == (False, None)
+        assert cache.get("platforms", "name", "ios") == (True, "platform-uuid")
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = ResolutionCache(cache_service_factory=None, max_entries=2)
+        cache.set("roles", "name", "a", "1")
+        cache.set("roles", "name", "b", "2")
+        cache.get("roles", "name", "a")
+        cache.set("roles", "name", "c", "3")
+
+        assert cache.get("roles", "name", "b") == (False, None)
+        assert cache.get("roles", "name", "a") == (True, "1")
+
+    def test_unreachable_redis_falls_back_to_local(self):
+        factory = MagicMock(side_effect=ConnectionError("refused"))
+        cache = ResolutionCache(cache_service_factory=factory)
+
+        cache.set("roles", "name", "Network", ROLE_ID)
+        assert cache.get("roles", "name", "Network") == (True, ROLE_ID)
+        factory.assert_called_once()
+
+
+@pytest.mark.unit
+class TestCachedResolvers:
+    @pytest.mark.asyncio
+    async def test_role_resolution_queries_nautobot_once(self):
+        nautobot = MagicMock()
+        nautobot.graphql_query = AsyncMock(
+            return_value=_role_result(("Network", ROLE_ID))
+        )
+        resolver = MetadataResolver(nautobot)
+
+        for _ in range(3):
+            assert await resolver.resolve_role_id("Network") == ROLE_ID
+        nautobot.graphql_query.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_graphql_errors_are_not_cached(self):
+        nautobot = MagicMock()
+        nautobot.graphql_query = AsyncMock(
+            side_effect=[{"errors": ["boom"]}, _role_result(("Network", ROLE_ID))]
+        )
+        resolver = MetadataResolver(nautobot)
+
+        assert await resolver.resolve_role_id("Network") is None
+        assert await resolver.resolve_role_id("Network") == ROLE_ID
+
+    @pytest.mark.asyncio
+    async def test_status_lookup_caches_the_whole_content_type(self):
+        nautobot = MagicMock()
+        nautobot.rest_request = AsyncMock(
+            return_value={
+                "count": 2,
+                "results": [
+                    {"id": ACTIVE_ID, "name": "Active"},
+                    {"id": PLANNED_ID, "name": "Planned"},
+                ],
+            }
+        )
+        resolver = MetadataResolver(nautobot)
+
+        assert await resolver.resolve_status_id("active") == ACTIVE_ID
+        assert await resolver.resolve_status_id("Planned") == PLANNED_ID
+        with pytest.raises(ValueError):
+            await resolver.resolve_status_id("Retired")
+        with pytest.raises(ValueError):
+            await resolver.resolve_status_id("Retired")
+        assert nautobot.rest_request.await_count == 2
+
+
+@pytest.mark.unit
+class TestWarmUpTaxonomies:
+    @pytest.mark.asyncio
+    async def test_loads_statuses_roles_platforms_and_device_types(self):
+        nautobot = MagicMock()
+        nautobot.rest_request = AsyncMock(
+            return_value={
+                "results": [
+                    {
+                        "id": ACTIVE_ID,
+                        "name": "Active",
+                        "content_types": ["dcim.device", "ipam.prefix"],
+                    }
+                ]
+            }
+        )
+        nautobot.graphql_query = AsyncMock(
+            return_value={
+                "data": {
+                    "roles": [{"id": ROLE_ID, "name": "Network"}],
+                    "platforms": [{"id": "p-1", "name": "ios"}],
+                    "device_types": [
+                        {
+                            "id": "dt-1",
+                            "model": "C9300",
+                            "manufacturer": {"name": "Cisco"},
+                        }
+                    ],
+                }
+            }
+        )
+
+        counts = await warm_up_taxonomies(nautobot)
+
+        assert counts == {"statuses": 2, "roles": 1, "platforms": 1, "device_types": 1}
+        cached = resolution_cache.get
+        prefix_status = status_field("ipam.prefix")
+        assert cached("statuses", prefix_status, "active") == (True, ACTIVE_ID)
+        assert cached("roles", "name", "Network") == (True, ROLE_ID)
+        for manufacturer in ("Cisco", None):
+            field = device_type_field(manufacturer)
+            assert cached("device_types", field, "C9300") == (True, "dt-1")
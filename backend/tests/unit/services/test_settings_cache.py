@@ -0,0 +1,135 @@
+"""Unit tests for services/settings/settings_cache.py.
+
+Redis is replaced by an in-memory pub/sub stand-in, so no server is needed.
+"""
+
+from __future__ import annotations
+
+import queue
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.settings.settings_cache import SettingsCache
+
+
+class _FakePubSub:
+    def __init__(self, broker):
+        self.broker = broker
+        self.messages = queue.Queue()
+
+    def subscribe(self, channel):
+        self.broker.subscribers.setdefault(channel, []).append(self)
+
+    def get_message(self, timeout=0.0):
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        pass
+
+
+class _FakeRedis:
+    """Shared broker: every client created by ``client()`` sees the same channels."""
+
+    def __init__(self):
+        self.subscribers = {}
+        self.published = []
+
+    def client(self):
+        return self
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return _FakePubSub(self)
+
+    def publish(self, channel, data):
+        self.published.append((channel, data))
+        for sub in self.subscribers.get(channel, []):
+            sub.messages.put({"type": "message", "channel": channel, "data": data})
+        return len(self.subscribers.get(channel, []))
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.mark.unit
+def test_get_loads_once_and_returns_independent_copies():
+    cache = SettingsCache(redis_factory=None, unsubscribed_max_age=60)
+    loader = MagicMock(return_value={"url": "https://nb", "tags": ["a"]})
+
+    first = cache.get("nautobot", loader)
+    first["tags"].append("mutated")
+    second = cache.get("nautobot", loader)
+
+    assert loader.call_count == 1
+    assert second == {"url": "https://nb", "tags": ["a"]}
+
+
+@pytest.mark.unit
+def test_invalidate_drops_only_the_named_section():
+    cache = SettingsCache(redis_factory=None, unsubscribed_max_age=60)
+    nautobot = MagicMock(side_effect=[{"v": 1}, {"v": 2}])
+    checkmk = MagicMock(return_value={"site": "cmk"})
+
+    cache.get("nautobot", nautobot)
+    cache.get("checkmk", checkmk)
+    cache.invalidate("nautobot")
+
+    assert cache.get("nautobot", nautobot) == {"v": 2}
+    assert cache.get("checkmk", checkmk) == {"site": "cmk"}
+    assert checkmk.call_count == 1
+
+    cache.invalidate()
+    cache.get("checkmk", checkmk)
+    assert checkmk.call_count == 2
+
+
+@pytest.mark.unit
+def test_value_loaded_across_an_invalidation_is_not_stored():
+    cache = SettingsCache(redis_factory=None, unsubscribed_max_age=60)
+
+    def stale_loader():
+        # An update lands while the old value is being read
+        cache.invalidate("cache")
+        return {"enabled": False}
+
+    assert cache.get("cache", stale_loader) == {"enabled": False}
+    assert cache.get("cache", lambda: {"enabled": True}) == {"enabled": True}
+
+
+@pytest.mark.unit
+def test_entries_expire_quickly_while_not_subscribed():
+    cache = SettingsCache(redis_factory=None, unsubscribed_max_age=10)
+    loader = MagicMock(side_effect=[{"v": 1}, {"v": 2}])
+
+    with patch("services.settings.settings_cache.time.monotonic", return_value=100.0):
+        cache.get("celery", loader)
+    with patch("services.settings.settings_cache.time.monotonic", return_value=111.0):
+        assert cache.get("celery", loader) == {"v": 2}
+
+
+@pytest.mark.unit
+def test_change_published_by_another_process_invalidates_this_one():
+    broker = _FakeRedis()
+    reader = SettingsCache(redis_factory=broker.client, channel="test-settings")
+    writer = SettingsCache(redis_factory=broker.client, channel="test-settings")
+    loader = MagicMock(side_effect=[{"timeout": 30}, {"timeout": 60}])
+
+    reader.get("nautobot", loader)
+    _wait_for(lambda: reader._subscribed)
+    assert reader.get("nautobot", loader) == {"timeout": 30}
+    assert loader.call_count == 1
+
+    writer.invalidate("nautobot")
+
+    assert ("test-settings", "nautobot") in broker.published
+    _wait_for(lambda: "nautobot" not in reader._entries)
+    assert reader.get("nautobot", loader) == {"timeout": 60}
@@ -253,3 +253,108 @@ def test_execute_backup_parallel_returns_running_status() -> None:
     assert result["success"] is True
     assert result["status"] == "running"
     assert result["chord_id"] == "chord-123"
+
+
+@pytest.mark.unit
+def test_execute_backup_agent_window_batches_devices(tmp_path) -> None:
+    """Agent backups with parallel_tasks > 1 run batches with one DB session each."""
+    repo_dir = tmp_path / "config-repo"
+    repo_dir.mkdir()
+    (repo_dir / ".git").mkdir()
+
+    credentials = MagicMock()
+    credentials.get_credential_by_id.return_value = {
+        "id": 10,
+        "name": "ssh",
+        "username": "admin",
+    }
+    credentials.get_decrypted_password.return_value = "secret"
+
+    mock_git = MagicMock()
+    mock_git.get_repo_path.return_value = repo_dir
+    mock_git.open_or_clone.return_value = MagicMock(
+        active_branch="main", head=MagicMock(commit=MagicMock(hexsha="abcdef12"))
+    )
+    mock_git.pull.return_value = SimpleNamespace(success=True, message="ok")
+    mock_git.commit_and_push.return_value = SimpleNamespace(
+        success=True,
+        message="pushed",
+        commit_sha="deadbeef",
+        pushed=True,
+        files_changed=3,
+    )
+
+    mock_git_auth = MagicMock()
+    mock_git_auth.resolve_credentials.return_value = ("git-user", "token", None)
+
+    schedule_service = MagicMock()
+    schedule_service.get_job_schedule.return_value = {"job_template_id": 44}
+    template_service = MagicMock()
+    template_service.get_job_template.return_value = {
+        "config_repository_id": 123,
+        "parallel_tasks": 4,
+        "backup_agent_id": "agent-1",
+    }
+
+    def backup_batch(**kwargs):
+        for device_id in kwargs["device_ids"]:
+            info = MagicMock()
+            info.is_successful.return_value = device_id != "dev-3"
+            info.to_dict.return_value = {"device_id": device_id}
+            yield info
+
+    backup_service = MagicMock()
+    backup_service.backup_devices_via_agent.side_effect = backup_batch
+    sessions = []
+
+    with (
+        patch("service_factory.build_git_service", return_value=mock_git),
+        patch("service_factory.build_git_auth_service", return_value=mock_git_auth),
+        patch("service_factory.build_credentials_service", return_value=credentials),
+        patch(
+            "service_factory.build_job_schedule_service", return_value=schedule_service
+        ),
+        patch(
+            "service_factory.build_job_template_service", return_value=template_service
+        ),
+        patch(
+            "services.git.shared_utils.git_repo_manager",
+            MagicMock(
+                get_repository=MagicMock(
+                    return_value={"id": 123, "name": "c", "url": "u", "branch": "main"}
+                )
+            ),
+        ),
+        patch(
+            "services.nautobot.configs.backup.DeviceBackupService",
+            return_value=backup_service,
+        ),
+        patch("tasks.execution.backup_executor.AGENT_BACKUP_BATCH_SIZE", 2),
+        patch(
+            "core.database.get_db_session",
+            side_effect=lambda: sessions.append(MagicMock()) or sessions[-1],
+        ),
+        patch("tasks.backup_tasks.increment_job_progress") as progress,
+    ):
+        result = execute_backup(
+            schedule_id=5,
+            credential_id=10,
+            job_parameters=None,
+            target_devices=["dev-1", "dev-2", "dev-3"],
+            task_context=MagicMock(),
+            job_run_id=99,
+        )
+
+    assert result["success"] is True
+    assert result["devices_backed_up"] == 2
+    assert result["devices_failed"] == 1
+    batches = [
+        c.kwargs["device_ids"]
+        for c in backup_service.backup_devices_via_agent.call_args_list
+    ]
+    assert batches == [["dev-1", "dev-2"], ["dev-3"]]
+    assert (
+        backup_service.backup_devices_via_agent.call_args.kwargs["max_in_flight"] == 4
+    )
+    assert len(sessions) == 2 and all(s.close.called for s in sessions)
+    assert progress.call_count == 3
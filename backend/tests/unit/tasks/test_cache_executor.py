@@ -40,7 +40,9 @@ def test_execute_cache_devices_success() -> None:
 
     assert result["success"] is True
     assert result["devices_cached"] == 2
-    assert mock_cache.set.call_count == 2
+    mock_cache.set_many.assert_called_once()
+    entries = dict(mock_cache.set_many.call_args[0][0])
+    assert set(entries) == {"nautobot:devices:uuid-1", "nautobot:devices:uuid-2"}
 
 
 @pytest.mark.unit
@@ -247,3 +247,4 @@ def test_client_data_executor_collects_and_persists() -> None:
     assert result["session_id"]
     mock_repo.bulk_insert_ip_addresses.assert_called_once()
     mock_repo.delete_old_sessions.assert_called_once_with(keep=5)
+    mock_repo.refresh_client_data.assert_called_once_with()
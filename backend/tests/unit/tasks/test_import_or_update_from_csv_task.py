@@ -580,3 +580,130 @@ class TestImportBehaviorFlags:
         agent_svc.send_get_data.assert_called_once_with(
             agent_id="agent-1", flow_id="flow1", sent_by="scheduler"
         )
+
+
+# ---------------------------------------------------------------------------
+# Test 4 – Pipelined mode (bulk lookup + concurrent apply)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestPipelinedImport:
+    """pipelined=True resolves primary keys in bulk and applies concurrently."""
+
+    def test_cockpit_devices_resolved_with_one_lookup(self, csv_repo_dir, task_context):
+        """Existing devices are updated, new ones created, from one GraphQL query."""
+        nautobot_svc, creation_svc, update_svc = _make_services()
+        nautobot_svc.graphql_query = AsyncMock(
+            return_value={"data": {"devices": [{"id": "lab2-uuid", "name": "lab-2"}]}}
+        )
+
+        result = _run(
+            csv_repo_dir,
+            task_context,
+            nautobot_svc,
+            creation_svc,
+            update_svc,
+            file_path=_COCKPIT_CSV,
+            import_type="devices",
+            primary_key="name",
+            import_format="cockpit",
+            update_existing=True,
+            pipelined=True,
+        )
+
+        assert result["summary"]["created"] == 1
+        assert result["summary"]["updated"] == 1
+        assert result["summary"]["failed"] == 0
+        lookups = [
+            call.args[1]
+            for call in nautobot_svc.graphql_query.await_args_list
+            if len(call.args) > 1 and "name" in call.args[1]
+        ]
+        assert len(lookups) == 1
+        assert sorted(lookups[0]["name"]) == ["LAB", "lab-2"]
+
+        update_kwargs = update_svc.update_device.await_args.kwargs
+        assert update_kwargs["device_identifier"] == {"id": "lab2-uuid"}
+        assert len(update_kwargs["interfaces"]) == _COCKPIT_INTERFACES_PER_DEVICE
+
+    def test_results_keep_input_order_and_repeated_keys_reuse_created_id(
+        self, csv_repo_dir, task_context
+    ):
+        """A repeated primary key updates the object created by its earlier row."""
+        (csv_repo_dir / "ips.csv").write_text(
+            "address,status\n"
+            "10.0.0.1/24,Active\n"
+            "10.0.0.2/24,Active\n"
+            ",Active\n"
+            "10.0.0.3/24,Active\n"
+            "10.0.0.1/24,Reserved\n"
+        )
+        nautobot_svc, creation_svc, update_svc = _make_services()
+        nautobot_svc.graphql_query = AsyncMock(
+            return_value={
+                "data": {"ip_addresses": [{"id": "ip2-uuid", "address": "10.0.0.2/24"}]}
+            }
+        )
+        created_ids = iter(["ip1-uuid", "ip3-uuid"])
+
+        async def rest_request(endpoint, method="GET", data=None):
+            if method == "POST":
+                return {"id": next(created_ids)}
+            return {}
+
+        nautobot_svc.rest_request = AsyncMock(side_effect=rest_request)
+
+        result = _run(
+            csv_repo_dir,
+            task_context,
+            nautobot_svc,
+            creation_svc,
+            update_svc,
+            file_path="ips.csv",
+            import_type="ip-addresses",
+            primary_key="address",
+            pipelined=True,
+        )
+
+        assert result["summary"]["failed"] == 0
+        assert [(e["row"], e["id"]) for e in result["created"]] == [
+            (1, "ip1-uuid"),
+            (4, "ip3-uuid"),
+        ]
+        assert [(e["row"], e["id"]) for e in result["updated"]] == [
+            (2, "ip2-uuid"),
+            (5, "ip1-uuid"),
+        ]
+        assert [e["row"] for e in result["skipped"]] == [3]
+        nautobot_svc.graphql_query.assert_awaited_once()
+
+    def test_failed_row_is_reported_without_stopping_the_batch(
+        self, csv_repo_dir, task_context
+    ):
+        """An exception while applying one object only fails that row."""
+        nautobot_svc, creation_svc, update_svc = _make_services()
+        creation_svc.create_device_with_interfaces = AsyncMock(
+            side_effect=[
+                RuntimeError("boom"),
+                {"success": True, "device_id": "lab2-uuid"},
+            ]
+        )
+
+        result = _run(
+            csv_repo_dir,
+            task_context,
+            nautobot_svc,
+            creation_svc,
+            update_svc,
+            file_path=_COCKPIT_CSV,
+            import_type="devices",
+            primary_key="name",
+            import_format="cockpit",
+            pipelined=True,
+        )
+
+        assert result["summary"]["created"] == 1
+        assert result["failures"] == [
+            {"file": _COCKPIT_CSV, "row": 1, "identifier": "LAB", "error": "boom"}
+        ]
@@ -1,20 +1,22 @@
 """Unit tests for tasks/ping_network_task.py.
 
 Covers the pure helper functions (_expand_cidr_to_ips, _is_valid_ip,
-_condense_ip_ranges) and the ping_network_task Celery task.
+_resolve_dns_many) and the ping_network_task Celery task.
 All tests run offline — no fping, Celery broker, or database required.
 """
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from tasks.ping_network_task import (
-    _condense_ip_ranges,
+    _dns_cache,
     _expand_cidr_to_ips,
     _is_valid_ip,
+    _resolve_dns_many,
     ping_network_task,
 )
 
@@ -93,60 +95,61 @@ def test_is_valid_ip_ipv6_is_valid():
     assert _is_valid_ip("2001:db8::1") is True
 
 
-# ── _condense_ip_ranges ───────────────────────────────────────────────────────
+# ── _resolve_dns_many ─────────────────────────────────────────────────────────
 
 
-@pytest.mark.unit
-def test_condense_ip_ranges_empty_list():
-    """Empty input returns empty list."""
-    assert _condense_ip_ranges([]) == []
+@pytest.fixture
+def empty_dns_cache():
+    _dns_cache.clear()
+    yield
+    _dns_cache.clear()
 
 
 @pytest.mark.unit
-def test_condense_ip_ranges_single_ip():
-    """Single IP is returned as-is without range notation."""
-    assert _condense_ip_ranges(["192.168.1.1"]) == ["192.168.1.1"]
-
+def test_resolve_dns_many_runs_lookups_concurrently(empty_dns_cache):
+    barrier = threading.Barrier(3, timeout=5)
 
-@pytest.mark.unit
-def test_condense_ip_ranges_consecutive_ips():
-    """Three consecutive IPs are condensed into a range."""
-    result = _condense_ip_ranges(["192.168.1.10", "192.168.1.11", "192.168.1.12"])
-    assert result == ["192.168.1.10 - 12"]
+    def _lookup(ip):
+        barrier.wait()  # only passes once all three lookups are in flight
+        return "" if ip.endswith(".3") else f"host-{ip}"
 
+    with patch("tasks.ping_network_task._resolve_dns", side_effect=_lookup):
+        result = _resolve_dns_many(["10.9.0.1", "10.9.0.2", "10.9.0.3"])
 
-@pytest.mark.unit
-def test_condense_ip_ranges_non_consecutive_kept_separate():
-    """IPs with a gap between them remain as separate entries."""
-    result = _condense_ip_ranges(["192.168.1.1", "192.168.1.5"])
-    assert len(result) == 2
-    assert "192.168.1.1" in result
-    assert "192.168.1.5" in result
+    assert result == {
+        "10.9.0.1": "host-10.9.0.1",
+        "10.9.0.2": "host-10.9.0.2",
+        "10.9.0.3": "",
+    }
 
 
 @pytest.mark.unit
-def test_condense_ip_ranges_unsorted_input():
-    """Input does not need to be sorted — the function sorts internally."""
-    result = _condense_ip_ranges(["192.168.1.12", "192.168.1.10", "192.168.1.11"])
-    assert result == ["192.168.1.10 - 12"]
+def test_resolve_dns_many_serves_repeats_from_cache(empty_dns_cache):
+    with patch("tasks.ping_network_task._resolve_dns", return_value="r1") as lookup:
+        _resolve_dns_many(["10.9.1.1"])
+        result = _resolve_dns_many(["10.9.1.1", "10.9.1.1"])
+
+    assert result == {"10.9.1.1": "r1"}
+    assert lookup.call_count == 1
 
 
 @pytest.mark.unit
-def test_condense_ip_ranges_cross_subnet_boundary():
-    """IPs across a /24 boundary (different third octet) are kept separate."""
-    result = _condense_ip_ranges(["192.168.1.254", "192.168.2.1"])
-    assert len(result) == 2
+def test_resolve_dns_many_times_out_slow_lookups(empty_dns_cache):
+    release = threading.Event()
 
+    def _lookup(ip):
+        if ip == "10.9.2.1":
+            release.wait(5)
+        return "slow" if ip == "10.9.2.1" else "fast"
 
-@pytest.mark.unit
-def test_condense_ip_ranges_mixed_ranges_and_singles():
-    """Output correctly mixes condensed ranges with isolated IPs."""
-    ips = ["10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.10", "10.0.0.20"]
-    result = _condense_ip_ranges(ips)
-    assert "10.0.0.1 - 3" in result
-    assert "10.0.0.10" in result
-    assert "10.0.0.20" in result
-    assert len(result) == 3
+    try:
+        with patch("tasks.ping_network_task._resolve_dns", side_effect=_lookup):
+            result = _resolve_dns_many(["10.9.2.1", "10.9.2.2"], timeout=0.1)
+    finally:
+        release.set()
+
+    assert result == {"10.9.2.1": "", "10.9.2.2": "fast"}
+    assert "10.9.2.1" not in _dns_cache
 
 
 # ── ping_network_task ─────────────────────────────────────────────────────────
@@ -12,6 +12,7 @@ import pytest
 
 from tasks.update_ip_addresses_from_csv_task import (
     _add_ip_address_note,
+    _apply_pending_updates,
     _prepare_ip_address_update_data,
     update_ip_addresses_from_csv_task,
 )
@@ -68,7 +69,7 @@ def test_update_ip_addresses_from_csv_dry_run_uses_graphql_lookup() -> None:
             return_value=("ip-1", {"tags": []}),
         ) as lookup,
         patch(
-            "tasks.update_ip_addresses_from_csv_task._update_ip_address",
+            "tasks.update_ip_addresses_from_csv_task._update_ip_addresses",
             new_callable=AsyncMock,
         ) as update,
         patch.object(update_ip_addresses_from_csv_task, "update_state"),
@@ -89,7 +90,7 @@ def test_update_ip_addresses_from_csv_dry_run_uses_graphql_lookup() -> None:
 
 @pytest.mark.unit
 def test_update_ip_addresses_from_csv_uuid_update_calls_rest_helper() -> None:
-    """UUID mode verifies the address and calls the update helper with selected fields."""
+    """UUID mode verifies the address and bulk-updates only the selected fields."""
     job_runs = MagicMock()
     job_runs.get_job_run_by_celery_id.return_value = None
 
@@ -108,9 +109,9 @@ def test_update_ip_addresses_from_csv_uuid_update_calls_rest_helper() -> None:
             return_value={"id": "ip-1", "tags": []},
         ) as get_by_uuid,
         patch(
-            "tasks.update_ip_addresses_from_csv_task._update_ip_address",
+            "tasks.update_ip_addresses_from_csv_task._update_ip_addresses",
             new_callable=AsyncMock,
-            return_value={"success": True},
+            return_value={},
         ) as update,
         patch.object(update_ip_addresses_from_csv_task, "update_state"),
     ):
@@ -125,7 +126,7 @@ def test_update_ip_addresses_from_csv_uuid_update_calls_rest_helper() -> None:
     assert result["successes"][0]["updated_fields"] == ["description"]
     get_by_uuid.assert_awaited_once()
     update.assert_awaited_once()
-    assert update.await_args.args[2] == {"description": "uplink"}
+    assert update.await_args.args[1] == {"ip-1": {"description": "uplink"}}
 
 
 @pytest.mark.unit
@@ -228,7 +229,7 @@ def test_add_ip_address_note_returns_failure_on_exception() -> None:
 
 @pytest.mark.unit
 def test_update_ip_addresses_notes_only_row_succeeds() -> None:
-    """A row where only 'notes' is mapped succeeds without calling the PATCH helper."""
+    """A row where only 'notes' is mapped succeeds without a PATCH."""
     job_runs = MagicMock()
     job_runs.get_job_run_by_celery_id.return_value = None
 
@@ -247,7 +248,7 @@ def test_update_ip_addresses_notes_only_row_succeeds() -> None:
             return_value=("ip-1", {"tags": []}),
         ),
         patch(
-            "tasks.update_ip_addresses_from_csv_task._update_ip_address",
+            "tasks.update_ip_addresses_from_csv_task._update_ip_addresses",
             new_callable=AsyncMock,
         ) as update,
         patch(
@@ -330,9 +331,9 @@ def test_update_ip_addresses_partial_note_failure_becomes_warning() -> None:
             return_value=("ip-1", {"tags": []}),
         ),
         patch(
-            "tasks.update_ip_addresses_from_csv_task._update_ip_address",
+            "tasks.update_ip_addresses_from_csv_task._update_ip_addresses",
             new_callable=AsyncMock,
-            return_value={"success": True},
+            return_value={},
         ),
         patch(
             "tasks.update_ip_addresses_from_csv_task._add_ip_address_note",
@@ -391,3 +392,91 @@ def test_update_ip_addresses_dry_run_includes_notes_preview() -> None:
 
     assert result["successes"][0]["updates"]["notes"] == "a note"
     add_note.assert_not_called()
+
+
+@pytest.mark.unit
+def test_apply_pending_updates_sends_patch_and_notes_in_one_event_loop() -> None:
+    """Notes of rows whose PATCH went through are added in the same loop."""
+    nautobot_service = MagicMock()
+    nautobot_service.bulk_update = AsyncMock(return_value={"ip-2": "invalid"})
+
+    def entry(row, uuid, update_data, note_text):
+        return {
+            "row": row,
+            "address": f"10.0.0.{row}/24",
+            "namespace": "Global",
+            "uuid": uuid,
+            "identifier": uuid,
+            "update_data": update_data,
+            "note_text": note_text,
+        }
+
+    pending = [
+        entry(1, "ip-1", {"description": "a"}, "first"),
+        entry(2, "ip-2", {"description": "b"}, "never sent"),
+        entry(3, "ip-3", {}, "note only"),
+        entry(4, "ip-1", {}, "second"),
+    ]
+    successes, failures, progress = [], [], []
+    run = MagicMock(side_effect=asyncio.run)
+
+    with (
+        patch("tasks.update_ip_addresses_from_csv_task.asyncio.run", run),
+        patch(
+            "tasks.update_ip_addresses_from_csv_task._add_ip_address_note",
+            new_callable=AsyncMock,
+            return_value={"success": True, "created": True},
+        ) as add_note,
+    ):
+        _apply_pending_updates(
+            nautobot_service,
+            pending,
+            successes,
+            failures,
+            lambda current, status: progress.append((current, status)),
+        )
+
+    assert run.call_count == 1
+    assert [(c.args[1], c.args[2]) for c in add_note.await_args_list] == [
+        ("ip-1", "first"),
+        ("ip-1", "second"),
+        ("ip-3", "note only"),
+    ]
+    assert [f["row"] for f in failures] == [2]
+    assert sorted(s["row"] for s in successes) == [1, 3, 4]
+    assert progress[0] == (90, "Updated 0/2 IP addresses in Nautobot")
+    assert progress[-1] == (95, "Added 3/3 notes")
+
+
+@pytest.mark.unit
+def test_apply_pending_updates_merges_custom_fields_of_rows_for_one_ip() -> None:
+    """Two rows setting different custom fields on one IP keep both."""
+    nautobot_service = MagicMock()
+    nautobot_service.bulk_update = AsyncMock(return_value={})
+
+    def entry(row, update_data):
+        return {
+            "row": row,
+            "address": "10.0.0.1/24",
+            "namespace": "Global",
+            "uuid": "ip-1",
+            "identifier": "ip-1",
+            "update_data": update_data,
+            "note_text": None,
+        }
+
+    pending = [
+        entry(1, {"description": "a", "custom_fields": {"monitored": "true"}}),
+        entry(2, {"description": "b", "custom_fields": {"owner": "noc"}}),
+    ]
+
+    _apply_pending_updates(nautobot_service, pending, [], [], lambda *_: None)
+
+    sent = nautobot_service.bulk_update.await_args.args[1]
+    assert sent == [
+        {
+            "id": "ip-1",
+            "description": "b",
+            "custom_fields": {"monitored": "true", "owner": "noc"},
+        }
+    ]
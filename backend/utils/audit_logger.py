@@ -3,7 +3,7 @@
 import logging
 from typing import Optional
 
-from repositories.audit_log.audit_log_repository import audit_log_repo
+from repositories.audit_log.audit_log_writer import audit_log_writer
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,7 @@ def log_auth_event(
     message = f"User {action}"
 
     try:
-        audit_log_repo.create_log(
+        audit_log_writer.write(
             username=username,
             user_id=user_id,
             event_type="authentication",
@@ -55,7 +55,7 @@ def log_device_onboarding(
     )
 
     try:
-        audit_log_repo.create_log(
+        audit_log_writer.write(
             username=username,
             user_id=user_id,
             event_type="onboarding",
@@ -65,7 +65,7 @@ def log_device_onboarding(
             resource_name=device_name,
             severity=severity,
         )
-        logger.info("Audit log created successfully for device %s", device_name)
+        logger.info("Audit log queued for device %s", device_name)
     except Exception as e:
         logger.error(
             "Failed to create device onboarding audit log: %s", e, exc_info=True
@@ -93,7 +93,7 @@ def log_checkmk_sync_event(
             message += f" - Error: {error_message}"
 
     try:
-        audit_log_repo.create_log(
+        audit_log_writer.write(
             username=username,
             user_id=user_id,
             event_type="checkmk_sync",
@@ -115,7 +115,7 @@ def log_system_event(
 ):
     """Log system events."""
     try:
-        audit_log_repo.create_log(
+        audit_log_writer.write(
             username="system",
             event_type=event_type,
             message=message,
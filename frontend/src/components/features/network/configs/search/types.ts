@@ -12,6 +12,9 @@ export interface ConfigContentSearchRequest {
   case_sensitive?: boolean
   limit?: number
   offset?: number
+  stream?: boolean
+  cursor?: string | null
+  count_total?: boolean
 }
 
 export interface ConfigContentSearchMatch {
@@ -33,6 +36,8 @@ export interface ConfigContentSearchData {
   files_scanned: number
   truncated: boolean
   search_mode: SearchMode
+  next_cursor?: string | null
+  total_is_estimate?: boolean
 }
 
 export interface ConfigContentSearchResponse {